@@ -75,14 +75,26 @@ def build_followup_response(
     if "max_results" not in search_params:
         search_params["max_results"] = capsule.get("max_results", page_size * next_page)
 
-    listings, total = tools.search_listings(
-        search_params,
-        page=next_page,
-        page_size=page_size,
-        return_total=True,
-    )
-
-    has_more = bool(total) and (total > next_page * page_size)
+    cursor = capsule.get("next_cursor")
+    next_cursor = None
+    if cursor:
+        # Keyset continuation: seek past the last card shown
+        listings, total, next_cursor = tools.search_listings_page(
+            search_params,
+            page_size=page_size,
+            cursor=cursor,
+        )
+        if total is None:
+            total = capsule.get("total")
+        has_more = next_cursor is not None
+    else:
+        listings, total = tools.search_listings(
+            search_params,
+            page=next_page,
+            page_size=page_size,
+            return_total=True,
+        )
+        has_more = bool(total) and (total > next_page * page_size)
 
     reply = (
         f"Here are more options (page {next_page})."
@@ -99,6 +111,7 @@ def build_followup_response(
         "page_size": page_size,
         "total": total,
         "has_more": has_more,
+        "next_cursor": next_cursor,
     }
 
     traces = {
@@ -110,6 +123,7 @@ def build_followup_response(
             "page": next_page,
             "page_size": page_size,
             "total": total,
+            "keyset": bool(cursor),
         },
         "search_result_count": len(listings),
         "total_results": total,
@@ -155,6 +169,7 @@ class PolicyState:
     page: int
     page_size: int
     total_results: int | None
+    next_cursor: str | None = None
 
 
 def initial_state() -> PolicyState:
@@ -423,7 +438,7 @@ def search(state: PolicyState) -> PolicyState:
     """
     Execute property search with extracted params.
 
-    Uses tools.search_listings() with intelligent margins:
+    Uses tools.search_listings_page() with intelligent margins:
     - +10% on max budget
     - +1 bedroom flexibility
     - Fuzzy location matching
@@ -443,14 +458,14 @@ def search(state: PolicyState) -> PolicyState:
     # Execute search (page 1)
     state.page = 1
     state.page_size = min(state.search_params.get("max_results", 25) or 25, 10)
-    results, total = tools.search_listings(
+    # total stays None when the API does not know it; a page length is not a total
+    results, total, next_cursor = tools.search_listings_page(
         state.search_params,
-        page=state.page,
         page_size=state.page_size,
-        return_total=True,
     )
     state.results = results
     state.total_results = total
+    state.next_cursor = next_cursor
     state.traces["search_result_count"] = len(results)
     state.traces["total_results"] = total
     state.traces["page_size"] = state.page_size
@@ -725,13 +740,17 @@ def build_response(request: AgentRequest, state: PolicyState) -> AgentResponse:
             actions = []  # No show_listings action for Q&A
         else:
             # Search response
-            total = state.total_results if state.total_results is not None else len(state.results)
+            total = state.total_results
             tenure_text = "nightly rentals" if state.tenure == "short_term" else "monthly rentals"
             if state.page > 1:
                 reply = f"Here are more {tenure_text} (page {state.page}):"
+            elif total is None:
+                reply = f"Here are {tenure_text} matching your search:"
             else:
                 reply = f"I found {total} {tenure_text} matching your search:"
-            has_more = bool(total) and (total > state.page * state.page_size)
+            has_more = state.next_cursor is not None or (
+                bool(total) and (total > state.page * state.page_size)
+            )
             state.traces["has_more"] = has_more
             max_results = (state.search_params or {}).get("max_results")
             if max_results is None and state.total_results is not None:
@@ -745,6 +764,7 @@ def build_response(request: AgentRequest, state: PolicyState) -> AgentResponse:
                 "page_size": state.page_size,
                 "total": total,
                 "has_more": has_more,
+                "next_cursor": state.next_cursor,
             }
             if max_results is not None:
                 action_params["max_results"] = max_results
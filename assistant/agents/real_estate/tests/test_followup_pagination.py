@@ -0,0 +1,68 @@
+"""
+Tests for the "show more" follow-up path of the real estate policy.
+
+The search layer is patched so these run without the v1 search API.
+"""
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from assistant.agents.contracts import AgentContext, AgentRequest
+from assistant.agents.real_estate.policy import build_followup_response
+
+
+def _request(text: str) -> AgentRequest:
+    return AgentRequest(
+        thread_id="thread-keyset",
+        client_msg_id="msg-1",
+        intent="property_search",
+        input=text,
+        ctx=AgentContext(user_id="u-1", locale="en", time="2025-11-02T12:00:00Z"),
+    )
+
+
+class FollowupKeysetPaginationTests(SimpleTestCase):
+    capsule = {
+        "search_params": {"location": "Kyrenia", "tenure": "short_term"},
+        "page": 1,
+        "page_size": 2,
+        "total": 5,
+        "next_cursor": "cursor-page-2",
+    }
+
+    @patch("assistant.agents.real_estate.tools.search_listings")
+    @patch("assistant.agents.real_estate.tools.search_listings_page")
+    def test_cursor_continues_without_rerunning_search(self, mock_page, mock_full):
+        mock_page.return_value = ([{"id": "3"}, {"id": "4"}], 5, "cursor-page-3")
+
+        response = build_followup_response(_request("show more"), self.capsule, "paginate_next")
+
+        mock_full.assert_not_called()
+        mock_page.assert_called_once()
+        self.assertEqual(mock_page.call_args.kwargs["cursor"], "cursor-page-2")
+        params = response["actions"][0]["params"]
+        self.assertEqual(params["page"], 2)
+        self.assertEqual(params["next_cursor"], "cursor-page-3")
+        self.assertTrue(params["has_more"])
+
+    @patch("assistant.agents.real_estate.tools.search_listings_page")
+    def test_last_page_has_no_more(self, mock_page):
+        mock_page.return_value = ([{"id": "5"}], None, None)
+
+        response = build_followup_response(_request("more"), self.capsule, "paginate_next")
+
+        params = response["actions"][0]["params"]
+        self.assertFalse(params["has_more"])
+        self.assertIsNone(params["next_cursor"])
+        self.assertEqual(params["total"], 5)  # falls back to the capsule total
+
+    @patch("assistant.agents.real_estate.tools.search_listings")
+    def test_capsule_without_cursor_uses_offset_path(self, mock_full):
+        mock_full.return_value = ([{"id": "3"}], 3)
+        capsule = {k: v for k, v in self.capsule.items() if k != "next_cursor"}
+
+        response = build_followup_response(_request("next"), capsule, "paginate_next")
+
+        mock_full.assert_called_once()
+        self.assertEqual(response["actions"][0]["params"]["page"], 2)
@@ -0,0 +1,57 @@
+"""
+Tests for pagination after the search fallback relaxed the filters.
+
+The v1 search API is stubbed at the HTTP layer.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from assistant.agents.real_estate.policy import initial_state, search
+from assistant.domain.real_estate_search_v1 import search_listings_v1
+
+
+def _response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+class RelaxedSearchCursorTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch("assistant.domain.real_estate_search_v1.requests.get")
+    def test_relaxed_page_keeps_cursor_and_total(self, mock_get):
+        mock_get.side_effect = [
+            _response({"count": 0, "results": [], "total": 0, "next_cursor": None}),
+            _response({"count": 1, "results": [{"listing_id": 1}], "total": 4, "next_cursor": "abc"}),
+        ]
+
+        first = search_listings_v1({"city": "Kyrenia", "budget_max": 500}, max_results=1)
+
+        self.assertEqual(first["total"], 4)
+        self.assertTrue(first["next_cursor"])
+        self.assertNotIn("max_price", mock_get.call_args_list[1].kwargs["params"])
+
+        mock_get.side_effect = [_response({"count": 1, "results": [{"listing_id": 2}], "total": 4, "next_cursor": None})]
+        second = search_listings_v1({"city": "Kyrenia", "budget_max": 500}, max_results=1, cursor=first["next_cursor"])
+
+        sent = mock_get.call_args.kwargs["params"]
+        self.assertEqual(sent["cursor"], "abc")
+        self.assertNotIn("max_price", sent)  # the page continues the relaxed filter set
+        self.assertEqual(second["results"], [{"listing_id": 2}])
+
+    @patch("assistant.agents.real_estate.tools.search_listings_page")
+    def test_unknown_total_is_not_the_page_length(self, mock_page):
+        mock_page.return_value = ([{"id": "1"}, {"id": "2"}], None, "cursor-2")
+        state = initial_state()
+        state.traces["states_visited"] = []
+        state.search_params = {"location": "Kyrenia"}
+
+        state = search(state)
+
+        self.assertIsNone(state.total_results)
+        self.assertEqual(state.next_cursor, "cursor-2")
@@ -21,7 +21,8 @@ from assistant.agents.real_estate.schema import (
     Budget,
     DateRange,
 )
-from assistant.agents.real_estate.tools_v1 import search_properties_v1
+from assistant.agents.real_estate.tools_v1 import search_properties_v1, search_properties_page_v1
+from assistant.brain.geo import ALIASES, canonical_location, fold_location_text
 
 # Configuration
 FIXTURES_PATH = Path(__file__).parent / "fixtures" / "listings.json"
@@ -29,11 +30,10 @@ MAX_RESULTS = 25
 PRICE_MARGIN_PERCENT = 10  # 10% margin on max budget
 BEDROOM_FLEXIBILITY = 1  # Show +1 bedroom options
 
-# Location aliases for fuzzy matching
+# Location aliases for fuzzy matching (derived from the shared geo table)
 LOCATION_ALIASES = {
-    "kyrenia": ["kyrenia", "girne", "keryneia"],
-    "famagusta": ["famagusta", "magusa", "gazimagusa"],
-    "nicosia": ["nicosia", "lefkosa", "lefkosia"],
+    canonical: sorted({fold_location_text(n) for n in [canonical, *names]})
+    for canonical, names in ALIASES.items()
 }
 
 
@@ -68,19 +68,19 @@ def normalize_location(location: str) -> list[str]:
         List of equivalent location strings to search
 
     Examples:
-        >>> normalize_location("Kyrenia")
-        ["kyrenia", "girne", "keryneia"]
-        >>> normalize_location("Catalkoy")
+        >>> normalize_location("Girne")
+        ["girne", "keryneia", "kyrenia"]
+        >>> normalize_location("Çatalköy")
         ["catalkoy"]
     """
-    location_lower = location.lower().strip()
+    location_lower = fold_location_text(location)
 
     # Check if it's a known canonical location
-    for canonical, aliases in LOCATION_ALIASES.items():
-        if location_lower in aliases:
-            return aliases
+    canonical = canonical_location(location_lower)
+    if canonical:
+        return LOCATION_ALIASES[canonical]
 
-    # Return as-is for districts/unknown locations
+    # Return as-is for unknown locations
     return [location_lower]
 
 
@@ -253,6 +253,22 @@ def search_listings(
     return paginated_results
 
 
+def search_listings_page(
+    params: SearchParams,
+    page_size: int = MAX_RESULTS,
+    cursor: str | None = None,
+) -> tuple[list[PropertyCard], int | None, str | None]:
+    """Fetch one keyset page of listings.
+
+    Returns ``(cards, total, next_cursor)``. ``next_cursor`` is passed back on
+    the next call to continue after the last card without re-running and
+    re-slicing the whole search; it is None once results are exhausted.
+    """
+    page_size = max(1, min(int(page_size), MAX_RESULTS))
+    page = search_properties_page_v1(params, page_size=page_size, cursor=cursor)
+    return page["cards"], page["total"], page["next_cursor"]
+
+
 def answer_property_qa(listing_id: str, question: str) -> QAAnswer | None:
     """
     Answer question about a specific property.
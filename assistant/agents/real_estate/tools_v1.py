@@ -39,50 +39,8 @@ def map_tenure_to_listing_type(tenure: str) -> Optional[str]:
     return mapping.get(tenure)
 
 
-def search_properties_v1(params: SearchParams) -> List[PropertyCard]:
-    """
-    Search property listings using v1 schema with intelligent filtering.
-
-    This function bridges the agent's SearchParams schema to the v1 domain layer.
-
-    Intelligent margins:
-    - Price: +10% on max budget (500-600 → search up to 660)
-    - Bedrooms: +1 bedroom flexibility handled by min_bedrooms filter
-
-    Args:
-        params: SearchParams with optional filters:
-            - tenure: "short_term" | "long_term" | "both"
-            - location: str (city or area)
-            - budget: {"min": int, "max": int, "currency": str}
-            - bedrooms: int
-            - property_type: str
-            - amenities: List[str]
-            - dates: DateRange (for availability)
-            - max_results: int
-
-    Returns:
-        List of PropertyCard dicts (max 25)
-
-    Example:
-        >>> search_properties_v1({
-        ...     "tenure": "long_term",
-        ...     "location": "Kyrenia",
-        ...     "budget": {"min": 500, "max": 800, "currency": "GBP"},
-        ...     "bedrooms": 2,
-        ...     "amenities": ["wifi", "pool"]
-        ... })
-        [
-            {
-                "id": "123",
-                "title": "2BR Apartment",
-                "subtitle": "Kyrenia, Catalkoy",
-                "price": "£750/mo",
-                ...
-            },
-            ...
-        ]
-    """
-    # Build filled_slots for domain layer
+def _build_filled_slots(params: SearchParams) -> Dict[str, Any]:
+    """Map agent SearchParams to v1 domain-layer filled slots."""
     filled_slots = {}
 
     # Map tenure to listing_type
@@ -149,6 +107,54 @@ def search_properties_v1(params: SearchParams) -> List[PropertyCard]:
         if "end" in dates:
             filled_slots["available_to"] = dates["end"]
 
+    return filled_slots
+
+
+def search_properties_v1(params: SearchParams) -> List[PropertyCard]:
+    """
+    Search property listings using v1 schema with intelligent filtering.
+
+    This function bridges the agent's SearchParams schema to the v1 domain layer.
+
+    Intelligent margins:
+    - Price: +10% on max budget (500-600 → search up to 660)
+    - Bedrooms: +1 bedroom flexibility handled by min_bedrooms filter
+
+    Args:
+        params: SearchParams with optional filters:
+            - tenure: "short_term" | "long_term" | "both"
+            - location: str (city or area)
+            - budget: {"min": int, "max": int, "currency": str}
+            - bedrooms: int
+            - property_type: str
+            - amenities: List[str]
+            - dates: DateRange (for availability)
+            - max_results: int
+
+    Returns:
+        List of PropertyCard dicts (max 25)
+
+    Example:
+        >>> search_properties_v1({
+        ...     "tenure": "long_term",
+        ...     "location": "Kyrenia",
+        ...     "budget": {"min": 500, "max": 800, "currency": "GBP"},
+        ...     "bedrooms": 2,
+        ...     "amenities": ["wifi", "pool"]
+        ... })
+        [
+            {
+                "id": "123",
+                "title": "2BR Apartment",
+                "subtitle": "Kyrenia, Catalkoy",
+                "price": "£750/mo",
+                ...
+            },
+            ...
+        ]
+    """
+    filled_slots = _build_filled_slots(params)
+
     # Max results
     max_results = min(params.get("max_results", MAX_RESULTS), MAX_RESULTS)
 
@@ -192,6 +198,47 @@ def search_properties_v1(params: SearchParams) -> List[PropertyCard]:
         return []
 
 
+def search_properties_page_v1(
+    params: SearchParams,
+    page_size: int = MAX_RESULTS,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch one keyset page of property cards.
+
+    Unlike ``search_properties_v1`` this only asks the API for ``page_size``
+    rows and hands back the opaque ``next_cursor`` so "show more" can seek
+    straight to the next page instead of re-running the whole search.
+
+    Returns:
+        Dict with ``cards`` (List[PropertyCard]), ``total`` (Optional[int])
+        and ``next_cursor`` (Optional[str]).
+    """
+    filled_slots = _build_filled_slots(params)
+    page_size = max(1, min(int(page_size), MAX_RESULTS))
+
+    try:
+        result = search_listings_v1(filled_slots, max_results=page_size, cursor=cursor)
+    except Exception as e:
+        logger.error(
+            "[Agent RE Tools V1] Unexpected error during paged search: %s",
+            e,
+            exc_info=True
+        )
+        return {"cards": [], "total": None, "next_cursor": None}
+
+    if result.get("error"):
+        logger.error("[Agent RE Tools V1] Paged search error: %s", result["error"])
+        return {"cards": [], "total": None, "next_cursor": None}
+
+    cards = [format_v1_listing_for_card(listing) for listing in result.get("results", [])]
+    return {
+        "cards": cards[:page_size],
+        "total": result.get("total"),
+        "next_cursor": result.get("next_cursor"),
+    }
+
+
 def get_property_details_v1(property_id: str) -> Optional[Dict[str, Any]]:
     """
     Get detailed information for a specific property.
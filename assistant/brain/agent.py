@@ -15,12 +15,12 @@ import json
 import logging
 import re
 from datetime import datetime
+from threading import Lock
 import uuid
 import time
 
 from langchain_core.tools import BaseTool
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import PydanticOutputParser
 from .resilience import guarded_llm_call
 from pydantic import BaseModel, Field
@@ -663,10 +663,10 @@ def search_external_web(query: str, search_type: str, language: str) -> List[Dic
 def generate_grounded_response(context_data: Dict) -> str:
     """Generate response with explicit language enforcement"""
     try:
-        from langchain_openai import ChatOpenAI
         from langchain_core.prompts import ChatPromptTemplate
-        
-        llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
+        from assistant.llm_gateway import get_chat_openai
+
+        llm = get_chat_openai("gpt-4o", temperature=0.7, agent="legacy_agent")
         language = context_data.get('language', 'en')
         user_input = context_data.get('user_input', '')
         search_results = context_data.get('search_results', [])
@@ -1532,10 +1532,21 @@ def build_enterprise_graph():
     graph.add_edge("booking", "long_term")
     graph.add_edge("long_term", END)
 
-    # Compile and cache the graph
-    compiled = graph.compile()
-    _ENTERPRISE_GRAPH_CACHE = compiled
-    return compiled
+    return graph.compile()
+
+
+_ENTERPRISE_GRAPH_CACHE = None
+_ENTERPRISE_GRAPH_LOCK = Lock()
+
+
+def get_enterprise_graph():
+    """Compiled enterprise graph, built on first use and shared by every request"""
+    global _ENTERPRISE_GRAPH_CACHE
+    if _ENTERPRISE_GRAPH_CACHE is None:
+        with _ENTERPRISE_GRAPH_LOCK:
+            if _ENTERPRISE_GRAPH_CACHE is None:
+                _ENTERPRISE_GRAPH_CACHE = build_enterprise_graph()
+    return _ENTERPRISE_GRAPH_CACHE
 
 # ============================================================================
 # ENTERPRISE AGENT ENTRY POINT
@@ -1575,9 +1586,8 @@ def run_enterprise_agent(user_input: str, conversation_id: str) -> Dict[str, Any
             retry_count=0
         )
         
-        logger.info(f"[{conversation_id}] Enterprise agent: building graph...")
-        # Build and run the enterprise graph
-        graph = build_enterprise_graph()
+        # Shared compiled graph (built once per process)
+        graph = get_enterprise_graph()
         
         logger.info(f"[{conversation_id}] Enterprise agent: invoking with user_input={user_input[:50]}...")
         # Save checkpoint before execution
@@ -1644,11 +1654,18 @@ def run_enterprise_agent(user_input: str, conversation_id: str) -> Dict[str, Any
 # SUPERVISOR AGENT ENTRY POINT
 # =============================================================================
 
-def run_supervisor_agent(user_input: str, thread_id: str, client_msg_id: str | None = None) -> Dict[str, Any]:
+def run_supervisor_agent(
+    user_input: str,
+    thread_id: str,
+    client_msg_id: str | None = None,
+    user_id: int | None = None,
+) -> Dict[str, Any]:
     """
     Central Supervisor entry point: route to specialized sub-agents.
     Returns a standardized response envelope used by views.
     Includes robust error handling to prevent 500 errors.
+    ``user_id`` is the thread owner; memory written by the graph is
+    attributed to them.
     """
     try:
         inc_agent_request("supervisor", "start")
@@ -1687,7 +1704,7 @@ def run_supervisor_agent(user_input: str, thread_id: str, client_msg_id: str | N
             'thread_id': thread_id,
             'messages': [],
             'history': restored_history or [],
-            'user_id': None,
+            'user_id': user_id,
             'conversation_history': [],
             'routing_decision': None,
             'target_agent': None,
@@ -1711,6 +1728,12 @@ def run_supervisor_agent(user_input: str, thread_id: str, client_msg_id: str | N
         with create_agent_span("supervisor", "graph_invoke", request_id=thread_id):
             result = safe_execute(graph.invoke, state, config={"configurable": {"thread_id": thread_id}})
         observe_agent_latency("supervisor", "graph_invoke", time.time() - start_graph)
+        logger.info(
+            "[%s] Supervisor node timings (ms): %s skipped=%s",
+            thread_id,
+            result.get("node_timings"),
+            result.get("budget_skipped"),
+        )
 
         # Return the actual response from the worker agent (normalize to string)
         raw_final = result.get('final_response')
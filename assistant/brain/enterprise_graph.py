@@ -15,12 +15,13 @@ import json
 import logging
 import re
 from datetime import datetime
+from threading import Lock
 import uuid
 
 from langchain_core.tools import BaseTool
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
 from .schemas_old import IntentResult
 
@@ -105,6 +106,67 @@ class EnterpriseAgentState(TypedDict):
     needs_retry: bool
     retry_count: int
 
+# ============================================================================
+# NODE DEPENDENCIES
+# ============================================================================
+
+class EnterpriseNodeDeps:
+    """
+    Shared handles for graph nodes: chat model, hybrid RAG coordinator and
+    guardrail system. Nodes receive the container through
+    ``config["configurable"]["deps"]``; each handle is built once on first use
+    unless injected (tests pass stubs).
+    """
+
+    def __init__(self, *, chat_model: Any = None, rag_coordinator: Any = None, guardrail_system: Any = None):
+        self._chat_model = chat_model
+        self._rag_coordinator = rag_coordinator
+        self._guardrail_system = guardrail_system
+        self._lock = Lock()
+
+    @property
+    def chat_model(self) -> Any:
+        if self._chat_model is None:
+            with self._lock:
+                if self._chat_model is None:
+                    from assistant.llm_gateway import get_chat_openai
+
+                    self._chat_model = get_chat_openai("gpt-4o", temperature=0.7, agent="enterprise")
+        return self._chat_model
+
+    @property
+    def rag_coordinator(self) -> Any:
+        if self._rag_coordinator is None:
+            with self._lock:
+                if self._rag_coordinator is None:
+                    self._rag_coordinator = get_hybrid_rag_coordinator()
+        return self._rag_coordinator
+
+    def check_guardrails(self, user_input: str):
+        if self._guardrail_system is not None:
+            return self._guardrail_system.check_guardrails(user_input)
+        # Module-level entry point already reuses a process-wide guardrail system
+        return run_enterprise_guardrails(user_input)
+
+
+_ENTERPRISE_DEPS: Optional[EnterpriseNodeDeps] = None
+_ENTERPRISE_DEPS_LOCK = Lock()
+
+
+def get_enterprise_deps() -> EnterpriseNodeDeps:
+    """Process-wide default dependency container"""
+    global _ENTERPRISE_DEPS
+    if _ENTERPRISE_DEPS is None:
+        with _ENTERPRISE_DEPS_LOCK:
+            if _ENTERPRISE_DEPS is None:
+                _ENTERPRISE_DEPS = EnterpriseNodeDeps()
+    return _ENTERPRISE_DEPS
+
+
+def _node_deps(config: Optional[RunnableConfig]) -> EnterpriseNodeDeps:
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get("deps") or get_enterprise_deps()
+
 # ============================================================================
 # INFRASTRUCTURE NODES (3 Critical Additions)
 # ============================================================================
@@ -137,7 +199,7 @@ def language_preprocessor_node(state: EnterpriseAgentState) -> EnterpriseAgentSt
         'output_language': normalized_language,  # Enforce consistency
     }
 
-def guardrail_refusal_node(state: EnterpriseAgentState) -> EnterpriseAgentState:
+def guardrail_refusal_node(state: EnterpriseAgentState, config: Optional[RunnableConfig] = None) -> EnterpriseAgentState:
     """
     INFRASTRUCTURE NODE 2: Guardrail / Refusal
     Role: Security and Scope Governance (Fail-Fast)
@@ -146,7 +208,7 @@ def guardrail_refusal_node(state: EnterpriseAgentState) -> EnterpriseAgentState:
     logger.info(f"[{state['conversation_id']}] Enterprise guardrail check: {state['user_input'][:50]}...")
     
     # Enterprise guardrails with comprehensive security checks
-    guardrail_result = run_enterprise_guardrails(state['user_input'])
+    guardrail_result = _node_deps(config).check_guardrails(state['user_input'])
     
     if not guardrail_result.passed:
         # Fast refusal path - no expensive LLM calls
@@ -281,7 +343,7 @@ def intent_routing_node(state: EnterpriseAgentState) -> EnterpriseAgentState:
         'routing_decision': routing_decision
     }
 
-def retrieval_node(state: EnterpriseAgentState) -> EnterpriseAgentState:
+def retrieval_node(state: EnterpriseAgentState, config: Optional[RunnableConfig] = None) -> EnterpriseAgentState:
     """
     DOMAIN NODE 3: Hybrid Retrieval (RAG)
     Role: Knowledge access with hybrid search
@@ -291,7 +353,7 @@ def retrieval_node(state: EnterpriseAgentState) -> EnterpriseAgentState:
     intent = _normalize_intent_result(state.get('intent_result'))
     
     # Use enterprise hybrid RAG coordinator
-    rag_coordinator = get_hybrid_rag_coordinator()
+    rag_coordinator = _node_deps(config).rag_coordinator
     search_results = rag_coordinator.search(
         query=state['user_input'],
         intent=intent,
@@ -305,7 +367,7 @@ def retrieval_node(state: EnterpriseAgentState) -> EnterpriseAgentState:
         'combined_results': search_results['combined_results']
     }
 
-def synthesis_node(state: EnterpriseAgentState) -> EnterpriseAgentState:
+def synthesis_node(state: EnterpriseAgentState, config: Optional[RunnableConfig] = None) -> EnterpriseAgentState:
     """
     DOMAIN NODE 4: Response Synthesis
     Role: Generate coherent, grounded natural language response with legacy feature parity
@@ -382,7 +444,7 @@ def synthesis_node(state: EnterpriseAgentState) -> EnterpriseAgentState:
     }
     
     # Generate response with explicit language enforcement
-    response = generate_grounded_response(context_data)
+    response = generate_grounded_response(context_data, deps=_node_deps(config))
 
     try:
         intent_confidence = intent.get('confidence')
@@ -667,13 +729,12 @@ def search_external_web(query: str, search_type: str, language: str) -> List[Dic
         logger.warning(f"External search failed: {e}")
         return []
 
-def generate_grounded_response(context_data: Dict) -> str:
+def generate_grounded_response(context_data: Dict, deps: Optional[EnterpriseNodeDeps] = None) -> str:
     """Generate response with explicit language enforcement"""
     try:
-        from langchain_openai import ChatOpenAI
         from langchain_core.prompts import ChatPromptTemplate
-        
-        llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
+
+        llm = (deps or get_enterprise_deps()).chat_model
         language = context_data.get('language', 'en')
         user_input = context_data.get('user_input', '')
         search_results = context_data.get('search_results', [])
@@ -1534,11 +1595,31 @@ def build_enterprise_graph():
     
     return graph.compile()
 
+_COMPILED_ENTERPRISE_GRAPH = None
+_ENTERPRISE_GRAPH_LOCK = Lock()
+
+
+def get_enterprise_graph():
+    """
+    Compiled enterprise graph, built on first use and shared by every request
+    (the graph holds no per-request state; dependencies arrive via config)
+    """
+    global _COMPILED_ENTERPRISE_GRAPH
+    if _COMPILED_ENTERPRISE_GRAPH is None:
+        with _ENTERPRISE_GRAPH_LOCK:
+            if _COMPILED_ENTERPRISE_GRAPH is None:
+                _COMPILED_ENTERPRISE_GRAPH = build_enterprise_graph()
+    return _COMPILED_ENTERPRISE_GRAPH
+
 # ============================================================================
 # ENTERPRISE AGENT ENTRY POINT
 # ============================================================================
 
-def run_enterprise_agent(user_input: str, conversation_id: str) -> Dict[str, Any]:
+def run_enterprise_agent(
+    user_input: str,
+    conversation_id: str,
+    deps: Optional[EnterpriseNodeDeps] = None,
+) -> Dict[str, Any]:
     """
     Enterprise agent entry point with full 12-node architecture
     """
@@ -1567,9 +1648,9 @@ def run_enterprise_agent(user_input: str, conversation_id: str) -> Dict[str, Any
         retry_count=0
     )
     
-    # Build and run the enterprise graph
-    graph = build_enterprise_graph()
-    result = graph.invoke(initial_state)
+    # Run the shared enterprise graph with injected node dependencies
+    graph = get_enterprise_graph()
+    result = graph.invoke(initial_state, config={"configurable": {"deps": deps or get_enterprise_deps()}})
     
     # Return standardized response
     return {
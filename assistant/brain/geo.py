@@ -1,10 +1,14 @@
-from typing import Dict, List, Optional
+import unicodedata
+from typing import Dict, List, Optional, Set
 
 
+# Single source of truth for TRNC location synonyms/romanizations. Other
+# alias tables (agent tools, internal listing search, the LocationAlias DB
+# table) are derived from this mapping.
 ALIASES: Dict[str, List[str]] = {
-    "kyrenia": ["kyrenia", "girne"],
-    "nicosia": ["nicosia", "lefkoşa", "lefkosa", "lefkoşa"],
-    "famagusta": ["famagusta", "magusa", "mağusa"],
+    "kyrenia": ["kyrenia", "girne", "keryneia"],
+    "nicosia": ["nicosia", "lefkoşa", "lefkosa", "lefkosha", "lefkosia"],
+    "famagusta": ["famagusta", "magusa", "mağusa", "gazimagusa", "gazimağusa"],
     "iskele": ["iskele"],
     "catalkoy": ["çatalköy", "catalkoy", "çatalkoy", "catalköy"],
     "karakum": ["karakum", "kara kum"],
@@ -12,6 +16,8 @@ ALIASES: Dict[str, List[str]] = {
     "alsancak": ["alsancak"],
     "bellapais": ["bellapais"],
     "esentepe": ["esentepe", "asentepe"],
+    "ozankoy": ["ozanköy", "ozankoy"],
+    "karsiyaka": ["karşıyaka", "karsiyaka"],
 }
 
 
@@ -22,20 +28,49 @@ REGIONAL_MAP: Dict[str, str] = {
     "alsancak": "kyrenia",
     "bellapais": "kyrenia",
     "esentepe": "kyrenia",
+    "ozankoy": "kyrenia",
+    "karsiyaka": "kyrenia",
 }
 
 
+# Turkish letters that NFKD does not decompose to ASCII (dotless i) or that
+# lowercase incorrectly with str.lower() (dotted capital I).
+_TURKISH_FOLD = str.maketrans({"ı": "i", "İ": "i", "I": "i"})
+
+
+def fold_location_text(raw: Optional[str]) -> str:
+    """Lowercase, strip diacritics and collapse whitespace ("Çatalköy " -> "catalkoy")."""
+    if not raw:
+        return ""
+    t = raw.translate(_TURKISH_FOLD).lower()
+    t = unicodedata.normalize("NFKD", t)
+    t = "".join(ch for ch in t if not unicodedata.combining(ch))
+    return " ".join(t.split())
+
+
+# Folded alias -> canonical name, built once at import.
+_ALIAS_INDEX: Dict[str, str] = {
+    fold_location_text(name): canon
+    for canon, names in ALIASES.items()
+    for name in [canon, *names]
+}
+
+
+def canonical_location(raw: Optional[str]) -> Optional[str]:
+    """Exact (diacritic-insensitive) alias lookup; None when the alias is unknown."""
+    return _ALIAS_INDEX.get(fold_location_text(raw))
+
+
 def normalize_location(raw: Optional[str]) -> Optional[str]:
     if not raw:
         return None
-    t = (raw or "").lower().strip()
+    t = fold_location_text(raw)
     # Exact alias hit
-    for canon, names in ALIASES.items():
-        if t in names:
-            return canon
+    if t in _ALIAS_INDEX:
+        return _ALIAS_INDEX[t]
     # Partial contains
-    for canon, names in ALIASES.items():
-        if any(n in t for n in names):
+    for alias, canon in _ALIAS_INDEX.items():
+        if alias in t:
             return canon
     return raw
 
@@ -46,3 +81,8 @@ def regional_fallback(canon: Optional[str]) -> Optional[str]:
     return REGIONAL_MAP.get(canon)
 
 
+def region_members(canon: Optional[str]) -> Set[str]:
+    """Canonical name plus every area that rolls up to it via REGIONAL_MAP."""
+    if not canon:
+        return set()
+    return {canon, *(area for area, region in REGIONAL_MAP.items() if region == canon)}
@@ -3,9 +3,15 @@ Enterprise-Grade Guardrail System for Multi-Domain AI Agent Platform
 Comprehensive security, compliance, and quality governance
 """
 
+import os
 import re
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
 from datetime import datetime
 import hashlib
 
@@ -13,6 +19,164 @@ from .schemas import GuardrailResult, QualityAssessment
 
 logger = logging.getLogger(__name__)
 
+GUARDRAIL_VERDICT_CACHE_SIZE = int(os.getenv("GUARDRAIL_VERDICT_CACHE_SIZE", "4096"))
+
+# Scan categories in verdict priority order
+GUARDRAIL_CATEGORIES = ("toxicity", "injection", "pii", "out_of_scope")
+
+# ============================================================================
+# COMPILED GUARDRAIL SCANNER
+# ============================================================================
+
+@dataclass(frozen=True)
+class GuardrailScan:
+    """Outcome of one scan: every matched category plus the suspicious flag"""
+    categories: FrozenSet[str]
+    suspicious: bool
+
+
+def normalize_guardrail_text(text: str) -> str:
+    """NFKC + casefold, so full-width or mixed-case variants scan (and cache) alike"""
+    return unicodedata.normalize("NFKC", text or "").casefold()
+
+
+# ``\b(alt|alt|...)\b`` word lists, and the literal / phrase alternatives inside them
+_WORD_LIST_PATTERN = re.compile(r"^\\b\((?:\?:)?([^()]+)\)\\b$")
+_LITERAL_WORD = re.compile(r"^\w+$")
+_LITERAL_PHRASE = re.compile(r"^(\w+)(?:\\s\+\w+)+$")
+_TOKEN = re.compile(r"\w+")
+
+
+class GuardrailScanner:
+    """
+    Single-pass scanner over every guardrail category.
+
+    Patterns are compiled once and split three ways:
+
+    - literal words from ``\\b(a|b|c)\\b`` lists go into one word -> categories
+      table, so a single tokenization of the text answers all of them
+      (``\\bword\\b`` matches exactly when ``word`` is a whole ``\\w+`` token)
+    - literal phrases (``act\\s+as``) are indexed by their first word and only
+      searched when that word occurs in the text
+    - everything else (PII, multi-group rules) becomes one alternation of
+      zero-width lookaheads with one named group per category, walked once
+      with ``finditer``
+
+    Verdicts are memoized in a bounded LRU keyed by a hash of the normalized text.
+    """
+
+    def __init__(self, patterns: Dict[str, List[str]], cache_size: int = GUARDRAIL_VERDICT_CACHE_SIZE):
+        self.categories = tuple(c for c in GUARDRAIL_CATEGORIES if patterns.get(c)) + tuple(
+            c for c in patterns if c not in GUARDRAIL_CATEGORIES and patterns[c]
+        )
+        self._by_category = {
+            category: re.compile("|".join(f"(?:{p})" for p in patterns[category]), re.IGNORECASE)
+            for category in self.categories
+        }
+
+        self._words: Dict[str, FrozenSet[str]] = {}
+        self._phrases: Dict[str, List[Tuple[str, Any]]] = {}
+        residual: Dict[str, List[str]] = {}
+        for category in self.categories:
+            for pattern in patterns[category]:
+                word_list = _WORD_LIST_PATTERN.match(pattern)
+                if not word_list:
+                    residual.setdefault(category, []).append(pattern)
+                    continue
+                for alternative in word_list.group(1).split("|"):
+                    phrase = _LITERAL_PHRASE.match(alternative)
+                    if _LITERAL_WORD.match(alternative):
+                        word = alternative.casefold()
+                        self._words[word] = self._words.get(word, frozenset()) | {category}
+                    elif phrase:
+                        self._phrases.setdefault(phrase.group(1).casefold(), []).append(
+                            (category, re.compile(rf"\b{alternative}\b", re.IGNORECASE))
+                        )
+                    else:
+                        residual.setdefault(category, []).append(rf"\b(?:{alternative})\b")
+
+        self._combined = None
+        if residual:
+            self._combined = re.compile(
+                "|".join(
+                    "(?=(?P<{}>{}))".format(category, "|".join(f"(?:{p})" for p in residual[category]))
+                    for category in self.categories
+                    if category in residual
+                ),
+                re.IGNORECASE,
+            )
+        self._cache_size = max(cache_size, 0)
+        self._cache: "OrderedDict[bytes, GuardrailScan]" = OrderedDict()
+        self._lock = Lock()
+
+    def matches(self, category: str, text: str) -> bool:
+        """Whether a single category matches (used by the per-category checks)"""
+        compiled = self._by_category.get(category)
+        return bool(compiled and compiled.search(normalize_guardrail_text(text)))
+
+    def scan(self, text: str) -> GuardrailScan:
+        normalized = normalize_guardrail_text(text)
+        key = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+        if self._cache_size:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    return cached
+
+        found = set()
+        tokens = set(_TOKEN.findall(normalized))
+        for token in tokens.intersection(self._words):
+            found |= self._words[token]
+        for token in tokens.intersection(self._phrases):
+            for category, phrase in self._phrases[token]:
+                if category not in found and phrase.search(normalized):
+                    found.add(category)
+        if self._combined is not None and len(found) < len(self.categories):
+            for match in self._combined.finditer(normalized):
+                found.add(match.lastgroup)
+                if len(found) == len(self.categories):
+                    break
+        verdict = GuardrailScan(
+            categories=frozenset(found),
+            suspicious=_has_suspicious_patterns(normalized),
+        )
+
+        if self._cache_size:
+            with self._lock:
+                self._cache[key] = verdict
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return verdict
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def _has_suspicious_patterns(text: str) -> bool:
+    """Excessive word repetition or special characters"""
+    # Check for excessive repetition
+    words = text.split()
+    if len(words) > 10:
+        word_counts = {}
+        for word in words:
+            word_counts[word] = word_counts.get(word, 0) + 1
+            if word_counts[word] > len(words) * 0.3:  # 30% repetition
+                return True
+
+    # Check for excessive special characters
+    special_char_count = sum(1 for c in text if not c.isalnum() and not c.isspace())
+    if special_char_count > len(text) * 0.5:  # 50% special characters
+        return True
+
+    return False
+
+
+@lru_cache(maxsize=8)
+def _scanner_for(pattern_sets: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> GuardrailScanner:
+    return GuardrailScanner({category: list(patterns) for category, patterns in pattern_sets})
+
 # ============================================================================
 # ENTERPRISE GUARDRAIL SYSTEM
 # ============================================================================
@@ -27,6 +191,13 @@ class EnterpriseGuardrailSystem:
         self.injection_patterns = self._load_injection_patterns()
         self.pii_patterns = self._load_pii_patterns()
         self.out_of_scope_patterns = self._load_out_of_scope_patterns()
+        # Compiled once per process for a given pattern set
+        self.scanner = _scanner_for((
+            ("toxicity", tuple(self.toxicity_patterns)),
+            ("injection", tuple(self.injection_patterns)),
+            ("pii", tuple(self.pii_patterns)),
+            ("out_of_scope", tuple(self.out_of_scope_patterns)),
+        ))
     
     def _load_toxicity_patterns(self) -> List[str]:
         """Load toxicity detection patterns"""
@@ -86,9 +257,13 @@ class EnterpriseGuardrailSystem:
             user_id=user_id
         )
         
+        # One pass over the text for every category (cached per normalized text)
+        scan = self.scanner.scan(user_input)
+        if scan.categories:
+            logger.warning(f"Guardrail categories matched: {sorted(scan.categories)}")
+
         # Check toxicity
-        toxicity_detected = self._check_toxicity(user_input)
-        if toxicity_detected:
+        if "toxicity" in scan.categories:
             result.toxicity_detected = True
             result.risk_level = "high"
             result.action_taken = "block"
@@ -97,8 +272,7 @@ class EnterpriseGuardrailSystem:
             return result
         
         # Check injection attempts
-        injection_detected = self._check_injection(user_input)
-        if injection_detected:
+        if "injection" in scan.categories:
             result.injection_detected = True
             result.risk_level = "critical"
             result.action_taken = "block"
@@ -107,8 +281,7 @@ class EnterpriseGuardrailSystem:
             return result
         
         # Check PII
-        pii_detected = self._check_pii(user_input)
-        if pii_detected:
+        if "pii" in scan.categories:
             result.pii_detected = True
             result.risk_level = "medium"
             result.action_taken = "escalate"
@@ -117,8 +290,7 @@ class EnterpriseGuardrailSystem:
             return result
         
         # Check out-of-scope
-        out_of_scope = self._check_out_of_scope(user_input)
-        if out_of_scope:
+        if "out_of_scope" in scan.categories:
             result.out_of_scope = True
             result.risk_level = "low"
             result.action_taken = "block"
@@ -132,8 +304,7 @@ class EnterpriseGuardrailSystem:
             result.reason = "Input too long"
         
         # Check for suspicious patterns
-        suspicious = self._check_suspicious_patterns(user_input)
-        if suspicious:
+        if scan.suspicious:
             result.risk_level = "medium"
             result.action_taken = "escalate"
         
@@ -141,56 +312,23 @@ class EnterpriseGuardrailSystem:
     
     def _check_toxicity(self, text: str) -> bool:
         """Check for toxic content"""
-        text_lower = text.lower()
-        for pattern in self.toxicity_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                logger.warning(f"Toxicity detected: {pattern}")
-                return True
-        return False
+        return self.scanner.matches("toxicity", text)
     
     def _check_injection(self, text: str) -> bool:
         """Check for prompt injection attempts"""
-        text_lower = text.lower()
-        for pattern in self.injection_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                logger.warning(f"Injection attempt detected: {pattern}")
-                return True
-        return False
+        return self.scanner.matches("injection", text)
     
     def _check_pii(self, text: str) -> bool:
         """Check for PII (Personally Identifiable Information)"""
-        for pattern in self.pii_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.warning(f"PII detected: {pattern}")
-                return True
-        return False
+        return self.scanner.matches("pii", text)
     
     def _check_out_of_scope(self, text: str) -> bool:
         """Check for out-of-scope requests"""
-        text_lower = text.lower()
-        for pattern in self.out_of_scope_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                logger.warning(f"Out-of-scope request detected: {pattern}")
-                return True
-        return False
+        return self.scanner.matches("out_of_scope", text)
     
     def _check_suspicious_patterns(self, text: str) -> bool:
         """Check for suspicious patterns"""
-        # Check for excessive repetition
-        words = text.split()
-        if len(words) > 10:
-            word_counts = {}
-            for word in words:
-                word_counts[word] = word_counts.get(word, 0) + 1
-                if word_counts[word] > len(words) * 0.3:  # 30% repetition
-                    return True
-        
-        # Check for excessive special characters
-        special_char_count = sum(1 for c in text if not c.isalnum() and not c.isspace())
-        if special_char_count > len(text) * 0.5:  # 50% special characters
-            return True
-        
-        return False
+        return _has_suspicious_patterns(normalize_guardrail_text(text))
 
 # ============================================================================
 # ENTERPRISE QUALITY ASSESSMENT SYSTEM
@@ -501,12 +639,21 @@ class EnterpriseAuditTrail:
 # ENTERPRISE GUARDRAIL ENTRY POINT
 # ============================================================================
 
+_GUARDRAIL_SYSTEM: Optional[EnterpriseGuardrailSystem] = None
+
+
+def get_guardrail_system() -> EnterpriseGuardrailSystem:
+    """Process-wide guardrail system (patterns compiled once)"""
+    global _GUARDRAIL_SYSTEM
+    if _GUARDRAIL_SYSTEM is None:
+        _GUARDRAIL_SYSTEM = EnterpriseGuardrailSystem()
+    return _GUARDRAIL_SYSTEM
+
 def run_enterprise_guardrails(user_input: str, user_id: Optional[str] = None) -> GuardrailResult:
     """
     Enterprise guardrail entry point
     """
-    guardrail_system = EnterpriseGuardrailSystem()
-    return guardrail_system.check_guardrails(user_input, user_id)
+    return get_guardrail_system().check_guardrails(user_input, user_id)
 
 def assess_enterprise_quality(internal_results: List[Dict[str, Any]], 
                             external_results: List[Dict[str, Any]], 
@@ -12,15 +12,49 @@ Expected Performance:
   - Latency: <500ms for 50 candidates
   - Precision@5: 0.85+
   - Recall@10: 0.90+
+
+Index lifecycle:
+  ``HybridIndex`` is the process-wide service behind ``node_hybrid_search``.
+  It owns one persistent Chroma collection (``CHROMA_PERSIST_DIR``) and an
+  ``IncrementalBM25`` whose term statistics are updated per document delta,
+  so ``upsert(listing)`` / ``delete(listing_id)`` (called from
+  ``index_listing_task`` / ``delete_listing_from_index``) never re-tokenize
+  the corpus. Other processes pick up those deltas from the collection when
+  the shared generation counter moves, reading it in pages of
+  ``HYBRID_INDEX_SYNC_PAGE`` documents. See ``scripts/bench_hybrid_index.py``.
+
+  Documents and queries are embedded with the listing indexer's model
+  (``listing_index.get_embeddings``); the batch indexer passes the vectors
+  it already computed for the listing's chunks, so nothing is embedded twice.
 """
 
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
+import heapq
 import logging
+import math
+import os
+import re
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+HYBRID_INDEX_COLLECTION = os.getenv("HYBRID_INDEX_COLLECTION", "listings_hybrid")
+HYBRID_INDEX_GENERATION_KEY = "hybrid_index:generation"
+# Pull window overlap so clock skew between processes never drops a delta
+HYBRID_INDEX_SYNC_SKEW_SECONDS = 5.0
+HYBRID_INDEX_SYNC_PAGE = int(os.getenv("HYBRID_INDEX_SYNC_PAGE", "500"))
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens shared by indexing and querying."""
+    return _TOKEN_RE.findall((text or "").lower())
+
 
 class RetrievalStrategy(Enum):
     """Retrieval strategy identifiers."""
@@ -63,16 +97,20 @@ class SearchResult:
 class DenseRetriever:
     """Dense vector-based retrieval using ChromaDB."""
     
-    def __init__(self, collection_name: str = "listings"):
+    def __init__(self, collection_name: str = "listings", persist_dir: Optional[str] = None):
         """
         Initialize dense retriever.
         
         Args:
             collection_name: ChromaDB collection name
+            persist_dir: Directory for a persistent client (in-memory when omitted)
         """
         try:
             import chromadb
-            self.client = chromadb.Client()
+            if persist_dir:
+                self.client = chromadb.PersistentClient(path=persist_dir)
+            else:
+                self.client = chromadb.Client()
             self.collection = self.client.get_or_create_collection(
                 name=collection_name,
                 metadata={"hnsw:space": "cosine"}
@@ -81,11 +119,29 @@ class DenseRetriever:
             logger.error(f"Failed to initialize ChromaDB: {e}")
             self.collection = None
     
+    def upsert(
+        self,
+        doc_id: str,
+        document: str,
+        metadata: Dict[str, Any],
+        embedding: Optional[List[float]] = None
+    ) -> None:
+        """Insert or replace one document (embedded by the collection unless ``embedding`` is given)."""
+        if self.collection:
+            vectors = {"embeddings": [embedding]} if embedding is not None else {}
+            self.collection.upsert(ids=[doc_id], documents=[document], metadatas=[metadata], **vectors)
+    
+    def delete(self, doc_id: str) -> None:
+        """Remove one document from the collection."""
+        if self.collection:
+            self.collection.delete(ids=[doc_id])
+    
     def search(
         self,
         query_embedding: List[float],
         top_k: int = 10,
-        metadata_filter: Optional[Dict[str, Any]] = None
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        query_text: Optional[str] = None
     ) -> List[SearchResult]:
         """
         Search by vector similarity.
@@ -94,6 +150,7 @@ class DenseRetriever:
             query_embedding: Query embedding vector
             top_k: Number of results to return
             metadata_filter: Optional metadata filter
+            query_text: Embedded by the collection when no query_embedding is given
             
         Returns:
             List of SearchResult objects
@@ -102,14 +159,21 @@ class DenseRetriever:
             logger.warning("ChromaDB collection not available")
             return []
         
+        if query_embedding:
+            query = {"query_embeddings": [query_embedding]}
+        elif query_text:
+            query = {"query_texts": [query_text]}
+        else:
+            return []
+        
         try:
             # Query ChromaDB
             where = self._build_metadata_filter(metadata_filter)
             results = self.collection.query(
-                query_embeddings=[query_embedding],
+                **query,
                 n_results=top_k,
                 where=where if where else None,
-                include=["embeddings", "metadatas", "documents", "distances"]
+                include=["metadatas", "documents", "distances"]
             )
             
             # Convert to SearchResult objects
@@ -152,58 +216,127 @@ class DenseRetriever:
         if "budget_max" in metadata_filter:
             filters["price"] = {"$lte": metadata_filter["budget_max"]}
         
+        if len(filters) > 1:
+            return {"$and": [{key: cond} for key, cond in filters.items()]}
         return filters if filters else None
 
 
+class IncrementalBM25:
+    """
+    Okapi BM25 whose term statistics are maintained per document delta.
+    
+    Postings (term -> {doc_id: tf}), document lengths and the corpus length
+    are adjusted on ``add``/``remove``, so an update costs O(|doc|) instead of
+    a full re-tokenization, and ``scores`` only visits the postings of the
+    query terms. IDF uses the non-negative ``log(1 + (N - df + 0.5) / (df + 0.5))``
+    form so common terms never subtract from a score.
+    """
+    
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.total_length = 0
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+    
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
+    
+    def add(self, doc_id: str, tokens: List[str]) -> None:
+        """Add a document, replacing any previous version of it."""
+        self.remove(doc_id)
+        counts = Counter(tokens)
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        self._doc_terms[doc_id] = tuple(counts)
+        self.doc_lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+    
+    def remove(self, doc_id: str) -> bool:
+        """Subtract a document's statistics; returns False if it was not indexed."""
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return False
+        for term in terms:
+            docs = self.postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self.postings[term]
+        self.total_length -= self.doc_lengths.pop(doc_id)
+        return True
+    
+    def idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.doc_lengths) - df + 0.5) / (df + 0.5))
+    
+    def scores(self, query_tokens: List[str]) -> Dict[str, float]:
+        """BM25 score for every document sharing at least one query term."""
+        if not self.doc_lengths:
+            return {}
+        avgdl = (self.total_length / len(self.doc_lengths)) or 1.0
+        k1, b = self.k1, self.b
+        scores: Dict[str, float] = {}
+        for term in set(query_tokens):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = self.idf(term)
+            for doc_id, tf in docs.items():
+                norm = k1 * (1 - b + b * self.doc_lengths[doc_id] / avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        return scores
+
+
 class SparseRetriever:
-    """Sparse keyword-based retrieval using BM25."""
+    """Sparse keyword-based retrieval using an incrementally maintained BM25."""
     
     def __init__(self):
-        """Initialize sparse retriever (BM25 via rank_bm25)."""
-        try:
-            from rank_bm25 import BM25Okapi
-            self.BM25Okapi = BM25Okapi
-            self.corpus = []
-            self.corpus_metadata = []
-            self.bm25 = None
-        except ImportError:
-            logger.warning("rank_bm25 not installed, sparse retrieval unavailable")
-            self.BM25Okapi = None
-            self.bm25 = None
+        """Initialize an empty sparse retriever."""
+        self.bm25 = IncrementalBM25()
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.bm25)
     
     def index(self, documents: List[Dict[str, Any]]) -> None:
         """
-        Build BM25 index from documents.
+        Rebuild the BM25 index from scratch.
         
         Args:
             documents: List of dicts with 'id', 'title', 'content', 'metadata'
         """
-        if not self.BM25Okapi:
-            return
-        
-        try:
-            # Tokenize all documents
-            tokenized_corpus = []
-            self.corpus = []
-            self.corpus_metadata = []
-            
+        with self._lock:
+            self.bm25 = IncrementalBM25(self.bm25.k1, self.bm25.b)
+            self.documents = {}
             for doc in documents:
-                text = f"{doc.get('title', '')} {doc.get('content', '')}".lower()
-                tokens = text.split()
-                tokenized_corpus.append(tokens)
-                self.corpus.append(text)
-                self.corpus_metadata.append({
-                    "id": doc.get("id"),
-                    "title": doc.get("title"),
-                    "content": doc.get("content"),
-                    "metadata": doc.get("metadata", {})
-                })
-            
-            # Build BM25 index
-            self.bm25 = self.BM25Okapi(tokenized_corpus)
-            logger.info(f"Indexed {len(documents)} documents with BM25")
-        except Exception as e:
-            logger.error(f"Failed to build BM25 index: {e}")
+                self._add(doc)
+        logger.info(f"Indexed {len(documents)} documents with BM25")
+    
+    def upsert(self, doc: Dict[str, Any]) -> None:
+        """Add or replace one document without touching the rest of the corpus."""
+        with self._lock:
+            self._add(doc)
+    
+    def remove(self, doc_id: str) -> bool:
+        """Drop one document; returns False if it was not indexed."""
+        with self._lock:
+            self.documents.pop(doc_id, None)
+            return self.bm25.remove(doc_id)
+    
+    def _add(self, doc: Dict[str, Any]) -> None:
+        doc_id = str(doc.get("id"))
+        self.bm25.add(doc_id, tokenize(f"{doc.get('title', '')} {doc.get('content', '')}"))
+        self.documents[doc_id] = {
+            "id": doc_id,
+            "title": doc.get("title"),
+            "content": doc.get("content"),
+            "metadata": doc.get("metadata") or {}
+        }
     
     def search(
         self,
@@ -222,50 +355,40 @@ class SparseRetriever:
         Returns:
             List of SearchResult objects
         """
-        if not self.bm25 or not self.corpus:
+        if not self.bm25:
             logger.warning("BM25 index not available")
             return []
         
         try:
-            # Tokenize query
-            query_tokens = query.lower().split()
-            
-            # Get BM25 scores
-            scores = self.bm25.get_scores(query_tokens)
-            
-            # Get top-k indices
-            top_indices = sorted(
-                range(len(scores)),
-                key=lambda i: scores[i],
-                reverse=True
-            )[:top_k]
-            
-            # Convert to SearchResult objects
-            search_results = []
-            max_score = max(scores) if scores else 1.0
-            
-            for idx in top_indices:
-                if scores[idx] <= 0:
-                    continue
-                
-                # Normalize score to 0-1
-                normalized_score = scores[idx] / max_score if max_score > 0 else 0
+            with self._lock:
+                scores = self.bm25.scores(tokenize(query))
+                if not scores:
+                    return []
+                max_score = max(scores.values())
                 
-                metadata = self.corpus_metadata[idx]["metadata"]
-                
-                # Apply metadata filter if provided
-                if metadata_filter and not self._matches_filter(metadata, metadata_filter):
-                    continue
+                candidates = (
+                    (doc_id, score) for doc_id, score in scores.items()
+                    if score > 0 and (
+                        not metadata_filter
+                        or self._matches_filter(self.documents[doc_id]["metadata"], metadata_filter)
+                    )
+                )
+                top = heapq.nlargest(top_k, candidates, key=lambda item: item[1])
                 
-                search_results.append(SearchResult(
-                    id=self.corpus_metadata[idx]["id"],
-                    title=self.corpus_metadata[idx]["title"],
-                    content=self.corpus_metadata[idx]["content"],
-                    score=normalized_score,
-                    strategy=RetrievalStrategy.SPARSE,
-                    sparse_score=normalized_score,
-                    metadata=metadata
-                ))
+                search_results = []
+                for doc_id, score in top:
+                    # Normalize score to 0-1
+                    normalized_score = score / max_score if max_score > 0 else 0
+                    doc = self.documents[doc_id]
+                    search_results.append(SearchResult(
+                        id=doc_id,
+                        title=doc["title"],
+                        content=doc["content"],
+                        score=normalized_score,
+                        strategy=RetrievalStrategy.SPARSE,
+                        sparse_score=normalized_score,
+                        metadata=doc["metadata"]
+                    ))
             
             return search_results
         except Exception as e:
@@ -297,10 +420,14 @@ class SparseRetriever:
 class HybridSearcher:
     """Orchestrates hybrid search combining dense + sparse + metadata."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        dense: Optional[DenseRetriever] = None,
+        sparse: Optional[SparseRetriever] = None
+    ):
         """Initialize hybrid searcher with dense and sparse retrievers."""
-        self.dense = DenseRetriever()
-        self.sparse = SparseRetriever()
+        self.dense = dense if dense is not None else DenseRetriever()
+        self.sparse = sparse if sparse is not None else SparseRetriever()
         self.weights = {
             "dense": 0.4,      # 40% weight to dense retrieval
             "sparse": 0.3,     # 30% weight to sparse retrieval
@@ -339,7 +466,8 @@ class HybridSearcher:
             dense_results = self.dense.search(
                 query_embedding,
                 top_k=top_k * 2,  # Get more candidates to merge
-                metadata_filter=metadata_filter if use_metadata else None
+                metadata_filter=metadata_filter if use_metadata else None,
+                query_text=query
             )
             for result in dense_results:
                 all_results[result.id] = result
@@ -464,6 +592,222 @@ def create_hybrid_searcher() -> HybridSearcher:
     return HybridSearcher()
 
 
+def listing_document(listing: Any) -> Dict[str, Any]:
+    """Flatten a ``listings.Listing`` into the hybrid index document shape."""
+    fields = listing.dynamic_fields or {}
+    details = " ".join(
+        f"{key} {value}" for key, value in fields.items()
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool)
+    )
+    category = getattr(listing, "category", None)
+    metadata: Dict[str, Any] = {
+        "listing_pk": str(listing.id),
+        "title": listing.title or "",
+        "location": (listing.location or "").lower(),
+        "type": str(fields.get("property_type") or fields.get("type") or (category.slug if category else "")).lower(),
+        "category": category.slug if category else "",
+        "status": listing.status or "",
+        "currency": listing.currency or "",
+    }
+    if listing.price is not None:
+        metadata["price"] = float(listing.price)
+    if fields.get("bedrooms") is not None:
+        try:
+            metadata["bedrooms"] = int(fields["bedrooms"])
+        except (TypeError, ValueError):
+            pass
+    return {
+        "id": str(listing.id),
+        "title": listing.title or "",
+        "content": f"{listing.description or ''} {details}".strip(),
+        "metadata": metadata,
+    }
+
+
+def _default_persist_dir() -> Optional[str]:
+    try:
+        from django.conf import settings
+
+        return getattr(settings, "CHROMA_PERSIST_DIR", None)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+class HybridIndex:
+    """
+    Long-lived hybrid index: one persistent Chroma collection plus an
+    incrementally maintained BM25.
+    
+    The process that applies a delta updates both sides directly and bumps a
+    generation counter in the Django cache. Other processes notice the bump on
+    their next query and pull only documents indexed since their last sync;
+    deletions are reconciled when the collection count disagrees with the
+    local BM25 size.
+    
+    ``embeddings`` (``embed_query``/``embed_documents``) embeds queries and
+    documents that arrive without a vector; without it the collection's own
+    embedding function is used.
+    """
+    
+    def __init__(
+        self,
+        collection_name: str = HYBRID_INDEX_COLLECTION,
+        persist_dir: Optional[str] = None,
+        dense: Optional[DenseRetriever] = None,
+        embeddings: Any = None
+    ):
+        self.dense = dense if dense is not None else DenseRetriever(
+            collection_name, persist_dir=persist_dir or _default_persist_dir()
+        )
+        self.embeddings = embeddings
+        self.sparse = SparseRetriever()
+        self.searcher = HybridSearcher(dense=self.dense, sparse=self.sparse)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._generation: Optional[int] = None
+        self._synced_at = 0.0
+    
+    def __len__(self) -> int:
+        return len(self.sparse)
+    
+    def upsert(self, listing: Any, embedding: Optional[List[float]] = None) -> Dict[str, Any]:
+        """Index (or re-index) one listing in both retrievers, reusing ``embedding`` when given."""
+        doc = listing if isinstance(listing, dict) else listing_document(listing)
+        metadata = {**doc.get("metadata", {}), "indexed_at": time.time()}
+        text = f"{doc['title']}\n\n{doc['content']}"
+        if embedding is None and self.embeddings is not None and self.dense.collection is not None:
+            embedding = self.embeddings.embed_documents([text])[0]
+        self.dense.upsert(doc["id"], text, metadata, embedding)
+        self.sparse.upsert({**doc, "metadata": metadata})
+        self._bump_generation()
+        return doc
+    
+    def delete(self, listing_id: str) -> bool:
+        """Remove one listing from both retrievers."""
+        listing_id = str(listing_id)
+        self.dense.delete(listing_id)
+        removed = self.sparse.remove(listing_id)
+        self._bump_generation()
+        return removed
+    
+    def rebuild(self, documents: List[Dict[str, Any]]) -> None:
+        """Cold rebuild of the sparse side (bootstrap and benchmarks only)."""
+        self.sparse.index(documents)
+        with self._lock:
+            self._loaded = True
+            self._synced_at = time.time()
+    
+    def search(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        top_k: int = 10
+    ) -> List[SearchResult]:
+        """Hybrid search over the live index."""
+        self.sync()
+        if not query_embedding and self.embeddings is not None and self.dense.collection is not None:
+            try:
+                query_embedding = self.embeddings.embed_query(query)
+            except Exception as e:
+                logger.warning(f"Hybrid query embedding failed, the collection embeds the text: {e}")
+        return self.searcher.search(
+            query=query,
+            query_embedding=query_embedding or [],
+            metadata_filter=metadata_filter,
+            top_k=top_k
+        )
+    
+    def sync(self) -> None:
+        """Apply deltas written by other processes since the last sync."""
+        collection = self.dense.collection
+        if collection is None:
+            return
+        generation = self._shared_generation()
+        with self._lock:
+            if self._loaded and generation == self._generation:
+                return
+            try:
+                since = 0.0 if not self._loaded else self._synced_at - HYBRID_INDEX_SYNC_SKEW_SECONDS
+                started = time.time()
+                where = {"indexed_at": {"$gt": since}} if self._loaded else None
+                offset = 0
+                while True:
+                    page = collection.get(
+                        where=where,
+                        include=["documents", "metadatas"],
+                        limit=HYBRID_INDEX_SYNC_PAGE,
+                        offset=offset
+                    )
+                    for doc_id, text, metadata in zip(page["ids"], page["documents"], page["metadatas"]):
+                        title, _, content = (text or "").partition("\n\n")
+                        self.sparse.upsert({"id": doc_id, "title": title, "content": content, "metadata": metadata or {}})
+                    if len(page["ids"]) < HYBRID_INDEX_SYNC_PAGE:
+                        break
+                    offset += len(page["ids"])
+                if collection.count() != len(self.sparse):
+                    live = set(collection.get(include=[])["ids"])
+                    for doc_id in list(self.sparse.documents):
+                        if doc_id not in live:
+                            self.sparse.remove(doc_id)
+                self._loaded = True
+                self._generation = generation
+                self._synced_at = started
+            except Exception as e:
+                logger.error(f"Hybrid index sync failed: {e}")
+    
+    def _shared_generation(self) -> Optional[int]:
+        try:
+            from django.core.cache import cache
+
+            return cache.get(HYBRID_INDEX_GENERATION_KEY)
+        except Exception:  # noqa: BLE001
+            return None
+    
+    def _bump_generation(self) -> None:
+        try:
+            from django.core.cache import cache
+
+            if cache.add(HYBRID_INDEX_GENERATION_KEY, 1, timeout=None):
+                generation = 1
+            else:
+                generation = cache.incr(HYBRID_INDEX_GENERATION_KEY)
+        except Exception:  # noqa: BLE001
+            return
+        with self._lock:
+            # Our own delta is already applied; only skip ahead if nothing else moved
+            if self._loaded and self._generation is not None and generation == self._generation + 1:
+                self._generation = generation
+
+
+class _ListingEmbeddings:
+    """The listing indexer's process-wide model, loaded on first use."""
+    
+    def embed_query(self, text: str) -> List[float]:
+        from .listing_index import get_embeddings
+        
+        return get_embeddings().embed_query(text)
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        from .listing_index import get_embeddings
+        
+        return get_embeddings().embed_documents(texts)
+
+
+_HYBRID_INDEX: Optional[HybridIndex] = None
+_HYBRID_INDEX_LOCK = threading.Lock()
+
+
+def get_hybrid_index() -> HybridIndex:
+    """Process-wide HybridIndex, created on first use."""
+    global _HYBRID_INDEX
+    if _HYBRID_INDEX is None:
+        with _HYBRID_INDEX_LOCK:
+            if _HYBRID_INDEX is None:
+                _HYBRID_INDEX = HybridIndex(embeddings=_ListingEmbeddings())
+    return _HYBRID_INDEX
+
+
 # Integration with LangGraph graph.py
 def node_hybrid_search(state: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -481,24 +825,18 @@ def node_hybrid_search(state: Dict[str, Any]) -> Dict[str, Any]:
     query_text = transformed.get("rewritten", state.get("user_text", ""))
     query_metadata = state.get("query_metadata", {})
     
-    # Placeholder: query_embedding should come from embedding service
-    # For now, return empty to avoid import errors
+    # Without an upstream embedding the collection embeds query_text itself
     query_embedding = state.get("query_embedding", [])
     
     if not query_text:
         return {**state, "search_results": [], "retrieval_metadata": {}}
     
     try:
-        searcher = create_hybrid_searcher()
-        
-        results = searcher.search(
+        results = get_hybrid_index().search(
             query=query_text,
-            query_embedding=query_embedding if query_embedding else [0] * 1536,
+            query_embedding=query_embedding,
             metadata_filter=query_metadata,
-            top_k=5,
-            use_dense=True,
-            use_sparse=True,
-            use_metadata=True
+            top_k=5
         )
         
         return {
@@ -15,10 +15,11 @@ import uuid
 from typing import Dict, Any, Optional
 from unittest.mock import Mock
 
-from django.conf import settings
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 
+from assistant.caching.llm_cache import LLMResultCache
+from assistant.llm_gateway import get_chat_openai
 from assistant.monitoring.metrics import PerformanceTracker, extract_token_usage
 from .resilience import guarded_llm_call
 
@@ -26,6 +27,33 @@ from .schemas import EnterpriseIntentResult
 
 logger = logging.getLogger(__name__)
 
+# Bump when the classification prompt below changes to invalidate cached intents
+INTENT_PROMPT_VERSION = "v1"
+_INTENT_CACHE = LLMResultCache("intent", version=INTENT_PROMPT_VERSION)
+
+# Known TRNC locations (canonical -> variants)
+_CITY_VARIANTS = {
+    "kyrenia": ["kyrenia", "girne"],
+    "nicosia": ["nicosia", "lefkosha", "lefkoşa"],
+    "famagusta": ["famagusta", "gazimagusa", "gazimağusa"],
+    "iskele": ["iskele", "trikomo"],
+    "lapta": ["lapta"],
+    "alsancak": ["alsancak"],
+    "esentepe": ["esentepe"],
+}
+
+
+def infer_city(text: Optional[str]) -> Optional[str]:
+    """Canonical city named in ``text`` (exact token first, then substring)."""
+    text_l = (text or "").lower().strip()
+    for canon, variants in _CITY_VARIANTS.items():
+        if text_l in variants:
+            return canon
+    for canon, variants in _CITY_VARIANTS.items():
+        if any(v in text_l for v in variants):
+            return canon
+    return None
+
 
 class StructuredIntentParser:
     """
@@ -47,11 +75,13 @@ class StructuredIntentParser:
         self.temperature = temperature
         supervisor_module = sys.modules.get("assistant.brain.supervisor")
         llm_cls = getattr(supervisor_module, "ChatOpenAI", ChatOpenAI)
-        self.llm = llm_cls(
-            model=model,
+        # Usage is already recorded by the PerformanceTracker around each parse
+        self.llm = get_chat_openai(
+            model,
             temperature=temperature,
-            api_key=settings.OPENAI_API_KEY,
             timeout=10,  # 10-second timeout to prevent hanging
+            track_usage=False,
+            llm_cls=llm_cls,
         )
     
     def parse_intent(
@@ -93,6 +123,24 @@ class StructuredIntentParser:
             token_budget = context.get("token_budget", 6000)
             current_token_estimate = context.get("current_token_estimate", 0)
 
+            # Token budget numbers are informational for the model and stay out of the key
+            cache_key = _INTENT_CACHE.key(
+                model=self.model,
+                temperature=self.temperature,
+                inputs={
+                    "message": user_input,
+                    "last_action": last_action,
+                    "history_summary": history_summary,
+                    "language": language,
+                    "location": location,
+                    "active_domain": active_domain,
+                },
+            )
+            cached = _INTENT_CACHE.get(cache_key)
+            if cached is not None:
+                logger.info(f"[{thread_id}] Intent cache hit: {cached.get('intent_type')}")
+                return EnterpriseIntentResult(**cached)
+
             # Build the prompt
             prompt = ChatPromptTemplate.from_template("""
 You are an expert intent classifier for a multi-domain marketplace platform (Easy Islanders).
@@ -258,31 +306,12 @@ EXAMPLES (for disambiguation):
             # Auto-normalize local_lookup attributes: city extraction heuristics
             try:
                 if getattr(result, "intent_type", None) == "local_lookup":
-                    # Known TRNC locations (variants -> canonical)
-                    city_variants = {
-                        "kyrenia": ["kyrenia", "girne"],
-                        "nicosia": ["nicosia", "lefkosha", "lefkoşa"],
-                        "famagusta": ["famagusta", "gazimagusa", "gazimağusa"],
-                        "iskele": ["iskele", "trikomo"],
-                        "lapta": ["lapta"],
-                        "alsancak": ["alsancak"],
-                        "esentepe": ["esentepe"],
-                    }
-                    text_l = (user_input or "").lower().strip()
                     # Ensure attributes dict exists
                     result.attributes = result.attributes or {}
-                    # 1) Single-token exact match
-                    if not result.attributes.get("city") and text_l in {v for vs in city_variants.values() for v in vs}:
-                        for canon, variants in city_variants.items():
-                            if text_l in variants:
-                                result.attributes["city"] = canon
-                                break
-                    # 2) Substring-based heuristic for embedded city names
                     if not result.attributes.get("city"):
-                        for canon, variants in city_variants.items():
-                            if any(v in text_l for v in variants):
-                                result.attributes["city"] = canon
-                                break
+                        city = infer_city(user_input)
+                        if city:
+                            result.attributes["city"] = city
             except Exception:
                 # Defensive: never break routing if normalization fails
                 pass
@@ -301,7 +330,9 @@ EXAMPLES (for disambiguation):
                 f"[{thread_id}] Intent classified: {intent_label} "
                 f"(confidence={confidence_display}, flow={flow_label})"
             )
-            
+
+            if isinstance(result, EnterpriseIntentResult):
+                _INTENT_CACHE.set(cache_key, result.model_dump())
             return result
         
         except Exception as e:
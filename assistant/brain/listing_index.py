@@ -0,0 +1,372 @@
+"""
+Listing chunk index: worker-level vector store and debounced batch indexer.
+
+The embedding model and the ``listings`` Chroma store are process
+singletons, built once per Celery worker process on ``worker_process_init``
+(prefork children) or ``worker_ready`` (threads/solo/gevent pools, where no
+child process is initialised), and lazily on first use elsewhere, so
+indexing never pays a model load.
+
+Listing saves are buffered in the shared cache and coalesced by a delayed
+``flush_listing_index`` task: one flush re-indexes every distinct listing
+saved during the debounce window and writes their chunks in batches of at
+most ``LISTING_INDEX_BATCH_CHUNKS`` chunks. Each batch is embedded once; the
+hybrid index (``hybrid_search.HybridIndex``) reuses those vectors (the mean
+of a listing's chunk vectors) instead of embedding the listing again, and a
+hybrid failure is logged without failing the batch.
+Stale chunks are removed by the ``listing_pk`` metadata filter, so a
+listing whose description shrinks (or is deleted) leaves nothing behind.
+When a batch fails it is retried listing by listing; a listing that still
+fails is logged and skipped so it never holds the buffer back.
+
+Buffer layout:
+    lix:seq         monotonically increasing sequence (cache.incr)
+    lix:done        highest sequence already indexed
+    lix:item:{n}    listing id buffered at sequence ``n``
+    lix:scheduled   set while a flush task is queued (coalesces saves)
+    lix:lock        held by the single active flusher
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+LISTING_INDEX_COLLECTION = "listings"
+EMBEDDING_MODEL_NAME = os.getenv("LISTING_INDEX_EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+BATCHING_ENABLED = os.getenv("LISTING_INDEX_BATCHING", "true").strip().lower() in {"1", "true", "yes", "on"}
+DEBOUNCE_S = float(os.getenv("LISTING_INDEX_DEBOUNCE_MS", "2000")) / 1000.0
+BATCH_CHUNKS = int(os.getenv("LISTING_INDEX_BATCH_CHUNKS", "256"))
+MAX_LISTINGS_PER_FLUSH = int(os.getenv("LISTING_INDEX_MAX_LISTINGS", "500"))
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 50
+BUFFER_TTL = 24 * 3600
+LOCK_TTL = 300
+GAP_ATTEMPTS = 3
+
+_EMBEDDINGS: Any = None
+_VECTOR_STORE: Any = None
+_STORE_LOCK = threading.Lock()
+
+
+def _key(*parts: Any) -> str:
+    return ":".join(["lix", *(str(p) for p in parts)])
+
+
+def persist_dir() -> str:
+    from django.conf import settings
+
+    return getattr(settings, "CHROMA_PERSIST_DIR", os.path.join(settings.BASE_DIR, "data", "chroma_db"))
+
+
+def get_embeddings():
+    """Process-wide sentence-transformers embedding model."""
+    global _EMBEDDINGS
+    if _EMBEDDINGS is None:
+        with _STORE_LOCK:
+            if _EMBEDDINGS is None:
+                from langchain_community.embeddings import HuggingFaceEmbeddings
+
+                _EMBEDDINGS = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL_NAME)
+    return _EMBEDDINGS
+
+
+def get_vector_store():
+    """Process-wide Chroma store for listing chunks (persisted under CHROMA_PERSIST_DIR)."""
+    global _VECTOR_STORE
+    if _VECTOR_STORE is None:
+        embeddings = get_embeddings()
+        with _STORE_LOCK:
+            if _VECTOR_STORE is None:
+                from langchain_community.vectorstores import Chroma
+
+                directory = persist_dir()
+                os.makedirs(directory, exist_ok=True)
+                _VECTOR_STORE = Chroma(
+                    collection_name=LISTING_INDEX_COLLECTION,
+                    embedding_function=embeddings,
+                    persist_directory=directory,
+                )
+    return _VECTOR_STORE
+
+
+def warm_up(**_kwargs: Any) -> None:
+    """Load the embedding model and open the store ahead of the first task."""
+    try:
+        get_vector_store()
+        logger.info("listing_index_warmed", extra={"model": EMBEDDING_MODEL_NAME})
+    except Exception as exc:  # noqa: BLE001 - tasks retry the load lazily
+        logger.warning("listing_index_warm_failed", extra={"error": str(exc)})
+
+
+def _warm_up_ready(sender: Any = None, **kwargs: Any) -> None:
+    """``worker_ready``: warm the worker process unless prefork children do it."""
+    pool = getattr(sender, "pool", None)
+    if pool is not None and type(pool).__module__ == "celery.concurrency.prefork":
+        return
+    warm_up(**kwargs)
+
+
+try:
+    from celery.signals import worker_process_init, worker_ready
+
+    worker_process_init.connect(warm_up, weak=False)
+    worker_ready.connect(_warm_up_ready, weak=False)
+except Exception:  # noqa: BLE001 - celery is optional outside workers
+    pass
+
+
+def listing_metadata(listing: Any) -> Dict[str, Any]:
+    return {
+        "listing_pk": str(listing.id),
+        "owner_id": str(listing.owner_id) if listing.owner_id else "",
+        "category": listing.category.slug if listing.category else "",
+        "location": listing.location or "",
+        "price": str(listing.price or ""),
+        "currency": listing.currency or "",
+        "status": listing.status,
+        "created_at": listing.created_at.isoformat(),
+        "updated_at": listing.updated_at.isoformat(),
+    }
+
+
+def listing_chunks(listing: Any) -> List[Any]:
+    """Split a listing (title + description + dynamic_fields) into chunk Documents."""
+    from langchain_core.documents import Document
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    title = listing.title or f"Listing {listing.id}"
+    dynamic_fields_str = json.dumps(listing.dynamic_fields or {}, ensure_ascii=False)
+    content = f"{title}\n\n{listing.description or ''}\n\nDetails: {dynamic_fields_str}"
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+    return splitter.split_documents([Document(page_content=content, metadata=listing_metadata(listing))])
+
+
+def delete_listing_chunks(listing_ids: Iterable[str], store: Any = None) -> None:
+    """Remove every chunk whose ``listing_pk`` is in ``listing_ids``."""
+    listing_ids = [str(pk) for pk in listing_ids]
+    if not listing_ids:
+        return
+    store = store or get_vector_store()
+    store.delete(where={"listing_pk": {"$in": listing_ids}})
+
+
+def write_chunks(
+    chunks: List[Any], ids: List[str], store: Any = None, batch_size: Optional[int] = None
+) -> List[List[float]]:
+    """
+    Embed and upsert chunks in batches of at most ``batch_size``; returns
+    the chunk vectors in order so callers can reuse them.
+    """
+    store = store or get_vector_store()
+    batch_size = max(1, batch_size or BATCH_CHUNKS)
+    vectors: List[List[float]] = []
+    for start in range(0, len(chunks), batch_size):
+        batch = chunks[start:start + batch_size]
+        embedded = store.embeddings.embed_documents([chunk.page_content for chunk in batch])
+        store._collection.upsert(
+            ids=ids[start:start + batch_size],
+            embeddings=embedded,
+            documents=[chunk.page_content for chunk in batch],
+            metadatas=[chunk.metadata for chunk in batch],
+        )
+        vectors.extend(embedded)
+    return vectors
+
+
+def _mean_vector(vectors: List[List[float]]) -> Optional[List[float]]:
+    if not vectors:
+        return None
+    return [sum(column) / len(vectors) for column in zip(*vectors)]
+
+
+def _update_hybrid(listings: List[Any], vectors: List[Optional[List[float]]], missing: List[str]) -> List[str]:
+    """Mirror the batch into the hybrid index; returns the ids it failed on."""
+    from assistant.brain.hybrid_search import get_hybrid_index
+
+    failed: List[str] = []
+    try:
+        hybrid = get_hybrid_index()
+    except Exception as exc:  # noqa: BLE001 - the chunk store is already written
+        logger.warning("listing_index_hybrid_failed", extra={"error": str(exc)})
+        return [str(listing.id) for listing in listings] + list(missing)
+    for listing, vector in zip(listings, vectors):
+        try:
+            hybrid.upsert(listing, embedding=vector)
+        except Exception as exc:  # noqa: BLE001
+            failed.append(str(listing.id))
+            logger.warning("listing_index_hybrid_failed", extra={"listing_id": str(listing.id), "error": str(exc)})
+    for listing_id in missing:
+        try:
+            hybrid.delete(listing_id)
+        except Exception as exc:  # noqa: BLE001
+            failed.append(listing_id)
+            logger.warning("listing_index_hybrid_failed", extra={"listing_id": listing_id, "error": str(exc)})
+    return failed
+
+
+def index_listings(listing_ids: Iterable[str], store: Any = None) -> Dict[str, Any]:
+    """
+    Re-index ``listing_ids`` in one pass: drop their old chunks, then write
+    the new ones in batches. Ids that no longer exist are only deleted.
+    Hybrid index failures are logged and reported under ``hybrid_failed``.
+    """
+    from listings.models import Listing
+
+    listing_ids = list(dict.fromkeys(str(pk) for pk in listing_ids))
+    if not listing_ids:
+        return {"listings": 0, "chunks": 0, "missing": [], "hybrid_failed": []}
+    listings = list(Listing.objects.select_related("category").filter(id__in=listing_ids))
+    missing = sorted(set(listing_ids) - {str(listing.id) for listing in listings})
+
+    chunks: List[Any] = []
+    ids: List[str] = []
+    counts: List[int] = []
+    for listing in listings:
+        parts = listing_chunks(listing)
+        chunks.extend(parts)
+        ids.extend(f"listing_{listing.id}_chunk_{i}" for i in range(len(parts)))
+        counts.append(len(parts))
+
+    store = store or get_vector_store()
+    delete_listing_chunks(listing_ids, store=store)
+    vectors = write_chunks(chunks, ids, store=store)
+
+    per_listing: List[Optional[List[float]]] = []
+    offset = 0
+    for count in counts:
+        per_listing.append(_mean_vector(vectors[offset:offset + count]))
+        offset += count
+    hybrid_failed = _update_hybrid(listings, per_listing, missing)
+
+    logger.info(
+        "listing_index_written",
+        extra={"listings": len(listings), "chunks": len(vectors), "missing": len(missing), "hybrid_failed": len(hybrid_failed)},
+    )
+    return {"listings": len(listings), "chunks": len(vectors), "missing": missing, "hybrid_failed": hybrid_failed}
+
+
+def enqueue_listing(listing_id: str) -> bool:
+    """
+    Buffer a saved listing for the next batched flush.
+
+    Falls back to the single-listing ``index_listing_task`` when batching is
+    disabled or the cache is unavailable.
+    """
+    listing_id = str(listing_id)
+    if BATCHING_ENABLED:
+        try:
+            cache.add(_key("seq"), 0, timeout=BUFFER_TTL)
+            cache.add(_key("done"), 0, timeout=BUFFER_TTL)
+            seq = cache.incr(_key("seq"))
+            cache.set(_key("item", seq), listing_id, timeout=BUFFER_TTL)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("listing_index_enqueue_failed", extra={"listing_id": listing_id, "error": str(exc)})
+        else:
+            _schedule_flush()
+            return True
+
+    from assistant.tasks import index_listing_task
+
+    index_listing_task.delay(listing_id, action="update")
+    return False
+
+
+def _schedule_flush(countdown: Optional[float] = None) -> None:
+    if not cache.add(_key("scheduled"), 1, timeout=LOCK_TTL):
+        return  # the queued flush will pick this listing up
+    try:
+        from assistant.tasks import flush_listing_index
+
+        flush_listing_index.apply_async(countdown=DEBOUNCE_S if countdown is None else countdown)
+    except Exception as exc:  # noqa: BLE001 - broker outage: stays buffered for the next save
+        cache.delete(_key("scheduled"))
+        logger.warning("listing_index_schedule_failed", extra={"error": str(exc)})
+
+
+def pending_count() -> int:
+    return max(int(cache.get(_key("seq"), 0)) - int(cache.get(_key("done"), 0)), 0)
+
+
+def _read_batch(done: int, head: int) -> tuple[List[str], int]:
+    """Return the buffered listing ids after ``done`` and the last sequence consumed."""
+    seqs = list(range(done + 1, min(head, done + MAX_LISTINGS_PER_FLUSH) + 1))
+    items = cache.get_many([_key("item", s) for s in seqs])
+    batch: List[str] = []
+    last = done
+    for seq in seqs:
+        listing_id = items.get(_key("item", seq))
+        if listing_id is None:
+            if batch:
+                break
+            # Not stored yet by a concurrent enqueue, or evicted
+            gap_key = _key("gap", seq)
+            cache.add(gap_key, 0, timeout=LOCK_TTL)
+            if cache.incr(gap_key) < GAP_ATTEMPTS:
+                break
+            last = seq
+            continue
+        batch.append(listing_id)
+        last = seq
+    return batch, last
+
+
+def _index_batch(batch: List[str], store: Any = None) -> int:
+    """Index ``batch``; on failure retry per listing, skipping the ones that still fail."""
+    try:
+        return index_listings(batch, store=store)["listings"]
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("listing_index_batch_failed", extra={"listings": len(batch), "error": str(exc)})
+    indexed = 0
+    for listing_id in dict.fromkeys(batch):
+        try:
+            indexed += index_listings([listing_id], store=store)["listings"]
+        except Exception as exc:  # noqa: BLE001
+            logger.error("listing_index_skipped", extra={"listing_id": listing_id, "error": str(exc)})
+    return indexed
+
+
+def flush_pending(store: Any = None) -> int:
+    """Index every buffered listing; returns the number of distinct listings indexed."""
+    cache.delete(_key("scheduled"))
+    lock_key = _key("lock")
+    if not cache.add(lock_key, 1, timeout=LOCK_TTL):
+        _schedule_flush()
+        return 0
+
+    indexed = 0
+    try:
+        while True:
+            done = int(cache.get(_key("done"), 0))
+            head = int(cache.get(_key("seq"), 0))
+            if head <= done:
+                break
+            batch, last = _read_batch(done, head)
+            if last == done:
+                _schedule_flush(countdown=DEBOUNCE_S)
+                break
+            if batch:
+                indexed += _index_batch(batch, store=store)
+            cache.set(_key("done"), last, timeout=BUFFER_TTL)
+            cache.delete_many([_key("item", s) for s in range(done + 1, last + 1)])
+        return indexed
+    finally:
+        cache.delete(lock_key)
+
+
+__all__ = [
+    "delete_listing_chunks",
+    "enqueue_listing",
+    "flush_pending",
+    "get_embeddings",
+    "get_vector_store",
+    "index_listings",
+    "listing_chunks",
+    "write_chunks",
+]
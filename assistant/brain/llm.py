@@ -1,32 +1,28 @@
 from typing import Any, Dict
-import os
 
-from django.conf import settings
+from assistant.llm_gateway import OpenAIUnavailableError, get_chat_openai
 from .config import OPENAI_CHAT_MODEL, DEFAULT_REQUEST_TIMEOUT_SECONDS, DEFAULT_MAX_RETRIES
 
 
 def get_chat_model() -> Any:
-    """Create a LangChain ChatOpenAI model lazily.
+    """Return the shared LangChain ChatOpenAI model (see assistant.llm_gateway).
 
     Returns Any to avoid hard dependency at import time if not installed.
     """
     try:
-        from langchain_openai import ChatOpenAI
+        import langchain_openai  # noqa: F401
     except Exception as e:
         raise RuntimeError("langchain-openai is not installed") from e
 
-    # Try Django settings first, then fall back to environment variable
-    api_key = getattr(settings, 'OPENAI_API_KEY', None) or os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY is not set")
-
-    return ChatOpenAI(
-        api_key=api_key,
-        model=OPENAI_CHAT_MODEL,
-        temperature=0.2,
-        timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
-        max_retries=DEFAULT_MAX_RETRIES,
-    )
+    try:
+        return get_chat_openai(
+            OPENAI_CHAT_MODEL,
+            temperature=0.2,
+            timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+            max_retries=DEFAULT_MAX_RETRIES,
+        )
+    except OpenAIUnavailableError as e:
+        raise RuntimeError("OPENAI_API_KEY is not set") from e
 
 
 def with_json_mode(model: Any) -> Any:
@@ -0,0 +1,155 @@
+"""
+Per-node timing and turn budget for the supervisor graph.
+
+``timed_node(name)`` wraps a graph node, or a ``state -> state`` helper a
+node calls, and on every call:
+
+- opens an OpenTelemetry span ``supervisor.node.<name>`` (a no-op when
+  OTel is off);
+- observes ``supervisor_node_latency_seconds{node=<name>}``;
+- adds the elapsed milliseconds to ``state["node_timings"][name]`` when the
+  wrapped callable takes and returns a state mapping. Helpers called from a
+  node are counted on their own and inside the node's total.
+
+The entry node is declared with ``turn_start=True``: it stamps
+``turn_started_at`` and resets ``node_timings`` / ``budget_skipped`` so the
+breakdown covers one turn.
+
+Every node has a soft deadline (``SUPERVISOR_NODE_DEADLINES_MS``, e.g.
+``"fuse_context=50,roll_summary=1000"``). Overruns are logged and counted,
+never interrupted. Nodes declared ``optional=True`` are skipped when less
+than their deadline is left of ``SUPERVISOR_TURN_BUDGET_MS``: the state
+passes through unchanged (so the previous turn's value is kept) and the node
+name is appended to ``budget_skipped``.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from assistant.monitoring.metrics import (
+    inc_node_deadline_exceeded,
+    inc_node_skipped,
+    observe_node_latency,
+)
+from assistant.monitoring.otel_instrumentation import create_node_span
+
+logger = logging.getLogger(__name__)
+
+BUDGET_ENABLED: bool = os.getenv("SUPERVISOR_TURN_BUDGET_ENABLED", "true").lower() in {"1", "true", "yes", "on"}
+TURN_BUDGET_MS: float = float(os.getenv("SUPERVISOR_TURN_BUDGET_MS", "5000"))
+
+DEFAULT_DEADLINES_MS: Dict[str, float] = {
+    "supervisor": 1500.0,
+    "route": 800.0,
+    "roll_summary": 1000.0,
+    "fuse_context": 50.0,
+    "persist_context_snapshot": 50.0,
+    "rehydrate_state": 500.0,
+    "real_estate_agent": 4000.0,
+    "marketplace_agent": 3000.0,
+    "general_conversation_agent": 3000.0,
+    "local_info_agent": 2000.0,
+}
+
+
+def _parse_deadlines(raw: str) -> Dict[str, float]:
+    deadlines: Dict[str, float] = {}
+    for item in raw.split(","):
+        name, _, value = item.partition("=")
+        try:
+            deadlines[name.strip()] = float(value)
+        except ValueError:
+            if item.strip():
+                logger.warning("Ignoring malformed SUPERVISOR_NODE_DEADLINES_MS entry %r", item)
+    return deadlines
+
+
+DEADLINES_MS: Dict[str, float] = {
+    **DEFAULT_DEADLINES_MS,
+    **_parse_deadlines(os.getenv("SUPERVISOR_NODE_DEADLINES_MS", "")),
+}
+
+
+def deadline_ms(name: str) -> Optional[float]:
+    return DEADLINES_MS.get(name)
+
+
+def remaining_ms(state: Mapping[str, Any], now: Optional[float] = None) -> Optional[float]:
+    """Milliseconds left of the turn budget, or None outside a timed turn."""
+    started = state.get("turn_started_at")
+    if not started:
+        return None
+    return TURN_BUDGET_MS - ((now or time.time()) - started) * 1000.0
+
+
+def _should_skip(name: str, state: Mapping[str, Any]) -> bool:
+    if not BUDGET_ENABLED:
+        return False
+    left = remaining_ms(state)
+    return left is not None and left <= (deadline_ms(name) or 0.0)
+
+
+def _with_timing(result: Dict[str, Any], state: Mapping[str, Any], name: str, elapsed_ms: float) -> Dict[str, Any]:
+    timings = dict(result.get("node_timings") or state.get("node_timings") or {})
+    timings[name] = round(timings.get(name, 0.0) + elapsed_ms, 3)
+    updated = {**result, "node_timings": timings}
+    for key in ("turn_started_at", "budget_skipped"):
+        if key not in updated and key in state:
+            updated[key] = state[key]
+    return updated
+
+
+def timed_node(name: str, optional: bool = False, turn_start: bool = False) -> Callable:
+    """Decorator: span + latency histogram + per-turn breakdown + soft deadline for a graph node."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            state = args[0] if args and isinstance(args[0], Mapping) else None
+            if state is not None and turn_start:
+                state = {**state, "turn_started_at": time.time(), "node_timings": {}, "budget_skipped": []}
+                args = (state, *args[1:])
+
+            if state is not None and optional and _should_skip(name, state):
+                inc_node_skipped(name)
+                logger.info(
+                    "[%s] Turn budget spent (%.0f ms left); skipping optional node %s",
+                    state.get("thread_id"),
+                    remaining_ms(state),
+                    name,
+                )
+                return {**state, "budget_skipped": [*(state.get("budget_skipped") or []), name]}
+
+            started = time.perf_counter()
+            with create_node_span(name, state.get("thread_id") if state is not None else None) as span:
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - started
+                    observe_node_latency(name, elapsed)
+                    limit = deadline_ms(name)
+                    if limit is not None and elapsed * 1000.0 > limit:
+                        inc_node_deadline_exceeded(name)
+                        span.set_attribute("node.deadline_exceeded", True)
+                        logger.warning(
+                            "[%s] Node %s took %.0f ms (soft deadline %.0f ms)",
+                            state.get("thread_id") if state is not None else None,
+                            name,
+                            elapsed * 1000.0,
+                            limit,
+                        )
+
+            if state is not None and isinstance(result, Mapping):
+                return _with_timing(dict(result), state, name, elapsed * 1000.0)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = ["DEADLINES_MS", "TURN_BUDGET_MS", "deadline_ms", "remaining_ms", "timed_node"]
@@ -22,10 +22,16 @@ import re
 from dataclasses import dataclass, asdict
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
+from assistant.caching.llm_cache import LLMResultCache
+from assistant.llm_gateway import get_chat_openai
 from .resilience import guarded_llm_call
 
 logger = logging.getLogger(__name__)
 
+# Bump when the HyDE prompt changes to invalidate cached hypotheses
+HYDE_PROMPT_VERSION = "v1"
+_HYDE_CACHE = LLMResultCache("hyde", version=HYDE_PROMPT_VERSION)
+
 
 @dataclass
 class TransformedQuery:
@@ -49,7 +55,8 @@ class QueryTransformer:
             model: OpenAI model to use (cheaper mini model for speed)
             temperature: LLM temperature (0.7 for creative expansion)
         """
-        self.llm = ChatOpenAI(model=model, temperature=temperature)
+        self.llm = get_chat_openai(model, temperature=temperature, agent="query_transformer", llm_cls=ChatOpenAI)
+        self.model = model
         self.temperature = temperature
         
     def transform(self, query: str) -> TransformedQuery:
@@ -119,6 +126,11 @@ Focus on concrete details: type, location, price, features.""")
 
 Listing:""")
             
+            cache_key = _HYDE_CACHE.key(model=self.model, inputs={"query": query}, temperature=self.temperature)
+            cached = _HYDE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
             response = guarded_llm_call(lambda: self.llm.invoke([system_msg, user_msg]))
             if isinstance(response, dict) and response.get("fallback"):
                 return query
@@ -127,6 +139,8 @@ Listing:""")
             # Ensure it's not too long
             if len(hypothesis) > 300:
                 hypothesis = hypothesis[:300]
+            if hypothesis:
+                _HYDE_CACHE.set(cache_key, hypothesis)
             
             logger.debug(f"Generated hypothesis: {hypothesis[:80]}...")
             return hypothesis
@@ -173,18 +173,31 @@ def handle_real_estate_prompt_driven(state: SupervisorState) -> SupervisorState:
     # Step 3: Call LLM
     prompt_start_time = time.time()
     try:
-        from assistant.llm import generate_chat_completion
-
-        llm_response_text = generate_chat_completion(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_input}
-            ],
-            temperature=0.7,
-            max_tokens=500,
-            # Encourage strict JSON from the model
-            response_format={"type": "json_object"}
-        )
+        from assistant.llm import generate_chat_completion, stream_chat_completion
+        from assistant.utils.streaming import SpeakFieldExtractor, emit_delta, streaming_active
+
+        llm_messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_input}
+        ]
+        if streaming_active():
+            # Stream only the user-facing "speak" text out of the JSON reply
+            speak_stream = SpeakFieldExtractor()
+            llm_response_text = stream_chat_completion(
+                messages=llm_messages,
+                on_delta=lambda chunk: emit_delta(speak_stream.feed(chunk)),
+                temperature=0.7,
+                max_tokens=500,
+                response_format={"type": "json_object"}
+            )
+        else:
+            llm_response_text = generate_chat_completion(
+                messages=llm_messages,
+                temperature=0.7,
+                max_tokens=500,
+                # Encourage strict JSON from the model
+                response_format={"type": "json_object"}
+            )
 
         prompt_duration_ms = (time.time() - prompt_start_time) * 1000
         record_prompt_duration(prompt_duration_ms)
@@ -0,0 +1,156 @@
+"""
+Rehydration snapshot served to WebSocket clients on (re)connect.
+
+``ChatConsumer.connect`` runs on the ASGI event loop, while the underlying
+sources (Zep queries, the supervisor checkpointer) are blocking. This module
+builds the payload on a small bounded thread pool, runs the Zep lookups and
+the checkpoint read concurrently, caches the result per thread so reconnect
+storms after a deploy do not fan out to Zep, and gives the caller an
+awaitable with a hard time budget.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+REHYDRATE_BUDGET_S = float(os.getenv("WS_REHYDRATE_BUDGET_MS", "1500")) / 1000.0
+REHYDRATE_CACHE_TTL = int(os.getenv("WS_REHYDRATE_CACHE_TTL", "30"))
+REHYDRATE_MAX_WORKERS = int(os.getenv("WS_REHYDRATE_MAX_WORKERS", "8"))
+
+_CACHE_PREFIX = "ws_rehydrate"
+
+# Bounded so a slow Zep can tie up at most this many threads, never the loop.
+_EXECUTOR = ThreadPoolExecutor(max_workers=REHYDRATE_MAX_WORKERS, thread_name_prefix="ws-rehydrate")
+# Separate pool for the checkpoint read issued from inside a build, so nested
+# submissions can never starve the outer pool.
+_LOOKUP_EXECUTOR = ThreadPoolExecutor(max_workers=REHYDRATE_MAX_WORKERS, thread_name_prefix="ws-rehydrate-ckpt")
+
+# In-flight builds per thread: concurrent connects share one fetch.
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.RLock()  # re-entrant: done callbacks may fire inside _submit
+
+
+def _cache_key(thread_id: str) -> str:
+    return f"{_CACHE_PREFIX}:{thread_id}"
+
+
+def invalidate_rehydration(thread_id: str) -> None:
+    """Drop the cached snapshot after a turn changes the thread state."""
+    try:
+        cache.delete(_cache_key(str(thread_id)))
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("ws_rehydrate_invalidate_failed: %s", exc)
+
+
+def _prune_checkpoint(checkpoint_state: Dict[str, Any]) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {}
+    agent_contexts = checkpoint_state.get("agent_contexts", {}) or {}
+    if agent_contexts:
+        # Prune agent contexts to essential fields only
+        payload["agent_contexts"] = {
+            agent_name: {
+                "filled_slots": agent_ctx.get("filled_slots", {}),
+                "stage": agent_ctx.get("stage"),
+                "awaiting_slot": agent_ctx.get("awaiting_slot"),
+            }
+            for agent_name, agent_ctx in agent_contexts.items()
+            if isinstance(agent_ctx, dict)
+        }
+
+    # Add shared context (location, budget, etc.)
+    shared_context = {}
+    re_ctx = agent_contexts.get("real_estate_agent", {})
+    if isinstance(re_ctx, dict):
+        filled_slots = re_ctx.get("filled_slots", {})
+        if "location" in filled_slots:
+            shared_context["user_location"] = filled_slots["location"]
+        if "budget" in filled_slots:
+            shared_context["user_budget"] = filled_slots["budget"]
+    payload["shared_context"] = shared_context
+
+    # Add recent turns (last 3 exchanges, user + assistant)
+    messages = checkpoint_state.get("messages", [])
+    if messages:
+        payload["recent_turns"] = [
+            {
+                "role": msg.get("role"),
+                "content": str(msg.get("content", ""))[:200],
+            }
+            for msg in messages[-6:]
+        ]
+    return payload
+
+
+def build_rehydration_snapshot(thread_id: str) -> Dict[str, Any]:
+    """Build the rehydration payload (blocking); Zep and checkpoint reads run concurrently."""
+    from assistant.brain.supervisor_graph import _get_checkpoint_state, rehydrate_state
+
+    checkpoint_future = _LOOKUP_EXECUTOR.submit(_get_checkpoint_state, thread_id)
+    rehydrated = rehydrate_state(thread_id)
+
+    payload: Dict[str, Any] = {
+        "type": "rehydration",
+        "thread_id": thread_id,
+        "rehydrated": rehydrated.get("rehydrated", False),
+        "active_domain": rehydrated.get("active_domain"),
+        "current_intent": rehydrated.get("current_intent"),
+        "conversation_summary": (rehydrated.get("conversation_summary") or "")[:500],
+        "turn_count": rehydrated.get("turn_count", 0),
+    }
+    try:
+        checkpoint_state = checkpoint_future.result()
+        if checkpoint_state:
+            payload.update(_prune_checkpoint(checkpoint_state))
+    except Exception as checkpoint_error:
+        logger.debug(
+            "ws_connect_checkpoint_fetch_failed",
+            extra={"thread_id": thread_id, "error": str(checkpoint_error)}
+        )
+    return payload
+
+
+def _cached_snapshot(thread_id: str) -> Dict[str, Any]:
+    key = _cache_key(thread_id)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    payload = build_rehydration_snapshot(thread_id)
+    cache.set(key, payload, timeout=REHYDRATE_CACHE_TTL)
+    return payload
+
+
+def _submit(thread_id: str) -> Future:
+    with _inflight_lock:
+        future = _inflight.get(thread_id)
+        if future is None:
+            future = _EXECUTOR.submit(_cached_snapshot, thread_id)
+            _inflight[thread_id] = future
+            future.add_done_callback(lambda _f: _drop_inflight(thread_id, _f))
+        return future
+
+
+def _drop_inflight(thread_id: str, future: Future) -> None:
+    with _inflight_lock:
+        if _inflight.get(thread_id) is future:
+            del _inflight[thread_id]
+
+
+async def get_rehydration_snapshot(thread_id: str, *, budget: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Return the rehydration payload without blocking the event loop.
+
+    Raises ``asyncio.TimeoutError`` when the snapshot is not ready within
+    ``budget`` seconds; the build keeps running in the pool and fills the
+    cache for the next connect.
+    """
+    future = asyncio.wrap_future(_submit(str(thread_id)))
+    payload = await asyncio.wait_for(asyncio.shield(future), timeout=budget or REHYDRATE_BUDGET_S)
+    return dict(payload)
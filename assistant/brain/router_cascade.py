@@ -0,0 +1,252 @@
+"""
+Confidence-gated routing cascade for ``CentralSupervisor.route_request``.
+
+Stage ``local``: the context-primed heuristic router (``intent_router``)
+scores the turn in-process. Its logits are sharpened with
+``ROUTER_CASCADE_TEMPERATURE`` into a calibrated confidence, and the winner
+is accepted when that confidence clears the domain's τ from
+``config/router_thresholds.yaml`` and the intent's slots can be filled
+in-process (``_LOCAL_SLOTS``); the language is detected with the same
+heuristic as the language preprocessor.
+
+Stage ``llm``: anything ambiguous falls through to
+``intent_parser.parse_intent_robust`` (structured gpt-4o-mini call).
+
+Every turn increments ``router_cascade_total{stage,domain}``.
+``evaluate_corpus`` replays ``scripts/router_eval_corpus.json`` and reports
+the local hit rate and accuracy (see ``scripts/eval_router_cascade.py``).
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .schemas import EnterpriseIntentResult
+
+logger = logging.getLogger(__name__)
+
+ROUTER_CASCADE_TEMPERATURE = float(os.getenv("ROUTER_CASCADE_TEMPERATURE", "0.4"))
+DEFAULT_TAU = 0.72
+
+CORPUS_PATH = Path(__file__).resolve().parents[2] / "scripts" / "router_eval_corpus.json"
+
+# intent_router label -> (threshold domain, intent_type, category)
+_LOCAL_INTENTS: Dict[str, Tuple[str, str, str]] = {
+    "property_search": ("real_estate", "property_search", "PROPERTY"),
+    "vehicle_search": ("marketplace", "vehicle_search", "VEHICLE"),
+    "local_lookup": ("local_info", "local_lookup", "KNOWLEDGE_QUERY"),
+    "general_help": ("general_conversation", "general_chat", "CONVERSATION"),
+}
+
+
+def _real_estate_slots(user_input: str) -> Dict[str, Any]:
+    from assistant.domain.real_estate_service import extract_slots
+
+    return extract_slots(user_input)
+
+
+def _marketplace_slots(user_input: str) -> Dict[str, Any]:
+    from .supervisor_graph import _extract_entities
+
+    return _extract_entities(user_input, {})
+
+
+def _local_lookup_slots(user_input: str) -> Dict[str, Any]:
+    from .intent_parser import infer_city
+
+    city = infer_city(user_input)
+    return {"city": city} if city else {}
+
+
+# intent_type -> in-process slot extractor (the one the intent's agent uses).
+# Downstream agents read their filters from ``attributes`` (stored as
+# ``extracted_criteria``), so an intent missing here always goes to the LLM.
+_LOCAL_SLOTS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "property_search": _real_estate_slots,
+    "vehicle_search": _marketplace_slots,
+    "local_lookup": _local_lookup_slots,
+    "general_chat": lambda _text: {},
+}
+
+
+def _resolve_enabled() -> bool:
+    try:
+        from django.conf import settings
+
+        value = getattr(settings, "ROUTER_CASCADE_ENABLED", None)
+        if value is not None:
+            return bool(value)
+    except Exception:  # noqa: BLE001
+        pass
+    return os.getenv("ROUTER_CASCADE_ENABLED", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+
+@lru_cache(maxsize=1)
+def domain_thresholds() -> Dict[str, float]:
+    """Per-domain τ from ``config/router_thresholds.yaml`` (flat or ``domains: {d: {tau}}``)."""
+    from .config import load_router_thresholds
+
+    raw = load_router_thresholds() or {}
+    nested = raw.get("domains") if isinstance(raw.get("domains"), dict) else None
+    thresholds: Dict[str, float] = {}
+    for domain, value in (nested or raw).items():
+        if isinstance(value, dict):
+            value = value.get("tau")
+        try:
+            thresholds[domain] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return thresholds
+
+
+def calibrated_probs(logits: Dict[str, float], temperature: float = ROUTER_CASCADE_TEMPERATURE) -> Dict[str, float]:
+    """Temperature-scaled softmax over the heuristic router's logits."""
+    if not logits:
+        return {}
+    t = max(temperature, 1e-3)
+    top = max(logits.values())
+    exps = {k: math.exp((v - top) / t) for k, v in logits.items()}
+    total = sum(exps.values())
+    return {k: v / total for k, v in exps.items()}
+
+
+def local_classify(user_input: str, state: Dict[str, Any], fused_context: str = "") -> Dict[str, Any]:
+    """
+    Score a turn with the local router; ``accepted`` is True when τ is
+    cleared and the intent's slots can be extracted locally.
+    """
+    from . import intent_router
+
+    label, _agent, _conf, evidence = intent_router.classify({
+        "user_input": user_input,
+        "fused_context": fused_context,
+        "active_domain": state.get("active_domain"),
+    })
+    probs = calibrated_probs(evidence.get("logits") or {})
+    confidence = float(probs.get(label, 0.0))
+    domain, intent_type, category = _LOCAL_INTENTS.get(label, _LOCAL_INTENTS["general_help"])
+    tau = domain_thresholds().get(domain, DEFAULT_TAU)
+    return {
+        "label": label,
+        "domain": domain,
+        "intent_type": intent_type,
+        "category": category,
+        "confidence": confidence,
+        "tau": tau,
+        "accepted": confidence >= tau and intent_type in _LOCAL_SLOTS,
+    }
+
+
+def _to_intent_result(decision: Dict[str, Any], user_input: str) -> EnterpriseIntentResult:
+    from .agent import detect_user_language
+
+    attributes = _LOCAL_SLOTS[decision["intent_type"]](user_input)
+    language = detect_user_language(user_input)
+    return EnterpriseIntentResult(
+        intent_type=decision["intent_type"],
+        category=decision["category"],
+        confidence=round(decision["confidence"], 4),
+        reasoning=(
+            f"local_router: {decision['label']} conf={decision['confidence']:.2f} "
+            f">= tau({decision['domain']})={decision['tau']:.2f}"
+        ),
+        input_language=language,
+        user_language=language,
+        attributes=attributes,
+    )
+
+
+_LLM_DOMAINS = {
+    "property_search": "real_estate",
+    "vehicle_search": "marketplace",
+    "product_search": "marketplace",
+    "service_search": "marketplace",
+    "local_lookup": "local_info",
+    "knowledge_query": "general_conversation",
+    "general_chat": "general_conversation",
+    "greeting": "general_conversation",
+}
+
+
+def route_intent(
+    user_input: str,
+    context: Dict[str, Any],
+    thread_id: Optional[str],
+    state: Dict[str, Any],
+    *,
+    fused_context: str = "",
+):
+    """Answer locally when confident, otherwise defer to the LLM intent parser."""
+    from . import intent_parser
+
+    if _resolve_enabled() and user_input:
+        try:
+            decision = local_classify(user_input, state, fused_context)
+        except Exception as exc:  # noqa: BLE001 - the LLM stage is always a valid fallback
+            logger.warning("[%s] Local router failed, deferring to LLM: %s", thread_id, exc)
+            decision = None
+        if decision and decision["accepted"]:
+            _record_stage("local", decision["domain"])
+            logger.info(
+                "[%s] Cascade local hit: %s (conf=%.2f, tau=%.2f)",
+                thread_id, decision["intent_type"], decision["confidence"], decision["tau"],
+            )
+            return _to_intent_result(decision, user_input)
+
+    result = intent_parser.parse_intent_robust(user_input, context, thread_id)
+    _record_stage("llm", _LLM_DOMAINS.get(getattr(result, "intent_type", None), "other"))
+    return result
+
+
+def _record_stage(stage: str, domain: str) -> None:
+    try:
+        from assistant.monitoring.metrics import inc_router_cascade
+
+        inc_router_cascade(stage, domain)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def evaluate_corpus(rows: Optional[Iterable[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Replay labelled turns (``{"x": utterance, "y": intent label}``) through the
+    local stage. Turns it would defer are counted as LLM round-trips; accuracy
+    is measured on the turns the local stage answers.
+    """
+    if rows is None:
+        rows = json.loads(CORPUS_PATH.read_text(encoding="utf-8"))
+    total = local_hits = local_correct = 0
+    per_domain: Dict[str, Dict[str, int]] = {}
+    for row in rows:
+        total += 1
+        decision = local_classify(row["x"], {"active_domain": row.get("active_domain")})
+        if not decision["accepted"]:
+            continue
+        correct = decision["label"] == row["y"]
+        local_hits += 1
+        local_correct += int(correct)
+        bucket = per_domain.setdefault(decision["domain"], {"hits": 0, "correct": 0})
+        bucket["hits"] += 1
+        bucket["correct"] += int(correct)
+    return {
+        "total": total,
+        "local_hits": local_hits,
+        "llm_calls": total - local_hits,
+        "local_hit_rate": local_hits / float(total or 1),
+        "local_accuracy": local_correct / float(local_hits or 1),
+        "per_domain": per_domain,
+    }
+
+
+__all__ = [
+    "calibrated_probs",
+    "domain_thresholds",
+    "evaluate_corpus",
+    "local_classify",
+    "route_intent",
+]
@@ -2,7 +2,7 @@ import logging
 from django.conf import settings
 
 from .supervisor_schemas import SupervisorState, SupervisorRoutingDecision
-from . import intent_parser
+from . import intent_parser, router_cascade
 from .registry import get_registry_client
 
 try:  # Backwards-compatible import so tests can patch ChatOpenAI
@@ -42,7 +42,7 @@ class CentralSupervisor:
         Route incoming user input to appropriate worker agent.
         
         Process:
-        1. Parse intent with structured output (Phase B.1)
+        1. Classify locally when confident, else parse intent with structured output (Phase B.1)
         2. Extract attributes specific to domain
         3. Determine target agent based on intent + flow
         4. Map to specialized worker node
@@ -78,7 +78,10 @@ class CentralSupervisor:
                 "active_domain": state.get("active_domain"),  # STEP 3: Include active domain
             }
 
-            intent_result = intent_parser.parse_intent_robust(user_input, context, thread_id)
+            # Cascade: confident local classification skips the LLM intent parser
+            intent_result = router_cascade.route_intent(
+                user_input, context, thread_id, state, fused_context=router_context
+            )
 
             # Backwards compatibility: accept legacy SupervisorRoutingDecision outputs
             if isinstance(intent_result, SupervisorRoutingDecision) or hasattr(intent_result, "primary_domain"):
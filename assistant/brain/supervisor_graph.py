@@ -8,22 +8,33 @@ user request—heavy lifting is delegated to downstream tools or flows.
 """
 
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
 from django.conf import settings
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
-import tiktoken
 
 from assistant.memory import read_enabled
 from assistant.brain.config import PREFS_APPLY_ENABLED
 from assistant.services.preferences import PreferenceService
 from assistant.memory.service import fetch_thread_context
+from assistant.memory.write_behind import enqueue_messages, redacted
+from assistant.utils.streaming import emit_delta
 from django.core.cache import cache
 
+from .checkpointing import get_checkpoint_saver
 from .supervisor import CentralSupervisor
 from .supervisor_schemas import SupervisorState
+from .token_budget import (
+    DEFAULT_TOKENIZER_MODEL,
+    ContextSegment,
+    count_tokens,
+    render_segments,
+    select_segments,
+    tokenizer_turn,
+    total_tokens,
+)
 from .slot_filling_guard import apply_slot_filling_guard
 from .tools_local import (
     get_on_duty_pharmacies,
@@ -33,6 +44,7 @@ from .tools_local import (
     geocode,
     overpass_pharmacies_near_city,
 )
+from .node_timing import timed_node
 from .observability import traced_supervisor_node, traced_worker_agent
 from .registry import get_registry_client
 # Use consolidated Zep client (official /api/v2/threads/ endpoints)
@@ -40,7 +52,8 @@ from assistant.memory.service import get_client as get_zep_client
 
 logger = logging.getLogger(__name__)
 
-_SUPERVISOR_MEMORY = MemorySaver()
+# Shared across workers (Django cache / Redis), last N checkpoints per thread with TTL
+_SUPERVISOR_MEMORY = get_checkpoint_saver(namespace="supervisor")
 _COMPILED_SUPERVISOR_GRAPH = None
 
 # Lazy-initialize Zep client to use consolidated client from memory service
@@ -117,7 +130,7 @@ def _extract_assistant_text(content: Any) -> str:
 _last_mem_key = None
 
 
-def _zep_store_memory(thread_id: str | None, role: str, content: str) -> None:
+def _zep_store_memory(thread_id: str | None, role: str, content: str, user_id: Any = None) -> None:
     """
     STEP 7.1: Safe Zep memory write with deduplication.
 
@@ -150,11 +163,9 @@ def _zep_store_memory(thread_id: str | None, role: str, content: str) -> None:
 
     _last_mem_key = key
 
-    try:
-        client.add_messages(thread_id, [{"role": role, "content": content_clean}])
-        logger.debug(f"[ZEP] Memory written: {thread_id}:{role} ({len(content_clean)} chars)")
-    except Exception as exc:  # noqa: BLE001
-        logger.debug("[ZEP] add_memory raised: %s", exc)
+    # Write-behind: buffered and flushed in batches off the reply path
+    if enqueue_messages(thread_id, [redacted(role, content_clean)], user_id=user_id):
+        logger.debug(f"[ZEP] Memory queued: {thread_id}:{role} ({len(content_clean)} chars)")
 
 
 def _inject_zep_context(state: SupervisorState) -> SupervisorState:
@@ -201,6 +212,7 @@ def _inject_zep_context(state: SupervisorState) -> SupervisorState:
         return {**state, "retrieved_context": ""}
 
 
+@timed_node("roll_summary", optional=True)
 def _maybe_roll_summary(state: SupervisorState) -> SupervisorState:
     """
     STEP 6: Rolling Summarization - Generate summary every 10 turns.
@@ -257,17 +269,14 @@ def _maybe_roll_summary(state: SupervisorState) -> SupervisorState:
         client = _get_zep_client()
         if thread_id and client:
             try:
-                client.add_messages(
+                enqueue_messages(
                     thread_id,
-                    [{
-                        "role": "system",
-                        "content": f"[CONVERSATION SUMMARY] {summary}",
-                        "metadata": {
-                            "type": "rolling_summary",
-                            "turns": turn_count,
-                            "timestamp": time.time(),
-                        }
-                    }]
+                    [redacted("system", f"[CONVERSATION SUMMARY] {summary}", {
+                        "type": "rolling_summary",
+                        "turns": turn_count,
+                        "timestamp": time.time(),
+                    })],
+                    user_id=state.get("user_id"),
                 )
                 logger.info(
                     "[%s] Rolling summary generated at turn %d (%d chars)",
@@ -332,9 +341,9 @@ def _append_turn_history(state: SupervisorState, assistant_output: Any) -> Super
         except Exception:
             pass
         if appended_user and user_text:
-            _zep_store_memory(thread, "user", str(user_text))
+            _zep_store_memory(thread, "user", str(user_text), user_id=state.get("user_id"))
         if appended_assistant and assistant_text:
-            _zep_store_memory(thread, "assistant", assistant_text)
+            _zep_store_memory(thread, "assistant", assistant_text, user_id=state.get("user_id"))
 
     # STEP 6: Rolling Summarization - Every 10 turns
     if len(history) > 0 and len(history) % 10 == 0:
@@ -347,17 +356,14 @@ def _append_turn_history(state: SupervisorState, assistant_output: Any) -> Super
             client = _get_zep_client()
             if thread and client:
                 try:
-                    client.add_messages(
+                    enqueue_messages(
                         thread,
-                        [{
-                            "role": "system",
-                            "content": f"[CONVERSATION SUMMARY] {summary}",
-                            "metadata": {
-                                "type": "rolling_summary",
-                                "turns": len(history),
-                                "timestamp": time.time(),
-                            }
-                        }]
+                        [redacted("system", f"[CONVERSATION SUMMARY] {summary}", {
+                            "type": "rolling_summary",
+                            "turns": len(history),
+                            "timestamp": time.time(),
+                        })],
+                        user_id=state.get("user_id"),
                     )
                     logger.info(
                         "[%s] Rolling summarization: archived summary at %d turns (%d chars)",
@@ -543,10 +549,13 @@ def _apply_memory_context(state: SupervisorState) -> SupervisorState:
 # STEP 5: Token Budget & Context Window Management
 # ============================================================================
 
-def estimate_tokens(text: str, model: str = "gpt-4-turbo") -> int:
+def estimate_tokens(text: str, model: str = DEFAULT_TOKENIZER_MODEL) -> int:
     """
     Estimate token count for given text using tiktoken.
 
+    The encoder is cached per process and counts are memoized by content
+    hash (see assistant.brain.token_budget).
+
     Args:
         text: Text to estimate tokens for
         model: Model name for tokenizer (default: gpt-4-turbo)
@@ -554,13 +563,7 @@ def estimate_tokens(text: str, model: str = "gpt-4-turbo") -> int:
     Returns:
         Estimated token count
     """
-    try:
-        enc = tiktoken.encoding_for_model(model)
-        return len(enc.encode(text))
-    except Exception as e:
-        logger.warning(f"[TOKEN_BUDGET] tiktoken encoding failed: {e}, using fallback")
-        # Fallback: rough estimate (1 token ≈ 4 characters)
-        return len(text) // 4
+    return count_tokens(text, model)
 
 
 def summarize_text(text: str, max_sentences: int = 3) -> str:
@@ -597,13 +600,15 @@ def summarize_text(text: str, max_sentences: int = 3) -> str:
 
 def _enforce_token_budget(state: SupervisorState, max_tokens: int = 6000) -> SupervisorState:
     """
-    STEP 5: Enforce token budget by progressively trimming context layers.
+    STEP 5: Enforce token budget over the fused context segments.
 
-    Trimming strategy (in order):
-    1. Halve long-term memory (Zep recall) - oldest semantic context
-    2. Summarize old conversation history (keep last 6 turns)
-    3. Trim agent-specific context if still over budget
-    4. Rebuild fused context and re-check
+    Token totals are the sum of memoized per-segment counts, so unchanged
+    turns, memories and summaries are never re-encoded. When over budget:
+    1. Summarize old conversation history (keep last 6 turns)
+    2. Trim agent-specific context
+    3. Pick the fused-context segments to keep with a knapsack selection
+       (active domain and the latest turn are always kept; newer turns and
+       summaries outrank older retrieved memories)
 
     Args:
         state: Current supervisor state
@@ -613,123 +618,97 @@ def _enforce_token_budget(state: SupervisorState, max_tokens: int = 6000) -> Sup
         State with trimmed context and updated token estimates
     """
     thread_id = state.get("thread_id", "unknown")
-    fused = state.get("fused_context", "")
 
-    # Estimate current token count
-    token_count = estimate_tokens(fused)
-
-    # Update state with budget tracking
-    state["current_token_estimate"] = token_count
-    state["token_budget"] = max_tokens
+    with tokenizer_turn() as tokenizer_seconds:
+        segments = _context_segments(state)
+        token_count = total_tokens(segments)
+
+        # Update state with budget tracking
+        state["current_token_estimate"] = token_count
+        state["token_budget"] = max_tokens
+
+        if token_count <= max_tokens:
+            # Within budget, no trimming needed
+            logger.debug(
+                "[%s] Token budget OK: %d/%d tokens (tokenizer %.1fms)",
+                thread_id,
+                token_count,
+                max_tokens,
+                tokenizer_seconds[0] * 1000,
+            )
+            return state
 
-    if token_count <= max_tokens:
-        # Within budget, no trimming needed
-        logger.debug(
-            "[%s] Token budget OK: %d/%d tokens",
+        # --- Exceeded budget: trim ---
+        logger.warning(
+            "[%s] Token budget exceeded: %d > %d tokens, trimming...",
             thread_id,
             token_count,
             max_tokens
         )
-        return state
-
-    # --- Exceeded budget: progressively trim ---
-    logger.warning(
-        "[%s] Token budget exceeded: %d > %d tokens, trimming...",
-        thread_id,
-        token_count,
-        max_tokens
-    )
-
-    # Strategy 1: Halve long-term memory (Zep recall)
-    retrieved = state.get("retrieved_context", "")
-    if retrieved and len(retrieved) > 100:
-        lines = retrieved.split("\n")
-        half_point = len(lines) // 2
-        state["retrieved_context"] = "\n".join(lines[:half_point])
-        logger.info(
-            "[%s] Trimmed retrieved_context: %d -> %d lines",
-            thread_id,
-            len(lines),
-            half_point
-        )
-
-    # Strategy 2: Summarize old history (keep last 6 turns + summary)
-    history = state.get("history") or []
-    if len(history) > 6:
-        # Summarize older turns (everything except last 6)
-        old_turns = history[:-6]
-        recent_turns = history[-6:]
-
-        # Combine old turns into text for summarization
-        old_text = " ".join([
-            f"{turn.get('role', 'user')}: {turn.get('content', '')}"
-            for turn in old_turns
-        ])
-
-        summary = summarize_text(old_text, max_sentences=2)
-
-        # Create summary turn
-        summary_turn = {
-            "role": "system",
-            "content": f"[Earlier conversation summary]: {summary}"
-        }
-
-        # Update history: summary + recent 6 turns
-        state["history"] = [summary_turn] + recent_turns
 
-        logger.info(
-            "[%s] Summarized history: %d turns -> summary + %d recent",
-            thread_id,
-            len(history),
-            len(recent_turns)
-        )
+        # Strategy 1: Summarize old history (keep last 6 turns + summary)
+        history = state.get("history") or []
+        if len(history) > 6:
+            # Summarize older turns (everything except last 6)
+            old_turns = history[:-6]
+            recent_turns = history[-6:]
 
-    # Strategy 3: Trim agent-specific context if still too large
-    agent_context_str = state.get("agent_specific_context", "")
-    if agent_context_str and len(agent_context_str) > 500:
-        # Keep first 500 chars + ellipsis
-        state["agent_specific_context"] = agent_context_str[:500] + "..."
-        logger.info(
-            "[%s] Trimmed agent_specific_context: %d -> 500 chars",
-            thread_id,
-            len(agent_context_str)
-        )
+            # Combine old turns into text for summarization
+            old_text = " ".join([
+                f"{turn.get('role', 'user')}: {turn.get('content', '')}"
+                for turn in old_turns
+            ])
 
-    # Rebuild fused context with trimmed inputs
-    # Note: We don't call _fuse_context here to avoid circular dependency
-    # Instead, we'll rebuild a simplified version
-    context_parts = []
+            summary = summarize_text(old_text, max_sentences=2)
 
-    if state.get("active_domain"):
-        context_parts.append(f"[Active Domain: {state['active_domain']}]")
+            # Create summary turn
+            summary_turn = {
+                "role": "system",
+                "content": f"{_HISTORY_SUMMARY_PREFIX}{summary}"
+            }
 
-    if state.get("retrieved_context"):
-        context_parts.append(f"[Relevant Past Context]:\n{state['retrieved_context'].strip()}")
+            # Update history: summary + recent 6 turns
+            state["history"] = [summary_turn] + recent_turns
 
-    history = state.get("history") or []
-    if history:
-        history_lines = [
-            f"{turn.get('role', 'unknown').capitalize()}: {turn.get('content', '')}"
-            for turn in history[-5:]  # Last 5 turns
-        ]
-        context_parts.append(f"[Recent Conversation]:\n" + "\n".join(history_lines))
+            logger.info(
+                "[%s] Summarized history: %d turns -> summary + %d recent",
+                thread_id,
+                len(history),
+                len(recent_turns)
+            )
 
-    if state.get("memory_context_summary"):
-        context_parts.append(f"[Summary]: {state['memory_context_summary']}")
+        # Strategy 2: Trim agent-specific context if too large
+        agent_context_str = state.get("agent_specific_context", "")
+        if agent_context_str and len(agent_context_str) > 500:
+            # Keep first 500 chars + ellipsis
+            state["agent_specific_context"] = agent_context_str[:500] + "..."
+            logger.info(
+                "[%s] Trimmed agent_specific_context: %d -> 500 chars",
+                thread_id,
+                len(agent_context_str)
+            )
 
-    # Rebuild fused context
-    new_fused = "\n\n".join(context_parts)
-    new_token_count = estimate_tokens(new_fused)
+        # Strategy 3: Keep the most valuable segments that fit, re-segmenting
+        # so the knapsack sees the summarized history and trimmed context
+        segments = _context_segments(state)
+        kept = select_segments(segments, max_tokens)
+        retrieved_lines = [seg.text for seg in kept if seg.section == _RETRIEVED_SECTION]
+        if state.get("retrieved_context"):
+            state["retrieved_context"] = "\n".join(retrieved_lines)
+        new_token_count = total_tokens(kept)
 
-    state["fused_context"] = new_fused
-    state["current_token_estimate"] = new_token_count
+        state["fused_context"] = render_segments(kept)
+        state["current_token_estimate"] = new_token_count
 
     logger.info(
-        "[%s] Token budget enforced: %d -> %d tokens (target: %d)",
+        "[%s] Token budget enforced: %d -> %d tokens (target: %d, dropped %d/%d segments, tokenizer %.1fms)",
         thread_id,
         token_count,
         new_token_count,
-        max_tokens
+        max_tokens,
+        len(segments) - len(kept),
+        len(segments),
+        tokenizer_seconds[0] * 1000,
     )
 
     # If still over budget after all trimming, log warning but proceed
@@ -840,14 +819,7 @@ def archive_to_zep(
 
         # Add memory to Zep (simple client API: thread_id, role, content)
         summary_content = f"[ARCHIVED SUMMARY {agent_name}] {summary}"
-        client.add_messages(
-            thread_id,
-            [{
-                "role": "system",
-                "content": summary_content,
-                "metadata": archive_metadata,
-            }]
-        )
+        enqueue_messages(thread_id, [redacted("system", summary_content, archive_metadata)])
 
         logger.info(
             "[LIFECYCLE] Archived context for %s to Zep (%d chars)",
@@ -940,6 +912,7 @@ def rotate_inactive_contexts(state: SupervisorState, ttl: int = 1800) -> Supervi
     return state
 
 
+@timed_node("persist_context_snapshot")
 def _persist_context_snapshot(state: SupervisorState) -> bool:
     """
     STEP 6: Persist context snapshot for state rehydration.
@@ -973,13 +946,14 @@ def _persist_context_snapshot(state: SupervisorState) -> bool:
 
         # Archive snapshot to Zep (simple client API: thread_id, role, content)
         snapshot_content = json.dumps(snapshot)
-        client.add_messages(
+        enqueue_messages(
             thread_id,
             [{
                 "role": "system",
                 "content": snapshot_content,
                 "metadata": {"type": "context_snapshot"},
-            }]
+            }],
+            user_id=state.get("user_id"),
         )
 
         logger.info(
@@ -997,6 +971,10 @@ def _persist_context_snapshot(state: SupervisorState) -> bool:
         return False
 
 
+_REHYDRATE_QUERY_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="zep-rehydrate")
+
+
+@timed_node("rehydrate_state")
 def rehydrate_state(thread_id: str) -> Dict[str, Any]:
     """
     STEP 6: Rehydrate conversation state on reconnect/resume.
@@ -1006,8 +984,8 @@ def rehydrate_state(thread_id: str) -> Dict[str, Any]:
 
     Flow:
         1. Query Zep for latest context_snapshot (system message with type=context_snapshot)
-        2. Query Zep for latest rolling_summary (system message with type=rolling_summary)
-        3. Parse and return state dict with restored fields
+           and latest rolling_summary (system message with type=rolling_summary) concurrently
+        2. Parse and return state dict with restored fields
 
     Args:
         thread_id: Conversation thread ID
@@ -1047,13 +1025,15 @@ def rehydrate_state(thread_id: str) -> Dict[str, Any]:
         return {"rehydrated": False}
 
     try:
-        # Query Zep for latest context snapshot
-        # Use search/filter to find system messages with type=context_snapshot
-        snapshots = client.query_memory(
-            thread_id,
-            query="context_snapshot",
-            limit=1,
+        # Query Zep for the latest context snapshot and rolling summary concurrently
+        snapshots_future = _REHYDRATE_QUERY_POOL.submit(
+            client.query_memory, thread_id, query="context_snapshot", limit=1
         )
+        summaries_future = _REHYDRATE_QUERY_POOL.submit(
+            client.query_memory, thread_id, query="CONVERSATION SUMMARY", limit=1
+        )
+        snapshots = snapshots_future.result()
+        summaries = summaries_future.result()
 
         snapshot_data = None
         summary_data = None
@@ -1065,13 +1045,6 @@ def rehydrate_state(thread_id: str) -> Dict[str, Any]:
             except (json.JSONDecodeError, IndexError):
                 logger.warning("[%s] Failed to parse context snapshot", thread_id)
 
-        # Query for latest rolling summary
-        summaries = client.query_memory(
-            thread_id,
-            query="CONVERSATION SUMMARY",
-            limit=1,
-        )
-
         if summaries:
             try:
                 # Extract summary text from system message
@@ -1140,7 +1113,7 @@ def rehydrate_state(thread_id: str) -> Dict[str, Any]:
 
 def _get_checkpoint_state(thread_id: str) -> Optional[Dict[str, Any]]:
     """
-    Helper to retrieve the latest checkpoint state from MemorySaver.
+    Helper to retrieve the latest checkpoint state from the supervisor checkpointer.
 
     Args:
         thread_id: Thread identifier
@@ -1149,9 +1122,7 @@ def _get_checkpoint_state(thread_id: str) -> Optional[Dict[str, Any]]:
         Dict with checkpoint state or None if not found
     """
     try:
-        from langgraph.checkpoint.base import CheckpointTuple
-
-        # Get checkpoint from MemorySaver
+        # Get latest checkpoint from the shared checkpointer
         config = {"configurable": {"thread_id": thread_id}}
         checkpoint_tuple = _SUPERVISOR_MEMORY.get(config)
 
@@ -1168,81 +1139,104 @@ def _get_checkpoint_state(thread_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def _fuse_context(state: SupervisorState) -> SupervisorState:
-    """
-    STEP 6: Enhanced Context Fusion
+_SUMMARY_SECTION = "[Conversation Summary]:"
+_RETRIEVED_SECTION = "[Relevant Past Context]:"
+_RECENT_SECTION = "[Recent Conversation]:"
+_LONG_TERM_SECTION = "[Long-term Summary]:"
+_FACTS_SECTION = "[Known Facts]:"
+_RECENT_TURN_LIMIT = 5
+_HISTORY_SUMMARY_PREFIX = "[Earlier conversation summary]: "
 
-    Merge multiple context sources into a unified reasoning context:
-    1. Conversation summary (from rolling summarization)
-    2. Long-term semantic recall (Zep retrieved_context)
-    3. Short-term history (last N turns)
-    4. Active domain state (for continuity tracking)
-    5. Memory facts (structured knowledge)
 
-    Returns state with populated fused_context field.
+def _context_segments(state: SupervisorState) -> List[ContextSegment]:
     """
-    context_parts = []
+    Split the fused context into ordered segments (see _fuse_context).
+
+    Values rank segments for the token budget knapsack: the latest turn and
+    the active domain are required, newer turns and summaries outrank
+    facts, and retrieved memories decay with their position.
+    """
+    segments: List[ContextSegment] = []
 
     # 1. Active domain context (for continuity)
     active_domain = state.get("active_domain")
     if active_domain:
-        context_parts.append(f"[Active Domain: {active_domain}]")
+        segments.append(ContextSegment("", f"[Active Domain: {active_domain}]", required=True))
 
-    # 2. STEP 6: Rolling conversation summary (high-level overview)
+    # 2. Rolling conversation summary (high-level overview)
     conversation_summary = state.get("conversation_summary")
     if conversation_summary and conversation_summary.strip():
-        context_parts.append(f"[Conversation Summary]:\n{conversation_summary.strip()}")
+        segments.append(ContextSegment(_SUMMARY_SECTION, conversation_summary.strip(), value=8.0))
+
+    # Older turns folded away by the token budget (see _enforce_token_budget)
+    history = state.get("history") or []
+    for turn in history[:1]:
+        content = turn.get("content") or ""
+        if turn.get("role") == "system" and content.startswith(_HISTORY_SUMMARY_PREFIX):
+            segments.append(ContextSegment(_SUMMARY_SECTION, content[len(_HISTORY_SUMMARY_PREFIX):], value=7.0))
+            history = history[1:]
 
     # 3. Long-term memory (Zep semantic recall - specific relevant memories)
     retrieved_context = state.get("retrieved_context")
     if retrieved_context and retrieved_context.strip():
-        context_parts.append(f"[Relevant Past Context]:\n{retrieved_context.strip()}")
+        for index, line in enumerate(retrieved_context.strip().split("\n")):
+            segments.append(ContextSegment(_RETRIEVED_SECTION, line, value=max(3.0 - 0.25 * index, 0.5)))
+
+    # 4. Short-term history (last N turns)
+    recent_history = [turn for turn in history[-_RECENT_TURN_LIMIT:] if turn.get("content", "")]
+    for index, turn in enumerate(recent_history):
+        age = len(recent_history) - 1 - index
+        role = turn.get("role", "unknown")
+        segments.append(ContextSegment(
+            _RECENT_SECTION,
+            f"{role.capitalize()}: {turn.get('content', '')}",
+            value=10.0 - age,
+            required=age == 0,
+        ))
+
+    # 5. Memory context summary from Zep service (only if different from rolling summary)
+    memory_summary = state.get("memory_context_summary")
+    if memory_summary and memory_summary.strip() and memory_summary != conversation_summary:
+        segments.append(ContextSegment(_LONG_TERM_SECTION, memory_summary.strip(), value=5.0))
 
-    # 4. Short-term history (last N turns, default: 5)
-    history = state.get("history") or []
-    recent_limit = 5
-    if len(history) > 0:
-        recent_history = history[-recent_limit:] if len(history) > recent_limit else history
-        history_lines = []
-        for turn in recent_history:
-            role = turn.get("role", "unknown")
-            content = turn.get("content", "")
-            if content:
-                history_lines.append(f"{role.capitalize()}: {content}")
+    # 6. Memory facts (structured knowledge, top 3)
+    memory_facts = state.get("memory_context_facts") or []
+    for rank, fact in enumerate(memory_facts[:3]):
+        if isinstance(fact, dict):
+            fact_text = fact.get("fact") or fact.get("content") or str(fact)
+            segments.append(ContextSegment(_FACTS_SECTION, f"- {fact_text}", value=4.0 - 0.5 * rank))
 
-        if history_lines:
-            context_parts.append(f"[Recent Conversation]:\n" + "\n".join(history_lines))
+    return segments
 
-    # 5. Memory context summary from Zep service (if available)
-    memory_summary = state.get("memory_context_summary")
-    if memory_summary and memory_summary.strip():
-        # Only include if different from rolling summary
-        if memory_summary != conversation_summary:
-            context_parts.append(f"[Long-term Summary]:\n{memory_summary.strip()}")
 
-    # 6. Memory facts (structured knowledge)
-    memory_facts = state.get("memory_context_facts") or []
-    if memory_facts:
-        facts_lines = []
-        for fact in memory_facts[:3]:  # Limit to top 3 facts
-            if isinstance(fact, dict):
-                fact_text = fact.get("fact") or fact.get("content") or str(fact)
-                facts_lines.append(f"- {fact_text}")
+@timed_node("fuse_context", optional=True)
+def _fuse_context(state: SupervisorState) -> SupervisorState:
+    """
+    STEP 6: Enhanced Context Fusion
+
+    Merge multiple context sources into a unified reasoning context:
+    1. Conversation summary (from rolling summarization)
+    2. Long-term semantic recall (Zep retrieved_context)
+    3. Short-term history (last N turns)
+    4. Active domain state (for continuity tracking)
+    5. Memory facts (structured knowledge)
 
-        if facts_lines:
-            context_parts.append(f"[Known Facts]:\n" + "\n".join(facts_lines))
+    Returns state with populated fused_context field.
+    """
+    segments = _context_segments(state)
 
     # Build fused context
-    if context_parts:
-        fused = "\n\n".join(context_parts)
+    if segments:
+        fused = render_segments(segments)
+        history = state.get("history") or []
         logger.info(
-            "[%s] Context fusion: %d parts, %d chars (summary=%s, retrieved=%s, recent=%d turns)",
+            "[%s] Context fusion: %d segments, %d chars (summary=%s, retrieved=%s, recent=%d turns)",
             state.get("thread_id"),
-            len(context_parts),
+            len(segments),
             len(fused),
-            "yes" if conversation_summary else "no",
-            "yes" if retrieved_context else "no",
-            min(len(history), recent_limit)
+            "yes" if state.get("conversation_summary") else "no",
+            "yes" if state.get("retrieved_context") else "no",
+            min(len(history), _RECENT_TURN_LIMIT)
         )
     else:
         fused = ""
@@ -1798,9 +1792,11 @@ def build_supervisor_graph():
         return _COMPILED_SUPERVISOR_GRAPH
     try:
         supervisor = CentralSupervisor()
+        route_request = timed_node("route")(supervisor.route_request)
         graph = StateGraph(SupervisorState)
 
         @traced_supervisor_node
+        @timed_node("supervisor", turn_start=True)
         def supervisor_node(state: SupervisorState) -> SupervisorState:
             state = _apply_memory_context(state)
             state = _inject_zep_context(state)  # STEP 6: Retrieve long-term memories from Zep
@@ -1853,7 +1849,7 @@ def build_supervisor_graph():
                 state = {**state, "conversation_ctx": updated_ctx}
 
             # Route to get target agent
-            routed_state = supervisor.route_request(state)
+            routed_state = route_request(state)
             target_agent = routed_state.get("target_agent")
 
             # STEP 4: Preserve context during agent switch + build agent-specific context
@@ -1873,6 +1869,7 @@ def build_supervisor_graph():
             return "real_estate_agent"
 
         @traced_worker_agent("general_conversation")
+        @timed_node("general_conversation_agent")
         def general_conversation_handler(state: SupervisorState) -> SupervisorState:
             """
             General Conversation Agent: Handle greetings, general info, platform questions.
@@ -1926,6 +1923,8 @@ def build_supervisor_graph():
                     stage
                 )
                 logger.info(f"[{thread_id}] General Conversation Agent: returning response")
+                # Canned reply (no LLM call): stream it as a single delta
+                emit_delta(response)
                 return _with_history(
                     state,
                     {
@@ -1953,6 +1952,7 @@ def build_supervisor_graph():
                 )
 
         @traced_worker_agent("real_estate")
+        @timed_node("real_estate_agent")
         def real_estate_handler(state: SupervisorState) -> SupervisorState:
             """
             Real Estate Agent: Routes to prompt-driven or legacy handler based on feature flag.
@@ -2193,6 +2193,7 @@ def build_supervisor_graph():
                 page_size = len(agent_response.get('actions', [{}])[0].get('params', {}).get('listings', [])) or 0
                 has_more = False
                 total_available = None
+                next_cursor = None
                 search_params_payload: Dict[str, Any] = dict(traces.get("extracted_params", {}) or {}) if isinstance(traces, dict) else {}
                 for action in actions:
                     if action['type'] == 'show_listings':
@@ -2202,6 +2203,7 @@ def build_supervisor_graph():
                         page_size = action_params.get('page_size', page_size or len(listings) or 10)
                         has_more = action_params.get('has_more', has_more)
                         total_available = action_params.get('total', total_available)
+                        next_cursor = action_params.get('next_cursor')
                         if action_params.get('search_params'):
                             search_params_payload = action_params['search_params']
                         # Convert PropertyCard → supervisor recommendation format
@@ -2239,6 +2241,7 @@ def build_supervisor_graph():
                             "total": total_available,
                             "last_results_ref": [rec['id'] for rec in recommendations if rec.get('id')],
                             "has_more": has_more,
+                            "next_cursor": next_cursor,
                             "max_results": search_params_payload.get("max_results") or total_available,
                         },
                     })
@@ -2353,6 +2356,7 @@ def build_supervisor_graph():
                 )
 
         @traced_worker_agent("marketplace")
+        @timed_node("marketplace_agent")
         def marketplace_handler(state: SupervisorState) -> SupervisorState:
             """
             Marketplace Agent: Handle non-real-estate product/service searches and broadcast requests.
@@ -2437,6 +2441,7 @@ def build_supervisor_graph():
                 )
 
         @traced_worker_agent("local_info")
+        @timed_node("local_info_agent")
         def local_info_handler(state: SupervisorState) -> SupervisorState:
             """
             Local Info Agent: Handle live local lookups (pharmacy on duty, hospitals, activities).
@@ -2798,7 +2803,7 @@ def build_supervisor_graph():
         graph.add_edge("general_conversation_agent", END)
         graph.add_edge("local_info_agent", END)
 
-        # Compile graph with in-memory session checkpointer
+        # Compile graph with the shared, bounded session checkpointer
         compiled = None
         try:
             compiled = graph.compile(checkpointer=_SUPERVISOR_MEMORY)
@@ -177,6 +177,11 @@ class SupervisorState(TypedDict):
     router_evidence: Optional[Dict[str, Any]]  # Evidence dict (logits, probs, tokens)
     clarify: Optional[bool]  # Flag to request user clarification
 
+    # Per-turn latency breakdown (see assistant.brain.node_timing)
+    turn_started_at: Optional[float]  # Epoch seconds when the entry node started this turn
+    node_timings: Optional[Dict[str, float]]  # Node name -> wall time in ms for this turn
+    budget_skipped: Optional[List[str]]  # Optional nodes skipped because the turn budget was spent
+
 
 class MapMarker(BaseModel):
     """DTO for individual map marker in geo-location recommendations."""
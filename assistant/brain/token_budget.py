@@ -0,0 +1,202 @@
+"""
+Token accounting for the supervisor context budget (STEP 5).
+
+- ``get_encoder``: tiktoken encoder per model, loaded once per process (a
+  failed load is cached too, so an offline worker does not retry the
+  download on every call and falls back to ~4 chars/token).
+- ``count_tokens``: token count memoized by content hash, so history turns,
+  retrieved memories and summaries that repeat across turns are encoded once.
+- ``ContextSegment`` / ``render_segments``: the fused context as an ordered
+  list of sections and items; totals are the sum of cached item counts.
+- ``select_segments``: 0/1 knapsack over the droppable items to fit a budget
+  in a single pass instead of trim, re-encode and re-check.
+- ``tokenizer_turn``: accumulates tokenizer time for a turn and reports it
+  to the ``supervisor_tokenizer_seconds`` histogram.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKENIZER_MODEL = "gpt-4-turbo"
+TOKEN_CACHE_MAX = int(os.getenv("TOKEN_COUNT_CACHE_MAX", "8192"))
+# Knapsack capacity is quantized to this many tokens to keep the DP small
+KNAPSACK_QUANTUM = 8
+SECTION_SEPARATOR = "\n\n"
+ITEM_SEPARATOR = "\n"
+
+_COUNTS: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+_COUNTS_LOCK = Lock()
+_TURN_SECONDS: ContextVar[Optional[List[float]]] = ContextVar("tokenizer_turn_seconds", default=None)
+
+
+@lru_cache(maxsize=8)
+def get_encoder(model: str = DEFAULT_TOKENIZER_MODEL):
+    """Return the tiktoken encoder for ``model`` (cached), or None when unavailable."""
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as exc:  # noqa: BLE001 - missing package or offline BPE download
+        logger.warning("[TOKEN_BUDGET] tiktoken unavailable for %s: %s, using fallback", model, exc)
+        return None
+
+
+def _encode_len(text: str, model: str) -> int:
+    encoder = get_encoder(model)
+    if encoder is None:
+        # Fallback: rough estimate (1 token ≈ 4 characters)
+        return len(text) // 4
+    try:
+        return len(encoder.encode(text, disallowed_special=()))
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("[TOKEN_BUDGET] tiktoken encoding failed: %s, using fallback", exc)
+        return len(text) // 4
+
+
+def count_tokens(text: str, model: str = DEFAULT_TOKENIZER_MODEL) -> int:
+    """Token count for ``text``, memoized by content hash."""
+    if not text:
+        return 0
+    key = (model, hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest())
+    with _COUNTS_LOCK:
+        cached = _COUNTS.get(key)
+        if cached is not None:
+            _COUNTS.move_to_end(key)
+            return cached
+
+    start = time.perf_counter()
+    tokens = _encode_len(text, model)
+    elapsed = time.perf_counter() - start
+    spent = _TURN_SECONDS.get()
+    if spent is not None:
+        spent[0] += elapsed
+
+    with _COUNTS_LOCK:
+        _COUNTS[key] = tokens
+        while len(_COUNTS) > TOKEN_CACHE_MAX:
+            _COUNTS.popitem(last=False)
+    return tokens
+
+
+def clear_token_cache() -> None:
+    with _COUNTS_LOCK:
+        _COUNTS.clear()
+
+
+@contextmanager
+def tokenizer_turn() -> Iterator[List[float]]:
+    """Measure tokenizer time spent inside the block and report it as one turn."""
+    spent = [0.0]
+    token = _TURN_SECONDS.set(spent)
+    try:
+        yield spent
+    finally:
+        _TURN_SECONDS.reset(token)
+        try:
+            from assistant.monitoring.metrics import observe_tokenizer_seconds
+
+            observe_tokenizer_seconds(spent[0])
+        except Exception:  # noqa: BLE001
+            pass
+
+
+@dataclass(frozen=True)
+class ContextSegment:
+    """One droppable piece of the fused context.
+
+    ``section`` is the header the item renders under; ``value`` ranks items
+    for the knapsack (higher is kept first) and ``required`` items are never
+    dropped.
+    """
+
+    section: str
+    text: str
+    value: float = 1.0
+    required: bool = False
+
+    @property
+    def tokens(self) -> int:
+        return count_tokens(self.text)
+
+
+def render_segments(segments: Sequence[ContextSegment]) -> str:
+    """Join segments into the fused context, grouping items under their section header."""
+    sections: "OrderedDict[str, List[str]]" = OrderedDict()
+    for segment in segments:
+        sections.setdefault(segment.section, []).append(segment.text)
+    parts = []
+    for header, items in sections.items():
+        body = ITEM_SEPARATOR.join(items)
+        parts.append(f"{header}\n{body}" if header else body)
+    return SECTION_SEPARATOR.join(parts)
+
+
+def total_tokens(segments: Sequence[ContextSegment]) -> int:
+    """Estimate tokens of ``render_segments(segments)`` from cached per-item counts."""
+    headers = {s.section for s in segments if s.section}
+    separators = max(len(segments) - 1, 0)
+    return sum(s.tokens for s in segments) + sum(count_tokens(h) for h in headers) + separators
+
+
+def select_segments(segments: Sequence[ContextSegment], max_tokens: int) -> List[ContextSegment]:
+    """
+    Keep the highest-value subset of ``segments`` that fits ``max_tokens``.
+
+    Required items are always kept; the rest are chosen with a 0/1 knapsack
+    (capacity quantized to KNAPSACK_QUANTUM, costs rounded up so the result
+    never exceeds the budget). Original order is preserved.
+    """
+    required = [i for i, s in enumerate(segments) if s.required]
+    optional = [i for i, s in enumerate(segments) if not s.required]
+    # Each item pays for itself, its separator and (conservatively) its header
+    cost = {i: segments[i].tokens + 1 + count_tokens(segments[i].section) for i in optional}
+    used = total_tokens([segments[i] for i in required])
+    capacity = (max_tokens - used) // KNAPSACK_QUANTUM
+    if capacity <= 0 or not optional:
+        return [segments[i] for i in required]
+
+    weights = [-(-cost[i] // KNAPSACK_QUANTUM) for i in optional]
+    best = [0.0] * (capacity + 1)
+    keep = [[False] * (capacity + 1) for _ in optional]
+    for n, i in enumerate(optional):
+        weight, value = weights[n], segments[i].value
+        for c in range(capacity, weight - 1, -1):
+            if best[c - weight] + value > best[c]:
+                best[c] = best[c - weight] + value
+                keep[n][c] = True
+
+    chosen = set(required)
+    c = capacity
+    for n in range(len(optional) - 1, -1, -1):
+        if keep[n][c]:
+            chosen.add(optional[n])
+            c -= weights[n]
+    return [s for i, s in enumerate(segments) if i in chosen]
+
+
+__all__ = [
+    "DEFAULT_TOKENIZER_MODEL",
+    "ContextSegment",
+    "clear_token_cache",
+    "count_tokens",
+    "get_encoder",
+    "render_segments",
+    "select_segments",
+    "tokenizer_turn",
+    "total_tokens",
+]
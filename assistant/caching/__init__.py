@@ -1,8 +1,9 @@
 # assistant/caching/__init__.py
 """
-Caching utilities for agent degraded-mode responses.
+Caching utilities for agent degraded-mode responses and LLM results.
 
-Exports simple helpers backed by Django cache. Advanced classes from
+Exports simple helpers backed by Django cache, plus the opt-in
+``LLMResultCache`` used by deterministic LLM call sites. Advanced classes from
 earlier iterations (ResponseCache, CacheStrategy, SemanticCache) are not
 required for current usage and intentionally omitted to avoid import errors.
 """
@@ -12,11 +13,14 @@ from .response_cache import (
     set_fallback_response,
     prompt_hash,
 )
+from .llm_cache import LLMResultCache, normalize_text
 
 __all__ = [
     "get_fallback_response",
     "set_fallback_response",
     "prompt_hash",
+    "LLMResultCache",
+    "normalize_text",
 ]
 
 
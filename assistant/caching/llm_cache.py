@@ -0,0 +1,185 @@
+"""
+Deterministic LLM result cache.
+
+Call sites opt in by owning an ``LLMResultCache`` with their own namespace
+and prompt template version (bump the version whenever the prompt changes).
+Entries are keyed by (model, prompt version, temperature bucket, normalized
+inputs) and stored in two tiers:
+
+- a process-local LRU (``LLM_RESULT_CACHE_LOCAL_MAX`` entries, TTL-aware)
+- the Django cache (Redis in production) with ``LLM_RESULT_CACHE_TTL``
+
+Hits increment ``llm_cache_hits_total{layer="<namespace>:<tier>"}``.
+The whole cache can be switched off with ``LLM_RESULT_CACHE_ENABLED=false``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+import unicodedata
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+try:
+    from django.core.cache import cache  # type: ignore
+    _CACHE_AVAILABLE = True
+except Exception:  # pragma: no cover
+    cache = None
+    _CACHE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+LLM_RESULT_CACHE_TTL = int(os.getenv("LLM_RESULT_CACHE_TTL", str(24 * 3600)))
+LLM_RESULT_CACHE_LOCAL_MAX = int(os.getenv("LLM_RESULT_CACHE_LOCAL_MAX", "2048"))
+LLM_RESULT_CACHE_LOCAL_TTL = int(os.getenv("LLM_RESULT_CACHE_LOCAL_TTL", "600"))
+
+
+def _resolve_enabled() -> bool:
+    try:
+        from django.conf import settings
+
+        value = getattr(settings, "LLM_RESULT_CACHE_ENABLED", None)
+        if value is not None:
+            return bool(value)
+    except Exception:  # noqa: BLE001
+        pass
+    return os.getenv("LLM_RESULT_CACHE_ENABLED", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def normalize_text(text: Any) -> str:
+    """Case-fold and collapse whitespace so trivially different inputs share a key."""
+    if text is None:
+        return ""
+    return " ".join(unicodedata.normalize("NFKC", str(text)).casefold().split())
+
+
+def temperature_bucket(temperature: Optional[float]) -> str:
+    if temperature is None:
+        return "default"
+    return f"{round(float(temperature), 1):.1f}"
+
+
+class LLMResultCache:
+    """Two-tier cache for the results of one LLM call site."""
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        version: str,
+        ttl: int = LLM_RESULT_CACHE_TTL,
+        local_max: int = LLM_RESULT_CACHE_LOCAL_MAX,
+        local_ttl: int = LLM_RESULT_CACHE_LOCAL_TTL,
+    ):
+        self.namespace = namespace
+        self.version = version
+        self.ttl = ttl
+        self.local_ttl = min(local_ttl, ttl)
+        self._local_max = max(local_max, 1)
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return _resolve_enabled()
+
+    def key(self, *, model: str, inputs: Mapping[str, Any], temperature: Optional[float] = None) -> str:
+        normalized = {name: normalize_text(value) for name, value in sorted(inputs.items())}
+        raw = json.dumps(
+            [model, self.version, temperature_bucket(temperature), normalized],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:40]
+        return f"llmc:{self.namespace}:{digest}"
+
+    def _local_get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return value
+
+    def _local_set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.local_ttl, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self._local_max:
+                self._local.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        value = self._local_get(key)
+        if value is not None:
+            _record_hit(self.namespace, "local")
+            return value
+        if not _CACHE_AVAILABLE:
+            return None
+        try:
+            value = cache.get(key)
+        except Exception:  # noqa: BLE001 - a cache outage is a miss
+            return None
+        if value is not None:
+            self._local_set(key, value)
+            _record_hit(self.namespace, "redis")
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if not self.enabled or value is None:
+            return
+        self._local_set(key, value)
+        if not _CACHE_AVAILABLE:
+            return
+        try:
+            cache.set(key, value, timeout=self.ttl)
+        except Exception:  # noqa: BLE001
+            pass
+
+    def get_or_compute(
+        self,
+        compute: Callable[[], Any],
+        *,
+        model: str,
+        inputs: Mapping[str, Any],
+        temperature: Optional[float] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Return the cached result or call ``compute`` and store it when ``cacheable``."""
+        key = self.key(model=model, inputs=inputs, temperature=temperature)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        value = compute()
+        if cacheable is None or cacheable(value):
+            self.set(key, value)
+        return value
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+
+def _record_hit(namespace: str, tier: str) -> None:
+    try:
+        from assistant.monitoring.metrics import inc_llm_cache_hit
+
+        inc_llm_cache_hit(f"{namespace}:{tier}")
+    except Exception:  # noqa: BLE001
+        pass
+
+
+__all__ = [
+    "LLMResultCache",
+    "normalize_text",
+    "temperature_bucket",
+]
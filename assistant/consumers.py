@@ -1,10 +1,12 @@
 """
 Production WebSocket consumer with close-code hygiene, duration tracking, and metrics.
 """
+import asyncio
 import json
 import time
 import logging
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from channels.consumer import get_handler_name
 from django.contrib.auth.models import AnonymousUser
 
 from assistant.utils.correlation import set_correlation_id, reset_correlation_id
@@ -85,70 +87,24 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
             if _PROMETHEUS_AVAILABLE and WEBSOCKET_CONNECTIONS:
                 WEBSOCKET_CONNECTIONS.labels(thread_id=str(self.thread_id)).inc()
 
-            # STEP 6 + FIX: Rehydrate conversation state on reconnect and PUSH to client
+            # STEP 6 + FIX: Rehydrate conversation state on reconnect and PUSH to client.
+            # Built off the event loop with a strict time budget (see brain.rehydration).
             try:
-                from assistant.brain.supervisor_graph import rehydrate_state, _get_checkpoint_state
+                from assistant.brain.rehydration import get_rehydration_snapshot
 
-                # Get rehydrated state from Zep
-                rehydrated = rehydrate_state(self.thread_id)
-
-                # Build comprehensive rehydration payload
-                rehydration_payload = {
-                    "type": "rehydration",
-                    "thread_id": self.thread_id,
-                    "rehydrated": rehydrated.get("rehydrated", False),
-                    "active_domain": rehydrated.get("active_domain"),
-                    "current_intent": rehydrated.get("current_intent"),
-                    "conversation_summary": rehydrated.get("conversation_summary", "")[:500],  # Truncate to 500 chars
-                    "turn_count": rehydrated.get("turn_count", 0),
-                }
-
-                # Try to get additional context from checkpoint
                 try:
-                    checkpoint_state = _get_checkpoint_state(self.thread_id)
-                    if checkpoint_state:
-                        # Add agent contexts
-                        agent_contexts = checkpoint_state.get("agent_contexts", {})
-                        if agent_contexts:
-                            # Prune agent contexts to essential fields only
-                            pruned_contexts = {}
-                            for agent_name, agent_ctx in agent_contexts.items():
-                                if isinstance(agent_ctx, dict):
-                                    pruned_contexts[agent_name] = {
-                                        "filled_slots": agent_ctx.get("filled_slots", {}),
-                                        "stage": agent_ctx.get("stage"),
-                                        "awaiting_slot": agent_ctx.get("awaiting_slot"),
-                                    }
-                            rehydration_payload["agent_contexts"] = pruned_contexts
-
-                        # Add shared context (location, budget, etc.)
-                        shared_context = {}
-                        re_ctx = agent_contexts.get("real_estate_agent", {})
-                        if isinstance(re_ctx, dict):
-                            filled_slots = re_ctx.get("filled_slots", {})
-                            if "location" in filled_slots:
-                                shared_context["user_location"] = filled_slots["location"]
-                            if "budget" in filled_slots:
-                                shared_context["user_budget"] = filled_slots["budget"]
-                        rehydration_payload["shared_context"] = shared_context
-
-                        # Add recent turns (last 3)
-                        messages = checkpoint_state.get("messages", [])
-                        if messages:
-                            recent_turns = messages[-6:]  # Last 3 exchanges (user + assistant)
-                            rehydration_payload["recent_turns"] = [
-                                {
-                                    "role": msg.get("role"),
-                                    "content": str(msg.get("content", ""))[:200]  # Truncate content
-                                }
-                                for msg in recent_turns
-                            ]
-                except Exception as checkpoint_error:
-                    logger.debug(
-                        "ws_connect_checkpoint_fetch_failed",
-                        extra={"thread_id": self.thread_id, "error": str(checkpoint_error)}
+                    rehydration_payload = await get_rehydration_snapshot(self.thread_id)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "ws_connect_rehydrate_timeout",
+                        extra={"thread_id": self.thread_id}
                     )
-
+                    rehydration_payload = {
+                        "type": "rehydration",
+                        "thread_id": self.thread_id,
+                        "rehydrated": False,
+                        "error": "rehydration_timeout",
+                    }
                 # Try to get user profile (minimal, PII-safe)
                 try:
                     user_profile = {
@@ -162,14 +118,14 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
                 # PUSH rehydration payload to client immediately
                 await self.safe_send_json(rehydration_payload)
 
-                if rehydrated.get("rehydrated"):
+                if rehydration_payload.get("rehydrated"):
                     logger.info(
                         "ws_connect_rehydrated_pushed",
                         extra={
                             "thread_id": self.thread_id,
-                            "domain": rehydrated.get("active_domain"),
-                            "intent": rehydrated.get("current_intent"),
-                            "turns": rehydrated.get("turn_count"),
+                            "domain": rehydration_payload.get("active_domain"),
+                            "intent": rehydration_payload.get("current_intent"),
+                            "turns": rehydration_payload.get("turn_count"),
                         }
                     )
                 else:
@@ -370,6 +326,39 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         finally:
             reset_correlation_id(token)
 
+    async def chat_delta(self, event):
+        """
+        Handle streamed assistant_delta frames (partial reply text).
+
+        Called via: channel_layer.group_send(group_name, {"type": "chat.delta", "data": {...}})
+        """
+        token = set_correlation_id(self.scope.get("correlation_id"))
+        try:
+            await self.safe_send_json(event.get("data") or event)
+        finally:
+            reset_correlation_id(token)
+
+    async def chat_batch(self, event):
+        """
+        Unpack a composite frame from the chat task's FrameBatcher.
+
+        Called via: channel_layer.group_send(group_name, {"type": "chat.batch", "frames": [...]})
+
+        Each inner frame is handled, in order, exactly as if it had been sent on its own.
+        """
+        for frame in event.get("frames") or []:
+            try:
+                handler = getattr(self, get_handler_name(frame), None)
+            except (TypeError, ValueError):
+                handler = None
+            if handler is None or handler == self.chat_batch:
+                logger.warning(
+                    "ws_batch_unknown_frame",
+                    extra={"thread_id": getattr(self, "thread_id", None)},
+                )
+                continue
+            await handler(frame)
+
     async def chat_error(self, event):
         """Handle chat_error event."""
         token = set_correlation_id(self.scope.get("correlation_id"))
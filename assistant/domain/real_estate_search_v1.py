@@ -49,6 +49,29 @@ def _build_cache_key(params: Dict[str, Any]) -> str:
     return f"re:v1:search:{key_hash}"
 
 
+# Filters the progressive fallback may drop, in the order it drops them
+RELAXABLE_FILTERS = ("max_price", "listing_type")
+_RELAXED_CURSOR_PREFIX = "relaxed."
+
+
+def _relaxed_cursor(dropped: List[str], cursor: Optional[str]) -> Optional[str]:
+    """
+    Tag an API cursor with the filters the fallback dropped, so the next page
+    continues the relaxed filter set the cursor was issued for.
+    """
+    if not cursor or not dropped:
+        return cursor
+    return f"{_RELAXED_CURSOR_PREFIX}{'+'.join(dropped)}.{cursor}"
+
+
+def _split_cursor(cursor: Optional[str]) -> tuple[List[str], Optional[str]]:
+    """Inverse of :func:`_relaxed_cursor`: ``(dropped_filters, api_cursor)``."""
+    if not cursor or not cursor.startswith(_RELAXED_CURSOR_PREFIX):
+        return [], cursor
+    dropped, _, api_cursor = cursor[len(_RELAXED_CURSOR_PREFIX):].partition(".")
+    return [f for f in dropped.split("+") if f in RELAXABLE_FILTERS], api_cursor or None
+
+
 def map_rental_type_to_listing_type(rental_type: str) -> str:
     """
     Map legacy rental_type to v1 listing_type_code.
@@ -70,7 +93,8 @@ def map_rental_type_to_listing_type(rental_type: str) -> str:
 def search_listings_v1(
     filled_slots: Dict[str, Any],
     max_results: int = 20,
-    api_base: Optional[str] = None
+    api_base: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Search real estate listings using v1 schema filled slots.
@@ -94,11 +118,16 @@ def search_listings_v1(
             - available_to: date
         max_results: Maximum number of results to return (default: 20)
         api_base: Optional API base URL (default: from settings or localhost)
+        cursor: Opaque keyset cursor from a previous page's ``next_cursor``.
+            Continuation pages never apply the progressive fallbacks.
 
     Returns:
         Dict with:
             - count: int (number of results)
             - results: List[Dict] (listing objects from v1 schema)
+            - total: Optional[int] (cached total matching the filters)
+            - next_cursor: Optional[str] (None when exhausted; after a fallback
+              it keeps the relaxed filters for the following pages)
             - filters_used: Dict (query params sent to API)
             - cached: bool (whether result was from cache)
             - error: Optional[str] (error message if failed)
@@ -169,6 +198,12 @@ def search_listings_v1(
 
     # Add max results
     params["limit"] = max_results
+    if cursor:
+        # A cursor from a relaxed first page keeps the same filters relaxed
+        dropped, api_cursor = _split_cursor(cursor)
+        for name in dropped:
+            params.pop(name, None)
+        params["cursor"] = api_cursor
 
     # Check cache first (30s TTL)
     cache_key = _build_cache_key(params)
@@ -233,9 +268,10 @@ def search_listings_v1(
             params
         )
 
-        # Progressive fallback: if 0 results, relax filters
+        # Progressive fallback: if 0 results, relax filters (first page only)
         effective_params = dict(params)
-        if result_count == 0:
+        page_data = data
+        if result_count == 0 and not cursor:
             # 1) Drop price_max if present
             if "max_price" in effective_params:
                 relaxed = dict(effective_params)
@@ -251,10 +287,11 @@ def search_listings_v1(
                         result_count = rc
                         results = data_relaxed.get("results", [])
                         effective_params = relaxed
+                        page_data = data_relaxed
                 except Exception:
                     pass
 
-        if result_count == 0:
+        if result_count == 0 and not cursor:
             # 2) Drop listing_type restriction
             if "listing_type" in effective_params:
                 relaxed2 = dict(effective_params)
@@ -270,14 +307,19 @@ def search_listings_v1(
                         result_count = rc2
                         results = data_relaxed2.get("results", [])
                         effective_params = relaxed2
+                        page_data = data_relaxed2
                 except Exception:
                     pass
 
+        dropped = [name for name in RELAXABLE_FILTERS if name in params and name not in effective_params]
         result = {
             "count": result_count,
             "results": results,
             "filters_used": effective_params,
-            "cached": False
+            "cached": False,
+            # Total and cursor belong to the filter set that produced the page
+            "total": page_data.get("total"),
+            "next_cursor": _relaxed_cursor(dropped, page_data.get("next_cursor")),
         }
 
         # Cache result for 30s
@@ -1,10 +1,13 @@
-"""Centralised OpenAI chat-completion helper for agent flows."""
+"""Centralised OpenAI chat-completion helper for agent flows (pooled via assistant.llm_gateway)."""
 
 from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from assistant.llm_gateway import OpenAIUnavailableError, chat_completion, get_openai_client
+from assistant.monitoring.metrics import PerformanceTracker
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +20,34 @@ _DEFAULT_MODEL = (
 )
 
 
-class OpenAIUnavailableError(RuntimeError):
-    """Raised when OpenAI credentials are missing or the SDK is unavailable."""
+def _build_request(
+    messages: List[Dict[str, Any]],
+    *,
+    model: Optional[str],
+    temperature: Optional[float],
+    max_tokens: Optional[int],
+    extra: Dict[str, Any],
+) -> Dict[str, Any]:
+    request_payload: Dict[str, Any] = {
+        "model": model or _DEFAULT_MODEL,
+        "messages": messages,
+    }
+    if temperature is not None:
+        request_payload["temperature"] = temperature
+    if max_tokens is not None:
+        request_payload["max_tokens"] = max_tokens
+    request_payload.update(extra)
+    return request_payload
 
 
-def _require_api_key() -> str:
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise OpenAIUnavailableError("OPENAI_API_KEY is not configured")
-    return api_key
+def _record_usage(tracker: PerformanceTracker, usage: Any) -> None:
+    if usage is None:
+        return
+    tracker.update_tokens(
+        prompt_tokens=getattr(usage, "prompt_tokens", None),
+        completion_tokens=getattr(usage, "completion_tokens", None),
+        total_tokens=getattr(usage, "total_tokens", None),
+    )
 
 
 def generate_chat_completion(
@@ -39,24 +61,10 @@ def generate_chat_completion(
 ) -> str:
     """Execute a chat completion request and return the assistant text."""
 
-    api_key = _require_api_key()
-    try:
-        from openai import OpenAI
-    except Exception as exc:  # noqa: BLE001
-        raise OpenAIUnavailableError(f"openai SDK import failed: {exc}") from exc
-
-    client = OpenAI(api_key=api_key, timeout=timeout)
-    request_payload: Dict[str, Any] = {
-        "model": model or _DEFAULT_MODEL,
-        "messages": messages,
-    }
-    if temperature is not None:
-        request_payload["temperature"] = temperature
-    if max_tokens is not None:
-        request_payload["max_tokens"] = max_tokens
-    request_payload.update(kwargs)
-
-    response = client.chat.completions.create(**request_payload)
+    request_payload = _build_request(
+        messages, model=model, temperature=temperature, max_tokens=max_tokens, extra=kwargs
+    )
+    response = chat_completion(timeout=timeout, **request_payload)
     choice = response.choices[0] if response.choices else None
     content = choice.message.content if choice and choice.message else ""
     if not content:
@@ -64,4 +72,38 @@ def generate_chat_completion(
     return content or ""
 
 
-__all__ = ["generate_chat_completion", "OpenAIUnavailableError"]
+def stream_chat_completion(
+    messages: List[Dict[str, Any]],
+    *,
+    on_delta: Callable[[str], None],
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    timeout: float = 30.0,
+    **kwargs: Any,
+) -> str:
+    """Stream a chat completion, calling ``on_delta`` per content chunk; return the full text."""
+
+    client = get_openai_client(timeout=timeout)
+    request_payload = _build_request(
+        messages, model=model, temperature=temperature, max_tokens=max_tokens, extra=kwargs
+    )
+    request_payload["stream"] = True
+    request_payload.setdefault("stream_options", {"include_usage": True})
+    parts: List[str] = []
+    with PerformanceTracker(model=request_payload["model"]) as tracker:
+        for chunk in client.chat.completions.create(**request_payload):
+            # The final chunk carries usage and no choices
+            _record_usage(tracker, getattr(chunk, "usage", None))
+            choice = chunk.choices[0] if chunk.choices else None
+            delta = choice.delta.content if choice and choice.delta else None
+            if delta:
+                parts.append(delta)
+                on_delta(delta)
+    content = "".join(parts)
+    if not content:
+        logger.warning("OpenAI streamed chat completion returned empty content")
+    return content
+
+
+__all__ = ["generate_chat_completion", "stream_chat_completion", "OpenAIUnavailableError"]
@@ -0,0 +1,233 @@
+"""
+Shared LLM clients for every OpenAI call site.
+
+All clients are built once per process and share one keep-alive HTTPX pool,
+so calls reuse warm TLS connections instead of setting up a new client per
+request. The pool size (``LLM_HTTP_POOL_SIZE``) doubles as
+the process-wide concurrency limit: extra calls wait up to
+``LLM_POOL_TIMEOUT_S`` for a free connection.
+
+- ``get_openai_client``: raw OpenAI SDK clients keyed by timeout;
+  ``chat_completion`` wraps them with accounting.
+- ``get_chat_openai``: LangChain ``ChatOpenAI`` instances keyed by
+  (model, temperature, timeout, json_mode); each reports latency, tokens and
+  cost through ``PerformanceTracker`` (``LLM_REQUESTS_TOTAL`` /
+  ``LLM_TOKENS_TOTAL``) unless ``track_usage=False``.
+
+Async calls keep the SDK's own transport: an ``httpx.AsyncClient`` is bound
+to the event loop it first ran on, so a process-wide one cannot be shared.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from threading import RLock
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LLM_HTTP_POOL_SIZE = int(os.getenv("LLM_HTTP_POOL_SIZE", "32"))
+LLM_POOL_TIMEOUT_S = float(os.getenv("LLM_POOL_TIMEOUT_S", "10"))
+LLM_KEEPALIVE_EXPIRY_S = float(os.getenv("LLM_KEEPALIVE_EXPIRY_S", "60"))
+
+_LOCK = RLock()
+_HTTP_CLIENT = None
+_OPENAI_CLIENTS: Dict[Tuple[str, float], Any] = {}
+_CHAT_MODELS: Dict[Tuple[Any, ...], Any] = {}
+
+
+class OpenAIUnavailableError(RuntimeError):
+    """Raised when OpenAI credentials are missing or the SDK is unavailable."""
+
+
+def _api_key() -> str:
+    api_key = None
+    try:
+        from django.conf import settings
+
+        api_key = getattr(settings, "OPENAI_API_KEY", None)
+    except Exception:  # noqa: BLE001 - settings not configured (scripts)
+        api_key = None
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise OpenAIUnavailableError("OPENAI_API_KEY is not configured")
+    return api_key
+
+
+def _limits():
+    import httpx
+
+    return httpx.Limits(
+        max_connections=max(LLM_HTTP_POOL_SIZE, 1),
+        max_keepalive_connections=max(LLM_HTTP_POOL_SIZE, 1),
+        keepalive_expiry=LLM_KEEPALIVE_EXPIRY_S,
+    )
+
+
+def _pool_timeout(timeout: float):
+    import httpx
+
+    return httpx.Timeout(timeout, pool=LLM_POOL_TIMEOUT_S)
+
+
+def shared_http_client():
+    """Process-wide keep-alive ``httpx.Client`` used by every sync LLM client."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        with _LOCK:
+            if _HTTP_CLIENT is None:
+                import httpx
+
+                _HTTP_CLIENT = httpx.Client(limits=_limits(), timeout=_pool_timeout(60.0))
+    return _HTTP_CLIENT
+
+
+def get_openai_client(*, timeout: float = 30.0):
+    """Return the shared ``openai.OpenAI`` client for ``timeout``."""
+    api_key = _api_key()
+    key = (api_key, float(timeout))
+    client = _OPENAI_CLIENTS.get(key)
+    if client is None:
+        try:
+            from openai import OpenAI
+        except Exception as exc:  # noqa: BLE001
+            raise OpenAIUnavailableError(f"openai SDK import failed: {exc}") from exc
+        with _LOCK:
+            client = _OPENAI_CLIENTS.get(key)
+            if client is None:
+                client = OpenAI(api_key=api_key, timeout=_pool_timeout(timeout), http_client=shared_http_client())
+                _OPENAI_CLIENTS[key] = client
+    return client
+
+
+def chat_completion(*, timeout: float = 30.0, agent: Optional[str] = None, **request: Any):
+    """``chat.completions.create`` on the shared client, recorded via PerformanceTracker."""
+    from assistant.monitoring.metrics import PerformanceTracker
+
+    client = get_openai_client(timeout=timeout)
+    with PerformanceTracker(model=request.get("model") or "unknown") as tracker:
+        if agent:
+            tracker.set_tool_context(agent_name=agent)
+        response = client.chat.completions.create(**request)
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            tracker.update_tokens(
+                prompt_tokens=getattr(usage, "prompt_tokens", None),
+                completion_tokens=getattr(usage, "completion_tokens", None),
+                total_tokens=getattr(usage, "total_tokens", None),
+            )
+    return response
+
+
+def _usage_callback_class():
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class _UsageCallback(BaseCallbackHandler):
+        """Feeds LangChain chat calls into PerformanceTracker (LLM_* metrics)."""
+
+        def __init__(self, model: str, agent: Optional[str]):
+            self.model = model
+            self.agent = agent
+            self._trackers: Dict[Any, Any] = {}
+
+        def _start(self, run_id) -> None:
+            from assistant.monitoring.metrics import PerformanceTracker
+
+            tracker = PerformanceTracker(model=self.model)
+            if self.agent:
+                tracker.set_tool_context(agent_name=self.agent)
+            tracker.__enter__()
+            self._trackers[run_id] = tracker
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+            self._start(run_id)
+
+        def on_llm_start(self, serialized, prompts, *, run_id, **kwargs) -> None:
+            self._start(run_id)
+
+        def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+            tracker = self._trackers.pop(run_id, None)
+            if tracker is None:
+                return
+            usage = (getattr(response, "llm_output", None) or {}).get("token_usage") or {}
+            tracker.update_tokens(
+                prompt_tokens=usage.get("prompt_tokens"),
+                completion_tokens=usage.get("completion_tokens"),
+                total_tokens=usage.get("total_tokens"),
+            )
+            tracker.__exit__(None, None, None)
+
+        def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+            tracker = self._trackers.pop(run_id, None)
+            if tracker is not None:
+                tracker.__exit__(type(error), error, None)
+
+    return _UsageCallback
+
+
+def get_chat_openai(
+    model: str,
+    *,
+    temperature: Optional[float] = None,
+    timeout: Optional[float] = None,
+    json_mode: bool = False,
+    max_retries: Optional[int] = None,
+    agent: Optional[str] = None,
+    track_usage: bool = True,
+    llm_cls: Any = None,
+) -> Any:
+    """
+    Return a shared LangChain ``ChatOpenAI`` bound to the pooled HTTP client.
+
+    ``llm_cls`` lets modules keep their own patchable ``ChatOpenAI`` name;
+    anything other than the real class is constructed fresh and not cached.
+    """
+    from langchain_openai import ChatOpenAI
+
+    kwargs: Dict[str, Any] = {"model": model}
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    if max_retries is not None:
+        kwargs["max_retries"] = max_retries
+    if json_mode:
+        kwargs["model_kwargs"] = {"response_format": {"type": "json_object"}}
+
+    if llm_cls is not None and llm_cls is not ChatOpenAI:
+        return llm_cls(**kwargs)
+
+    kwargs["api_key"] = _api_key()
+    key = (model, temperature, timeout, json_mode, max_retries, agent, track_usage, kwargs["api_key"])
+    llm = _CHAT_MODELS.get(key)
+    if llm is None:
+        with _LOCK:
+            llm = _CHAT_MODELS.get(key)
+            if llm is None:
+                if track_usage:
+                    kwargs["callbacks"] = [_usage_callback_class()(model, agent)]
+                llm = ChatOpenAI(
+                    http_client=shared_http_client(),
+                    **kwargs,
+                )
+                _CHAT_MODELS[key] = llm
+    return llm
+
+
+def reset_clients() -> None:
+    """Drop cached clients (tests, or after the API key changes)."""
+    global _HTTP_CLIENT
+    with _LOCK:
+        _OPENAI_CLIENTS.clear()
+        _CHAT_MODELS.clear()
+        _HTTP_CLIENT = None
+
+
+__all__ = [
+    "OpenAIUnavailableError",
+    "chat_completion",
+    "get_chat_openai",
+    "get_openai_client",
+    "reset_clients",
+    "shared_http_client",
+]
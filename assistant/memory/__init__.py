@@ -22,6 +22,7 @@ from .service import (  # noqa: F401
     fetch_thread_context,
     get_client,
     invalidate_context,
+    prefetch_thread_context,
 )
 
 __all__ = [
@@ -33,6 +34,7 @@ __all__ = [
     "call_zep",
     "fetch_thread_context",
     "invalidate_context",
+    "prefetch_thread_context",
     "ZepClient",
     "ZepClientError",
     "ZepCircuitOpenError",
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
 from threading import Lock
 from typing import Any, Dict, Optional, Tuple
 
@@ -50,6 +51,22 @@ logger = logging.getLogger(__name__)
 _CLIENT: Optional[ZepClient] = None
 _CLIENT_LOCK = Lock()
 
+CONTEXT_FRESH_TTL = 30
+CONTEXT_STALE_TTL = int(os.getenv("ZEP_CONTEXT_STALE_TTL", "900"))
+CONTEXT_REFRESH_AHEAD_S = int(os.getenv("ZEP_CONTEXT_REFRESH_AHEAD_S", "20"))
+CONTEXT_REFRESH_LOCK_TTL = 15
+_CONTEXT_REFRESH_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ZEP_CONTEXT_REFRESH_WORKERS", "4")),
+    thread_name_prefix="zep-context",
+)
+_CONTEXT_REFRESHES: Dict[Tuple[str, str], Future] = {}
+_CONTEXT_REFRESH_LOCK = Lock()
+
+
+def _context_keys(thread_id: str, mode: str) -> Tuple[str, str]:
+    """(fresh, stale) cache keys; invalidate_context only drops the fresh one."""
+    return f"zep:ctx:v1:{thread_id}:{mode}", f"zep:ctx:stale:{thread_id}:{mode}"
+
 
 def get_client(*, require_read: bool = False, require_write: bool = False) -> Optional[ZepClient]:
     """
@@ -150,81 +167,39 @@ def call_zep(op: str, func, *, observe_retry: bool = False) -> Tuple[bool, Optio
         return True, result
 
 
-def fetch_thread_context(
-    thread_id: str,
-    *,
-    mode: str = "summary",
-    timeout_ms: int = 250,
-) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
-    """
-    Fetch summarised memory context for a thread with timeout fallback and auto-downgrade guard.
-
-    Args:
-        thread_id: Thread identifier
-        mode: Context retrieval strategy (summary, etc.)
-        timeout_ms: Maximum time to wait for context (default 250ms)
-
-    Returns a tuple of (context_dict | None, metadata) where metadata always
-    includes the fields required for traces.memory.
-
-    Auto-downgrade behavior (PR-J):
-        - If mode is forced to write_only due to health issues, immediately return empty context
-        - On 401/403: Force write_only mode, hold for 5 minutes
-        - On 3 consecutive timeouts/5xx: Force write_only mode, hold for 5 minutes
-        - After TTL expiry: Attempt probe with 150ms timeout; on success restore mode
-    """
-    meta: Dict[str, Any] = {
-        "used": False,
-        "mode": effective_mode().value,  # Use effective_mode instead of current_mode
-        "source": "zep",
-        "strategy": mode,
-    }
-
-    # PR-J: Check if mode is forced to write_only (health degradation)
-    forced = get_forced_mode()
-    if forced:
-        meta.update({
-            "used": False,
-            "source": "write_only_forced",
-            "reason": forced.get("reason"),
-            "until": forced.get("until"),
-        })
-        logger.debug(
-            "zep_read_blocked_forced_mode",
-            extra={"thread_id": thread_id, "reason": forced.get("reason")}
-        )
-        return None, meta
-
-    # Cache fast-path
-    cache_key = f"zep:ctx:v1:{thread_id}:{mode}"
-    cached = None
+def _load_context(client, thread_id: str, mode: str, timeout_ms: int) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+    """Blocking Zep context read; runs on the refresh pool and fills the cache."""
+    meta: Dict[str, Any] = {}
+    cache_key, stale_key = _context_keys(thread_id, mode)
+    lock_key = f"zep:ctx:lock:{thread_id}:{mode}"
+    if not cache.add(lock_key, 1, timeout=CONTEXT_REFRESH_LOCK_TTL):
+        # Another process is refreshing this thread: wait for its result instead of dog-piling
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        while time.monotonic() < deadline:
+            cached = cache.get(cache_key)
+            if isinstance(cached, dict) and not cached.get("_neg"):
+                return cached, {"used": True, "cached": True}
+            time.sleep(0.02)
+        return None, {"reason": "refresh_in_progress"}
     try:
-        cached = cache.get(cache_key)
-    except Exception:
-        cached = None
-
-    if isinstance(cached, dict):
-        # Negative cache sentinel suppresses dog-piling for a short period
-        if cached.get("_neg"):
-            meta.update({"used": False, "cached": True, "source": cached.get("source", "timeout"), "reason": cached.get("reason", "timeout")})
-            return None, meta
-        inc_zep_context_cache_hit()
-        meta.update({"used": True, "cached": True})
-        meta.setdefault("facts_count", len(cached.get("facts") or []))
-        meta.setdefault("recent_count", len(cached.get("recent") or []))
-        return cached, meta
+        return _read_context(client, thread_id, mode, timeout_ms, cache_key, stale_key, meta)
+    finally:
+        cache.delete(lock_key)
 
-    client = get_client(require_read=True)
-    if not client:
-        meta["reason"] = "disabled"
-        return None, meta
 
+def _read_context(
+    client,
+    thread_id: str,
+    mode: str,
+    timeout_ms: int,
+    cache_key: str,
+    stale_key: str,
+    meta: Dict[str, Any],
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
     op = f"context_{mode}"
     inc_zep_read_request(op)
     start = time.perf_counter()
     try:
-        # Note: The ZepClient already has timeout_ms configured globally,
-        # but we track our own timeout to ensure strict read-path bounds
         context = client.get_user_context(thread_id, mode=mode)
     except ZepCircuitOpenError:
         inc_zep_read_skipped(op, "circuit_open")
@@ -316,11 +291,10 @@ def fetch_thread_context(
     latency = time.perf_counter() - start
     observe_zep_read_latency(op, latency)
 
-    # Check if we exceeded our timeout budget even though the request succeeded
+    # Callers waiting on this refresh were already released at their budget;
+    # keep a signal for slow upstream reads.
     latency_ms = latency * 1000
     if latency_ms > timeout_ms:
-        # Mark as over budget for traces and emit a warning
-        meta["reason"] = "timeout"
         logger.warning(
             "zep_context_slow",
             extra={"thread_id": thread_id, "mode": mode, "latency_ms": round(latency_ms, 2), "timeout_ms": timeout_ms},
@@ -337,12 +311,168 @@ def fetch_thread_context(
         }
     )
     try:
-        cache.set(cache_key, context, timeout=30)
+        cache.set(cache_key, context, timeout=CONTEXT_FRESH_TTL)
+        cache.set(stale_key, {"context": context, "fetched_at": time.time()}, timeout=CONTEXT_STALE_TTL)
     except Exception:
         pass
     return context, meta
 
 
+def _drop_context_refresh(key: Tuple[str, str], future: Future) -> None:
+    with _CONTEXT_REFRESH_LOCK:
+        if _CONTEXT_REFRESHES.get(key) is future:
+            del _CONTEXT_REFRESHES[key]
+
+
+def _submit_context_refresh(client, thread_id: str, mode: str, timeout_ms: int) -> Future:
+    """Start (or join) the single in-flight refresh for this thread/mode."""
+    key = (str(thread_id), mode)
+    with _CONTEXT_REFRESH_LOCK:
+        future = _CONTEXT_REFRESHES.get(key)
+        if future is None:
+            future = _CONTEXT_REFRESH_POOL.submit(_load_context, client, thread_id, mode, timeout_ms)
+            _CONTEXT_REFRESHES[key] = future
+            future.add_done_callback(lambda f: _drop_context_refresh(key, f))
+        return future
+
+
+def prefetch_thread_context(thread_id: str, *, mode: str = "summary", timeout_ms: int = 250) -> None:
+    """Warm the context cache in the background (e.g. as soon as a user message is accepted)."""
+    if not thread_id or get_forced_mode():
+        return
+    try:
+        if cache.get(_context_keys(thread_id, mode)[0]) is not None:
+            return
+        client = get_client(require_read=True)
+        if client:
+            _submit_context_refresh(client, thread_id, mode, timeout_ms)
+    except Exception as exc:  # noqa: BLE001 - prefetch is best-effort
+        logger.debug("zep_context_prefetch_failed", extra={"thread_id": thread_id, "error": str(exc)})
+
+
+def fetch_thread_context(
+    thread_id: str,
+    *,
+    mode: str = "summary",
+    timeout_ms: int = 250,
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Fetch summarised memory context for a thread with timeout fallback and auto-downgrade guard.
+
+    Reads are stale-while-revalidate: a fresh entry (CONTEXT_FRESH_TTL) is
+    served directly and refreshed ahead of expiry; on a miss a single
+    background refresh per thread is started (or joined) and awaited for at
+    most ``timeout_ms``, after which the last good context (kept for
+    CONTEXT_STALE_TTL) or None is returned. The budget is a hard ceiling.
+
+    Args:
+        thread_id: Thread identifier
+        mode: Context retrieval strategy (summary, etc.)
+        timeout_ms: Maximum time to wait for context (default 250ms)
+
+    Returns a tuple of (context_dict | None, metadata) where metadata always
+    includes the fields required for traces.memory.
+
+    Auto-downgrade behavior (PR-J):
+        - If mode is forced to write_only due to health issues, immediately return empty context
+        - On 401/403: Force write_only mode, hold for 5 minutes
+        - On 3 consecutive timeouts/5xx: Force write_only mode, hold for 5 minutes
+        - After TTL expiry: Attempt probe with 150ms timeout; on success restore mode
+    """
+    meta: Dict[str, Any] = {
+        "used": False,
+        "mode": effective_mode().value,  # Use effective_mode instead of current_mode
+        "source": "zep",
+        "strategy": mode,
+    }
+
+    # PR-J: Check if mode is forced to write_only (health degradation)
+    forced = get_forced_mode()
+    if forced:
+        meta.update({
+            "used": False,
+            "source": "write_only_forced",
+            "reason": forced.get("reason"),
+            "until": forced.get("until"),
+        })
+        logger.debug(
+            "zep_read_blocked_forced_mode",
+            extra={"thread_id": thread_id, "reason": forced.get("reason")}
+        )
+        return None, meta
+
+    # Cache fast-path
+    cache_key, stale_key = _context_keys(thread_id, mode)
+    cached = None
+    try:
+        cached = cache.get(cache_key)
+    except Exception:
+        cached = None
+
+    if isinstance(cached, dict):
+        # Negative cache sentinel suppresses dog-piling for a short period
+        if cached.get("_neg"):
+            meta.update({"used": False, "cached": True, "source": cached.get("source", "timeout"), "reason": cached.get("reason", "timeout")})
+            return None, meta
+        inc_zep_context_cache_hit()
+        meta.update({"used": True, "cached": True})
+        meta.setdefault("facts_count", len(cached.get("facts") or []))
+        meta.setdefault("recent_count", len(cached.get("recent") or []))
+        _refresh_ahead(thread_id, mode, timeout_ms)
+        return cached, meta
+
+    client = get_client(require_read=True)
+    if not client:
+        meta["reason"] = "disabled"
+        return None, meta
+
+    # Single-flight refresh on the background pool; wait at most timeout_ms
+    future = _submit_context_refresh(client, thread_id, mode, timeout_ms)
+    try:
+        context, refresh_meta = future.result(timeout=max(timeout_ms, 1) / 1000.0)
+    except FutureTimeout:
+        context, refresh_meta = None, {"reason": "timeout", "source": "timeout"}
+        logger.warning(
+            "zep_context_timeout",
+            extra={"thread_id": thread_id, "mode": mode, "timeout_ms": timeout_ms, "refresh": "background"},
+        )
+    meta.update(refresh_meta)
+    if context is not None:
+        return context, meta
+
+    # Stale-while-revalidate: serve the last good context unless auth failed
+    if meta.get("reason") != "auth":
+        try:
+            stale = cache.get(stale_key)
+        except Exception:
+            stale = None
+        if isinstance(stale, dict) and isinstance(stale.get("context"), dict):
+            stale_context = stale["context"]
+            meta.update({
+                "used": True,
+                "cached": True,
+                "stale": True,
+                "stale_age_s": round(time.time() - stale.get("fetched_at", 0), 1),
+                "facts_count": len(stale_context.get("facts") or []),
+                "recent_count": len(stale_context.get("recent") or []),
+            })
+            return stale_context, meta
+    return None, meta
+
+
+def _refresh_ahead(thread_id: str, mode: str, timeout_ms: int) -> None:
+    """Keep active threads warm: refresh in the background before the fresh entry expires."""
+    try:
+        stale = cache.get(_context_keys(thread_id, mode)[1])
+        if not isinstance(stale, dict) or time.time() - stale.get("fetched_at", 0) < CONTEXT_REFRESH_AHEAD_S:
+            return
+        client = get_client(require_read=True)
+        if client:
+            _submit_context_refresh(client, thread_id, mode, timeout_ms)
+    except Exception:
+        pass
+
+
 def invalidate_context(thread_id: str) -> None:
     """Invalidate cached context entries for a thread.
 
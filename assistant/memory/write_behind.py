@@ -0,0 +1,300 @@
+"""
+Write-behind buffer for mirroring chat turns into Zep.
+
+The chat path only appends messages to a per-thread buffer in the shared
+cache and schedules a flush; a Celery task on the ``memory`` queue drains the
+buffer in order and posts it as one multi-message batch per thread. The chat
+reply therefore never waits on a Zep round-trip.
+
+Buffer layout (per thread):
+    zwb:{thread}:seq        monotonically increasing sequence (cache.incr)
+    zwb:{thread}:done       highest sequence already delivered to Zep
+    zwb:{thread}:item:{n}   buffered message payload ``n``
+    zwb:{thread}:scheduled  set while a flush task is queued (coalesces turns)
+    zwb:{thread}:lock       held by the single active flusher (keeps order)
+    zwb:{thread}:user       Zep user the thread's messages are written for
+    zwb:{thread}:key:{k}    stable key of a recently buffered message (dedupe)
+
+Payloads are PII-redacted before they are buffered; the flusher sends them
+verbatim. Every message gets a stable key when it is enqueued: the Message
+primary key for turns mirrored from the Message table, the (role, content)
+hash otherwise. A re-enqueue of a key seen in the last ``RECENT_TTL``
+seconds is dropped, so when the same turn is written both by the chat task
+and by the supervisor graph only one copy is sent, whichever comes first.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+
+from .pii import redact_pii
+
+logger = logging.getLogger(__name__)
+
+WRITE_BEHIND_ENABLED = os.getenv("ZEP_WRITE_BEHIND", "true").strip().lower() in {"1", "true", "yes"}
+FLUSH_DELAY_S = float(os.getenv("ZEP_WRITE_BEHIND_DELAY_MS", "500")) / 1000.0
+MAX_BATCH = int(os.getenv("ZEP_WRITE_BEHIND_MAX_BATCH", "50"))
+BUFFER_TTL = int(os.getenv("ZEP_WRITE_BEHIND_TTL", str(7 * 24 * 3600)))
+LOCK_TTL = 60
+GAP_ATTEMPTS = 3
+RECENT_HASHES = 32
+RECENT_TTL = 300
+
+
+class WriteBehindFlushError(RuntimeError):
+    """Raised when a batch could not be delivered; the buffer is kept for retry."""
+
+
+def _key(thread_id: str, *parts: Any) -> str:
+    return ":".join(["zwb", str(thread_id), *(str(p) for p in parts)])
+
+
+def redacted(role: str, content: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build a Zep message payload with PII redacted (the single redaction point)."""
+    redaction = redact_pii(content)
+    payload: Dict[str, Any] = {"role": role, "content": redaction["text"]}
+    meta = dict(metadata or {})
+    if redaction["redactions"]:
+        meta["pii_redactions"] = redaction["redactions"]
+    if meta:
+        payload["metadata"] = meta
+    return payload
+
+
+def _next_seq(thread_id: str) -> int:
+    seq_key = _key(thread_id, "seq")
+    cache.add(seq_key, 0, timeout=BUFFER_TTL)
+    cache.add(_key(thread_id, "done"), 0, timeout=BUFFER_TTL)
+    try:
+        return cache.incr(seq_key)
+    except ValueError:
+        # Key evicted between add and incr
+        cache.add(seq_key, 0, timeout=BUFFER_TTL)
+        return cache.incr(seq_key)
+
+
+def _claim(thread_id: str, payload: Dict[str, Any]) -> bool:
+    """
+    Record the payload's stable key; False when it is a re-enqueue to drop.
+
+    Mirrored messages claim their Message pk, so a user repeating themselves
+    is kept. Each message also claims its (role, content) hash: an un-keyed
+    copy never follows a claimed hash, and a mirrored copy does not follow
+    an un-keyed one (the graph echoed the turn first).
+    """
+    digest_key = _key(thread_id, "key", _content_hash(payload))
+    if not _is_mirrored(payload):
+        return cache.add(digest_key, "unkeyed", timeout=RECENT_TTL)
+    pk_key = _key(thread_id, "key", f"pk:{payload['metadata']['message_pk']}")
+    if not cache.add(pk_key, 1, timeout=RECENT_TTL):
+        return False
+    if cache.add(digest_key, "mirrored", timeout=RECENT_TTL):
+        return True
+    if cache.get(digest_key) == "unkeyed":
+        cache.set(digest_key, "mirrored", timeout=RECENT_TTL)
+        return False
+    return True
+
+
+def enqueue_messages(
+    thread_id: str,
+    payloads: Iterable[Dict[str, Any]],
+    *,
+    user_id: Optional[str] = None,
+) -> bool:
+    """
+    Buffer already-redacted payloads for ``thread_id`` and schedule a flush.
+
+    ``user_id`` (the Zep user) is remembered with the thread's buffer, so
+    callers that do not know it still flush under the right user.
+
+    Returns True when the messages were accepted (buffered, already
+    buffered under the same key, or written inline when write-behind is
+    disabled).
+    """
+    payloads = [p for p in payloads if (p.get("content") or "").strip()]
+    if not thread_id or not payloads:
+        return False
+    thread_id = str(thread_id)
+    try:
+        if user_id:
+            cache.set(_key(thread_id, "user"), str(user_id), timeout=BUFFER_TTL)
+        for payload in payloads:
+            if not _claim(thread_id, payload):
+                continue
+            seq = _next_seq(thread_id)
+            cache.set(_key(thread_id, "item", seq), payload, timeout=BUFFER_TTL)
+        cache.touch(_key(thread_id, "seq"), BUFFER_TTL)
+        cache.touch(_key(thread_id, "done"), BUFFER_TTL)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("zep_write_behind_enqueue_failed", extra={"thread_id": thread_id, "error": str(exc)})
+        return False
+
+    if not WRITE_BEHIND_ENABLED:
+        try:
+            flush_thread(thread_id)
+        except WriteBehindFlushError:
+            return False
+        return True
+    _schedule_flush(thread_id)
+    return True
+
+
+def _schedule_flush(thread_id: str, countdown: Optional[float] = None) -> None:
+    if not cache.add(_key(thread_id, "scheduled"), 1, timeout=LOCK_TTL):
+        return  # a queued flush will pick these messages up
+    try:
+        from assistant.tasks import flush_zep_writes
+
+        flush_zep_writes.apply_async(
+            args=[thread_id],
+            countdown=FLUSH_DELAY_S if countdown is None else countdown,
+        )
+    except Exception as exc:  # noqa: BLE001 - broker outage: keep buffered for the next turn
+        cache.delete(_key(thread_id, "scheduled"))
+        logger.warning("zep_write_behind_schedule_failed", extra={"thread_id": thread_id, "error": str(exc)})
+
+
+def pending_count(thread_id: str) -> int:
+    thread_id = str(thread_id)
+    return max(int(cache.get(_key(thread_id, "seq"), 0)) - int(cache.get(_key(thread_id, "done"), 0)), 0)
+
+
+def _content_hash(payload: Dict[str, Any]) -> str:
+    raw = f"{payload.get('role')}\x00{(payload.get('content') or '').strip()}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _is_mirrored(payload: Dict[str, Any]) -> bool:
+    """Messages mirrored from the Message table carry their primary key."""
+    return bool((payload.get("metadata") or {}).get("message_pk"))
+
+
+def _coalesce(thread_id: str, batch: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Drop echoes of the same turn written without a Message row behind them.
+
+    Two mirrored messages are never merged (a user may repeat themselves);
+    an un-keyed payload is dropped when the same (role, content) was seen
+    in this batch or delivered recently, and replaced in-batch by a
+    mirrored copy when one follows.
+    """
+    seen = set(cache.get(_key(thread_id, "recent")) or [])
+    out: List[Dict[str, Any]] = []
+    index: Dict[str, int] = {}
+    for payload in batch:
+        digest = _content_hash(payload)
+        mirrored = _is_mirrored(payload)
+        if digest in index:
+            kept = out[index[digest]]
+            if not mirrored:
+                continue
+            if not _is_mirrored(kept):
+                out[index[digest]] = payload
+                continue
+        elif digest in seen and not mirrored:
+            continue
+        index[digest] = len(out)
+        out.append(payload)
+    return out, list(index)
+
+
+def _remember_delivered(thread_id: str, digests: List[str]) -> None:
+    if not digests:
+        return
+    recent = list(cache.get(_key(thread_id, "recent")) or [])
+    cache.set(_key(thread_id, "recent"), (recent + digests)[-RECENT_HASHES:], timeout=RECENT_TTL)
+
+
+def _read_batch(thread_id: str, done: int, head: int) -> tuple[List[Dict[str, Any]], int]:
+    """Return the contiguous run of buffered payloads after ``done`` and its last sequence."""
+    seqs = list(range(done + 1, min(head, done + MAX_BATCH) + 1))
+    items = cache.get_many([_key(thread_id, "item", s) for s in seqs])
+    batch: List[Dict[str, Any]] = []
+    last = done
+    for seq in seqs:
+        payload = items.get(_key(thread_id, "item", seq))
+        if payload is None:
+            if batch:
+                break
+            # Either a concurrent enqueue has not stored it yet, or it was
+            # evicted; skip it once it stays missing for a few flushes.
+            gap_key = _key(thread_id, "gap", seq)
+            cache.add(gap_key, 0, timeout=LOCK_TTL * 10)
+            if cache.incr(gap_key) < GAP_ATTEMPTS:
+                break
+            logger.warning("zep_write_behind_gap_skipped", extra={"thread_id": thread_id, "seq": seq})
+            last = seq
+            continue
+        batch.append(payload)
+        last = seq
+    return batch, last
+
+
+def flush_thread(thread_id: str, *, user_id: Optional[str] = None, client: Any = None) -> int:
+    """
+    Deliver buffered messages for ``thread_id`` in order; return how many were sent.
+
+    Raises :class:`WriteBehindFlushError` when Zep rejects a batch so the
+    caller (Celery) can retry; undelivered messages stay buffered. The Zep
+    user is read from the buffer unless ``user_id`` is given.
+    """
+    from .service import call_zep, get_client, invalidate_context
+
+    thread_id = str(thread_id)
+    cache.delete(_key(thread_id, "scheduled"))
+    lock_key = _key(thread_id, "lock")
+    if not cache.add(lock_key, 1, timeout=LOCK_TTL):
+        # Another worker is flushing; make sure a later flush sees our items.
+        _schedule_flush(thread_id)
+        return 0
+    user_id = user_id or cache.get(_key(thread_id, "user"))
+
+    sent = 0
+    try:
+        client = client or get_client(require_write=True)
+        if client is None:
+            return 0
+        while True:
+            done = int(cache.get(_key(thread_id, "done"), 0))
+            head = int(cache.get(_key(thread_id, "seq"), 0))
+            if head <= done:
+                break
+            batch, last = _read_batch(thread_id, done, head)
+            if last == done:
+                _schedule_flush(thread_id, countdown=FLUSH_DELAY_S)
+                break
+            messages, digests = _coalesce(thread_id, batch)
+            if messages:
+                ok, _ = call_zep(
+                    "batch_messages",
+                    lambda: client.add_messages(thread_id, messages, user_id=user_id),
+                    observe_retry=True,
+                )
+                if not ok:
+                    raise WriteBehindFlushError(f"Zep batch write failed for thread {thread_id}")
+                _remember_delivered(thread_id, digests)
+            cache.set(_key(thread_id, "done"), last, timeout=BUFFER_TTL)
+            cache.delete_many([_key(thread_id, "item", s) for s in range(done + 1, last + 1)])
+            sent += len(messages)
+        return sent
+    finally:
+        cache.delete(lock_key)
+        if sent:
+            # The landed batch changes what Zep returns for this thread
+            invalidate_context(thread_id)
+            logger.info("zep_write_behind_flushed", extra={"thread_id": thread_id, "messages": sent})
+
+
+__all__ = [
+    "WRITE_BEHIND_ENABLED",
+    "WriteBehindFlushError",
+    "enqueue_messages",
+    "flush_thread",
+    "pending_count",
+    "redacted",
+]
@@ -17,6 +17,8 @@ import time
 from threading import Lock
 from typing import Any, Dict, Iterable, Optional, Literal
 
+from .zep_transport import KNOWN_THREADS, KNOWN_USERS, build_session
+
 logger = logging.getLogger(__name__)
 
 # Import metrics for skipped writes (same as original client)
@@ -71,8 +73,8 @@ class ZepCloudClient:
         max_retries: int = 2,
         failure_threshold: int = 3,
         cooldown_seconds: float = 30.0,
-        session: Optional[Any] = None,  # Ignored, for compatibility
-        proxies: Optional[Dict[str, str]] = None,  # Ignored, for compatibility
+        session: Optional[Any] = None,
+        proxies: Optional[Dict[str, str]] = None,
         api_version: Literal["v1", "v2", "auto"] = "auto",
     ) -> None:
         """
@@ -85,8 +87,8 @@ class ZepCloudClient:
             max_retries: Max retry attempts (for circuit breaker compatibility)
             failure_threshold: Circuit breaker failure threshold
             cooldown_seconds: Circuit breaker cooldown duration
-            session: Ignored (compatibility with old client)
-            proxies: Ignored (compatibility with old client)
+            session: Optional pre-built HTTP session (defaults to a pooled keep-alive session)
+            proxies: Optional proxy map applied to the default session
             api_version: API version preference (Cloud SDK always uses v2)
         """
         # Validate we're pointing to Zep Cloud
@@ -101,6 +103,11 @@ class ZepCloudClient:
         self.api_version = "v2"  # Always use v2 for Cloud API
         self.is_cloud = True
 
+        # Pooled keep-alive transport and "already exists" caches (see zep_transport)
+        self._http = session if session is not None else build_session(proxies=proxies)
+        self._known_users = KNOWN_USERS
+        self._known_threads = KNOWN_THREADS
+
         # Circuit breaker state (same as original client)
         self._lock = Lock()
         self._failure_count = 0
@@ -187,7 +194,8 @@ class ZepCloudClient:
         Returns:
             Empty dict on success
         """
-        import requests
+        if user_id in self._known_users:
+            return {}
 
         print(f"[ZEP USER] Checking if user {user_id} exists")
 
@@ -200,12 +208,13 @@ class ZepCloudClient:
         check_url = f"{self.base_url}/api/v2/users/{user_id}"
 
         try:
-            check_resp = requests.get(check_url, headers=headers, timeout=5)
+            check_resp = self._http.get(check_url, headers=headers, timeout=5)
             print(f"[ZEP USER] GET response: HTTP {check_resp.status_code}")
 
             if check_resp.status_code == 200:
                 # User exists
                 print(f"[ZEP USER] User {user_id} already exists")
+                self._known_users.add(user_id)
                 return {}
 
             if check_resp.status_code == 404:
@@ -220,7 +229,7 @@ class ZepCloudClient:
 
                 print(f"[ZEP USER] Creating user {user_id}")
 
-                create_resp = requests.post(
+                create_resp = self._http.post(
                     create_url,
                     json=create_payload,
                     headers=headers,
@@ -233,10 +242,12 @@ class ZepCloudClient:
                         "zep_user_created",
                         extra={"user_id": user_id}
                     )
+                    self._known_users.add(user_id)
                     return {}
                 elif create_resp.status_code == 409:
                     # Conflict - user already exists (race condition)
                     print(f"[ZEP USER] User {user_id} already exists (409 conflict)")
+                    self._known_users.add(user_id)
                     return {}
                 else:
                     error_body = create_resp.text
@@ -282,7 +293,8 @@ class ZepCloudClient:
         Returns:
             Empty dict on success
         """
-        import requests
+        if thread_id in self._known_threads:
+            return {}
 
         print(f"[ZEP CREATE] Ensuring user {user_id} exists first")
         # CRITICAL: Create user BEFORE thread
@@ -302,7 +314,7 @@ class ZepCloudClient:
         print(f"[ZEP CREATE] GET {check_url}")
 
         try:
-            check_resp = requests.get(check_url, headers=headers, params={"lastn": 1}, timeout=5)
+            check_resp = self._http.get(check_url, headers=headers, params={"lastn": 1}, timeout=5)
             print(f"[ZEP CREATE] GET response: HTTP {check_resp.status_code}")
 
             if check_resp.status_code == 200:
@@ -311,6 +323,7 @@ class ZepCloudClient:
                     "zep_thread_exists",
                     extra={"thread_id": thread_id}
                 )
+                self._known_threads.add(thread_id)
                 return {}
 
             if check_resp.status_code == 404:
@@ -328,7 +341,7 @@ class ZepCloudClient:
 
                 print(f"[ZEP CREATE] Creating thread {thread_id} for user {user_id}")
 
-                create_resp = requests.post(
+                create_resp = self._http.post(
                     create_url,
                     json=create_payload,
                     headers=headers,
@@ -341,6 +354,7 @@ class ZepCloudClient:
                         extra={"thread_id": thread_id, "user_id": user_id}
                     )
                     print(f"[ZEP CREATE] Thread created successfully: {thread_id}")
+                    self._known_threads.add(thread_id)
                     return {}
                 elif create_resp.status_code == 409:
                     # Thread already exists (race condition)
@@ -349,6 +363,7 @@ class ZepCloudClient:
                         "zep_thread_already_exists",
                         extra={"thread_id": thread_id}
                     )
+                    self._known_threads.add(thread_id)
                     return {}
                 else:
                     # Log creation failure
@@ -391,7 +406,7 @@ class ZepCloudClient:
 
             print(f"[ZEP CREATE] Creating thread {thread_id} for user {user_id} (after unexpected check)")
 
-            create_resp = requests.post(
+            create_resp = self._http.post(
                 create_url,
                 json=create_payload,
                 headers=headers,
@@ -404,6 +419,7 @@ class ZepCloudClient:
                     extra={"thread_id": thread_id, "user_id": user_id, "after_unexpected_check": True}
                 )
                 print(f"[ZEP CREATE] Thread created successfully: {thread_id}")
+                self._known_threads.add(thread_id)
                 return {}
             elif create_resp.status_code == 409:
                 # Thread already exists (race condition or check endpoint issue)
@@ -412,6 +428,7 @@ class ZepCloudClient:
                     "zep_thread_already_exists",
                     extra={"thread_id": thread_id}
                 )
+                self._known_threads.add(thread_id)
                 return {}
             else:
                 # Failed to create
@@ -479,48 +496,8 @@ class ZepCloudClient:
                 extra={"thread_id": thread_id, "warning": "user_id not available - thread may not exist"}
             )
 
-        messages_list = list(messages)
-
-        # GUARD: Never enqueue empty messages arrays to Zep
-        if not messages_list:
-            logger.info(
-                "zep_write_skipped_empty_array",
-                extra={"thread_id": thread_id, "reason": "empty"}
-            )
-            inc_zep_write_skipped("add_messages", "empty_array")
-            return {}
-
-        # GUARD: Filter out messages with empty or too-short content
-        valid_messages = []
-        for msg in messages_list:
-            content = (msg.get("content") or "").strip()
-            role = msg.get("role", "")
-
-            if not content:
-                logger.info(
-                    "zep_write_skipped_empty_content",
-                    extra={"thread_id": thread_id, "role": role, "reason": "empty"}
-                )
-                inc_zep_write_skipped("add_messages", "empty_content")
-                continue
-
-            if len(content) < 2:
-                logger.info(
-                    "zep_write_skipped_short_content",
-                    extra={"thread_id": thread_id, "role": role, "length": len(content), "reason": "too_short"}
-                )
-                inc_zep_write_skipped("add_messages", "content_too_short")
-                continue
-
-            valid_messages.append(msg)
-
-        # If no valid messages after filtering, skip write
+        valid_messages = self._filter_messages(thread_id, messages)
         if not valid_messages:
-            logger.info(
-                "zep_write_skipped_no_valid_messages",
-                extra={"thread_id": thread_id, "original_count": len(messages_list), "reason": "empty"}
-            )
-            inc_zep_write_skipped("add_messages", "no_valid_messages")
             return {}
 
         # Use direct HTTP API call with official schema
@@ -530,17 +507,7 @@ class ZepCloudClient:
             import requests
 
             # Build payload matching official Zep API schema
-            payload = {
-                "messages": [
-                    {
-                        "role": msg.get("role", "user"),
-                        "content": msg["content"],
-                        "metadata": msg.get("metadata"),
-                        "name": msg.get("name"),
-                    }
-                    for msg in valid_messages
-                ]
-            }
+            payload = self._messages_payload(valid_messages)
 
             # Direct HTTP call to official endpoint
             url = f"{self.base_url}/api/v2/threads/{thread_id}/messages"
@@ -549,7 +516,7 @@ class ZepCloudClient:
                 "Content-Type": "application/json",
             }
 
-            response = requests.post(
+            response = self._http.post(
                 url,
                 json=payload,
                 headers=headers,
@@ -577,6 +544,9 @@ class ZepCloudClient:
 
             # Handle error responses
             self._record_failure(transient=(500 <= response.status_code < 600))
+            if response.status_code == 404:
+                # Thread vanished upstream; recreate it on the next write
+                self._known_threads.discard(thread_id)
 
             error_body = None
             try:
@@ -684,7 +654,7 @@ class ZepCloudClient:
             # Get last 10 messages for context
             params = {"lastn": 10}
 
-            response = requests.get(
+            response = self._http.get(
                 url,
                 headers=headers,
                 params=params,
@@ -711,29 +681,7 @@ class ZepCloudClient:
                 messages = data.get("messages", [])
 
                 # Convert to our expected format
-                result = {
-                    "context": "",  # Build context from messages
-                    "facts": [],
-                    "recent": [
-                        {
-                            "role": msg.get("role"),
-                            "content": msg.get("content"),
-                            "uuid": msg.get("uuid"),
-                            "created_at": msg.get("created_at"),
-                        }
-                        for msg in messages
-                    ],
-                }
-
-                # Build simple context summary from recent messages
-                if messages:
-                    summary_parts = []
-                    for msg in messages[-5:]:  # Last 5 messages
-                        role = msg.get("role", "unknown")
-                        content = msg.get("content", "")
-                        if content:
-                            summary_parts.append(f"[{role}] {content[:100]}")
-                    result["context"] = " | ".join(summary_parts)
+                result = self._context_from_messages(messages)
 
                 logger.debug(
                     "zep_context_fetched",
@@ -818,11 +766,136 @@ class ZepCloudClient:
 
     @property
     def session(self):
-        """Compatibility property (not used by SDK)."""
-        return None
+        """Pooled HTTP session used for all Zep calls."""
+        return self._http
 
     # --- Helper Methods ---
 
+    def _filter_messages(self, thread_id: str, messages: Iterable[Dict[str, Any]]) -> list[Dict[str, Any]]:
+        """Drop empty/too-short messages (never send them to Zep), counting skips."""
+        messages_list = list(messages)
+
+        # GUARD: Never enqueue empty messages arrays to Zep
+        if not messages_list:
+            logger.info(
+                "zep_write_skipped_empty_array",
+                extra={"thread_id": thread_id, "reason": "empty"}
+            )
+            inc_zep_write_skipped("add_messages", "empty_array")
+            return []
+
+        # GUARD: Filter out messages with empty or too-short content
+        valid_messages = []
+        for msg in messages_list:
+            content = (msg.get("content") or "").strip()
+            role = msg.get("role", "")
+
+            if not content:
+                logger.info(
+                    "zep_write_skipped_empty_content",
+                    extra={"thread_id": thread_id, "role": role, "reason": "empty"}
+                )
+                inc_zep_write_skipped("add_messages", "empty_content")
+                continue
+
+            if len(content) < 2:
+                logger.info(
+                    "zep_write_skipped_short_content",
+                    extra={"thread_id": thread_id, "role": role, "length": len(content), "reason": "too_short"}
+                )
+                inc_zep_write_skipped("add_messages", "content_too_short")
+                continue
+
+            valid_messages.append(msg)
+
+        # If no valid messages after filtering, skip write
+        if not valid_messages:
+            logger.info(
+                "zep_write_skipped_no_valid_messages",
+                extra={"thread_id": thread_id, "original_count": len(messages_list), "reason": "empty"}
+            )
+            inc_zep_write_skipped("add_messages", "no_valid_messages")
+            return []
+        return valid_messages
+
+    @staticmethod
+    def _messages_payload(valid_messages: list[Dict[str, Any]]) -> Dict[str, Any]:
+        """Official schema: { "messages": [ {"role", "content", "metadata", "name"} ] }"""
+        return {
+            "messages": [
+                {
+                    "role": msg.get("role", "user"),
+                    "content": msg["content"],
+                    "metadata": msg.get("metadata"),
+                    "name": msg.get("name"),
+                }
+                for msg in valid_messages
+            ]
+        }
+
+    @staticmethod
+    def _context_from_messages(messages: list[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert a thread message window into the context dict callers expect."""
+        result = {
+            "context": "",  # Build context from messages
+            "facts": [],
+            "recent": [
+                {
+                    "role": msg.get("role"),
+                    "content": msg.get("content"),
+                    "uuid": msg.get("uuid"),
+                    "created_at": msg.get("created_at"),
+                }
+                for msg in messages
+            ],
+        }
+
+        # Build simple context summary from recent messages
+        if messages:
+            summary_parts = []
+            for msg in messages[-5:]:  # Last 5 messages
+                role = msg.get("role", "unknown")
+                content = msg.get("content", "")
+                if content:
+                    summary_parts.append(f"[{role}] {content[:100]}")
+            result["context"] = " | ".join(summary_parts)
+        return result
+
+    @staticmethod
+    def _search_contents(sdata: Dict[str, Any], limit: int) -> list[str]:
+        results = sdata.get("results", []) or sdata.get("messages", []) or []
+        out: list[str] = []
+        for item in results:
+            # result may be dict with content/message
+            content = None
+            if isinstance(item, dict):
+                content = item.get("content") or item.get("message")
+            if isinstance(content, str) and content.strip():
+                out.append(content.strip())
+            if len(out) >= limit:
+                break
+        return out
+
+    @staticmethod
+    def _window_matches(messages: list[Dict[str, Any]], query: str, limit: int) -> list[str]:
+        q = (query or "").strip().lower()
+        if not q:
+            return []
+
+        matches: list[str] = []
+        for msg in reversed(messages):  # Search newest to oldest
+            try:
+                content = (msg.get("content") or "").strip()
+                if not content:
+                    continue
+                if q in content.lower():
+                    matches.append(content)
+                    if len(matches) >= limit:
+                        break
+            except Exception:
+                continue
+        return matches
+
     def _lookup_user_id_from_thread(self, thread_id: str) -> Optional[str]:
         """
         Look up user_id from ConversationThread in database.
@@ -919,23 +992,12 @@ class ZepCloudClient:
             try:
                 search_url = f"{self.base_url}/api/v2/threads/{thread_id}/search"
                 payload = {"text": query, "limit": limit}
-                sresp = requests.post(search_url, json=payload, headers=headers, timeout=10)
+                sresp = self._http.post(search_url, json=payload, headers=headers, timeout=10)
                 if sresp.status_code == 404:
                     # Thread not found yet → no memories
                     return []
                 if sresp.status_code in (200, 201):
-                    sdata = sresp.json() or {}
-                    results = sdata.get("results", []) or sdata.get("messages", []) or []
-                    out: list[str] = []
-                    for item in results:
-                        # result may be dict with content/message
-                        content = None
-                        if isinstance(item, dict):
-                            content = item.get("content") or item.get("message")
-                        if isinstance(content, str) and content.strip():
-                            out.append(content.strip())
-                        if len(out) >= limit:
-                            break
+                    out = self._search_contents(sresp.json() or {}, limit)
                     if out:
                         return out
             except requests.RequestException as e:
@@ -946,7 +1008,7 @@ class ZepCloudClient:
             # Fallback: windowed fetch + substring filter
             msgs_url = f"{self.base_url}/api/v2/threads/{thread_id}/messages"
             params = {"lastn": 50}
-            mresp = requests.get(msgs_url, headers=headers, params=params, timeout=10)
+            mresp = self._http.get(msgs_url, headers=headers, params=params, timeout=10)
             if mresp.status_code == 404:
                 return []
             if mresp.status_code != 200:
@@ -957,24 +1019,7 @@ class ZepCloudClient:
                 return []
 
             data = mresp.json() or {}
-            messages = list(data.get("messages", []))
-            q = (query or "").strip().lower()
-            if not q:
-                return []
-
-            matches: list[str] = []
-            for msg in reversed(messages):  # Search newest to oldest
-                try:
-                    content = (msg.get("content") or "").strip()
-                    if not content:
-                        continue
-                    if q in content.lower():
-                        matches.append(content)
-                        if len(matches) >= limit:
-                            break
-                except Exception:
-                    continue
-            return matches
+            return self._window_matches(list(data.get("messages", [])), query, limit)
         except Exception as e:
             logger.debug(
                 "zep_query_memory_error",
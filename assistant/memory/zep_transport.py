@@ -0,0 +1,110 @@
+"""
+HTTP transport shared by the Zep clients.
+
+- ``build_session``: a keep-alive ``requests.Session`` with a sized connection
+  pool, so each Zep call reuses a warm TLS connection instead of opening one.
+- ``KnownEntities``: records users/threads already known to exist in Zep
+  (process-local LRU backed by the Django cache), so ``ensure_user`` /
+  ``ensure_thread`` round-trips happen once per entity rather than per write.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+ZEP_HTTP_POOL_SIZE = int(os.getenv("ZEP_HTTP_POOL_SIZE", "20"))
+ZEP_KNOWN_ENTITY_TTL = int(os.getenv("ZEP_KNOWN_ENTITY_TTL", "86400"))
+ZEP_KNOWN_ENTITY_LOCAL_MAX = int(os.getenv("ZEP_KNOWN_ENTITY_LOCAL_MAX", "10000"))
+
+
+def build_session(*, pool_size: int = ZEP_HTTP_POOL_SIZE, proxies: Optional[Dict[str, str]] = None):
+    """Return a pooled keep-alive session for Zep (retries stay with the caller)."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(pool_size, 1), max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if proxies:
+        session.proxies.update(proxies)
+    return session
+
+
+class KnownEntities:
+    """Set of Zep ids known to exist: in-process LRU first, then the shared cache."""
+
+    def __init__(self, kind: str, *, ttl: int = ZEP_KNOWN_ENTITY_TTL, max_local: int = ZEP_KNOWN_ENTITY_LOCAL_MAX):
+        self.kind = kind
+        self._ttl = ttl
+        self._max_local = max(max_local, 1)
+        self._local: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = Lock()
+
+    def _key(self, entity_id: str) -> str:
+        return f"zep_known:{self.kind}:{entity_id}"
+
+    def _remember_local(self, entity_id: str) -> None:
+        with self._lock:
+            self._local[entity_id] = None
+            self._local.move_to_end(entity_id)
+            while len(self._local) > self._max_local:
+                self._local.popitem(last=False)
+
+    def __contains__(self, entity_id: object) -> bool:
+        entity_id = str(entity_id)
+        with self._lock:
+            if entity_id in self._local:
+                self._local.move_to_end(entity_id)
+                return True
+        try:
+            from django.core.cache import cache
+
+            if cache.get(self._key(entity_id)):
+                self._remember_local(entity_id)
+                return True
+        except Exception as exc:  # noqa: BLE001 - cache outage means "unknown"
+            logger.debug("zep_known_cache_get_failed: %s", exc)
+        return False
+
+    def add(self, entity_id: str) -> None:
+        entity_id = str(entity_id)
+        self._remember_local(entity_id)
+        try:
+            from django.core.cache import cache
+
+            cache.set(self._key(entity_id), 1, timeout=self._ttl)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("zep_known_cache_set_failed: %s", exc)
+
+    def discard(self, entity_id: str) -> None:
+        entity_id = str(entity_id)
+        with self._lock:
+            self._local.pop(entity_id, None)
+        try:
+            from django.core.cache import cache
+
+            cache.delete(self._key(entity_id))
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("zep_known_cache_delete_failed: %s", exc)
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+
+KNOWN_USERS = KnownEntities("user")
+KNOWN_THREADS = KnownEntities("thread")
+
+
+__all__ = [
+    "build_session",
+    "KnownEntities",
+    "KNOWN_USERS",
+    "KNOWN_THREADS",
+]
@@ -0,0 +1,227 @@
+"""
+Cardinality guard for Prometheus metrics.
+
+Every exported label key must be on ``ALLOWED_LABEL_KEYS``; identifier keys
+(``thread_id``, ``user_id``, ...) are never exported. A ``GuardedMetric``
+wraps a prometheus_client metric and rewrites label values at ``labels()``
+time:
+
+- hashed keys (e.g. ``thread_id``) become a stable ``thread_bucket`` in
+  ``0..METRICS_THREAD_BUCKETS-1``;
+- any other key keeps at most ``METRICS_MAX_LABEL_VALUES`` distinct values,
+  later ones collapse to ``"other"``.
+
+Exact per-thread activity is kept in-process only, in a Space-Saving top-K
+sketch per metric (``sketch_snapshot``), exposed by the
+``metrics/top-threads/`` debug endpoint rather than on ``/metrics``.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+THREAD_BUCKETS = int(os.getenv("METRICS_THREAD_BUCKETS", "16"))
+MAX_LABEL_VALUES = int(os.getenv("METRICS_MAX_LABEL_VALUES", "100"))
+TOP_K = int(os.getenv("METRICS_TOP_K", "100"))
+OTHER = "other"
+
+HIGH_CARDINALITY_KEYS = frozenset({
+    "thread_id",
+    "conversation_id",
+    "user_id",
+    "session_id",
+    "request_id",
+    "message_id",
+    "listing_id",
+})
+
+ALLOWED_LABEL_KEYS = frozenset({
+    "act", "agent", "agent_name", "cache_type", "category", "code", "component", "connection_type",
+    "domain", "endpoint", "error_type", "event", "field_type", "from_domain", "intent", "kind",
+    "language", "layer", "market_id", "method", "mode", "model", "model_family", "node", "op",
+    "operation", "path", "provider", "reason", "rent_type", "result", "route_target", "service",
+    "severity", "slot", "source", "stage", "state", "status", "status_code", "success", "task_name",
+    "tenure", "thread_bucket", "to_domain", "tool", "type", "variant", "why",
+})
+
+
+class CardinalityError(ValueError):
+    """Raised when a metric would export a label key outside the allowlist."""
+
+
+def check_label_names(metric_name: str, labelnames: Iterable[str]) -> None:
+    for key in labelnames:
+        if key in HIGH_CARDINALITY_KEYS or key not in ALLOWED_LABEL_KEYS:
+            raise CardinalityError(f"{metric_name}: label {key!r} is not on the metrics label allowlist")
+
+
+def hash_bucket(value: Any, buckets: int = THREAD_BUCKETS) -> str:
+    """Stable (cross-process) bucket for an identifier."""
+    digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+    return str(int.from_bytes(digest, "big") % max(buckets, 1))
+
+
+class BoundedValues:
+    """First ``limit`` distinct values pass through, the rest map to ``"other"``."""
+
+    def __init__(self, limit: int = MAX_LABEL_VALUES):
+        self.limit = limit
+        self._seen: set = set()
+        self._lock = threading.Lock()
+
+    def bound(self, value: Any) -> str:
+        value = str(value)
+        if value in self._seen:
+            return value
+        with self._lock:
+            if value in self._seen:
+                return value
+            if len(self._seen) >= self.limit:
+                return OTHER
+            self._seen.add(value)
+            return value
+
+
+class TopKSketch:
+    """
+    Space-Saving heavy-hitter sketch with ``capacity`` counters.
+
+    Counts for tracked keys are exact until the sketch is full; after that an
+    evicted key's replacement inherits the evicted count as its ``error``
+    bound, so ``count - error`` is a guaranteed lower bound.
+    """
+
+    def __init__(self, capacity: int = TOP_K):
+        self.capacity = max(capacity, 1)
+        self._counts: Dict[str, float] = {}
+        self._errors: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, key: Any, amount: float = 1.0) -> None:
+        key = str(key)
+        with self._lock:
+            if key in self._counts:
+                self._counts[key] += amount
+                return
+            if len(self._counts) < self.capacity:
+                self._counts[key] = amount
+                self._errors[key] = 0.0
+                return
+            victim = min(self._counts, key=self._counts.__getitem__)
+            floor = self._counts.pop(victim)
+            self._errors.pop(victim, None)
+            self._counts[key] = floor + amount
+            self._errors[key] = floor
+
+    def top(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            ranked = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+            return [
+                {"key": key, "count": count, "error": self._errors.get(key, 0.0)}
+                for key, count in ranked[:n]
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._errors.clear()
+
+
+_SKETCHES: Dict[str, TopKSketch] = {}
+_SKETCHES_LOCK = threading.Lock()
+
+
+def sketch_for(metric_name: str) -> TopKSketch:
+    sketch = _SKETCHES.get(metric_name)
+    if sketch is None:
+        with _SKETCHES_LOCK:
+            sketch = _SKETCHES.setdefault(metric_name, TopKSketch())
+    return sketch
+
+
+def sketch_snapshot(n: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """Top keys per guarded metric (debug endpoint payload)."""
+    return {name: sketch.top(n) for name, sketch in sorted(_SKETCHES.items())}
+
+
+class _GuardedChild:
+    """Forwards to the bounded child; inc/observe also feed the per-key sketch."""
+
+    __slots__ = ("_child", "_sketch", "_key")
+
+    def __init__(self, child: Any, sketch: Optional[TopKSketch], key: Optional[str]):
+        self._child = child
+        self._sketch = sketch
+        self._key = key
+
+    def inc(self, amount: float = 1) -> None:
+        if self._sketch is not None and amount > 0:
+            self._sketch.add(self._key, amount)
+        self._child.inc(amount)
+
+    def observe(self, value: float) -> None:
+        if self._sketch is not None:
+            self._sketch.add(self._key)
+        self._child.observe(value)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._child, name)
+
+
+class GuardedMetric:
+    """
+    Wrap a labelled prometheus_client metric behind the cardinality guard.
+
+    ``hashed`` maps a caller-side identifier key to the exported bucket key,
+    e.g. ``{"thread_id": "thread_bucket"}``.
+    """
+
+    def __init__(self, metric: Any, hashed: Optional[Dict[str, str]] = None, buckets: int = THREAD_BUCKETS):
+        self._metric = metric
+        self._name = getattr(metric, "_name", repr(metric))
+        self._hashed = dict(hashed or {})
+        self._buckets = buckets
+        labelnames: Tuple[str, ...] = tuple(getattr(metric, "_labelnames", ()))
+        check_label_names(self._name, labelnames)
+        self._bounded = {key: BoundedValues() for key in labelnames if key not in self._hashed.values()}
+        self._sketch = sketch_for(self._name) if self._hashed else None
+
+    def labels(self, **labels: Any) -> _GuardedChild:
+        exported: Dict[str, str] = {}
+        sketch_key = None
+        for key, value in labels.items():
+            if key in self._hashed:
+                sketch_key = str(value)
+                exported[self._hashed[key]] = hash_bucket(value, self._buckets)
+            elif key in self._bounded:
+                exported[key] = self._bounded[key].bound(value)
+            else:
+                raise CardinalityError(f"{self._name}: unexpected label {key!r}")
+        return _GuardedChild(self._metric.labels(**exported), self._sketch if sketch_key else None, sketch_key)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._metric, name)
+
+
+def guarded(metric: Any, **hashed: str) -> GuardedMetric:
+    """``guarded(Gauge(..., ["thread_bucket"]), thread_id="thread_bucket")``."""
+    return GuardedMetric(metric, hashed=hashed)
+
+
+__all__ = [
+    "ALLOWED_LABEL_KEYS",
+    "BoundedValues",
+    "CardinalityError",
+    "GuardedMetric",
+    "HIGH_CARDINALITY_KEYS",
+    "TopKSketch",
+    "check_label_names",
+    "guarded",
+    "hash_bucket",
+    "sketch_snapshot",
+]
@@ -28,6 +28,8 @@ except Exception:
     cache = None
     _DJANGO_AVAILABLE = False
 
+from .cardinality import BoundedValues, guarded
+
 logger = logging.getLogger(__name__)
 
 def _safe_cache_get(key: str, default=None):
@@ -285,6 +287,27 @@ if _PROMETHEUS_AVAILABLE:
         "Count of cache hits for Zep context fetches",
         [],
     )
+    SUPERVISOR_TOKENIZER_SECONDS = Histogram(
+        "supervisor_tokenizer_seconds",
+        "Tokenizer time spent on context budget accounting per turn",
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+    )
+    SUPERVISOR_NODE_LATENCY_SECONDS = Histogram(
+        "supervisor_node_latency_seconds",
+        "Wall time per supervisor graph node (see assistant.brain.node_timing)",
+        ["node"],
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 3, 5, 8),
+    )
+    SUPERVISOR_NODE_DEADLINE_EXCEEDED_TOTAL = Counter(
+        "supervisor_node_deadline_exceeded_total",
+        "Supervisor graph nodes that ran past their soft deadline",
+        ["node"],
+    )
+    SUPERVISOR_NODE_SKIPPED_TOTAL = Counter(
+        "supervisor_node_skipped_total",
+        "Optional supervisor graph nodes skipped because the turn budget was spent",
+        ["node"],
+    )
     ERROR_RATE = Counter(
         "error_rate_total",
         "Error rate by service and error type",
@@ -380,21 +403,34 @@ if _PROMETHEUS_AVAILABLE:
         "Router context override events (sticky routing)",
         ["from_domain", "to_domain"],
     )
+    ROUTER_CASCADE_TOTAL = Counter(
+        "router_cascade_total",
+        "Routing cascade decisions by answering stage (local|llm) and domain",
+        ["stage", "domain"],
+    )
 
-    # Gate B: WebSocket connection metrics
-    WEBSOCKET_CONNECTIONS = Gauge(
-        "websocket_connections_active",
-        "Active WebSocket connections by thread",
-        ["thread_id"],
+    # Gate B: WebSocket connection metrics. Callers label by thread_id; the
+    # guard exports a bounded thread_bucket and keeps exact per-thread counts
+    # in the in-process top-K sketch (see monitoring.cardinality).
+    WEBSOCKET_CONNECTIONS = guarded(
+        Gauge(
+            "websocket_connections_active",
+            "Active WebSocket connections by thread bucket",
+            ["thread_bucket"],
+        ),
+        thread_id="thread_bucket",
     )
     WS_MESSAGE_SEND_ERRORS = Counter(
         "ws_message_send_errors_total",
         "Total WebSocket message send failures",
     )
-    WS_OUT_INVALID_ENVELOPE_TOTAL = Counter(
-        "ws_out_invalid_envelope_total",
-        "Outgoing WebSocket frames rejected by validation",
-        ["thread_id"],
+    WS_OUT_INVALID_ENVELOPE_TOTAL = guarded(
+        Counter(
+            "ws_out_invalid_envelope_total",
+            "Outgoing WebSocket frames rejected by validation, by thread bucket",
+            ["thread_bucket"],
+        ),
+        thread_id="thread_bucket",
     )
 
     # P1: Enhanced WebSocket metrics for production observability
@@ -445,46 +481,24 @@ if _PROMETHEUS_AVAILABLE:
         ["method"],
         buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0),
     )
-else:
-    WS_OUT_INVALID_ENVELOPE_TOTAL = None
-
-    # Gate B: WebSocket connection metrics
-    WEBSOCKET_CONNECTIONS = Gauge(
-        "websocket_connections_active",
-        "Active WebSocket connections by thread",
-        ["thread_id"],
-    )
-    WS_MESSAGE_SEND_ERRORS = Counter(
-        "ws_message_send_errors_total",
-        "Total WebSocket message send failures",
-    )
-    WS_OUT_INVALID_ENVELOPE_TOTAL = Counter(
-        "ws_out_invalid_envelope_total",
-        "Outgoing WebSocket frames rejected by validation",
-        ["thread_id"],
-    )
-
-    # P1: Enhanced WebSocket metrics for production observability
-    WS_CLOSES_TOTAL = Counter(
-        "ws_closes_total",
-        "WebSocket close events by code and reason",
-        ["code", "reason"],
-    )
-    WS_CONNECTION_DURATION_SECONDS = Histogram(
-        "ws_connection_duration_seconds",
-        "WebSocket connection duration in seconds",
-        buckets=[1, 5, 30, 60, 300, 600, 1800, 3600, 7200],  # 1s, 5s, 30s, 1m, 5m, 10m, 30m, 1h, 2h
+    PREFS_EXTRACT_MESSAGES_TOTAL = Counter(
+        "prefs_extract_messages_total",
+        "User messages handed to preference extraction",
+        ["result"],  # extracted (first in its window)|merged (rode along on another's call)
     )
-    WS_FRAMES_SENT_TOTAL = Counter(
-        "ws_frames_sent_total",
-        "WebSocket frames sent by event type",
-        ["event"],
-    )
-    WS_RECONNECT_ADVICE_TOTAL = Counter(
-        "ws_reconnect_advice_total",
-        "WebSocket reconnect advice given by reason",
-        ["why"],  # auth, network, transient
+    PREFS_UNCHANGED_TOTAL = Counter(
+        "prefs_unchanged_total",
+        "Extracted preferences not written because the stored row already matches",
+        ["type"],
     )
+else:
+    WEBSOCKET_CONNECTIONS = None
+    WS_MESSAGE_SEND_ERRORS = None
+    WS_OUT_INVALID_ENVELOPE_TOTAL = None
+    WS_CLOSES_TOTAL = None
+    WS_CONNECTION_DURATION_SECONDS = None
+    WS_FRAMES_SENT_TOTAL = None
+    WS_RECONNECT_ADVICE_TOTAL = None
 
 
 @dataclass
@@ -573,6 +587,22 @@ def observe_prefs_latency(method: str, seconds: float) -> None:
         pass
 
 
+def inc_prefs_messages(result: str, count: int = 1) -> None:
+    try:
+        if _PROMETHEUS_AVAILABLE and count:
+            PREFS_EXTRACT_MESSAGES_TOTAL.labels(result=result).inc(count)
+    except Exception:
+        pass
+
+
+def inc_prefs_unchanged(pref_type: str) -> None:
+    try:
+        if _PROMETHEUS_AVAILABLE:
+            PREFS_UNCHANGED_TOTAL.labels(type=pref_type).inc()
+    except Exception:
+        pass
+
+
 def increment_ws_invalid_envelope(thread_id: str) -> None:
     """Increment counter for invalid WS envelopes (noop if metrics disabled)."""
     try:
@@ -810,6 +840,15 @@ def inc_router_context_override(from_domain: str, to_domain: str) -> None:
         pass
 
 
+def inc_router_cascade(stage: str, domain: str) -> None:
+    """Increment routing cascade counter for the stage that answered the turn."""
+    try:
+        if _PROMETHEUS_AVAILABLE:
+            ROUTER_CASCADE_TOTAL.labels(stage=stage, domain=domain).inc()
+    except Exception:
+        pass
+
+
 def set_router_uncertain_ratio(domain: str, ratio: float) -> None:
     """Set ratio of uncertain predictions."""
     try:
@@ -1406,11 +1445,16 @@ def record_turn_summary(summary: Dict[str, Any], ttl_seconds: int = _PER_REQUEST
     )
 
 
+_HTTP_ENDPOINTS = BoundedValues()
+
+
 def record_http_metrics(method: str, endpoint: str, status_code: int, duration: float, service: str = "django"):
     """Record HTTP request metrics."""
     if not _PROMETHEUS_AVAILABLE:
         return
     
+    # Unresolved paths (404s, ids in URLs) must not mint new series
+    endpoint = _HTTP_ENDPOINTS.bound(endpoint)
     HTTP_REQUESTS_TOTAL.labels(
         method=method,
         endpoint=endpoint,
@@ -1534,3 +1578,43 @@ def inc_zep_context_cache_hit() -> None:
             MEMORY_ZEP_CONTEXT_CACHE_HITS_TOTAL.inc()
     except Exception:
         pass
+
+
+def observe_tokenizer_seconds(seconds: float) -> None:
+    try:
+        if _PROMETHEUS_AVAILABLE:
+            SUPERVISOR_TOKENIZER_SECONDS.observe(seconds)
+    except Exception:
+        pass
+
+
+def observe_node_latency(node: str, seconds: float) -> None:
+    try:
+        if _PROMETHEUS_AVAILABLE:
+            SUPERVISOR_NODE_LATENCY_SECONDS.labels(node=node).observe(seconds)
+    except Exception:
+        pass
+
+
+def inc_node_deadline_exceeded(node: str) -> None:
+    try:
+        if _PROMETHEUS_AVAILABLE:
+            SUPERVISOR_NODE_DEADLINE_EXCEEDED_TOTAL.labels(node=node).inc()
+    except Exception:
+        pass
+
+
+def inc_node_skipped(node: str) -> None:
+    try:
+        if _PROMETHEUS_AVAILABLE:
+            SUPERVISOR_NODE_SKIPPED_TOTAL.labels(node=node).inc()
+    except Exception:
+        pass
+
+
+def inc_llm_cache_hit(layer: str) -> None:
+    try:
+        if _PROMETHEUS_AVAILABLE:
+            LLM_CACHE_HITS_TOTAL.labels(layer).inc()
+    except Exception:
+        pass
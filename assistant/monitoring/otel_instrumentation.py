@@ -256,6 +256,19 @@ def create_agent_span(agent_name: str, operation: str, request_id: Optional[str]
     return _ManagedSpan(tracer, f"{agent_name}.{operation}", attributes)
 
 
+def create_node_span(node_name: str, thread_id: Optional[str] = None):
+    """Create a span for a supervisor graph node."""
+    if not ENABLE_OTEL_METRICS or _tracer_provider is None:
+        return _NullSpan()
+
+    tracer = get_tracer()
+    attributes = {
+        "graph.node": node_name,
+        "thread_id": thread_id or "",
+    }
+    return _ManagedSpan(tracer, f"supervisor.node.{node_name}", attributes)
+
+
 def create_tool_span(tool_name: str, operation: str, request_id: Optional[str] = None):
     """Create a span for tool operations."""
     if not ENABLE_OTEL_METRICS or _tracer_provider is None:
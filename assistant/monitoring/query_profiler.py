@@ -0,0 +1,175 @@
+"""
+Request-scoped database query profiler.
+
+``QueryProfile`` is a ``connection.execute_wrapper`` callable that records,
+for everything executed inside it, the query count, total DB time and a
+count per normalized SQL fingerprint (literals, placeholders and ``IN``
+lists collapsed). A fingerprint repeated ``QUERY_PROFILER_REPEAT_THRESHOLD``
+or more times in one request is reported as a likely N+1.
+
+- ``QueryProfilerMiddleware`` profiles each request when enabled
+  (``QUERY_PROFILER_ENABLED`` setting or env; defaults to ``DEBUG``), logs
+  suspected N+1 fingerprints, and under ``DEBUG`` adds ``X-DB-Query-Count``,
+  ``X-DB-Query-Time-Ms`` and ``X-DB-Max-Repeat`` response headers.
+- ``QueryBudgetMixin.assertMaxQueries(view, n)`` pins a query budget for a
+  view in tests and prints the fingerprint report when it is exceeded.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%s|\?")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WS_RE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """Normalize ``sql`` so queries that differ only by parameters compare equal."""
+    sql = _STRING_RE.sub("?", sql)
+    sql = _PLACEHOLDER_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("(...)", sql)
+    return _WS_RE.sub(" ", sql).strip()
+
+
+def _resolve_enabled() -> bool:
+    try:
+        from django.conf import settings
+
+        value = getattr(settings, "QUERY_PROFILER_ENABLED", None)
+        if value is not None:
+            return bool(value)
+        env = os.getenv("QUERY_PROFILER_ENABLED")
+        if env is None:
+            return bool(settings.DEBUG)
+    except Exception:  # noqa: BLE001
+        env = os.getenv("QUERY_PROFILER_ENABLED", "false")
+    return env.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _resolve_threshold() -> int:
+    try:
+        from django.conf import settings
+
+        value = getattr(settings, "QUERY_PROFILER_REPEAT_THRESHOLD", None)
+        if value is not None:
+            return int(value)
+    except Exception:  # noqa: BLE001
+        pass
+    return int(os.getenv("QUERY_PROFILER_REPEAT_THRESHOLD", "5"))
+
+
+class QueryProfile:
+    """``execute_wrapper`` that tallies count, DB time and fingerprints."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.fingerprints: Counter = Counter()
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.total_seconds += time.perf_counter() - started
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000.0
+
+    @property
+    def max_repeat(self) -> int:
+        return max(self.fingerprints.values(), default=0)
+
+    def repeated(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Fingerprints run at least ``threshold`` times (likely N+1), most repeated first."""
+        threshold = _resolve_threshold() if threshold is None else threshold
+        return [(sql, n) for sql, n in self.fingerprints.most_common() if n >= threshold]
+
+    def report(self, limit: int = 10) -> str:
+        lines = [f"{self.count} queries, {self.total_ms:.1f} ms"]
+        lines.extend(f"  {n:>4}x  {sql}" for sql, n in self.fingerprints.most_common(limit))
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_queries(using: Optional[str] = None) -> Iterator[QueryProfile]:
+    """Profile queries on ``using`` (default: every configured connection) inside the block."""
+    profile = QueryProfile()
+    aliases = [using] if using else list(connections)
+    with ExitStack() as stack:
+        for alias in aliases:
+            stack.enter_context(connections[alias].execute_wrapper(profile))
+        yield profile
+
+
+class QueryProfilerMiddleware:
+    """Profile each request's queries; flag N+1 patterns; expose counts as headers under DEBUG."""
+
+    def __init__(self, get_response: Callable):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not _resolve_enabled():
+            return self.get_response(request)
+
+        with profile_queries() as profile:
+            response = self.get_response(request)
+        request.query_profile = profile
+
+        repeated = profile.repeated()
+        if repeated:
+            sql, n = repeated[0]
+            logger.warning(
+                "Likely N+1 on %s %s: %d queries (%.1f ms), %d fingerprint(s) repeated; worst %dx: %s",
+                request.method,
+                request.path,
+                profile.count,
+                profile.total_ms,
+                len(repeated),
+                n,
+                sql[:300],
+            )
+
+        from django.conf import settings
+
+        if settings.DEBUG:
+            response["X-DB-Query-Count"] = str(profile.count)
+            response["X-DB-Query-Time-Ms"] = f"{profile.total_ms:.1f}"
+            response["X-DB-Max-Repeat"] = str(profile.max_repeat)
+        return response
+
+
+class QueryBudgetMixin:
+    """TestCase mixin: ``self.assertMaxQueries("/api/...", 6)`` or ``assertMaxQueries(callable, 6)``."""
+
+    def assertMaxQueries(self, view, n: int, using: Optional[str] = None, **request_kwargs):  # noqa: N802
+        with profile_queries(using) as profile:
+            result = self.client.get(view, **request_kwargs) if isinstance(view, str) else view()
+        if profile.count > n:
+            self.fail(f"{view}: {profile.count} queries exceed the budget of {n}\n{profile.report()}")
+        return result
+
+
+__all__ = [
+    "QueryBudgetMixin",
+    "QueryProfile",
+    "QueryProfilerMiddleware",
+    "fingerprint",
+    "profile_queries",
+]
@@ -1,4 +1,7 @@
 from django.http import HttpResponse, HttpResponseServerError
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
 
 try:
     from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
@@ -14,3 +17,20 @@ def prometheus_metrics_view(request):
         return HttpResponseServerError("Prometheus metrics not configured")
     output = generate_latest()
     return HttpResponse(output, content_type=CONTENT_TYPE_LATEST)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def top_threads_debug_view(request):
+    """
+    Exact per-thread activity for guarded metrics (top-K sketch, this process only).
+
+    GET /api/metrics/top-threads/?n=20
+    """
+    from .cardinality import sketch_snapshot
+
+    try:
+        n = max(1, min(int(request.GET.get("n", 20)), 1000))
+    except ValueError:
+        n = 20
+    return Response({"top": sketch_snapshot(n)})
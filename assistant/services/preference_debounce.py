@@ -0,0 +1,345 @@
+"""
+Debounced, batched preference extraction per thread.
+
+The chat task only appends the user's utterance to a per-thread buffer in the
+shared cache and schedules a flush; the flush waits until the thread has been
+quiet for ``PREFS_EXTRACT_DEBOUNCE_MS`` (or the oldest buffered message is
+``PREFS_EXTRACT_MAX_WAIT_MS`` old), then runs ONE extraction over everything
+buffered and persists the result with a single bulk upsert. A user typing
+several short messages in a row therefore costs one LLM call instead of one
+per message.
+
+Buffer layout (per thread):
+    pxb:{thread}:seq        monotonically increasing sequence (cache.incr)
+    pxb:{thread}:done       highest sequence already extracted
+    pxb:{thread}:item:{n}   buffered message ``n`` (user_id, message_id, utterance)
+    pxb:{thread}:first      enqueue time of the oldest unflushed message
+    pxb:{thread}:last       enqueue time of the newest message
+    pxb:{thread}:scheduled  set while a flush task is queued (coalesces messages)
+    pxb:{thread}:lock       held by the single active flusher
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from django.core.cache import cache
+
+from assistant.models import PreferenceExtractionEvent
+from assistant.monitoring.metrics import (
+    inc_prefs_extract_request,
+    inc_prefs_messages,
+    inc_prefs_saved,
+    inc_prefs_unchanged,
+    observe_prefs_latency,
+)
+from assistant.services.preference_extraction import extract_preferences_from_message
+from assistant.services.preferences import PreferenceService
+
+logger = logging.getLogger(__name__)
+
+DEBOUNCE_ENABLED = os.getenv("PREFS_EXTRACT_DEBOUNCE", "true").strip().lower() in {"1", "true", "yes"}
+DEBOUNCE_S = float(os.getenv("PREFS_EXTRACT_DEBOUNCE_MS", "2000")) / 1000.0
+MAX_WAIT_S = float(os.getenv("PREFS_EXTRACT_MAX_WAIT_MS", "10000")) / 1000.0
+MAX_BATCH = int(os.getenv("PREFS_EXTRACT_MAX_BATCH", "20"))
+BUFFER_TTL = 3600
+LOCK_TTL = 120
+GAP_ATTEMPTS = 3
+EXTRACT_ATTEMPTS = 3
+
+_BUDGET_RE = re.compile(r"(€|\$|eur|usd|try)\s?([0-9]{2,6})", flags=re.IGNORECASE)
+
+
+def _key(thread_id: str, *parts: Any) -> str:
+    return ":".join(["pxb", str(thread_id), *(str(p) for p in parts)])
+
+
+def _now() -> float:
+    return time.time()
+
+
+def _rule_budget(utterance: str) -> Optional[Dict[str, Any]]:
+    m = _BUDGET_RE.search(utterance)
+    if not m:
+        return None
+    sym = m.group(1).upper()
+    amount = float(m.group(2))
+    unit = "EUR" if sym in {"€", "EUR"} else ("USD" if sym in {"$", "USD"} else ("TRY" if sym == "TRY" else "EUR"))
+    return {
+        "category": "real_estate",
+        "preference_type": "budget",
+        "value": {"type": "range", "min": amount, "max": None, "unit": unit},
+        "confidence": 0.6,
+        "source": "inferred",
+    }
+
+
+def extract_and_persist(user_id: int, thread_id: str, message_ids: List[str], utterances: List[str]) -> Dict[str, Any]:
+    """
+    Extract preferences from one or more consecutive utterances with a single
+    LLM call (plus the rule-based budget fallback) and bulk-upsert them.
+
+    Later utterances win when they restate the same preference type.
+    """
+    start = time.perf_counter()
+    method = "skipped"
+    extracted: List[Dict[str, Any]] = []
+
+    # Try LLM structured extraction first (if OPENAI key configured)
+    llm_data = extract_preferences_from_message("\n".join(utterances))
+    if llm_data and isinstance(llm_data.get("preferences"), list):
+        method = "llm"
+        for p in llm_data["preferences"]:
+            extracted.append({
+                "category": p.get("category", "real_estate"),
+                "preference_type": p.get("preference_type", "unknown"),
+                "value": p.get("value") or {"type": "single", "value": "unknown"},
+                "confidence": float(p.get("confidence", 0.7)),
+                "source": p.get("source", "inferred"),
+                "reasoning": p.get("reasoning", ""),
+            })
+
+    # Add minimal rule-based budget extraction (fallback/augment)
+    for utterance in utterances:
+        budget = _rule_budget(utterance)
+        if budget:
+            extracted.append(budget)
+            if method == "skipped":
+                method = "fallback"
+
+    # Persist
+    written, unchanged = PreferenceService.bulk_upsert(
+        user_id=user_id,
+        preferences=[{k: v for k, v in pref.items() if k != "reasoning"} for pref in extracted],
+    )
+    for obj in written:
+        inc_prefs_saved(obj.metadata.get("category", "unknown"), obj.preference_type, obj.source)
+    for pref_type in {p["preference_type"] for p in extracted} - {obj.preference_type for obj in written}:
+        inc_prefs_unchanged(pref_type)
+
+    result = method if extracted else "skipped"
+    inc_prefs_extract_request(result)
+    inc_prefs_messages("extracted")
+    inc_prefs_messages("merged", len(utterances) - 1)
+    observe_prefs_latency(result, time.perf_counter() - start)
+
+    # Audit trail event (one per extraction call, against the newest message)
+    try:
+        PreferenceExtractionEvent.objects.create(
+            user_id=user_id,
+            thread_id=str(thread_id),
+            message_id=message_ids[-1],
+            utterance="\n".join(utterances),
+            extracted_preferences=extracted,
+            confidence_scores={p.get("preference_type", "unknown"): p.get("confidence", 0.0) for p in extracted},
+            extraction_method=method if extracted else "fallback",
+            llm_reasoning=(llm_data or {}).get("overall_reasoning", "") if llm_data else "",
+            contradictions_detected=[],
+            processing_time_ms=int((time.perf_counter() - start) * 1000),
+        )
+    except Exception:
+        pass
+
+    return {
+        "saved": len(written),
+        "unchanged": unchanged,
+        "messages": len(utterances),
+        "result": result,
+        "extracted": extracted,
+    }
+
+
+def enqueue_message(thread_id: str, *, user_id: int, message_id: str, utterance: str) -> bool:
+    """
+    Buffer a user message for the thread's next debounced extraction.
+
+    Returns True when the message was buffered; falls back to the
+    per-message ``extract_preferences_async`` task (and returns False) when
+    debouncing is disabled or the cache is unavailable.
+    """
+    thread_id = str(thread_id)
+    if DEBOUNCE_ENABLED and (utterance or "").strip():
+        try:
+            now = _now()
+            cache.add(_key(thread_id, "seq"), 0, timeout=BUFFER_TTL)
+            cache.add(_key(thread_id, "done"), 0, timeout=BUFFER_TTL)
+            seq = cache.incr(_key(thread_id, "seq"))
+            cache.set(
+                _key(thread_id, "item", seq),
+                {"user_id": user_id, "message_id": str(message_id), "utterance": utterance},
+                timeout=BUFFER_TTL,
+            )
+            cache.add(_key(thread_id, "first"), now, timeout=BUFFER_TTL)
+            cache.set(_key(thread_id, "last"), now, timeout=BUFFER_TTL)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("preferences_debounce_enqueue_failed", extra={"thread_id": thread_id, "error": str(exc)})
+        else:
+            _schedule_flush(thread_id)
+            return True
+
+    from assistant.tasks import extract_preferences_async, log_preference_extraction_failure
+
+    extract_preferences_async.apply_async(
+        kwargs={"user_id": user_id, "thread_id": thread_id, "message_id": str(message_id), "utterance": utterance},
+        link_error=log_preference_extraction_failure.s(thread_id),
+    )
+    return False
+
+
+def _schedule_flush(thread_id: str, countdown: Optional[float] = None) -> None:
+    if not cache.add(_key(thread_id, "scheduled"), 1, timeout=LOCK_TTL):
+        return  # the queued flush will pick this message up
+    try:
+        from assistant.tasks import flush_preference_extraction
+
+        flush_preference_extraction.apply_async(
+            args=[thread_id],
+            countdown=DEBOUNCE_S if countdown is None else countdown,
+        )
+    except Exception as exc:  # noqa: BLE001 - broker outage: stays buffered for the next message
+        cache.delete(_key(thread_id, "scheduled"))
+        logger.warning("preferences_debounce_schedule_failed", extra={"thread_id": thread_id, "error": str(exc)})
+
+
+def pending_count(thread_id: str) -> int:
+    thread_id = str(thread_id)
+    return max(int(cache.get(_key(thread_id, "seq"), 0)) - int(cache.get(_key(thread_id, "done"), 0)), 0)
+
+
+def _quiet_in(thread_id: str) -> float:
+    """Seconds until the debounce window closes (<= 0 when a flush is due)."""
+    now = _now()
+    last = cache.get(_key(thread_id, "last"))
+    first = cache.get(_key(thread_id, "first"))
+    if last is None:
+        return 0.0
+    due = last + DEBOUNCE_S
+    if first is not None:
+        due = min(due, first + MAX_WAIT_S)
+    return due - now
+
+
+def _read_batch(thread_id: str, done: int, head: int) -> tuple[List[Dict[str, Any]], int]:
+    """Return the buffered messages after ``done`` and the last sequence consumed."""
+    seqs = list(range(done + 1, min(head, done + MAX_BATCH) + 1))
+    items = cache.get_many([_key(thread_id, "item", s) for s in seqs])
+    batch: List[Dict[str, Any]] = []
+    last = done
+    for seq in seqs:
+        item = items.get(_key(thread_id, "item", seq))
+        if item is None:
+            if batch:
+                break
+            # Not stored yet by a concurrent enqueue, or evicted
+            gap_key = _key(thread_id, "gap", seq)
+            cache.add(gap_key, 0, timeout=LOCK_TTL)
+            if cache.incr(gap_key) < GAP_ATTEMPTS:
+                break
+            last = seq
+            continue
+        batch.append(item)
+        last = seq
+    return batch, last
+
+
+def _extract_groups(
+    thread_id: str, done: int, by_user: Dict[Any, List[Dict[str, Any]]], stats: Dict[str, int]
+) -> bool:
+    """
+    Extract each user's share of the batch after ``done``; False while a
+    failed group still has retries left (the batch stays buffered).
+
+    Messages already extracted by an earlier attempt are not extracted
+    again; after ``EXTRACT_ATTEMPTS`` failures the group is logged and
+    dropped so one poison batch cannot block the thread.
+    """
+    complete = True
+    for user_id, items in by_user.items():
+        ok_key = _key(thread_id, "ok", done, user_id)
+        extracted = set(cache.get(ok_key) or ())
+        items = [item for item in items if item["message_id"] not in extracted]
+        if not items:
+            continue
+        message_ids = [item["message_id"] for item in items]
+        try:
+            result = extract_and_persist(user_id, thread_id, message_ids, [item["utterance"] for item in items])
+        except Exception as exc:  # noqa: BLE001
+            inc_prefs_extract_request("error")
+            fail_key = _key(thread_id, "fail", done)
+            cache.add(fail_key, 0, timeout=BUFFER_TTL)
+            attempts = cache.incr(fail_key)
+            extra = {"thread_id": thread_id, "user_id": user_id, "messages": len(items), "attempt": attempts, "error": str(exc)}
+            if attempts < EXTRACT_ATTEMPTS:
+                logger.warning("preferences_debounce_extract_failed", extra=extra)
+                complete = False
+            else:
+                logger.error("preferences_debounce_extract_skipped", extra=extra)
+            continue
+        cache.set(ok_key, sorted(extracted | set(message_ids)), timeout=BUFFER_TTL)
+        stats["extractions"] += 1
+        stats["messages"] += len(items)
+        stats["saved"] += result["saved"]
+    return complete
+
+
+def flush_thread(thread_id: str) -> Dict[str, int]:
+    """
+    Extract everything buffered for ``thread_id`` once its debounce window
+    has closed; re-schedules itself while messages are still arriving.
+
+    Returns ``{"extractions", "messages", "saved"}`` for this flush.
+    """
+    thread_id = str(thread_id)
+    stats = {"extractions": 0, "messages": 0, "saved": 0}
+    cache.delete(_key(thread_id, "scheduled"))
+    wait = _quiet_in(thread_id)
+    if wait > 0:
+        _schedule_flush(thread_id, countdown=wait)
+        return stats
+
+    lock_key = _key(thread_id, "lock")
+    if not cache.add(lock_key, 1, timeout=LOCK_TTL):
+        _schedule_flush(thread_id)
+        return stats
+
+    try:
+        cache.delete(_key(thread_id, "first"))
+        while True:
+            done = int(cache.get(_key(thread_id, "done"), 0))
+            head = int(cache.get(_key(thread_id, "seq"), 0))
+            if head <= done:
+                break
+            batch, last = _read_batch(thread_id, done, head)
+            if last == done:
+                _schedule_flush(thread_id)
+                break
+            # A thread belongs to one user; group defensively all the same
+            by_user: Dict[Any, List[Dict[str, Any]]] = {}
+            for item in batch:
+                by_user.setdefault(item["user_id"], []).append(item)
+            if not _extract_groups(thread_id, done, by_user, stats):
+                _schedule_flush(thread_id)
+                break
+            cache.set(_key(thread_id, "done"), last, timeout=BUFFER_TTL)
+            cache.delete_many(
+                [_key(thread_id, "item", s) for s in range(done + 1, last + 1)]
+                + [_key(thread_id, "fail", done)]
+                + [_key(thread_id, "ok", done, user_id) for user_id in by_user]
+            )
+        return stats
+    finally:
+        cache.delete(lock_key)
+        if stats["messages"]:
+            logger.info("preferences_debounce_flushed", extra={"thread_id": thread_id, **stats})
+
+
+__all__ = [
+    "DEBOUNCE_ENABLED",
+    "enqueue_message",
+    "extract_and_persist",
+    "flush_thread",
+    "pending_count",
+]
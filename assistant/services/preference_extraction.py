@@ -28,17 +28,18 @@ def extract_preferences_from_message(text: str, *, model: Optional[str] = None,
     if not _llm_available():
         return None
     try:
-        from openai import OpenAI
         import json
 
-        client = OpenAI()
+        from assistant.llm_gateway import chat_completion
+
         model = model or os.getenv("OPENAI_CHAT_MODEL", "gpt-4o-mini")
         system = (
             "You extract user preferences for a real estate/services app. "
             "Return strict JSON: {\n  \"preferences\": [ {\n    \"category\": one of [real_estate, services, lifestyle, general],\n    \"preference_type\": string,\n    \"value\": {\"type\": \"range|list|single\", ...},\n    \"confidence\": float 0..1,\n    \"source\": \"explicit|inferred\",\n    \"reasoning\": string\n  } ],\n  \"overall_reasoning\": string\n}\n"
         )
         user = f"Utterance: {text}"
-        resp = client.chat.completions.create(
+        resp = chat_completion(
+            agent="preference_extraction",
             model=model,
             messages=[
                 {"role": "system", "content": system},
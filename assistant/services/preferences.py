@@ -7,7 +7,7 @@ Initial minimal implementation to support Sprint 6 foundation. Embeddings and
 advanced normalization can be added incrementally.
 """
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from django.db import transaction
 from django.utils import timezone
 
@@ -26,6 +26,26 @@ def _sanitize_embedding(embedding: Optional[List[float]]) -> Optional[List[float
     return embedding
 
 
+def _redact_value(value: Dict[str, Any]) -> Dict[str, Any]:
+    """PII-redact a value's free text in place (single and list values)."""
+    try:
+        # Redact inside nested fields if present
+        if value.get("type") == "single" and isinstance(value.get("value"), str):
+            red = redact_pii(value["value"])
+            value["value"] = red["text"]
+        if value.get("type") == "list":
+            new_vals = []
+            for x in value.get("values", []):
+                if isinstance(x, str):
+                    new_vals.append(redact_pii(x)["text"])  # counters emitted inside redact_pii
+                else:
+                    new_vals.append(x)
+            value["values"] = new_vals
+    except Exception:
+        pass
+    return value
+
+
 class PreferenceService:
     @staticmethod
     def normalize(preference_type: str, value: Dict[str, Any]) -> Dict[str, Any]:
@@ -61,24 +81,7 @@ class PreferenceService:
         embedding: Optional[List[float]] = None,  # Deprecated: not used
         metadata: Optional[Dict[str, Any]] = None,
     ) -> UserPreference:
-        # PII-redact values' free text where applicable
-        try:
-            # Redact inside nested fields if present
-            if value.get("type") == "single" and isinstance(value.get("value"), str):
-                red = redact_pii(value["value"])
-                value["value"] = red["text"]
-            if value.get("type") == "list":
-                new_vals = []
-                for x in value.get("values", []):
-                    if isinstance(x, str):
-                        new_vals.append(redact_pii(x)["text"])  # counters emitted inside redact_pii
-                    else:
-                        new_vals.append(x)
-                value["values"] = new_vals
-        except Exception:
-            pass
-
-        norm_value = PreferenceService.normalize(preference_type, value)
+        norm_value = PreferenceService.normalize(preference_type, _redact_value(value))
         
         # Store category in metadata
         pref_metadata = metadata or {}
@@ -110,6 +113,77 @@ class PreferenceService:
             obj.save()
         return obj
 
+    @staticmethod
+    def bulk_upsert(*, user_id: int, preferences: Iterable[Dict[str, Any]]) -> Tuple[List[UserPreference], int]:
+        """
+        Upsert many extracted preferences for one user in a single statement.
+
+        Same rules as :meth:`upsert_preference` (redaction, normalization, the
+        higher confidence wins, metadata merged); a later entry for the same
+        ``preference_type`` overrides an earlier one, and an update without a
+        ``source`` keeps the stored one. Rows whose stored value, confidence,
+        source and metadata would not change are not written.
+
+        Returns ``(written_rows, unchanged_count)``.
+        """
+        incoming: Dict[str, Dict[str, Any]] = {}
+        for pref in preferences:
+            preference_type = pref["preference_type"]
+            value = dict(pref.get("value") or {})
+            entry = incoming.setdefault(preference_type, {"confidence": 0.0, "metadata": {}})
+            entry["value"] = PreferenceService.normalize(preference_type, _redact_value(value))
+            entry["confidence"] = max(entry["confidence"], pref.get("confidence") or 0.0)
+            entry["source"] = pref.get("source") or entry.get("source")
+            entry["metadata"].update(pref.get("metadata") or {})
+            if pref.get("category"):
+                entry["metadata"]["category"] = pref["category"]
+        if not incoming:
+            return [], 0
+
+        existing = {
+            row.preference_type: row
+            for row in UserPreference.objects.filter(user_id=user_id, preference_type__in=list(incoming))
+        }
+        rows: List[UserPreference] = []
+        unchanged = 0
+        for preference_type, entry in incoming.items():
+            current = existing.get(preference_type)
+            confidence = entry["confidence"]
+            metadata = entry["metadata"]
+            source = entry["source"] or "explicit"
+            if current is not None:
+                confidence = max(current.confidence or 0.0, confidence)
+                metadata = {**(current.metadata or {}), **metadata}
+                source = entry["source"] or current.source
+                if (
+                    current.value == entry["value"]
+                    and current.confidence == confidence
+                    and current.source == source
+                    and current.metadata == metadata
+                ):
+                    unchanged += 1
+                    continue
+            row = UserPreference(
+                user_id=user_id,
+                preference_type=preference_type,
+                value=entry["value"],
+                confidence=confidence,
+                source=source,
+                metadata=metadata,
+            )
+            if current is not None:
+                row.pk = current.pk
+            rows.append(row)
+
+        if rows:
+            UserPreference.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["user", "preference_type"],
+                update_fields=["value", "confidence", "source", "metadata", "updated_at"],
+            )
+        return rows, unchanged
+
     @staticmethod
     def mark_used(pref: UserPreference) -> None:
         pref.use_count = (pref.use_count or 0) + 1
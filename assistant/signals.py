@@ -1,7 +1,8 @@
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from listings.models import Listing
-from .tasks import index_listing_task, delete_listing_from_index
+from .tasks import delete_listing_from_index
+from .brain.listing_index import enqueue_listing
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,8 +12,8 @@ logger = logging.getLogger(__name__)
 def on_listing_saved(sender, instance, created, **kwargs):
     """Trigger indexing when a Listing is created or updated."""
     try:
-        # Queue async indexing task
-        index_listing_task.delay(str(instance.id), action='create' if created else 'update')
+        # Buffer for the next debounced batch flush
+        enqueue_listing(str(instance.id))
         logger.info(f"Queued indexing for listing {instance.id}")
     except Exception as e:
         logger.error(f"Failed to queue indexing for listing {instance.id}: {e}")
@@ -18,6 +18,8 @@ from listings.models import Listing
 from assistant.models import Message, ConversationThread
 from assistant.brain.agent import run_supervisor_agent
 from assistant.utils.correlation import set_correlation_id, reset_correlation_id
+from assistant.utils.streaming import DeltaCoalescer, delta_sink
+from assistant.brain.rehydration import invalidate_rehydration
 from .utils.notifications import put_card_display, put_auto_display
 from .twilio_client import MediaProcessor
 from datetime import datetime, timedelta, timezone
@@ -31,15 +33,17 @@ from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
 from assistant.monitoring.metrics import increment_ws_invalid_envelope
 from assistant.memory import current_mode, read_enabled, write_enabled
 from assistant.memory.flags import MemoryMode, get_forced_mode
-from assistant.memory.service import get_client, call_zep, invalidate_context
+from assistant.memory.service import get_client, prefetch_thread_context
 from assistant.memory.pii import redact_pii
+from assistant.memory.write_behind import WriteBehindFlushError, enqueue_messages, flush_thread
 from assistant.brain.config import PREFS_EXTRACT_ENABLED
-from assistant.services.preferences import PreferenceService
-from assistant.services.preference_extraction import extract_preferences_from_message
-from assistant.models import PreferenceExtractionEvent
+from assistant.services.preference_debounce import (
+    enqueue_message as enqueue_preference_message,
+    extract_and_persist,
+    flush_thread as flush_preference_buffer,
+)
 from assistant.monitoring.metrics import (
     inc_prefs_extract_request,
-    inc_prefs_saved,
     observe_prefs_latency,
 )
 
@@ -56,6 +60,7 @@ def _log_assistant_turn_safe(thread_id: str,
                              result_dict: Dict[str, Any],
                              ttfb_ms: int,
                              *,
+                             total_ms: int | None = None,
                              user_msg_id: str | None = None,
                              assistant_msg_id: str | None = None,
                              client_msg_id_user: str | None = None,
@@ -80,6 +85,7 @@ def _log_assistant_turn_safe(thread_id: str,
                 "slots": result_dict.get("extracted_criteria") or None,
                 "results": len(result_dict.get("recommendations") or []),
                 "ttfb_ms": ttfb_ms,
+                "total_ms": total_ms,
                 "status": "ok",
                 "user_msg_id": user_msg_id,
                 "assistant_msg_id": assistant_msg_id,
@@ -111,23 +117,14 @@ class _ZepWriteContext:
         self.used = False
 
     def add_message(self, op: str, payload: Dict[str, Any]) -> bool:
-        def _send():
-            # Preferred path: new client with add_messages (supports user_id for thread creation)
-            if hasattr(self.client, "add_messages"):
-                return self.client.add_messages(self.thread_id, [payload], user_id=self.user_id)
-
-            # Fallback: legacy client with add_memory (no thread creation support)
-            if hasattr(self.client, "add_memory"):
-                role = payload.get("role", "user")
-                content = payload.get("content", "")
-                return self.client.add_memory(self.thread_id, role, content)
-
-            raise AttributeError("Zep client does not support known write interfaces")
-
-        success, _ = call_zep(op, _send, observe_retry=True)
-        if success:
+        # Write-behind: buffer for the memory-queue flusher (flush_zep_writes)
+        # instead of calling Zep on the reply path.
+        accepted = enqueue_messages(self.thread_id, [payload], user_id=self.user_id)
+        if accepted:
             self.used = True
-        return success
+        else:
+            logger.warning("zep_write_behind_rejected", extra={"thread_id": self.thread_id, "op": op})
+        return accepted
 
 
 def _prepare_zep_write_context(thread: ConversationThread) -> Optional[_ZepWriteContext]:
@@ -1185,107 +1182,52 @@ def monitor_new_media_and_trigger_proactive(self) -> Dict[str, Any]:
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_kwargs={"max_retries": 3})
 def index_listing_task(self, listing_id: str, action: str = 'create') -> Dict[str, Any]:
     """
-    Asynchronously index a listing into ChromaDB with metadata.
-    Uses local sentence-transformers for embeddings (Phase A).
+    Index one listing into ChromaDB (chunks) and the hybrid index right away.
+    Uses the worker's cached embedding model and store; routine saves go
+    through the batched ``flush_listing_index`` path instead.
     """
-    from listings.models import Listing
-    from langchain.text_splitter import RecursiveCharacterTextSplitter
-    from langchain.embeddings import HuggingFaceEmbeddings
-    from langchain.vectorstores import Chroma
-    from langchain.schema import Document
-    import json
-    
-    try:
-        listing = Listing.objects.get(id=listing_id)
-    except Listing.DoesNotExist:
-        logger.warning(f"Listing {listing_id} not found for indexing")
-        return {"success": False, "error": "listing_not_found", "listing_id": listing_id}
-    
+    from assistant.brain.listing_index import index_listings
+
     try:
-        # Build content: title + description + dynamic_fields (stringified)
-        title = listing.title or f"Listing {listing_id}"
-        description = listing.description or ""
-        dynamic_fields_str = json.dumps(listing.dynamic_fields or {}, ensure_ascii=False)
-        content = f"{title}\n\n{description}\n\nDetails: {dynamic_fields_str}"
-        
-        # Create metadata dict
-        metadata = {
-            "listing_pk": str(listing.id),
-            "owner_id": str(listing.owner_id) if listing.owner_id else "",
-            "category": listing.category.slug if listing.category else "",
-            "location": listing.location or "",
-            "price": str(listing.price or ""),
-            "currency": listing.currency or "",
-            "status": listing.status,
-            "created_at": listing.created_at.isoformat(),
-            "updated_at": listing.updated_at.isoformat(),
-        }
-        
-        # Create Document
-        doc = Document(page_content=content, metadata=metadata)
-        
-        # Split text
-        splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50)
-        chunks = splitter.split_documents([doc])
-        
-        # ISSUE-011 FIX: Use configured path instead of hardcoded /tmp
-        from django.conf import settings
-        import os
-        
-        # Get persist directory from settings or use default in BASE_DIR
-        persist_dir = getattr(
-            settings, 
-            'CHROMA_PERSIST_DIR', 
-            os.path.join(settings.BASE_DIR, 'data', 'chroma_db')
-        )
-        
-        # Ensure directory exists
-        os.makedirs(persist_dir, exist_ok=True)
-        
-        # Embed and store in ChromaDB (SQLite backend)
-        embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
-        db = Chroma(
-            collection_name="listings",
-            embedding_function=embeddings,
-            persist_directory=persist_dir  # Use configured path
-        )
-        
-        # Upsert chunks (using listing_id + chunk index as unique ID)
-        ids = [f"listing_{listing_id}_chunk_{i}" for i in range(len(chunks))]
-        db.add_documents(chunks, ids=ids)
-        
-        logger.info(f"Indexed listing {listing_id}: {len(chunks)} chunks")
-        return {
-            "success": True,
-            "listing_id": str(listing.id),
-            "chunks_indexed": len(chunks),
-            "action": action,
-        }
-        
+        result = index_listings([listing_id])
     except Exception as e:
         logger.error(f"Failed to index listing {listing_id}: {e}")
         raise
 
+    if result["missing"]:
+        logger.warning(f"Listing {listing_id} not found for indexing")
+        return {"success": False, "error": "listing_not_found", "listing_id": listing_id}
+
+    logger.info(f"Indexed listing {listing_id}: {result['chunks']} chunks")
+    return {
+        "success": True,
+        "listing_id": str(listing_id),
+        "chunks_indexed": result["chunks"],
+        "action": action,
+    }
+
+
+@shared_task(bind=True, ignore_result=True, autoretry_for=(Exception,), retry_backoff=True, retry_kwargs={"max_retries": 3})
+def flush_listing_index(self) -> int:
+    """Index every listing saved during the debounce window in batched writes."""
+    from assistant.brain.listing_index import flush_pending
+
+    return flush_pending()
+
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_kwargs={"max_retries": 2})
 def delete_listing_from_index(self, listing_id: str) -> Dict[str, Any]:
     """
-    Asynchronously delete a listing from ChromaDB.
+    Asynchronously delete every chunk of a listing (by ``listing_pk``) from
+    ChromaDB and drop it from the hybrid index.
     """
-    from langchain.embeddings import HuggingFaceEmbeddings
-    from langchain.vectorstores import Chroma
+    from assistant.brain.hybrid_search import get_hybrid_index
+    from assistant.brain.listing_index import delete_listing_chunks
 
-    try:
-        embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
-        db = Chroma(
-            collection_name="listings",
-            embedding_function=embeddings,
-            persist_directory="/tmp/chroma_db"
-        )
+    get_hybrid_index().delete(listing_id)
 
-        # Delete all chunks for this listing
-        ids = [f"listing_{listing_id}_chunk_{i}" for i in range(10)]  # Safe upper bound
-        db.delete(ids=ids)
+    try:
+        delete_listing_chunks([listing_id])
 
         logger.info(f"Deleted listing {listing_id} from index")
         return {
@@ -1371,6 +1313,35 @@ def _resolve_strict_validation() -> bool:
 
 
 WS_STRICT_VALIDATION = _resolve_strict_validation()
+
+
+def _resolve_stream_deltas() -> bool:
+    setting_value = getattr(settings, 'WS_STREAM_DELTAS', None)
+    if setting_value is not None:
+        return bool(setting_value)
+    env_value = os.getenv('WS_STREAM_DELTAS')
+    if env_value is None:
+        return True
+    return env_value.strip().lower() not in {'0', 'false', 'no'}
+
+
+WS_STREAM_DELTAS = _resolve_stream_deltas()
+
+
+def _resolve_batch_frames() -> bool:
+    setting_value = getattr(settings, 'WS_BATCH_FRAMES', None)
+    if setting_value is not None:
+        return bool(setting_value)
+    env_value = os.getenv('WS_BATCH_FRAMES')
+    if env_value is None:
+        return True
+    return env_value.strip().lower() not in {'0', 'false', 'no'}
+
+
+WS_BATCH_FRAMES = _resolve_batch_frames()
+WS_DELTA_INTERVAL_S = float(os.getenv('WS_DELTA_INTERVAL_MS', '50')) / 1000.0
+# Buffered delta text is flushed once it is this old, even if no new delta arrives
+WS_DELTA_MAX_AGE_S = float(os.getenv('WS_DELTA_MAX_AGE_MS', '150')) / 1000.0
 _invalid_logged_threads: Set[str] = set()
 
 
@@ -1429,7 +1400,46 @@ class WsAssistantFrame(BaseModel):
 _protocol_error_threads: Set[str] = set()
 
 
-def _record_invalid_envelope(channel_layer, group_name: str, thread_id: UUID, correlation_id: Optional[str], reason: str) -> None:
+class FrameBatcher:
+    """
+    Collect a turn's outbound channel-layer frames and send them per flush.
+
+    Every ``async_to_sync(group_send)`` enters a fresh event loop (and, with
+    channels_redis, a fresh connection), so frames emitted back to back are
+    queued with :meth:`add` and sent together by :meth:`flush`. A flush of
+    several frames goes out as one ``chat.batch`` message that
+    ``ChatConsumer.chat_batch`` unpacks in order: one loop entry and one
+    ``group_send`` per flush. :meth:`send` flushes immediately, for frames
+    the client should see right away (typing, streamed deltas).
+
+    With ``WS_BATCH_FRAMES`` off (e.g. while consumers without
+    ``chat_batch`` are still connected) each frame is sent on its own.
+    """
+
+    def __init__(self, channel_layer, group_name: str, batch: Optional[bool] = None) -> None:
+        self._channel_layer = channel_layer
+        self._group_name = group_name
+        self._batch = WS_BATCH_FRAMES if batch is None else batch
+        self._pending: List[Dict[str, Any]] = []
+        self.group_sends = 0
+
+    def add(self, message: Dict[str, Any]) -> None:
+        self._pending.append(message)
+
+    def send(self, message: Dict[str, Any]) -> None:
+        self.add(message)
+        self.flush()
+
+    def flush(self) -> None:
+        frames, self._pending = self._pending, []
+        if len(frames) > 1 and self._batch:
+            frames = [{"type": "chat.batch", "frames": frames}]
+        for message in frames:
+            async_to_sync(self._channel_layer.group_send)(self._group_name, message)
+            self.group_sends += 1
+
+
+def _record_invalid_envelope(frames: FrameBatcher, thread_id: UUID, correlation_id: Optional[str], reason: str) -> None:
     thread_str = str(thread_id)
     increment_ws_invalid_envelope(thread_str)
     if thread_str not in _invalid_logged_threads:
@@ -1443,8 +1453,7 @@ def _record_invalid_envelope(channel_layer, group_name: str, thread_id: UUID, co
     payload = {"reason": "invalid_envelope"}
     if correlation_id:
         payload["correlation_id"] = correlation_id
-    async_to_sync(channel_layer.group_send)(
-        group_name,
+    frames.add(
         {
             "type": "chat.message",
             "data": {
@@ -1453,10 +1462,49 @@ def _record_invalid_envelope(channel_layer, group_name: str, thread_id: UUID, co
                 "thread_id": thread_str,
                 "payload": payload,
             },
-        },
+        }
     )
 
 
+def _delta_coalescer(frames: FrameBatcher, thread_id, in_reply_to: str,
+                     correlation_id: Optional[str]) -> DeltaCoalescer:
+    """Build a coalescer that relays partial reply text as assistant_delta frames."""
+    meta: Dict[str, Any] = {"in_reply_to": in_reply_to}
+    if correlation_id:
+        meta["correlation_id"] = correlation_id
+
+    def send(text: str, seq: int) -> None:
+        frames.send(
+            {
+                "type": "chat.delta",
+                "data": {
+                    "type": "chat_message",
+                    "event": "assistant_delta",
+                    "thread_id": str(thread_id),
+                    "payload": {"delta": text, "seq": seq},
+                    "meta": meta,
+                },
+            }
+        )
+
+    return DeltaCoalescer(send, interval=WS_DELTA_INTERVAL_S, max_age=WS_DELTA_MAX_AGE_S)
+
+
+@shared_task(
+    bind=True,
+    ignore_result=True,
+    autoretry_for=(WriteBehindFlushError,),
+    retry_backoff=True,
+    retry_backoff_max=60,
+    retry_jitter=True,
+    max_retries=5,
+    queue="memory",
+)
+def flush_zep_writes(self, thread_id: str, user_id: Optional[str] = None) -> int:
+    """Deliver buffered Zep writes for a thread as ordered multi-message batches."""
+    return flush_thread(thread_id, user_id=user_id)
+
+
 @shared_task(queue="dlq")
 def dead_letter_queue(task_name: str, args: dict, exception: str):
     """
@@ -1484,12 +1532,14 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
     correlation_id = headers.get("correlation_id")
     token = set_correlation_id(correlation_id)
 
-    channel_layer = get_channel_layer()
-    group_name = f"thread-{thread_id}"
+    # Frames emitted back to back (final message, typing off, errors) share one group_send
+    frames = FrameBatcher(get_channel_layer(), f"thread-{thread_id}")
 
     # Track task duration and status
     start_time = time.time()
+    start_monotonic = time.monotonic()
     status = 'success'
+    coalescer = None
 
     try:
         msg = Message.objects.get(id=message_id)
@@ -1510,16 +1560,18 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
             zep_context = None  # Skip Zep writes, continue without memory
         else:
             zep_context = _prepare_zep_write_context(thread)
+            # Warm the memory context while the typing frame, mirroring and
+            # preference extraction run; the supervisor joins this refresh.
+            prefetch_thread_context(thread.thread_id)
 
         # Step 1: notify typing/on-progress
-        async_to_sync(channel_layer.group_send)(
-            group_name,
+        frames.send(
             {
                 "type": "chat_status",
                 "event": "typing",
                 "value": True,
                 "correlation_id": correlation_id,
-            },
+            }
         )
 
         # Step 2: run the agent (slow path)
@@ -1540,20 +1592,18 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
                         extra={"thread_id": thread.thread_id}
                     )
                 else:
-                    result = extract_preferences_async.apply_async(
-                        kwargs={
-                            "user_id": msg.sender_id,
-                            "thread_id": thread.thread_id,
-                            "message_id": str(msg.id),
-                            "utterance": user_text,
-                        },
-                        link_error=log_preference_extraction_failure.s(thread.thread_id)
+                    # Buffered per thread: a burst of messages shares one extraction
+                    debounced = enqueue_preference_message(
+                        thread.thread_id,
+                        user_id=msg.sender_id,
+                        message_id=str(msg.id),
+                        utterance=user_text,
                     )
                     logger.debug(
                         "preferences_extract_queued",
                         extra={
                             "thread_id": thread.thread_id,
-                            "task_id": result.id,
+                            "debounced": debounced,
                             "correlation_id": correlation_id,
                         }
                     )
@@ -1568,11 +1618,27 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
                 exc_info=True
             )
 
-        result = run_supervisor_agent(
-            user_text,
-            thread.thread_id,
-            client_msg_id=str(client_msg_id) if client_msg_id else None,
-        )
+        # Partial reply text is streamed as assistant_delta frames; the final
+        # assistant_message below remains the source of truth.
+        in_reply_to = client_msg_id or (msg.client_msg_id and str(msg.client_msg_id))
+        if WS_STREAM_DELTAS:
+            coalescer = _delta_coalescer(
+                frames,
+                thread.thread_id,
+                str(in_reply_to) if in_reply_to else str(msg.id),
+                correlation_id,
+            )
+        with delta_sink(coalescer):
+            result = run_supervisor_agent(
+                user_text,
+                thread.thread_id,
+                client_msg_id=str(client_msg_id) if client_msg_id else None,
+                user_id=thread.user_id,
+            )
+        if coalescer is not None:
+            # Flush the tail now so every delta precedes the final message
+            coalescer.close()
+        invalidate_rehydration(thread.thread_id)
         result_dict = result if isinstance(result, dict) else {}
         reply_text = result_dict.get("message") or "Got it. I'll search options that match."
         recommendations = result_dict.get("recommendations") or []
@@ -1609,15 +1675,9 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
             assistant_write_ok, assistant_write_ms, assistant_redactions = _mirror_assistant_message(
                 zep_context, a, reply_text, thread, result_dict
             )
-        # Invalidate cached context after successful writes to avoid stale reads
-        try:
-            if zep_context and (user_write_ok or assistant_write_ok):
-                invalidate_context(thread.thread_id)
-        except Exception:
-            pass
+        # Cached context is invalidated by flush_zep_writes once the batch lands
 
         # Step 3: emit final assistant message
-        in_reply_to = client_msg_id or (msg.client_msg_id and str(msg.client_msg_id))
         ws_meta: Dict[str, Any] = {
             "queued_message_id": str(a.id),
             "in_reply_to": str(in_reply_to) if in_reply_to else str(msg.client_msg_id or msg.id),
@@ -1709,9 +1769,10 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
             )
             payload = frame.model_dump(mode="json")
         except ValidationError as ex:
-            _record_invalid_envelope(channel_layer, group_name, thread.thread_id, correlation_id, str(ex))
+            _record_invalid_envelope(frames, thread.thread_id, correlation_id, str(ex))
             if WS_STRICT_VALIDATION:
                 return result_dict  # Return result even on validation failure
+            # Non-strict path: send original payload even after validation failure
             payload = {
                 "type": "chat_message",
                 "event": "assistant_message",
@@ -1719,30 +1780,20 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
                 "payload": frame_payload,
                 "meta": ws_meta,
             }
-        else:
-            # Strict path: send validated payload
-            async_to_sync(channel_layer.group_send)(
-                group_name,
-                {
-                    "type": "chat.message",
-                    "data": payload,
-                },
-            )
-            # Don't return here - fall through to logging and return result_dict
-
-        # Non-strict path: send original payload even after validation failure
-        if not WS_STRICT_VALIDATION or 'ex' in locals():
-            async_to_sync(channel_layer.group_send)(
-                group_name,
-                {
-                    "type": "chat.message",
-                    "data": payload,
-                },
-            )
+        # Queued; goes out with the typing-off frame when the task finishes
+        frames.add(
+            {
+                "type": "chat.message",
+                "data": payload,
+            }
+        )
 
         # Structured per-turn log emission (PR-I)
         zep_meta = ws_meta.get("traces", {}).get("memory", {})
-        ttfb_ms = int((time.time() - start_time) * 1000)
+        total_ms = int((time.time() - start_time) * 1000)
+        ttfb_ms = total_ms
+        if coalescer is not None and coalescer.first_sent_at is not None:
+            ttfb_ms = int((coalescer.first_sent_at - start_monotonic) * 1000)
         _log_assistant_turn_safe(
             thread_id=str(thread.thread_id),
             mode=current_mode().value,
@@ -1754,6 +1805,7 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
             assistant_redactions=assistant_redactions,
             result_dict=result_dict,
             ttfb_ms=ttfb_ms,
+            total_ms=total_ms,
             user_msg_id=str(msg.id) if msg else None,
             assistant_msg_id=str(a.id) if 'a' in locals() and a else None,
             client_msg_id_user=str(msg.client_msg_id) if getattr(msg, 'client_msg_id', None) else None,
@@ -1775,8 +1827,7 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
             },
             queue="dlq",
         )
-        async_to_sync(channel_layer.group_send)(
-            group_name,
+        frames.add(
             {
                 "type": "chat_error",
                 "event": "task_failed_max_retries",
@@ -1786,13 +1837,12 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
                     "queued_message_id": message_id,
                     "correlation_id": correlation_id,
                 },
-            },
+            }
         )
         raise
     except Exception as e:
         status = 'failure'
-        async_to_sync(channel_layer.group_send)(
-            group_name,
+        frames.add(
             {
                 "type": "chat_error",
                 "event": "task_failed",
@@ -1802,22 +1852,25 @@ def process_chat_message(self, message_id: str, thread_id: str, client_msg_id: O
                     "queued_message_id": message_id,
                     "correlation_id": correlation_id,
                 },
-            },
+            }
         )
         raise
     finally:
+        # Stops the max-age timer when the turn failed mid-stream (no-op once closed)
+        if coalescer is not None:
+            coalescer.close()
+
         # Record task duration metric
         duration = time.time() - start_time
         TASK_DURATION.labels(task_name='process_chat_message', status=status).observe(duration)
 
-        async_to_sync(channel_layer.group_send)(
-            group_name,
+        frames.send(
             {
                 "type": "chat_status",
                 "event": "typing",
                 "value": False,
                 "correlation_id": correlation_id,
-            },
+            }
         )
         reset_correlation_id(token)
 
@@ -1878,80 +1931,15 @@ def extract_preferences_async(self, user_id: int, thread_id: str, message_id: st
     Async extraction and persistence of preferences from a user utterance.
     Uses lightweight normalization and PII redaction. LLM/rule extraction
     can be implemented in assistant/services/preference_extraction.py.
+
+    The chat path normally buffers messages through
+    ``preference_debounce.enqueue_message`` instead; this task is the
+    per-message fallback when debouncing is disabled.
     """
     import time as _time
     start = _time.perf_counter()
     try:
-        import re
-        method = "skipped"
-        extracted: List[Dict[str, Any]] = []
-
-        # Try LLM structured extraction first (if OPENAI key configured)
-        llm_data = extract_preferences_from_message(utterance)
-        if llm_data and isinstance(llm_data.get("preferences"), list):
-            method = "llm"
-            for p in llm_data["preferences"]:
-                extracted.append({
-                    "category": p.get("category", "real_estate"),
-                    "preference_type": p.get("preference_type", "unknown"),
-                    "value": p.get("value") or {"type": "single", "value": "unknown"},
-                    "confidence": float(p.get("confidence", 0.7)),
-                    "source": p.get("source", "inferred"),
-                    "reasoning": p.get("reasoning", ""),
-                })
-
-        # Add minimal rule-based budget extraction (fallback/augment)
-        m = re.search(r"(€|\$|eur|usd|try)\s?([0-9]{2,6})", utterance, flags=re.IGNORECASE)
-        if m:
-            sym = m.group(1).upper()
-            amount = float(m.group(2))
-            unit = "EUR" if sym in {"€", "EUR"} else ("USD" if sym in {"$", "USD"} else ("TRY" if sym == "TRY" else "EUR"))
-            extracted.append({
-                "category": "real_estate",
-                "preference_type": "budget",
-                "value": {"type": "range", "min": amount, "max": None, "unit": unit},
-                "confidence": 0.6,
-                "source": "inferred",
-            })
-            if method == "skipped":
-                method = "fallback"
-
-        # Persist
-        saved = 0
-        for pref in extracted:
-            obj = PreferenceService.upsert_preference(
-                user_id=user_id,
-                category=pref["category"],
-                preference_type=pref["preference_type"],
-                value=pref["value"],
-                confidence=pref.get("confidence", 0.6),
-                source=pref.get("source", "inferred"),
-            )
-            category = pref.get("category", obj.metadata.get("category", "unknown"))
-            inc_prefs_saved(category, obj.preference_type, obj.source)
-            saved += 1
-
-        inc_prefs_extract_request(method if extracted else "skipped")
-        observe_prefs_latency(method if extracted else "skipped", _time.perf_counter() - start)
-
-        # Audit trail event
-        try:
-            PreferenceExtractionEvent.objects.create(
-                user_id=user_id,
-                thread_id=str(thread_id),
-                message_id=message_id,
-                utterance=utterance,
-                extracted_preferences=extracted,
-                confidence_scores={p.get("preference_type", "unknown"): p.get("confidence", 0.0) for p in extracted},
-                extraction_method=method if extracted else "fallback",
-                llm_reasoning=(llm_data or {}).get("overall_reasoning", "") if llm_data else "",
-                contradictions_detected=[],
-                processing_time_ms=int((_time.perf_counter() - start) * 1000),
-            )
-        except Exception:
-            pass
-
-        return {"saved": saved, "result": method if extracted else "skipped", "extracted": extracted}
+        return extract_and_persist(user_id, thread_id, [message_id], [utterance])
     except Exception as e:
         inc_prefs_extract_request("error")
         observe_prefs_latency("error", _time.perf_counter() - start)
@@ -1959,6 +1947,22 @@ def extract_preferences_async(self, user_id: int, thread_id: str, message_id: st
         raise
 
 
+@shared_task(
+    bind=True,
+    autoretry_for=(requests.exceptions.Timeout, requests.exceptions.ConnectionError),
+    retry_backoff=True,
+    retry_kwargs={"max_retries": 3},
+)
+def flush_preference_extraction(self, thread_id: str) -> Dict[str, int]:
+    """Run one debounced extraction over the messages buffered for a thread."""
+    try:
+        return flush_preference_buffer(thread_id)
+    except Exception as e:
+        inc_prefs_extract_request("error")
+        logger.error(f"flush_preference_extraction failed: {e}", extra={"thread_id": thread_id})
+        raise
+
+
 @shared_task
 def log_preference_extraction_failure(task_id, exc, traceback, thread_id):
     """
@@ -22,8 +22,10 @@ from django.conf import settings
 from django.db import transaction
 from django.db.models import Q
 
+from assistant.brain.geo import ALIASES, REGIONAL_MAP, canonical_location, fold_location_text, region_members
 from assistant.models import KnowledgeBase, ServiceProvider
 from listings.models import Listing
+from listings.search import full_text_enabled, keyword_filter, rank_by_text
 from assistant.serializers import KnowledgeBaseSerializer, ServiceProviderSerializer
 from assistant.twilio_client import TwilioWhatsAppClient
 from assistant.models import ContactIndex
@@ -42,10 +44,10 @@ def has_contact_info(listing) -> bool:
         bool: True if listing has contact info, False otherwise
     """
     try:
-        sd = listing.structured_data or {}
+        fields = listing.dynamic_fields or {}
         
-        # Check structured_data contact_info
-        contact_info = sd.get("contact_info")
+        # Check dynamic_fields contact_info
+        contact_info = fields.get("contact_info")
         if contact_info:
             # If it's a string, check if it's not empty
             if isinstance(contact_info, str) and contact_info.strip():
@@ -56,12 +58,13 @@ def has_contact_info(listing) -> bool:
                 if any(contact_info.get(field) for field in contact_fields):
                     return True
         
-        # Check model-level contact fields
-        if listing.contact_identifier and listing.contact_identifier.strip():
+        # Check the owner's phone
+        owner = listing.owner
+        if owner is not None and (getattr(owner, "phone", "") or "").strip():
             return True
         
-        # Check raw_text for phone patterns
-        if listing.raw_text:
+        # Check the description for phone patterns
+        if listing.description:
             phone_patterns = [
                 r'\+90\d{10}',  # Turkish mobile
                 r'\+90\d{11}',  # Turkish landline
@@ -70,7 +73,7 @@ def has_contact_info(listing) -> bool:
                 r'\+?\d[\d\s\-]{7,}'  # General phone pattern
             ]
             for pattern in phone_patterns:
-                if re.search(pattern, listing.raw_text):
+                if re.search(pattern, listing.description):
                     return True
         
         return False
@@ -119,29 +122,13 @@ def _ua_headers() -> Dict[str, str]:
     }
 
 
-_LOCATION_ALIASES = {
-    # TRNC common synonyms/romanizations
-    "girne": "kyrenia",
-    "kyrenia": "kyrenia",
-    "çatalköy": "catalkoy",
-    "catalkoy": "catalkoy",
-    "lefkoşa": "nicosia",
-    "lefkosha": "nicosia",
-    "nicosia": "nicosia",
-    "gazimağusa": "famagusta",
-    "gazimagusa": "famagusta",
-    "famagusta": "famagusta",
-    "iskele": "iskele",
-    "esentepe": "esentepe",
-    "alsancak": "alsancak",
-    "lapta": "lapta",
-    "karşıyaka": "karsiyaka",
-    "karsiyaka": "karsiyaka",
-}
-
 # Regions and their common nearby/child areas for graceful fallback
 _REGION_NEARBY = {
-    "kyrenia": ["kyrenia", "girne", "catalkoy", "alsancak", "lapta", "karakum", "ozankoy", "esentepe", "karsiyaka"],
+    region: sorted(
+        region_members(region)
+        | {fold_location_text(n) for n in ALIASES.get(region, [])}
+    )
+    for region in set(REGIONAL_MAP.values())
 }
 
 
@@ -149,7 +136,7 @@ def _normalize_location(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
     t = text.strip().lower()
-    return _LOCATION_ALIASES.get(t, t)
+    return canonical_location(t) or t
 
 
 def _parse_bedrooms_from_text(text: Optional[str]) -> Optional[int]:
@@ -179,16 +166,6 @@ def _parse_bedrooms_from_text(text: Optional[str]) -> Optional[int]:
     return None
 
 
-def _infer_listing_type(raw: Optional[str]) -> str:
-    """Heuristic fallback when DB.listing_type is empty."""
-    t = (raw or "").lower()
-    if any(k in t for k in ["rent", "kira", "kiralık", "kiralik"]):
-        return "property_rent"
-    if any(k in t for k in ["sale", "satılık", "satilik", "sell"]):
-        return "property_sale"
-    return "property_rent"
-
-
 def _format_price(price: Optional[float], currency: Optional[str]) -> str:
     if price is None:
         return ""
@@ -261,6 +238,42 @@ def _first_image(sd: Dict[str, Any]) -> Optional[str]:
 # -------------------------------------------------------------------
 
 
+_RENT_TRANSACTION_TYPES = ("rent_short", "rent_long")
+
+
+def _transaction_filter(listing_type: Optional[str]) -> Q:
+    """Map tool listing types ("property_rent", "car_sale", ...) onto Listing.transaction_type/domain."""
+    lt = (listing_type or "").lower()
+    condition = Q(transaction_type="sale") if "sale" in lt else Q(transaction_type__in=_RENT_TRANSACTION_TYPES)
+    domain = "vehicles" if lt.startswith("car") else ("real-estate" if lt.startswith("property") else None)
+    if domain:
+        condition &= Q(domain=domain) | Q(domain__isnull=True) | Q(domain="")
+    return condition
+
+
+def _listing_card(lst: Listing) -> Dict[str, Any]:
+    fields = lst.dynamic_fields or {}
+    beds = fields.get("bedrooms")
+    location = lst.location or fields.get("location") or "North Cyprus"
+    description = lst.description or ""
+    if len(description) > 280:
+        description = description[:280] + "…"
+    image = next(iter(lst.images.all()), None)
+    images = [image.image.url] if image is not None and image.image else []
+    if not images and _first_image(fields):
+        images = [_first_image(fields)]
+    return {
+        "id": str(lst.id),
+        "title": lst.title or (f"{beds}+1 in {location}" if beds else "Listing"),
+        "description": description,
+        "location": location,
+        "price": _format_price(lst.price, lst.currency),
+        "images": images,  # Use 'images' array for consistency
+        "details_url": f"/listings/{lst.id}",  # internal safe URL
+        "features": [f for f in (f"{beds} bedrooms" if beds else None, lst.get_transaction_type_display()) if f],
+    }
+
+
 def search_internal_listings(
     listing_type: str,
     location: Optional[str] = None,
@@ -274,8 +287,8 @@ def search_internal_listings(
     Parameters
     ----------
     listing_type : str
-        Expected values like "property_rent", "property_sale", "car_sale".
-        We match with icontains and also infer from raw text when needed.
+        Expected values like "property_rent", "property_sale", "car_sale";
+        mapped onto ``transaction_type`` (and ``domain``). Rentals by default.
     location : str, optional
         User-stated area (e.g., "Girne"). We normalize to "Kyrenia" for matching.
     previous_listing_id : str, optional
@@ -288,6 +301,10 @@ def search_internal_listings(
     language : str
         Unused here but part of tool signature.
 
+    Keyword matching (query, features, furnished/pets/duration synonyms) goes
+    through ``listings.search``: the GIN-indexed search vector on PostgreSQL,
+    ranked by ``ts_rank_cd`` for the query, and ``icontains`` elsewhere.
+
     Returns
     -------
     dict:
@@ -307,167 +324,97 @@ def search_internal_listings(
         if not requested_beds and text_query:
             requested_beds = _parse_bedrooms_from_text(text_query)
 
-        qs = Listing.objects.filter(is_active=True)
-
-        # Listing type filter (robust)
-        if listing_type:
-            qs = qs.filter(Q(listing_type__icontains=listing_type))
-        else:
-            # heuristic fallback
-            qs = qs.filter(
-                Q(listing_type__icontains="rent")
-                | Q(raw_text__icontains="rent")
-                | Q(raw_text__icontains="kiralık")
-                | Q(raw_text__icontains="kiralik")
-            )
-
-        # Text query filter (broad, keyword-based)
-        if text_query:
-            keywords = text_query.split()
-            q_objects = Q()
-            for keyword in keywords:
-                q_objects |= (
-                    Q(raw_text__icontains=keyword)
-                    | Q(location__icontains=keyword)
-                    | Q(structured_data__title__icontains=keyword)
-                    | Q(structured_data__description__icontains=keyword)
-                    | Q(structured_data__features__icontains=keyword)
-                )
-            qs = qs.filter(q_objects)
-
         # If “similar to previous listing” requested
         base_beds = None
         base_loc = None
         if previous_listing_id:
             try:
                 base = Listing.objects.get(id=previous_listing_id)
-                sd = base.structured_data or {}
-                base_beds = sd.get("bedrooms")
-                base_loc = sd.get("location") or base.location
+                base_beds = (base.dynamic_fields or {}).get("bedrooms")
+                base_loc = base.location
             except Listing.DoesNotExist:
                 pass
-
-        # Location constraint
         effective_loc = _normalize_location(norm_loc or base_loc)
-        if effective_loc:
-            qs = qs.filter(
-                Q(location__icontains=effective_loc)
-                | Q(structured_data__location__icontains=effective_loc)
-                | Q(raw_text__icontains=effective_loc)
-            )
-
-        # Bedroom filter
         effective_beds = requested_beds or base_beds
-        if effective_beds:
-            qs = qs.filter(
-                Q(structured_data__bedrooms=effective_beds)
-                | Q(raw_text__icontains=f"{effective_beds}+1")
-            )
 
-        # Price filter
-        if max_price is not None:
-            try:
-                mp = float(max_price)
-                qs = qs.filter(price__isnull=False, price__lte=mp)
-            except Exception:
-                pass
+        def _filtered(location_q: Q):
+            qs = Listing.objects.filter(status="active").filter(_transaction_filter(listing_type), location_q)
+            db = qs.db
+
+            # Bedroom filter
+            if effective_beds:
+                qs = qs.filter(
+                    Q(dynamic_fields__bedrooms=effective_beds)
+                    | Q(title__icontains=f"{effective_beds}+1")
+                    | Q(description__icontains=f"{effective_beds}+1")
+                )
+
+            # Price filter
+            if max_price is not None:
+                try:
+                    mp = float(max_price)
+                    qs = qs.filter(price__isnull=False, price__lte=mp)
+                except Exception:
+                    pass
 
-        # Feature/amenity keyword filter (e.g., "private pool", "sea view")
-        if wanted_features:
-            for feat in wanted_features:
+            # Feature/amenity keyword filter (e.g., "private pool", "sea view")
+            for feat in wanted_features or []:
                 if not feat:
                     continue
                 f = str(feat).strip()
                 qs = qs.filter(
-                    Q(structured_data__features__icontains=f)
-                    | Q(structured_data__amenities__icontains=f)
-                    | Q(raw_text__icontains=f)
-                    | Q(structured_data__description__icontains=f)
+                    Q(dynamic_fields__features__icontains=f)
+                    | Q(dynamic_fields__amenities__icontains=f)
+                    | keyword_filter([f], db)
                 )
 
-        # Furnished filter (heuristic if structured key missing)
-        if furnished is not None:
-            if furnished:
-                cond = Q(structured_data__furnished=True)
-                for kw in _FURNISHED_TRUE_KEYWORDS:
-                    cond |= Q(raw_text__icontains=kw) | Q(structured_data__description__icontains=kw)
-                qs = qs.filter(cond)
-            else:
-                cond = Q(structured_data__furnished=False)
-                for kw in _FURNISHED_FALSE_KEYWORDS:
-                    cond |= Q(raw_text__icontains=kw) | Q(structured_data__description__icontains=kw)
-                qs = qs.filter(cond)
-
-        # Pets allowed filter
-        if pets_allowed is not None:
-            if pets_allowed:
-                cond = Q(structured_data__pets_allowed=True)
-                for kw in _PETS_ALLOWED_KEYWORDS:
-                    cond |= Q(raw_text__icontains=kw) | Q(structured_data__description__icontains=kw)
-                qs = qs.filter(cond)
-            else:
-                # If explicitly not allowed, exclude ones that say pets allowed
-                cond = Q(structured_data__pets_allowed=False)
-                for kw in _PETS_ALLOWED_KEYWORDS:
-                    qs = qs.exclude(Q(raw_text__icontains=kw) | Q(structured_data__description__icontains=kw))
-                qs = qs.filter(cond)
-
-        # Duration filter
-        if duration:
-            d = duration.strip().lower()
-            cond = Q(structured_data__duration__iexact=d)
-            kws = []
-            if d in ("daily", "short_term"):
-                kws = _DURATION_DAILY
-            elif d in ("monthly", "long_term"):
-                kws = _DURATION_MONTHLY + _DURATION_LONG
-            for kw in kws:
-                cond |= Q(raw_text__icontains=kw) | Q(structured_data__description__icontains=kw)
-            qs = qs.filter(cond)
-
-        # ISSUE-007 FIX: Add select_related to prevent N+1 queries
-        qs = qs.select_related('category', 'owner').order_by("-last_seen_at")[:25]
-
-        # Filter out listings without contact information
-        listings_with_contact = []
-        for lst in qs:
-            if has_contact_info(lst):
-                listings_with_contact.append(lst)
-            else:
-                logger.info(f"Filtering out listing {lst.id} - no contact information")
-
-        cards: List[Dict[str, Any]] = []
-        for lst in listings_with_contact:
-            sd = lst.structured_data or {}
-            # Resolve a reasonable title/desc
-            title = (
-                sd.get("title")
-                or (
-                    f"{sd.get('bedrooms', '')}+1 in {sd.get('location') or lst.location or 'North Cyprus'}".strip()
-                )
-                or "Listing"
-            )
-            desc = sd.get("description") or ((lst.raw_text or "")[:280] + "…") if lst.raw_text else ""
-
-            lt = lst.listing_type or sd.get("listing_type") or _infer_listing_type(lst.raw_text)
-
-            cards.append(
-                {
-                    "id": str(lst.id),
-                    "title": title,
-                    "description": desc,
-                    "location": sd.get("location") or lst.location or "North Cyprus",
-                    "price": _format_price(lst.price, lst.currency),
-                    "images": [_first_image(sd)] if _first_image(sd) else [], # Use 'images' array for consistency
-                    "details_url": f"/listings/{lst.id}",  # internal safe URL
-                    "features": [f"{sd.get('bedrooms')} bedrooms" if sd.get("bedrooms") else None,
-                                 lt.replace("_", " ").title() if lt else None],
-                }
-            )
+            # Furnished filter (keyword synonyms when the field is missing)
+            if furnished is not None:
+                keywords = _FURNISHED_TRUE_KEYWORDS if furnished else _FURNISHED_FALSE_KEYWORDS
+                qs = qs.filter(Q(dynamic_fields__furnished=furnished) | keyword_filter(keywords, db))
+
+            # Pets allowed filter
+            if pets_allowed is not None:
+                if pets_allowed:
+                    qs = qs.filter(Q(dynamic_fields__pets_allowed=True) | keyword_filter(_PETS_ALLOWED_KEYWORDS, db))
+                else:
+                    # If explicitly not allowed, exclude ones that say pets allowed
+                    qs = qs.exclude(keyword_filter(_PETS_ALLOWED_KEYWORDS, db)).filter(dynamic_fields__pets_allowed=False)
+
+            # Duration filter
+            if duration:
+                d = duration.strip().lower()
+                kws: List[str] = []
+                if d in ("daily", "short_term"):
+                    kws = _DURATION_DAILY
+                elif d in ("monthly", "long_term"):
+                    kws = _DURATION_MONTHLY + _DURATION_LONG
+                qs = qs.filter(Q(dynamic_fields__duration__iexact=d) | keyword_filter(kws, db))
+
+            return qs.select_related("category", "owner").prefetch_related("images")
+
+        def _cards(qs) -> List[Dict[str, Any]]:
+            cards: List[Dict[str, Any]] = []
+            for lst in qs:
+                if not has_contact_info(lst):
+                    logger.info(f"Filtering out listing {lst.id} - no contact information")
+                    continue
+                cards.append(_listing_card(lst))
+            return cards
+
+        qs = _filtered(Q(location__icontains=effective_loc) if effective_loc else Q())
 
-        # Clean up None features
-        for c in cards:
-            c["features"] = [f for f in c.get("features", []) if f]
+        # Text query filter (broad, keyword-based): GIN-backed full-text
+        # search on PostgreSQL, icontains elsewhere (SQLite)
+        ranked = False
+        if text_query and full_text_enabled(qs.db):
+            qs = rank_by_text(qs, text_query)
+            ranked = True
+        elif text_query:
+            qs = qs.filter(keyword_filter(text_query.split(), qs.db))
+
+        ordering = ("-rank", "-updated_at") if ranked else ("-updated_at",)
+        cards = _cards(qs.order_by(*ordering)[:25])
 
         meta: Dict[str, Any] = {}
 
@@ -480,73 +427,13 @@ def search_internal_listings(
                     region = reg
                     break
             if region:
-                base_qs = Listing.objects.filter(is_active=True)
-                # Listing type filter retained
-                if listing_type:
-                    base_qs = base_qs.filter(Q(listing_type__icontains=listing_type))
-                # Bedrooms and price and features retained
-                if requested_beds:
-                    base_qs = base_qs.filter(
-                        Q(structured_data__bedrooms=requested_beds)
-                        | Q(raw_text__icontains=f"{requested_beds}+1")
-                    )
-                if max_price is not None:
-                    try:
-                        mp = float(max_price)
-                        base_qs = base_qs.filter(price__isnull=False, price__lte=mp)
-                    except Exception:
-                        pass
-                if wanted_features:
-                    for feat in wanted_features:
-                        if not feat:
-                            continue
-                        f = str(feat).strip()
-                        base_qs = base_qs.filter(
-                            Q(structured_data__features__icontains=f)
-                            | Q(structured_data__amenities__icontains=f)
-                            | Q(raw_text__icontains=f)
-                            | Q(structured_data__description__icontains=f)
-                        )
-                # Region-wide location ORs
+                # Region-wide location ORs; the other filters are retained
                 cond = Q()
                 for area in _REGION_NEARBY.get(region, []):
-                    cond |= Q(location__icontains=area) | Q(structured_data__location__icontains=area) | Q(raw_text__icontains=area)
-                base_qs = base_qs.filter(cond).order_by("-last_seen_at")[:25]
-
-                # Filter fallback results by contact info too
-                for lst in base_qs:
-                    if not has_contact_info(lst):
-                        logger.info(f"Filtering out fallback listing {lst.id} - no contact information")
-                        continue
-                    sd = lst.structured_data or {}
-                    title = (
-                        sd.get("title")
-                        or (
-                            f"{sd.get('bedrooms', '')}+1 in {sd.get('location') or lst.location or 'North Cyprus'}".strip()
-                        )
-                        or "Listing"
-                    )
-                    desc = sd.get("description") or ((lst.raw_text or "")[:280] + "…") if lst.raw_text else ""
-                    lt = lst.listing_type or sd.get("listing_type") or _infer_listing_type(lst.raw_text)
-                    cards.append(
-                        {
-                            "id": str(lst.id),
-                            "title": title,
-                            "description": desc,
-                            "location": sd.get("location") or lst.location or "North Cyprus",
-                            "price": _format_price(lst.price, lst.currency),
-                            "images": [_first_image(sd)] if _first_image(sd) else [], # Use 'images' array for consistency
-                            "details_url": f"/listings/{lst.id}",
-                            "features": [f"{sd.get('bedrooms')} bedrooms" if sd.get("bedrooms") else None,
-                                         lt.replace("_", " ").title() if lt else None],
-                        }
-                    )
-                # Clean None
-                for c in cards:
-                    c["features"] = [f for f in c.get("features", []) if f]
+                    cond |= Q(location__icontains=area)
+                cards = _cards(_filtered(cond).order_by("-updated_at")[:25])
                 if cards:
                     meta = {"broadened": True, "from": norm_loc, "to": region}
-
         logger.info("search_internal_listings", extra={
             "listing_type": listing_type,
             "location": norm_loc,
@@ -1,6 +1,7 @@
 from django.urls import path
 from assistant.views_core import ChatEnqueueView
 from assistant.views.health import redis_health
+from assistant.monitoring.views import top_threads_debug_view
 from assistant.views.preferences import (
     get_active_preferences,
     set_thread_personalization,
@@ -24,6 +25,7 @@ from assistant.views.listings import (
 urlpatterns = [
     path("chat/", ChatEnqueueView.as_view(), name="chat-enqueue"),
     path("health/redis/", redis_health, name="health-redis"),
+    path("metrics/top-threads/", top_threads_debug_view, name="metrics-top-threads"),
     path("preferences/active/", get_active_preferences, name="preferences-active"),
     path("preferences/", upsert_preference, name="preferences-upsert"),
     # Legacy client data migration (localStorage -> backend)
@@ -0,0 +1,165 @@
+"""
+Token streaming plumbing for assistant replies.
+
+The chat task installs a delta sink for the duration of a turn; agent code
+deep inside the supervisor graph calls :func:`emit_delta` with reply text as
+the LLM produces it, without the sink having to be threaded through the
+graph state. Outside a streaming turn :func:`emit_delta` is a no-op.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DeltaSink = Callable[[str], None]
+
+_delta_sink: ContextVar[Optional[DeltaSink]] = ContextVar("assistant_delta_sink", default=None)
+
+
+@contextmanager
+def delta_sink(sink: Optional[DeltaSink]) -> Iterator[None]:
+    """Route :func:`emit_delta` calls in the current context to ``sink``."""
+    token = _delta_sink.set(sink)
+    try:
+        yield
+    finally:
+        _delta_sink.reset(token)
+
+
+def streaming_active() -> bool:
+    return _delta_sink.get() is not None
+
+
+def emit_delta(text: Optional[str]) -> None:
+    """Forward a reply fragment to the active sink (never raises)."""
+    sink = _delta_sink.get()
+    if sink is None or not text:
+        return
+    try:
+        sink(text)
+    except Exception as exc:  # noqa: BLE001 - streaming must not break the turn
+        logger.debug("assistant_delta_emit_failed: %s", exc)
+
+
+class DeltaCoalescer:
+    """
+    Batch small deltas into frames sent at most every ``interval`` seconds.
+
+    ``send(text, seq)`` is called with the coalesced text; :meth:`close`
+    flushes whatever is left. With ``max_age`` set, buffered text is also
+    flushed from a timer once it is that old, so a pause in the LLM stream
+    does not hold back text that already arrived. ``first_sent_at`` records
+    when the first frame went out (monotonic clock) for time-to-first-token
+    accounting.
+    """
+
+    def __init__(self, send: Callable[[str, int], None], interval: float = 0.05,
+                 clock: Callable[[], float] = time.monotonic, max_age: Optional[float] = None) -> None:
+        self._send = send
+        self._interval = interval
+        self._clock = clock
+        self._max_age = max_age
+        self._buffer: List[str] = []
+        self._last_flush = clock()
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+        self.seq = 0
+        self.first_sent_at: Optional[float] = None
+
+    def __call__(self, text: str) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._buffer.append(text)
+            if self._clock() - self._last_flush >= self._interval:
+                self.flush()
+            elif self._max_age is not None and self._timer is None:
+                self._timer = threading.Timer(self._max_age, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._last_flush = self._clock()
+            if not self._buffer:
+                return
+            text, self._buffer = "".join(self._buffer), []
+            if self.first_sent_at is None:
+                self.first_sent_at = self._last_flush
+            self._send(text, self.seq)
+            self.seq += 1
+
+    def close(self) -> None:
+        """Flush the rest and ignore later deltas; safe to call more than once."""
+        with self._lock:
+            self.flush()
+            self._closed = True
+
+
+_SPEAK_KEY = re.compile(r'"speak"\s*:\s*"')
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class SpeakFieldExtractor:
+    """
+    Incrementally decode the ``"speak"`` string of a streamed JSON reply.
+
+    Agents that answer in JSON (``{"act": ..., "speak": ...}``) feed raw LLM
+    deltas to :meth:`feed` and get back only the newly decoded user-facing
+    text, so the stream never shows JSON syntax.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos: Optional[int] = None  # index just past the opening quote
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        if self._done or not chunk:
+            return ""
+        self._buffer += chunk
+        if self._pos is None:
+            match = _SPEAK_KEY.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+
+        out: List[str] = []
+        buf, i = self._buffer, self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self._done = True
+                i += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+            if i + 1 >= len(buf):
+                break  # wait for the rest of the escape
+            code = buf[i + 1]
+            if code == "u":
+                if i + 6 > len(buf):
+                    break
+                try:
+                    out.append(chr(int(buf[i + 2:i + 6], 16)))
+                except ValueError:
+                    pass
+                i += 6
+            else:
+                out.append(_ESCAPES.get(code, code))
+                i += 2
+        self._pos = i
+        return "".join(out)
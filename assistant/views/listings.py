@@ -22,7 +22,7 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
-from openai import OpenAI
+from assistant.llm_gateway import chat_completion, get_openai_client
 
 # Use LangChain agent for all AI processing
 # from .brain.agent import process_turn as lc_process_turn  # DELETED - using enterprise agent
@@ -186,7 +186,7 @@ def get_card_display(request, listing_id: int):
 
 
 try:
-    openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    openai_client = get_openai_client()
 except Exception as e:
     logger.error(f"Failed to initialize OpenAI client in views.py: {e}")
     openai_client = None
@@ -271,7 +271,7 @@ def chat_with_assistant(request):
                 # 🚦 Prefer Central Supervisor when enabled
                 logger.info(f"[{thread_id}] Using Supervisor Agent path")
                 from assistant.brain.agent import run_supervisor_agent
-                lc_result = run_supervisor_agent(message, thread_id)
+                lc_result = run_supervisor_agent(message, thread_id, user_id=user.id)
             elif use_enterprise_agent:
                 # ✅ ENTERPRISE PATH: 12-node enterprise architecture
                 logger.info(f"[{thread_id}] Using Enterprise Agent path")
@@ -743,7 +743,8 @@ Omit missing keys.
 """.strip()
 
             model_name = getattr(settings, "OPENAI_CLASSIFIER_MODEL", getattr(settings, "OPENAI_MODEL", "gpt-4o-mini"))
-            completion = openai_client.chat.completions.create(
+            completion = chat_completion(
+                agent="lead_ingest",
                 model=model_name,
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
@@ -2339,7 +2340,7 @@ def get_card_display(request, listing_id: int):
 
 
 try:
-    openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    openai_client = get_openai_client()
 except Exception as e:
     logger.error(f"Failed to initialize OpenAI client in views.py: {e}")
     openai_client = None
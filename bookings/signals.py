@@ -9,6 +9,7 @@ Handles booking lifecycle events:
 - Availability management
 - Notifications
 """
+from django.db import transaction
 from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
@@ -133,6 +134,30 @@ def on_booking_deleted(sender, instance, **kwargs):
     print(f"[Booking Signal] Deleted: {instance.reference_number}")
 
 
+@receiver(post_save, sender=Booking)
+@receiver(post_delete, sender=Booking)
+def invalidate_seller_dashboard_cache(sender, instance, **kwargs):
+    """
+    Invalidate the listing owner's cached dashboard metrics.
+
+    Runs after commit so a concurrent dashboard request cannot re-cache the
+    pre-change numbers.
+    """
+    if not instance.listing_id:
+        return
+
+    from listings.dashboard_metrics import invalidate_owner_dashboard
+    from listings.models import Listing
+
+    listing_id = instance.listing_id
+
+    def _invalidate():
+        owner_id = Listing.objects.filter(pk=listing_id).values_list('owner_id', flat=True).first()
+        invalidate_owner_dashboard(owner_id)
+
+    transaction.on_commit(_invalidate)
+
+
 # =============================================================================
 # TYPE-SPECIFIC SIGNALS
 # =============================================================================
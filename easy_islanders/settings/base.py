@@ -75,6 +75,7 @@ MIDDLEWARE = [
     'assistant.monitoring.otel_instrumentation.RequestIDMiddleware',
     'assistant.monitoring.middleware.OpenTelemetryMiddleware',  # OpenTelemetry tracing
     'assistant.monitoring.middleware.MetricsMiddleware',  # Additional metrics
+    'assistant.monitoring.query_profiler.QueryProfilerMiddleware',  # Per-request DB query profile (DEBUG by default)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -365,6 +366,8 @@ CELERY_TASK_IGNORE_RESULT = True  # we don't need results for enqueue-only
 CELERY_TASK_DEFAULT_QUEUE = "default"
 CELERY_TASK_ROUTES = {
     "assistant.tasks.process_chat_message": {"queue": "chat"},
+    # write-behind Zep mirroring, kept off the chat queue
+    "assistant.tasks.flush_zep_writes": {"queue": "memory"},
     # background jobs -> lower priority queue
     "assistant.tasks.process_incoming_media_task": {"queue": "background"},
     "assistant.tasks.trigger_get_and_prepare_card_task": {"queue": "background"},
@@ -372,6 +375,9 @@ CELERY_TASK_ROUTES = {
     "assistant.tasks.broadcast_request_for_request": {"queue": "background"},
     "assistant.tasks.update_calibration_params": {"queue": "background"},
     "assistant.tasks.dispatch_broadcast": {"queue": "background"},
+    # debounced batch flushes, kept off the chat queue
+    "assistant.tasks.flush_preference_extraction": {"queue": "background"},
+    "assistant.tasks.flush_listing_index": {"queue": "background"},
 }
 # Fair scheduling; avoid big tasks starving small ones
 CELERYD_PREFETCH_MULTIPLIER = 1
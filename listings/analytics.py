@@ -2,71 +2,99 @@
 Analytics module for seller dashboard statistics and insights.
 
 Computes performance metrics, trends, and AI-powered insights
-for business sellers using the platform.
+for business sellers using the platform. Everything is derived from a
+handful of aggregate queries, so the cost does not grow with the number
+of listings or broadcasts a seller has.
 """
-from django.db.models import Count, Sum, Q, Avg
+from django.db.models import Count, Sum, Q
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from datetime import timedelta
+from .dashboard_metrics import cached_for_owner
 from .models import Listing, SellerProfile
 
+# Broadcast statuses that are still reaching buyers
+ACTIVE_BROADCAST_STATUSES = ('pending', 'sent', 'retrying')
 
-def compute_seller_stats(seller):
-    """
-    Compute comprehensive statistics for a seller.
 
-    Args:
-        seller: SellerProfile instance
+def _listing_totals(seller, since):
+    """Single aggregate over the seller's listings."""
+    return Listing.objects.filter(owner_id=seller.user_id).aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(status='active')),
+        views=Coalesce(Sum('views'), 0),
+        new=Count('id', filter=Q(created_at__gte=since)),
+    )
 
-    Returns:
-        dict: Statistics including views, listings, requests, conversion rate
-    """
-    # Get all seller's listings
-    listings = Listing.objects.filter(seller=seller)
-    total_listings = listings.count()
 
-    # Total views across all listings
-    total_views = sum(listing.views_count for listing in listings if hasattr(listing, 'views_count'))
+def _broadcast_totals(seller, since):
+    """Aggregate broadcasts targeted at the seller (one query per broadcast table)."""
+    from assistant.models import AgentBroadcast, AgentBroadcastV2
+
+    totals = {'total': 0, 'active': 0, 'responded': 0, 'new': 0}
+    for model in (AgentBroadcast, AgentBroadcastV2):
+        row = model.objects.filter(seller_id=str(seller.user_id)).aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status__in=ACTIVE_BROADCAST_STATUSES)),
+            responded=Count('id', filter=Q(status='responded')),
+            new=Count('id', filter=Q(created_at__gte=since)),
+        )
+        for key in totals:
+            totals[key] += row[key]
+    return totals
+
 
-    # Active listings (status='active')
-    active_listings = listings.filter(status='active').count()
+def _stats_from_totals(seller, listings, broadcasts):
+    total_listings = listings['total']
 
     # Buyer requests in seller's categories
-    # Note: Assumes SellerProfile has a 'categories' M2M or similar
     # For now, count all unfulfilled requests as potential opportunities
     pending_requests = 0  # Placeholder until buyer requests are re-implemented
 
-    # Broadcasts statistics
-    broadcasts = BroadcastMessage.objects.filter(seller=seller)
-    total_broadcasts = broadcasts.count()
-    active_broadcasts = broadcasts.filter(status='active').count()
-    broadcast_views = sum(b.views_count for b in broadcasts)
-    broadcast_responses = sum(b.response_count for b in broadcasts)
-
     # Conversion rate (pending requests / total listings * 100)
     conversion_rate = round((pending_requests / total_listings) * 100, 2) if total_listings else 0.0
 
-    # Average rating (from SellerProfile)
-    avg_rating = seller.rating
-
-    # Recent activity (last 30 days)
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-    recent_listings = listings.filter(created_at__gte=thirty_days_ago).count()
-
     return {
-        "total_views": total_views,
+        "total_views": listings['views'],
         "total_listings": total_listings,
-        "active_listings": active_listings,
+        "active_listings": listings['active'],
         "pending_requests": pending_requests,
         "conversion_rate": conversion_rate,
-        "avg_rating": avg_rating,
-        "total_broadcasts": total_broadcasts,
-        "active_broadcasts": active_broadcasts,
-        "broadcast_views": broadcast_views,
-        "broadcast_responses": broadcast_responses,
-        "recent_listings_30d": recent_listings,
+        "avg_rating": seller.rating,
+        "total_broadcasts": broadcasts['total'],
+        "active_broadcasts": broadcasts['active'],
+        "broadcast_views": 0,  # Broadcast impressions are not tracked
+        "broadcast_responses": broadcasts['responded'],
+        "recent_listings_30d": listings['new'],
+    }
+
+
+def _trends_from_totals(listings, broadcasts, start_date, end_date, days):
+    return {
+        "period_days": days,
+        "new_listings": listings['new'],
+        "new_broadcasts": broadcasts['new'],
+        # View growth would need historical tracking; current total views as proxy
+        "current_total_views": listings['views'],
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
     }
 
 
+def compute_seller_stats(seller):
+    """
+    Compute comprehensive statistics for a seller.
+
+    Args:
+        seller: SellerProfile instance
+
+    Returns:
+        dict: Statistics including views, listings, requests, conversion rate
+    """
+    since = timezone.now() - timedelta(days=30)
+    return _stats_from_totals(seller, _listing_totals(seller, since), _broadcast_totals(seller, since))
+
+
 def compute_category_breakdown(seller):
     """
     Compute listing distribution by category for a seller.
@@ -77,18 +105,13 @@ def compute_category_breakdown(seller):
     Returns:
         dict: Category breakdown with counts
     """
-    listings = Listing.objects.filter(seller=seller).select_related('category')
-
-    category_data = {}
-    for listing in listings:
-        if listing.category:
-            cat_name = listing.category.name
-            if cat_name in category_data:
-                category_data[cat_name] += 1
-            else:
-                category_data[cat_name] = 1
-
-    return category_data
+    rows = (
+        Listing.objects.filter(owner_id=seller.user_id, category__isnull=False)
+        .order_by()
+        .values('category__name')
+        .annotate(count=Count('id'))
+    )
+    return {row['category__name']: row['count'] for row in rows}
 
 
 def compute_performance_trends(seller, days=30):
@@ -102,48 +125,32 @@ def compute_performance_trends(seller, days=30):
     Returns:
         dict: Trend data including view growth, listing growth
     """
-    start_date = timezone.now() - timedelta(days=days)
-
-    # New listings in period
-    new_listings = Listing.objects.filter(
-        seller=seller,
-        created_at__gte=start_date
-    ).count()
-
-    # New broadcasts in period
-    new_broadcasts = BroadcastMessage.objects.filter(
-        seller=seller,
-        created_at__gte=start_date
-    ).count()
-
-    # View growth (would need historical tracking for accurate calculation)
-    # Simplified: current total views as proxy
-    listings = Listing.objects.filter(seller=seller)
-    current_views = sum(l.views_count for l in listings if hasattr(l, 'views_count'))
-
-    return {
-        "period_days": days,
-        "new_listings": new_listings,
-        "new_broadcasts": new_broadcasts,
-        "current_total_views": current_views,
-        "start_date": start_date.isoformat(),
-        "end_date": timezone.now().isoformat(),
-    }
-
-
-def get_ai_insights(seller):
+    end_date = timezone.now()
+    start_date = end_date - timedelta(days=days)
+    return _trends_from_totals(
+        _listing_totals(seller, start_date),
+        _broadcast_totals(seller, start_date),
+        start_date,
+        end_date,
+        days,
+    )
+
+
+def get_ai_insights(seller, stats=None):
     """
     Generate AI-powered insights and recommendations for seller.
 
     Args:
         seller: SellerProfile instance
+        stats: Precomputed compute_seller_stats() result (computed if omitted)
 
     Returns:
         list: List of insight strings
     """
     insights = []
 
-    stats = compute_seller_stats(seller)
+    if stats is None:
+        stats = compute_seller_stats(seller)
 
     # Insight: Low listing count
     if stats['total_listings'] < 3:
@@ -200,15 +207,27 @@ def compute_dashboard_summary(seller):
     """
     Compute complete dashboard summary combining stats, trends, and insights.
 
+    The listing and broadcast aggregates are computed once and shared by the
+    stats, trends and insights sections. The result is cached per seller
+    and invalidated when the seller's listings or broadcasts change.
+
     Args:
         seller: SellerProfile instance
 
     Returns:
         dict: Complete dashboard data
     """
-    return {
-        "stats": compute_seller_stats(seller),
-        "category_breakdown": compute_category_breakdown(seller),
-        "trends": compute_performance_trends(seller, days=30),
-        "insights": get_ai_insights(seller),
-    }
+    def compute():
+        end_date = timezone.now()
+        start_date = end_date - timedelta(days=30)
+        listings = _listing_totals(seller, start_date)
+        broadcasts = _broadcast_totals(seller, start_date)
+        stats = _stats_from_totals(seller, listings, broadcasts)
+        return {
+            "stats": stats,
+            "category_breakdown": compute_category_breakdown(seller),
+            "trends": _trends_from_totals(listings, broadcasts, start_date, end_date, 30),
+            "insights": get_ai_insights(seller, stats=stats),
+        }
+
+    return cached_for_owner(seller.user_id, 'seller_analytics', compute)
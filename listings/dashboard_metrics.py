@@ -0,0 +1,184 @@
+"""
+Database-side metrics for the seller real estate dashboard.
+
+Occupancy and earnings are aggregated in the database with a constant
+number of queries, regardless of how many bookings an owner has:
+
+- occupied nights per month use ``generate_series`` month buckets and range
+  intersection arithmetic on PostgreSQL (one query). Other backends (SQLite
+  in tests) fetch the overlapping bookings once and bucket them in Python.
+- revenue per property is a single grouped ``SUM`` with a filtered month
+  aggregate alongside the year-to-date one.
+
+Results are cached per owner; the cache is invalidated from the bookings
+and listings signals whenever one of the owner's bookings, listings or
+broadcasts is saved or deleted.
+"""
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q, Sum
+
+from bookings.models import Booking
+
+OCCUPANCY_STATUSES = ('confirmed', 'in_progress')
+REVENUE_STATUSES = ('confirmed', 'completed')
+
+DASHBOARD_CACHE_TTL = 300  # seconds
+
+
+# ---------------------------------------------------------------------------
+# Per-owner cache
+# ---------------------------------------------------------------------------
+
+def _owner_version(owner_id):
+    return cache.get_or_set(f"re_dash:v:{owner_id}", 1, None)
+
+
+def cached_for_owner(owner_id, name, compute):
+    """Return ``compute()`` cached under (owner, name) until the owner is invalidated."""
+    key = f"re_dash:{owner_id}:{_owner_version(owner_id)}:{name}"
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, DASHBOARD_CACHE_TTL)
+    return value
+
+
+def invalidate_owner_dashboard(owner_id):
+    """Drop every cached dashboard payload of ``owner_id`` (version bump)."""
+    if owner_id is None:
+        return
+    key = f"re_dash:v:{owner_id}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, None)
+
+
+# ---------------------------------------------------------------------------
+# Occupancy
+# ---------------------------------------------------------------------------
+
+def _month_start(now, months_back):
+    base = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    years, month_index = divmod(base.month - 1 - months_back, 12)
+    return base.replace(year=base.year + years, month=month_index + 1)
+
+
+def _month_buckets(now, months):
+    """[(month_start, month_end), ...] for the last ``months`` calendar months, oldest first."""
+    return [
+        (_month_start(now, i), _month_start(now, i - 1))
+        for i in range(months - 1, -1, -1)
+    ]
+
+
+_OCCUPANCY_SQL = """
+    WITH months AS (
+        SELECT gs AS month_start, gs + interval '1 month' AS month_end
+        FROM generate_series(
+            date_trunc('month', %(now)s::timestamptz) - %(back)s * interval '1 month',
+            date_trunc('month', %(now)s::timestamptz),
+            interval '1 month'
+        ) AS gs
+    )
+    SELECT
+        m.month_start,
+        m.month_end,
+        COALESCE(SUM(GREATEST(0, EXTRACT(DAY FROM
+            LEAST(b.end_date, m.month_end) - GREATEST(b.start_date, m.month_start)
+        ))), 0)::int AS occupied_nights
+    FROM months m
+    LEFT JOIN {table} b
+        ON b.listing_id = ANY(%(listing_ids)s)
+        AND b.status IN %(statuses)s
+        AND b.start_date < m.month_end
+        AND b.end_date > m.month_start
+    GROUP BY m.month_start, m.month_end
+    ORDER BY m.month_start
+"""
+
+
+def occupied_nights_by_month(listing_ids, now, months=6):
+    """
+    Occupied nights per calendar month for the given generic listing ids.
+
+    Returns ``[(month_start, days_in_month, occupied_nights), ...]`` oldest first.
+    """
+    listing_ids = list(listing_ids)
+
+    if listing_ids and connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                _OCCUPANCY_SQL.format(table=Booking._meta.db_table),
+                {
+                    'now': now,
+                    'back': months - 1,
+                    'listing_ids': listing_ids,
+                    'statuses': OCCUPANCY_STATUSES,
+                },
+            )
+            return [
+                (month_start, (month_end - month_start).days, occupied)
+                for month_start, month_end, occupied in cursor.fetchall()
+            ]
+
+    buckets = _month_buckets(now, months)
+    occupied = [0] * len(buckets)
+    if listing_ids:
+        window_start, window_end = buckets[0][0], buckets[-1][1]
+        ranges = Booking.objects.filter(
+            listing_id__in=listing_ids,
+            status__in=OCCUPANCY_STATUSES,
+            start_date__lt=window_end,
+            end_date__gt=window_start,
+        ).values_list('start_date', 'end_date')
+        for start, end in ranges:
+            for i, (month_start, month_end) in enumerate(buckets):
+                nights = (min(end, month_end) - max(start, month_start)).days
+                if nights > 0:
+                    occupied[i] += nights
+
+    return [
+        (month_start, (month_end - month_start).days, occupied[i])
+        for i, (month_start, month_end) in enumerate(buckets)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Earnings
+# ---------------------------------------------------------------------------
+
+def revenue_by_listing(listing_ids, month_start, ytd_start):
+    """
+    Month-to-date and year-to-date booking revenue per generic listing id.
+
+    One grouped query; returns ``{listing_id: {'month': Decimal, 'ytd': Decimal}}``
+    for listings that have revenue in the year so far.
+    """
+    listing_ids = list(listing_ids)
+    if not listing_ids:
+        return {}
+
+    rows = (
+        Booking.objects.filter(
+            listing_id__in=listing_ids,
+            status__in=REVENUE_STATUSES,
+            start_date__gte=ytd_start,
+        )
+        .order_by()  # drop Meta.ordering so it does not leak into GROUP BY
+        .values('listing_id')
+        .annotate(
+            ytd=Sum('total_price'),
+            month=Sum('total_price', filter=Q(start_date__gte=month_start)),
+        )
+    )
+    return {
+        row['listing_id']: {
+            'month': row['month'] or Decimal('0.00'),
+            'ytd': row['ytd'] or Decimal('0.00'),
+        }
+        for row in rows
+    }
@@ -0,0 +1,85 @@
+import django.contrib.postgres.search
+from django.db import migrations
+
+FORWARD_SQL = [
+    # unaccent needs a superuser (or the database owner on PostgreSQL 13+,
+    # where it is a trusted extension). Without it the configuration is
+    # plain ``simple``; see listings/search.py.
+    """
+    DO $$
+    BEGIN
+        CREATE EXTENSION IF NOT EXISTS unaccent;
+    EXCEPTION WHEN insufficient_privilege THEN
+        RAISE WARNING 'unaccent not installed (needs superuser): listing search will not fold diacritics';
+    END
+    $$
+    """,
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'listing_search') THEN
+            CREATE TEXT SEARCH CONFIGURATION listing_search (COPY = simple);
+        END IF;
+        IF EXISTS (SELECT 1 FROM pg_ts_dict WHERE dictname = 'unaccent') THEN
+            ALTER TEXT SEARCH CONFIGURATION listing_search
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, simple;
+        END IF;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION listings_listing_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('listing_search', coalesce(NEW.title, '')), 'A')
+            || setweight(to_tsvector('listing_search', coalesce(NEW.description, '')), 'B')
+            || setweight(jsonb_to_tsvector('listing_search', coalesce(NEW.dynamic_fields::jsonb, '{}'::jsonb),
+                                           '["key", "string", "numeric", "boolean"]'), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER listings_listing_search_vector
+        BEFORE INSERT OR UPDATE ON listings_listing
+        FOR EACH ROW EXECUTE FUNCTION listings_listing_search_vector_update()
+    """,
+    # Backfill existing rows through the trigger
+    "UPDATE listings_listing SET title = title",
+    "CREATE INDEX IF NOT EXISTS listings_listing_search_vector_gin ON listings_listing USING gin (search_vector)",
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS listings_listing_search_vector_gin",
+    "DROP TRIGGER IF EXISTS listings_listing_search_vector ON listings_listing",
+    "DROP FUNCTION IF EXISTS listings_listing_search_vector_update()",
+    "DROP TEXT SEARCH CONFIGURATION IF EXISTS listing_search",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        # The trigger, text search configuration and GIN index are PostgreSQL-only;
+        # other backends keep the column and fall back to icontains search.
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0009_sellerprofile_storefront_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='listing',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(_run(FORWARD_SQL), _run(REVERSE_SQL)),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations
+
+TRIGGER_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION listings_listing_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('listing_search', coalesce(NEW.title, '')), 'A')
+            || setweight(to_tsvector('listing_search', coalesce(NEW.description, '')), 'B'){location}
+            || setweight(jsonb_to_tsvector('listing_search', coalesce(NEW.dynamic_fields::jsonb, '{{}}'::jsonb),
+                                           '["key", "string", "numeric", "boolean"]'), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+LOCATION_SQL = "\n            || setweight(to_tsvector('listing_search', coalesce(NEW.location, '')), 'B')"
+
+# Backfill existing rows through the trigger
+BACKFILL_SQL = "UPDATE listings_listing SET title = title"
+
+FORWARD_SQL = [TRIGGER_FUNCTION_SQL.format(location=LOCATION_SQL), BACKFILL_SQL]
+REVERSE_SQL = [TRIGGER_FUNCTION_SQL.format(location=""), BACKFILL_SQL]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0010_listing_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunPython(_run(FORWARD_SQL), _run(REVERSE_SQL)),
+    ]
@@ -0,0 +1,103 @@
+"""
+Full-text search over listings.
+
+On PostgreSQL every ``listings_listing`` row carries a ``search_vector``
+maintained by the ``listings_listing_search_vector`` trigger (migrations
+0010/0011): title weighted A, description and location B, and the flattened
+keys and values of ``dynamic_fields`` C, all under the ``listing_search``
+text search configuration (``simple`` dictionary behind ``unaccent``, so
+"Girne", "kiralık" and "kiralik" match regardless of language or
+diacritics). A GIN index backs the column.
+
+``unaccent`` is created by migration 0010 when the migrating role may do so
+(a superuser, or the database owner on PostgreSQL 13+ where it is a trusted
+extension). Otherwise the configuration is plain ``simple`` and diacritics
+must match; to add folding later, run ``CREATE EXTENSION unaccent`` as a
+superuser, then the ``ALTER TEXT SEARCH CONFIGURATION listing_search ...``
+mapping from migration 0010 and a backfill (``UPDATE listings_listing SET
+title = title``).
+
+Other backends (SQLite in tests and local dev) have no such column
+contents; ``keyword_filter`` falls back to ``icontains`` there.
+"""
+from __future__ import annotations
+
+from functools import reduce
+from operator import or_
+from typing import Iterable, Optional
+
+from django.db import connection
+from django.db.models import F, FloatField, Q, QuerySet, Value
+
+SEARCH_CONFIG = "listing_search"
+
+# Keep in sync with migration 0011 (the trigger body); used by the benchmark.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('listing_search', coalesce({row}.title, '')), 'A')"
+    " || setweight(to_tsvector('listing_search', coalesce({row}.description, '')), 'B')"
+    " || setweight(to_tsvector('listing_search', coalesce({row}.location, '')), 'B')"
+    " || setweight(jsonb_to_tsvector('listing_search', coalesce({row}.dynamic_fields::jsonb, '{{}}'::jsonb),"
+    " '[\"key\", \"string\", \"numeric\", \"boolean\"]'), 'C')"
+)
+
+
+def full_text_enabled(using: Optional[str] = None) -> bool:
+    """True when the database maintains ``Listing.search_vector``."""
+    from django.db import connections
+
+    conn = connections[using] if using else connection
+    return conn.vendor == "postgresql"
+
+
+def keyword_query(keywords: Iterable[str]):
+    """OR of plain per-keyword queries, so any keyword matches and more matches rank higher."""
+    from django.contrib.postgres.search import SearchQuery
+
+    queries = [SearchQuery(k, config=SEARCH_CONFIG, search_type="plain") for k in keywords if k.strip()]
+    return reduce(or_, queries) if queries else None
+
+
+def keyword_filter(keywords: Iterable[str], using: Optional[str] = None) -> Q:
+    """
+    ``Q`` matching listings that mention any of ``keywords``: the search
+    vector on PostgreSQL, ``icontains`` over the indexed fields elsewhere.
+    """
+    keywords = [k for k in keywords if k and k.strip()]
+    if not keywords:
+        return Q()
+    if full_text_enabled(using):
+        return Q(search_vector=keyword_query(keywords))
+    condition = Q()
+    for keyword in keywords:
+        condition |= (
+            Q(title__icontains=keyword)
+            | Q(description__icontains=keyword)
+            | Q(location__icontains=keyword)
+            | Q(dynamic_fields__icontains=keyword)
+        )
+    return condition
+
+
+def rank_by_text(qs: QuerySet, text: str) -> QuerySet:
+    """
+    Filter ``qs`` to rows matching any keyword in ``text`` and annotate
+    ``rank`` (``ts_rank_cd``, cover density) for ordering.
+    """
+    from django.contrib.postgres.search import SearchRank
+
+    query = keyword_query(text.split())
+    if query is None:
+        return qs.annotate(rank=Value(0.0, output_field=FloatField()))
+    return qs.filter(search_vector=query).annotate(
+        rank=SearchRank(F("search_vector"), query, cover_density=True)
+    )
+
+
+__all__ = [
+    "SEARCH_CONFIG",
+    "SEARCH_VECTOR_SQL",
+    "full_text_enabled",
+    "keyword_filter",
+    "keyword_query",
+    "rank_by_text",
+]
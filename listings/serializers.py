@@ -478,13 +478,13 @@ class SellerAnalyticsSerializer(serializers.Serializer):
     """Serializer for seller dashboard analytics"""
 
     # Stats section
-    stats = serializers.DictField(child=serializers.Field())
+    stats = serializers.DictField()
 
     # Category breakdown
     category_breakdown = serializers.DictField(child=serializers.IntegerField())
 
     # Performance trends
-    trends = serializers.DictField(child=serializers.Field())
+    trends = serializers.DictField()
 
     # AI-powered insights
     insights = serializers.ListField(child=serializers.CharField())
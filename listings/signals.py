@@ -0,0 +1,31 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from assistant.models import AgentBroadcast, AgentBroadcastV2
+
+from .dashboard_metrics import invalidate_owner_dashboard
+from .models import Listing, SellerProfile
+
+
+def _invalidate_on_commit(owner_id):
+    transaction.on_commit(lambda: invalidate_owner_dashboard(owner_id))
+
+
+@receiver([post_save, post_delete], sender=Listing)
+def invalidate_analytics_on_listing_change(sender, instance, **kwargs):
+    """Listing counts, views and categories feed the owner's seller analytics."""
+    _invalidate_on_commit(instance.owner_id)
+
+
+@receiver(post_save, sender=SellerProfile)
+def invalidate_analytics_on_profile_change(sender, instance, **kwargs):
+    _invalidate_on_commit(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=AgentBroadcast)
+@receiver([post_save, post_delete], sender=AgentBroadcastV2)
+def invalidate_analytics_on_broadcast_change(sender, instance, **kwargs):
+    """Broadcasts reference their seller by user id (as a string)."""
+    if instance.seller_id:
+        _invalidate_on_commit(instance.seller_id)
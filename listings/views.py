@@ -22,6 +22,12 @@ from .serializers import (
     RECalendarSerializer,
 )
 from .analytics import compute_dashboard_summary
+from .dashboard_metrics import (
+    OCCUPANCY_STATUSES,
+    cached_for_owner,
+    occupied_nights_by_month,
+    revenue_by_listing,
+)
 from django.utils import timezone
 
 try:
@@ -1097,97 +1103,74 @@ class RealEstateDashboardViewSet(viewsets.ViewSet):
     # Stubs for later deep-dive sections (return empty shapes to avoid 404s)
     @action(detail=False, methods=['get'])
     def occupancy(self, request):
-        now = timezone.now()
-        props = self._get_user_properties(request)
-        # Build last 6 months occupancy timeline
-        timeline = []
-        for i in range(5, -1, -1):
-            month = (now - timezone.timedelta(days=30 * i))
-            month_start = month.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            # crude month end
-            next_month = (month_start + timezone.timedelta(days=32)).replace(day=1)
-            month_end = next_month
-            days = (month_end - month_start).days or 30
-            total_nights = max(props.count() * days, 1)
-            occupied_nights = 0
-            qs = self._get_user_bookings(request, props).filter(
-                status__in=['confirmed', 'in_progress'],
-                start_date__lt=month_end,
-                end_date__gt=month_start,
-            )
-            for b in qs:
-                s = max(b.start_date, month_start)
-                e = min(b.end_date or month_end, month_end)
-                delta = (e - s).days
-                if delta > 0:
-                    occupied_nights += delta
-            rate = round((occupied_nights / total_nights) * 100.0, 2) if total_nights else 0.0
-            timeline.append({
-                'label': month_start.strftime('%Y-%m'),
-                'occupancy_rate': rate,
-                'occupied_nights': occupied_nights,
-                'total_nights': total_nights,
-            })
+        def compute():
+            now = timezone.now()
+            props = self._get_user_properties(request)
+            unit_count = props.count()
+            listing_ids = list(props.exclude(listing__isnull=True).values_list('listing_id', flat=True))
+
+            # Last 6 calendar months, bucketed in the database
+            timeline = []
+            for month_start, days, occupied_nights in occupied_nights_by_month(listing_ids, now, months=6):
+                total_nights = max(unit_count * days, 1)
+                rate = round((occupied_nights / total_nights) * 100.0, 2) if total_nights else 0.0
+                timeline.append({
+                    'label': month_start.strftime('%Y-%m'),
+                    'occupancy_rate': rate,
+                    'occupied_nights': occupied_nights,
+                    'total_nights': total_nights,
+                })
 
-        vacancy = [{
-            'status': 'vacant',
-            'count': props.count() - self._get_user_bookings(request, props).filter(
-                status__in=['confirmed', 'in_progress'],
+            occupied_now = Booking.objects.filter(
+                listing_id__in=listing_ids,
+                status__in=OCCUPANCY_STATUSES,
                 start_date__lte=now,
                 end_date__gte=now,
             ).values('listing_id').distinct().count()
-        }]
+            vacancy = [{'status': 'vacant', 'count': unit_count - occupied_now}]
 
-        return Response({'timeline': timeline, 'vacancy': vacancy, 'seasonality': [], 'forecast': {}})
+            return {'timeline': timeline, 'vacancy': vacancy, 'seasonality': [], 'forecast': {}}
+
+        return Response(cached_for_owner(request.user.id, 'occupancy', compute))
 
     @action(detail=False, methods=['get'])
     def earnings(self, request):
-        now = timezone.now()
-        props = self._get_user_properties(request)
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        ytd_start = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-        from decimal import Decimal
+        def compute():
+            now = timezone.now()
+            props = self._get_user_properties(request)
+            month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            ytd_start = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+            from decimal import Decimal
 
-        month_bookings = self._get_user_bookings(request, props).filter(
-            status__in=['confirmed', 'completed'],
-            start_date__gte=month_start,
-        )
-        ytd_bookings = self._get_user_bookings(request, props).filter(
-            status__in=['confirmed', 'completed'],
-            start_date__gte=ytd_start,
-        )
+            prop_rows = list(props.values('id', 'title', 'listing_id'))
+            revenue = revenue_by_listing(
+                [row['listing_id'] for row in prop_rows if row['listing_id']],
+                month_start,
+                ytd_start,
+            )
 
-        total_month = sum((b.total_price or Decimal('0.00')) for b in month_bookings)
-        total_ytd = sum((b.total_price or Decimal('0.00')) for b in ytd_bookings)
+            # By property breakdown (grouped SUM per listing)
+            zero = {'month': Decimal('0.00'), 'ytd': Decimal('0.00')}
+            by_property = []
+            for row in prop_rows:
+                totals = revenue.get(row['listing_id'], zero)
+                by_property.append({
+                    'id': row['id'],
+                    'title': row['title'],
+                    'monthly_revenue': totals['month'],
+                    'ytd_revenue': totals['ytd'],
+                })
+            top_performers = sorted(by_property, key=lambda x: x['monthly_revenue'], reverse=True)[:5]
 
-        # By property breakdown (month)
-        by_property_map = {}
-        for p in props:
-            by_property_map[p.id] = {
-                'id': p.id,
-                'title': p.title,
-                'monthly_revenue': Decimal('0.00'),
-                'ytd_revenue': Decimal('0.00'),
+            summary = {
+                'month_total': sum((t['month'] for t in revenue.values()), Decimal('0.00')),
+                'ytd_total': sum((t['ytd'] for t in revenue.values()), Decimal('0.00')),
+                'currency': 'EUR',
             }
-        for b in month_bookings:
-            prop = props.filter(listing_id=b.listing_id).first()
-            if prop:
-                by_property_map[prop.id]['monthly_revenue'] += (b.total_price or Decimal('0.00'))
-        for b in ytd_bookings:
-            prop = props.filter(listing_id=b.listing_id).first()
-            if prop:
-                by_property_map[prop.id]['ytd_revenue'] += (b.total_price or Decimal('0.00'))
-
-        by_property = list(by_property_map.values())
-        top_performers = sorted(by_property, key=lambda x: x['monthly_revenue'], reverse=True)[:5]
 
-        summary = {
-            'month_total': total_month,
-            'ytd_total': total_ytd,
-            'currency': 'EUR',
-        }
+            return {'summary': summary, 'by_property': by_property, 'payouts': [], 'top_performers': top_performers}
 
-        return Response({'summary': summary, 'by_property': by_property, 'payouts': [], 'top_performers': top_performers})
+        return Response(cached_for_owner(request.user.id, 'earnings', compute))
 
     @action(detail=False, methods=['get'], url_path='sales-pipeline')
     def sales_pipeline(self, request):
@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import (
-    Location, PropertyType, FeatureCategory, Feature, TitleDeedType, UtilityType, TaxType,
+    Location, LocationAlias, PropertyType, FeatureCategory, Feature, TitleDeedType, UtilityType, TaxType,
     Contact, ContactRole,
     Project,
     Property, PropertyFeature, PropertyOwner, PropertyUtilityAccount, PropertyTax,
@@ -19,6 +19,13 @@ class LocationAdmin(admin.ModelAdmin):
     search_fields = ('city', 'area')
 
 
+@admin.register(LocationAlias)
+class LocationAliasAdmin(admin.ModelAdmin):
+    list_display = ('alias', 'canonical', 'location')
+    list_filter = ('canonical',)
+    search_fields = ('alias', 'canonical')
+
+
 @admin.register(PropertyType)
 class PropertyTypeAdmin(admin.ModelAdmin):
     list_display = ('code', 'label', 'category')
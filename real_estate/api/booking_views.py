@@ -5,7 +5,7 @@ Provides endpoints for:
 1. Availability checking (with optional date range for daily rentals)
 2. Booking creation
 """
-from datetime import datetime
+from datetime import datetime, timedelta
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -14,6 +14,7 @@ from django.db import transaction
 import logging
 
 from real_estate.models import Listing, Tenancy
+from real_estate.occupancy import is_range_free
 from assistant.brain.metrics import record_availability_check, record_booking_request
 
 logger = logging.getLogger(__name__)
@@ -99,14 +100,14 @@ class AvailabilityCheckView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Check for overlapping tenancies
-            # A tenancy overlaps if: tenancy.start_date <= check_out AND tenancy.end_date >= check_in
-            overlapping = Tenancy.objects.filter(
-                listing=listing,
-                start_date__lte=check_out,
-                end_date__gte=check_in,
-                status__in=['PENDING', 'ACTIVE']  # Only consider active/pending bookings
-            ).exists()
+            # Check for overlapping tenancies against the precomputed night calendar.
+            # A tenancy overlaps if: tenancy.start_date <= check_out AND tenancy.end_date >= check_in,
+            # i.e. it holds a night between the eve of check-in and the night of check-out.
+            overlapping = not is_range_free(
+                listing.id,
+                check_in - timedelta(days=1),
+                check_out + timedelta(days=1),
+            )
 
             if overlapping:
                 record_availability_check(result='unavailable')
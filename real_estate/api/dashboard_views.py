@@ -25,6 +25,7 @@ from django.db.models import Count, Sum, Avg, Q
 from django.utils import timezone
 
 from real_estate.models import Listing as REListing
+from real_estate.occupancy import daily_occupied_counts, occupancy_rate
 from listings.models import Listing as GenericListing
 from bookings.models import Booking
 
@@ -202,27 +203,33 @@ class RealEstateOccupancyView(APIView):
 
     def get(self, request, *args, **kwargs):
         user = request.user
-        properties = REListing.objects.filter(owner=user)
-        total_units = properties.count()
+        listing_ids = list(
+            REListing.objects.filter(
+                created_by=user,
+                listing_type__code__in=['DAILY_RENTAL', 'LONG_TERM_RENTAL'],
+            ).values_list('id', flat=True)
+        )
+        total_units = len(listing_ids)
+
+        # Last 30 nights (including tonight), read from the occupancy calendar
+        today = timezone.now().date()
+        start = today - timedelta(days=29)
+        end = today + timedelta(days=1)
+        counts = daily_occupied_counts(listing_ids, start, end)
 
-        # Generate last 30 days of occupancy data (placeholder)
         series = []
-        today = date.today()
-        for i in range(30):
-            day = today - timedelta(days=29 - i)
-            # Placeholder occupancy calculation
-            occupied = int(total_units * 0.75)  # 75% occupancy
+        for i, occupied in enumerate(counts):
             series.append({
-                "date": day.isoformat(),
-                "occupancy_rate": 0.75,
+                "date": (start + timedelta(days=i)).isoformat(),
+                "occupancy_rate": round(occupied / total_units, 2) if total_units else 0.0,
                 "units_occupied": occupied,
                 "units_vacant": total_units - occupied,
             })
 
         data = {
             "series": series,
-            "current_occupancy_rate": 0.75,
-            "avg_occupancy_rate": 0.75,
+            "current_occupancy_rate": series[-1]["occupancy_rate"],
+            "avg_occupancy_rate": round(occupancy_rate(listing_ids, start, end), 2),
         }
 
         serializer = RealEstateOccupancySerializer(data)
@@ -0,0 +1,90 @@
+"""
+Keyset (cursor) pagination helpers for Real Estate v1 APIs.
+
+Cursors are opaque, URL-safe tokens encoding the sort key of the last row
+of a page (e.g. ``(base_price, listing_id)``). The next page is fetched with
+a row comparison on that tuple, so deep pages cost the same as the first one.
+Totals are computed once per filter set and cached briefly instead of being
+re-counted on every page.
+"""
+import base64
+import hashlib
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+# Cached totals are approximate by design: a new/removed listing shows up
+# in ``total`` after at most this many seconds.
+TOTAL_COUNT_CACHE_TTL = 60
+
+_DECODERS = {
+    "decimal": Decimal,
+    "int": int,
+    "datetime": parse_datetime,
+}
+
+
+def _tag(value):
+    if isinstance(value, Decimal):
+        return "decimal"
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, int):
+        return "int"
+    return None
+
+
+def encode_cursor(scope, values):
+    """Encode the sort key ``values`` of the last row into an opaque cursor."""
+    # Serialize by hand: DjangoJSONEncoder truncates datetimes to
+    # milliseconds, which would break the keyset equality on created_at.
+    payload = {
+        "s": scope,
+        "k": [v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, Decimal) else v
+              for v in values],
+        "t": [_tag(v) for v in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, scope):
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises ValidationError if the token is malformed or was issued for a
+    different sort order (``scope``).
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if payload.get("s") != scope:
+            raise ValueError("cursor scope mismatch")
+        values = []
+        for value, tag in zip(payload["k"], payload["t"]):
+            if value is not None and tag in _DECODERS:
+                value = _DECODERS[tag](value)
+                if value is None:
+                    raise ValueError("bad cursor value")
+            values.append(value)
+        return values
+    except (ValueError, KeyError, TypeError, InvalidOperation):
+        raise ValidationError({"cursor": "Invalid or expired cursor."})
+
+
+def cached_total(namespace, filters, compute):
+    """Return ``compute()`` cached per (namespace, filters) for TOTAL_COUNT_CACHE_TTL."""
+    digest = hashlib.md5(
+        json.dumps(filters, cls=DjangoJSONEncoder, sort_keys=True).encode()
+    ).hexdigest()
+    key = f"re:v1:total:{namespace}:{digest}"
+    total = cache.get(key)
+    if total is None:
+        total = compute()
+        cache.set(key, total, TOTAL_COUNT_CACHE_TTL)
+    return total
@@ -113,74 +113,74 @@ class PortfolioListingSerializer(serializers.ModelSerializer):
 
         return 'Available'
 
-    def get_views_30d(self, obj):
-        """Count VIEW events in last 30 days."""
+    def _recent_event_count(self, obj, event_type):
+        """30-day event count; read from with_portfolio_stats() annotations when present."""
+        annotated = getattr(obj, f"{event_type.lower()}_30d_count", None)
+        if annotated is not None:
+            return annotated
+
         from datetime import timedelta
         from django.utils import timezone
 
         thirty_days_ago = timezone.now() - timedelta(days=30)
         return obj.events.filter(
-            event_type='VIEW',
+            event_type=event_type,
             occurred_at__gte=thirty_days_ago
         ).count()
 
+    def _feature_codes(self, obj):
+        """Feature codes of the related property (uses prefetched ``property__features``)."""
+        if not obj.property:
+            return set()
+        return {feature.code for feature in obj.property.features.all()}
+
+    def get_views_30d(self, obj):
+        """Count VIEW events in last 30 days."""
+        return self._recent_event_count(obj, 'VIEW')
+
     def get_enquiries_30d(self, obj):
         """Count ENQUIRY events in last 30 days."""
-        from datetime import timedelta
-        from django.utils import timezone
-
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        return obj.events.filter(
-            event_type='ENQUIRY',
-            occurred_at__gte=thirty_days_ago
-        ).count()
+        return self._recent_event_count(obj, 'ENQUIRY')
 
     def get_bookings_30d(self, obj):
         """Count BOOKING_CONFIRMED events in last 30 days."""
-        from datetime import timedelta
-        from django.utils import timezone
-
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        return obj.events.filter(
-            event_type='BOOKING_CONFIRMED',
-            occurred_at__gte=thirty_days_ago
-        ).count()
+        return self._recent_event_count(obj, 'BOOKING_CONFIRMED')
 
     def get_has_wifi(self, obj):
         """Check if property has WiFi feature."""
-        if not obj.property:
-            return False
-
-        return obj.property.features.filter(code='WIFI').exists()
+        return 'WIFI' in self._feature_codes(obj)
 
     def get_has_kitchen(self, obj):
         """Check if property has Kitchen feature."""
-        if not obj.property:
-            return False
-
-        return obj.property.features.filter(code='KITCHEN').exists()
+        return 'KITCHEN' in self._feature_codes(obj)
 
     def get_has_pool(self, obj):
         """Check if property has any pool feature."""
-        if not obj.property:
-            return False
-
-        pool_codes = ['PRIVATE_POOL', 'SHARED_POOL', 'PUBLIC_POOL']
-        return obj.property.features.filter(code__in=pool_codes).exists()
+        return bool({'PRIVATE_POOL', 'SHARED_POOL', 'PUBLIC_POOL'} & self._feature_codes(obj))
 
     def get_has_private_pool(self, obj):
         """Check if property has private pool feature."""
-        if not obj.property:
-            return False
-
-        return obj.property.features.filter(code='PRIVATE_POOL').exists()
+        return 'PRIVATE_POOL' in self._feature_codes(obj)
 
     def get_has_sea_view(self, obj):
         """Check if property has sea view feature."""
-        if not obj.property:
-            return False
-
-        return obj.property.features.filter(code='SEA_VIEW').exists()
+        return 'SEA_VIEW' in self._feature_codes(obj)
+
+
+def with_portfolio_stats(qs):
+    """
+    Annotate ``qs`` with the 30-day event counts PortfolioListingSerializer
+    reads, so a page of listings costs one query instead of three per row.
+    """
+    from datetime import timedelta
+    from django.db.models import Count, Q
+    from django.utils import timezone
+
+    recent = Q(events__occurred_at__gte=timezone.now() - timedelta(days=30))
+    return qs.annotate(**{
+        f"{event_type.lower()}_30d_count": Count('events', filter=recent & Q(events__event_type=event_type))
+        for event_type in ('VIEW', 'ENQUIRY', 'BOOKING_CONFIRMED')
+    })
 
 
 class PortfolioSummaryItemSerializer(serializers.Serializer):
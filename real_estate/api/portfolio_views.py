@@ -15,10 +15,12 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
 from real_estate.models import Listing, ListingType, ListingEvent
+from .pagination import cached_total, decode_cursor, encode_cursor
 from .portfolio_serializers import (
     PortfolioListingSerializer,
     PortfolioSummaryItemSerializer,
     ListingUpdateSerializer,
+    with_portfolio_stats,
 )
 
 
@@ -45,15 +47,21 @@ class PortfolioViewSet(viewsets.ViewSet):
             - city (str): Filter by city name
             - area (str): Filter by area name
             - search (str): Search in title, reference_code, description
-            - page (int): Page number (default: 1)
+            - page (int): Page number (default: 1), ignored when cursor is given
             - page_size (int): Items per page (default: 20)
+            - cursor (str): Opaque next_cursor from the previous page
+
+        Listings are ordered newest first on (created_at, id); with a cursor
+        the next page is a keyset seek rather than an OFFSET scan. ``total``
+        is cached per filter set (approximate for up to a minute).
 
         Response:
             {
                 "results": [PortfolioListing, ...],
                 "page": int,
                 "page_size": int,
-                "total": int
+                "total": int,
+                "next_cursor": str | null
             }
         """
         # Extract query parameters
@@ -73,7 +81,6 @@ class PortfolioViewSet(viewsets.ViewSet):
             'property__property_type'
         ).prefetch_related(
             'property__features',
-            'events'
         ).all()
 
         # Apply filters
@@ -96,22 +103,45 @@ class PortfolioViewSet(viewsets.ViewSet):
                 Q(description__icontains=search_query)
             )
 
-        # Count total before pagination
-        total = qs.count()
+        # Count total before pagination (cached per filter set)
+        filters = {
+            'listing_type': listing_type_code,
+            'status': status_filter,
+            'city': city_filter,
+            'area': area_filter,
+            'search': search_query,
+        }
+        total = cached_total('portfolio_listings', filters, qs.count)
+
+        # Keyset pagination on (created_at, id), newest first
+        qs = with_portfolio_stats(qs).order_by('-created_at', '-id')
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            created_at, last_id = decode_cursor(cursor, 'portfolio')
+            qs = qs.filter(
+                Q(created_at__lt=created_at) |
+                Q(created_at=created_at, id__lt=last_id)
+            )
+            page_items = list(qs[:page_size + 1])
+        else:
+            start = (page - 1) * page_size
+            page_items = list(qs[start:start + page_size + 1])
 
-        # Pagination
-        start = (page - 1) * page_size
-        end = start + page_size
-        qs = qs[start:end]
+        next_cursor = None
+        if len(page_items) > page_size:
+            page_items = page_items[:page_size]
+            last = page_items[-1]
+            next_cursor = encode_cursor('portfolio', (last.created_at, last.id))
 
         # Serialize
-        serializer = PortfolioListingSerializer(qs, many=True)
+        serializer = PortfolioListingSerializer(page_items, many=True)
 
         return Response({
             'results': serializer.data,
             'page': page,
             'page_size': page_size,
             'total': total,
+            'next_cursor': next_cursor,
         })
 
     @action(detail=False, methods=['get'], url_path='summary')
@@ -44,6 +44,7 @@ class ListingSearchQuerySerializer(serializers.Serializer):
     # Pagination
     limit = serializers.IntegerField(required=False, default=50, min_value=1, max_value=200)
     offset = serializers.IntegerField(required=False, default=0, min_value=0)
+    cursor = serializers.CharField(required=False, max_length=512, help_text="Opaque keyset cursor (next_cursor)")
 
     # Sorting
     sort_by = serializers.ChoiceField(
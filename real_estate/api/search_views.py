@@ -8,8 +8,42 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from drf_spectacular.utils import extend_schema, OpenApiParameter
+from real_estate.locations import resolve_location_ids
+from .pagination import cached_total, decode_cursor, encode_cursor
 from .search_serializers import ListingSearchQuerySerializer, ListingSearchResultSerializer
 
+# sort_by -> (view column, direction, sentinel standing in for NULL so that
+# NULLs sort last and the keyset comparison stays total)
+SORT_KEYS = {
+    "price_asc": ("base_price", "ASC", None),
+    "price_desc": ("base_price", "DESC", None),
+    "bedrooms_asc": ("bedrooms", "ASC", 2147483647),
+    "bedrooms_desc": ("bedrooms", "DESC", -1),
+    "created_at_desc": ("created_at", "DESC", None),
+}
+
+
+def _location_clause(field, raw, sql_params):
+    """SQL fragment restricting results to the Locations ``raw`` resolves to."""
+    location_ids = resolve_location_ids(raw)
+    if not location_ids:
+        # Unknown alias: case-insensitive prefix match on the raw text (partial
+        # or unaliased names); no leading wildcard, so it stays index-friendly
+        escaped = raw.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        sql_params[field] = f"{escaped}%"
+        return f" AND LOWER({field}) LIKE LOWER(%({field})s) ESCAPE '\\'"
+
+    placeholders = []
+    for i, location_id in enumerate(location_ids):
+        key = f"{field}_location_{i}"
+        sql_params[key] = location_id
+        placeholders.append(f"%({key})s")
+    return (
+        " AND listing_id IN (SELECT l.id FROM real_estate_listing l"
+        " JOIN real_estate_property p ON p.id = l.property_id"
+        f" WHERE p.location_id IN ({', '.join(placeholders)}))"
+    )
+
 
 class ListingSearchView(APIView):
     """
@@ -36,7 +70,8 @@ class ListingSearchView(APIView):
             OpenApiParameter(name="has_kitchen", type=bool),
             OpenApiParameter(name="has_private_pool", type=bool),
             OpenApiParameter(name="limit", type=int, description="Max 200"),
-            OpenApiParameter(name="offset", type=int),
+            OpenApiParameter(name="offset", type=int, description="Ignored when cursor is given"),
+            OpenApiParameter(name="cursor", type=str, description="Opaque next_cursor from the previous page"),
         ],
         responses={200: ListingSearchResultSerializer(many=True)}
     )
@@ -56,14 +91,11 @@ class ListingSearchView(APIView):
             sql += " AND listing_type_code = %(listing_type)s"
             sql_params["listing_type"] = lt
 
-        # Location filters
-        if city := params.get("city"):
-            sql += " AND city ILIKE %(city)s"
-            sql_params["city"] = f"%{city}%"
-
-        if area := params.get("area"):
-            sql += " AND area ILIKE %(area)s"
-            sql_params["area"] = f"%{area}%"
+        # Location filters: aliases resolve to Location ids (with regional
+        # expansion) so the filter hits the indexed property.location_id.
+        for field in ("city", "area"):
+            if raw := params.get(field):
+                sql += _location_clause(field, raw, sql_params)
 
         # Price filters
         if min_price := params.get("min_price"):
@@ -116,26 +148,37 @@ class ListingSearchView(APIView):
             sql += " AND (available_to IS NULL OR available_to >= %(available_to)s)"
             sql_params["available_to"] = at
 
-        # Sorting
+        where_params = dict(sql_params)
+
+        # Approximate total: counted once per filter set, then cached
+        def _count():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    sql.replace("SELECT *", "SELECT COUNT(*)", 1), where_params
+                )
+                return cursor.fetchone()[0]
+
+        total = cached_total("listing_search", where_params, _count)
+
+        # Keyset pagination on (sort column, listing_id)
         sort_by = params.get("sort_by", "price_asc")
-        if sort_by == "price_asc":
-            sql += " ORDER BY base_price ASC NULLS LAST"
-        elif sort_by == "price_desc":
-            sql += " ORDER BY base_price DESC NULLS LAST"
-        elif sort_by == "bedrooms_asc":
-            sql += " ORDER BY bedrooms ASC NULLS LAST"
-        elif sort_by == "bedrooms_desc":
-            sql += " ORDER BY bedrooms DESC NULLS LAST"
-        elif sort_by == "created_at_desc":
-            sql += " ORDER BY created_at DESC"
-        else:
-            sql += " ORDER BY base_price ASC NULLS LAST"
-
-        # Pagination
+        column, direction, null_sentinel = SORT_KEYS.get(sort_by, SORT_KEYS["price_asc"])
+        sort_expr = column if null_sentinel is None else f"COALESCE({column}, {null_sentinel})"
+
+        if cursor_token := params.get("cursor"):
+            key_value, key_id = decode_cursor(cursor_token, sort_by)
+            comparator = ">" if direction == "ASC" else "<"
+            sql += f" AND ({sort_expr}, listing_id) {comparator} (%(cursor_key)s, %(cursor_id)s)"
+            sql_params["cursor_key"] = key_value
+            sql_params["cursor_id"] = key_id
+
+        sql += f" ORDER BY {sort_expr} {direction}, listing_id {direction}"
+
+        # Pagination (offset kept for clients that have not moved to cursors)
         limit = params.get("limit", 50)
-        offset = params.get("offset", 0)
+        offset = 0 if params.get("cursor") else params.get("offset", 0)
         sql += " LIMIT %(limit)s OFFSET %(offset)s"
-        sql_params["limit"] = limit
+        sql_params["limit"] = limit + 1  # one extra row tells us whether a next page exists
         sql_params["offset"] = offset
 
         # Execute query
@@ -144,11 +187,20 @@ class ListingSearchView(APIView):
             columns = [col[0] for col in cursor.description]
             rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
 
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            last_key = last[column] if last[column] is not None else null_sentinel
+            next_cursor = encode_cursor(sort_by, (last_key, last["listing_id"]))
+
         # Serialize and return
         data = ListingSearchResultSerializer(rows, many=True).data
         return Response({
             "count": len(data),
             "results": data,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "total": total,
+            "next_cursor": next_cursor,
         })
@@ -0,0 +1,98 @@
+"""
+Location canonicalization service.
+
+Resolves free-text location input ("Girne", "lefkoşa", "Çatalköy") to
+real_estate Location ids through the LocationAlias table, so search can
+filter on the indexed ``property.location_id`` instead of ``ILIKE '%city%'``
+scans. Alias names come from assistant.brain.geo (the single alias table);
+resolutions are cached and invalidated whenever aliases are re-synced.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Set
+
+from django.core.cache import cache
+
+from assistant.brain.geo import canonical_location, fold_location_text, region_members
+from .models import Location, LocationAlias
+
+RESOLVE_CACHE_TTL = 600  # seconds
+_VERSION_KEY = "re:locations:alias_version"
+
+
+def _cache_version() -> int:
+    return cache.get_or_set(_VERSION_KEY, 1, None)
+
+
+def _bump_cache_version() -> None:
+    try:
+        cache.incr(_VERSION_KEY)
+    except ValueError:
+        cache.set(_VERSION_KEY, 2, None)
+
+
+def aliases_for_location(location: Location) -> Set[tuple]:
+    """Return the (alias, canonical) pairs a Location should be reachable by."""
+    pairs = set()
+    for name in (location.city, location.area):
+        alias = fold_location_text(name)
+        if alias:
+            pairs.add((alias, canonical_location(alias) or alias))
+    return pairs
+
+
+def sync_location_aliases(location: Location) -> None:
+    """Rebuild the alias rows of a single Location."""
+    pairs = aliases_for_location(location)
+    LocationAlias.objects.filter(location=location).exclude(
+        alias__in=[alias for alias, _ in pairs]
+    ).delete()
+    for alias, canonical in pairs:
+        LocationAlias.objects.update_or_create(
+            location=location, alias=alias, defaults={"canonical": canonical}
+        )
+    _bump_cache_version()
+
+
+def sync_all_location_aliases(locations: Optional[Iterable[Location]] = None) -> int:
+    """Rebuild alias rows for every Location (or the given ones); returns rows written."""
+    locations = Location.objects.all() if locations is None else locations
+    rows: List[LocationAlias] = []
+    ids = []
+    for location in locations:
+        ids.append(location.id)
+        rows.extend(
+            LocationAlias(location=location, alias=alias, canonical=canonical)
+            for alias, canonical in aliases_for_location(location)
+        )
+    LocationAlias.objects.filter(location_id__in=ids).delete()
+    LocationAlias.objects.bulk_create(rows, batch_size=500)
+    _bump_cache_version()
+    return len(rows)
+
+
+def resolve_location_ids(raw: Optional[str], expand_region: bool = True) -> List[int]:
+    """
+    Resolve a city/area alias to the ids of every matching Location.
+
+    With ``expand_region`` a region (e.g. 'kyrenia') also returns the
+    locations of its member areas from REGIONAL_MAP. Unknown input yields [].
+    """
+    folded = fold_location_text(raw)
+    if not folded:
+        return []
+
+    key = f"re:locations:resolve:v{_cache_version()}:{int(expand_region)}:{folded}"
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    canonical = canonical_location(folded) or folded
+    names = region_members(canonical) if expand_region else {canonical}
+    ids = sorted(
+        LocationAlias.objects.filter(canonical__in=names)
+        .values_list("location_id", flat=True)
+        .distinct()
+    )
+    cache.set(key, ids, RESOLVE_CACHE_TTL)
+    return ids
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from real_estate.occupancy import rebuild_all
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-listing occupancy bitmaps from Tenancy rows."
+
+    def handle(self, *args, **options):
+        listings = rebuild_all()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt occupancy calendars for {listings} listings"))
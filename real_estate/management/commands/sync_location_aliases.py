@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from real_estate.locations import sync_all_location_aliases
+
+
+class Command(BaseCommand):
+    help = "Rebuild LocationAlias rows for every Location from the shared geo alias table."
+
+    def handle(self, *args, **options):
+        written = sync_all_location_aliases()
+        self.stdout.write(self.style.SUCCESS(f"Synced {written} location aliases"))
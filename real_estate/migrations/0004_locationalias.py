@@ -0,0 +1,76 @@
+# Generated by Django 5.0.4 on 2025-11-20 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def seed_location_aliases(apps, schema_editor):
+    """Backfill alias rows for existing locations (city + area, folded)."""
+    from assistant.brain.geo import canonical_location, fold_location_text
+
+    Location = apps.get_model("real_estate", "Location")
+    LocationAlias = apps.get_model("real_estate", "LocationAlias")
+
+    rows = []
+    for location in Location.objects.all().iterator():
+        aliases = {fold_location_text(name) for name in (location.city, location.area)}
+        for alias in filter(None, aliases):
+            rows.append(
+                LocationAlias(
+                    location_id=location.id,
+                    alias=alias,
+                    canonical=canonical_location(alias) or alias,
+                )
+            )
+    LocationAlias.objects.bulk_create(rows, batch_size=500, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("real_estate", "0003_areademographics_areamarketstats_projectunittype_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LocationAlias",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "alias",
+                    models.CharField(
+                        help_text="Lowercased, diacritic-free alias, e.g. 'girne'",
+                        max_length=128,
+                    ),
+                ),
+                (
+                    "canonical",
+                    models.CharField(
+                        help_text="Canonical geo name, e.g. 'kyrenia'", max_length=64
+                    ),
+                ),
+                (
+                    "location",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aliases",
+                        to="real_estate.location",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Location Alias",
+                "verbose_name_plural": "Location Aliases",
+                "indexes": [
+                    models.Index(fields=["alias"], name="real_estate_alias_fcf38a_idx"),
+                    models.Index(fields=["canonical"], name="real_estate_canonic_aae0d5_idx"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("alias", "location"), name="uniq_location_alias"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(seed_location_aliases, migrations.RunPython.noop),
+    ]
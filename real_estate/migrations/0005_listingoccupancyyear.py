@@ -0,0 +1,82 @@
+# Generated by Django 5.2.8 on 2025-11-21 09:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_occupancy(apps, schema_editor):
+    """Build occupancy bitmaps for every listing from its existing tenancies."""
+    from collections import defaultdict
+
+    from real_estate.occupancy import build_year_bitmaps, to_bytes
+
+    Tenancy = apps.get_model("real_estate", "Tenancy")
+    ListingOccupancyYear = apps.get_model("real_estate", "ListingOccupancyYear")
+
+    by_listing = defaultdict(list)
+    rows = Tenancy.objects.filter(listing__isnull=False).values_list(
+        "listing_id", "start_date", "end_date", "status"
+    )
+    for listing_id, start, end, status in rows.iterator():
+        by_listing[listing_id].append((start, end, status))
+
+    calendars = []
+    for listing_id, tenancies in by_listing.items():
+        for year, (held, occupied) in build_year_bitmaps(tenancies).items():
+            calendars.append(
+                ListingOccupancyYear(
+                    listing_id=listing_id,
+                    year=year,
+                    held=to_bytes(held),
+                    occupied=to_bytes(occupied),
+                )
+            )
+    ListingOccupancyYear.objects.bulk_create(calendars, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("real_estate", "0004_locationalias"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ListingOccupancyYear",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("year", models.PositiveSmallIntegerField()),
+                (
+                    "held",
+                    models.BinaryField(
+                        help_text="Nights blocked by pending/active tenancies (availability)"
+                    ),
+                ),
+                (
+                    "occupied",
+                    models.BinaryField(
+                        help_text="Nights of active/ended tenancies (occupancy metrics)"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "listing",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="occupancy_years",
+                        to="real_estate.listing",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Listing Occupancy Year",
+                "verbose_name_plural": "Listing Occupancy Years",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("listing", "year"), name="uniq_listing_occupancy_year"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_occupancy, migrations.RunPython.noop),
+    ]
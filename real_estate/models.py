@@ -48,6 +48,35 @@ class Location(models.Model):
         return f"{self.city}, {self.area}" if self.area else self.city
 
 
+class LocationAlias(models.Model):
+    """
+    Folded alias -> Location lookup row.
+
+    One row per (alias, location); ``canonical`` is the shared geo name
+    (e.g. 'kyrenia', 'catalkoy') so regional expansion is a single indexed
+    ``canonical IN (...)`` query. Maintained by real_estate.locations.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    alias = models.CharField(max_length=128, help_text="Lowercased, diacritic-free alias, e.g. 'girne'")
+    canonical = models.CharField(max_length=64, help_text="Canonical geo name, e.g. 'kyrenia'")
+    location = models.ForeignKey(Location, on_delete=models.CASCADE, related_name="aliases")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["alias", "location"], name="uniq_location_alias"),
+        ]
+        indexes = [
+            models.Index(fields=["alias"]),
+            models.Index(fields=["canonical"]),
+        ]
+        verbose_name = "Location Alias"
+        verbose_name_plural = "Location Aliases"
+
+    def __str__(self):
+        return f"{self.alias} -> {self.canonical}"
+
+
 class PropertyType(models.Model):
     """Types of properties (apartment, villa, penthouse, etc.)."""
 
@@ -742,6 +771,34 @@ class Tenancy(models.Model):
         return f"{self.property.reference_code} - {self.tenant} ({self.start_date} to {self.end_date})"
 
 
+class ListingOccupancyYear(models.Model):
+    """
+    Precomputed night calendar of a listing for one year.
+
+    Bit ``n`` of each bitmap is the night starting on day-of-year ``n``
+    (Jan 1 = bit 0). Maintained from Tenancy rows by real_estate.occupancy.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    listing = models.ForeignKey(Listing, on_delete=models.CASCADE, related_name="occupancy_years")
+    year = models.PositiveSmallIntegerField()
+
+    held = models.BinaryField(help_text="Nights blocked by pending/active tenancies (availability)")
+    occupied = models.BinaryField(help_text="Nights of active/ended tenancies (occupancy metrics)")
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["listing", "year"], name="uniq_listing_occupancy_year"),
+        ]
+        verbose_name = "Listing Occupancy Year"
+        verbose_name_plural = "Listing Occupancy Years"
+
+    def __str__(self):
+        return f"{self.listing_id} - {self.year}"
+
+
 # ============================================================================
 # 7. DEALS / PIPELINE
 # ============================================================================
@@ -0,0 +1,207 @@
+"""
+Per-listing night calendar backed by ListingOccupancyYear bitmaps.
+
+Each listing-year stores one bit per night, so availability checks,
+occupancy rates and vacancy counts are integer bit operations over at most
+a couple of bitmaps instead of scans over Tenancy rows.
+
+The bitmaps are rebuilt for the affected listing-years whenever a Tenancy
+is saved or deleted (see real_estate.signals). Rebuilding a listing-year
+reads only that listing's tenancies for that year, which keeps the update
+correct even if tenancies overlap (e.g. created through the admin).
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Nights that block new bookings (matches the availability/booking views).
+HELD_STATUSES = ("PENDING", "ACTIVE")
+# Nights that count as occupied on the dashboards.
+OCCUPIED_STATUSES = ("ACTIVE", "ENDED")
+
+BITMAP_BYTES = 46  # 366 nights
+
+
+def _night_index(day: date) -> int:
+    return day.timetuple().tm_yday - 1
+
+
+def night_mask(start: date, end: date, year: int) -> int:
+    """Bits for the nights ``[start, end)`` that fall within ``year``."""
+    first = max(start, date(year, 1, 1))
+    last = min(end, date(year + 1, 1, 1))
+    if last <= first:
+        return 0
+    lo = _night_index(first)
+    hi = lo + (last - first).days
+    return ((1 << (hi - lo)) - 1) << lo
+
+
+def years_spanned(start: date, end: date) -> range:
+    """Calendar years touched by the nights ``[start, end)``."""
+    if end <= start:
+        return range(0)
+    return range(start.year, (end - timedelta(days=1)).year + 1)
+
+
+def to_bytes(bits: int) -> bytes:
+    return bits.to_bytes(BITMAP_BYTES, "little")
+
+
+def from_bytes(raw) -> int:
+    return int.from_bytes(bytes(raw or b""), "little")
+
+
+def build_year_bitmaps(
+    tenancies: Iterable[Tuple[date, date, str]],
+    years: Optional[Iterable[int]] = None,
+) -> Dict[int, Tuple[int, int]]:
+    """
+    Fold ``(start_date, end_date, status)`` rows into ``{year: (held, occupied)}``.
+
+    Only ``years`` are built when given (missing years map to empty bitmaps).
+    """
+    wanted = set(years) if years is not None else None
+    held: Dict[int, int] = defaultdict(int)
+    occupied: Dict[int, int] = defaultdict(int)
+    for start, end, status in tenancies:
+        is_held = status in HELD_STATUSES
+        is_occupied = status in OCCUPIED_STATUSES
+        if not (is_held or is_occupied):
+            continue
+        for year in years_spanned(start, end):
+            if wanted is not None and year not in wanted:
+                continue
+            mask = night_mask(start, end, year)
+            if is_held:
+                held[year] |= mask
+            if is_occupied:
+                occupied[year] |= mask
+    result = {year: (held[year], occupied[year]) for year in set(held) | set(occupied)}
+    for year in wanted or ():
+        result.setdefault(year, (0, 0))
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Maintenance
+# ---------------------------------------------------------------------------
+
+def rebuild_listing_years(listing_id: int, years: Iterable[int]) -> None:
+    """Recompute the bitmaps of ``listing_id`` for ``years`` from its tenancies."""
+    from .models import ListingOccupancyYear, Tenancy
+
+    years = sorted(set(years))
+    if not years:
+        return
+
+    window_start, window_end = date(years[0], 1, 1), date(years[-1] + 1, 1, 1)
+    rows = Tenancy.objects.filter(
+        listing_id=listing_id,
+        status__in=HELD_STATUSES + OCCUPIED_STATUSES,
+        start_date__lt=window_end,
+        end_date__gt=window_start,
+    ).values_list("start_date", "end_date", "status")
+
+    for year, (held, occupied) in build_year_bitmaps(rows, years).items():
+        if not held and not occupied:
+            ListingOccupancyYear.objects.filter(listing_id=listing_id, year=year).delete()
+            continue
+        ListingOccupancyYear.objects.update_or_create(
+            listing_id=listing_id,
+            year=year,
+            defaults={"held": to_bytes(held), "occupied": to_bytes(occupied)},
+        )
+
+
+def rebuild_all() -> int:
+    """Rebuild every listing calendar. Returns the number of listings touched."""
+    from .models import ListingOccupancyYear, Tenancy
+
+    spans = defaultdict(set)
+    rows = Tenancy.objects.filter(listing__isnull=False).values_list(
+        "listing_id", "start_date", "end_date"
+    )
+    for listing_id, start, end in rows.iterator():
+        spans[listing_id].update(years_spanned(start, end))
+
+    ListingOccupancyYear.objects.exclude(listing_id__in=list(spans)).delete()
+    for listing_id, years in spans.items():
+        stale = ListingOccupancyYear.objects.filter(listing_id=listing_id).exclude(year__in=years)
+        stale.delete()
+        rebuild_listing_years(listing_id, years)
+    return len(spans)
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def _load(listing_ids: Sequence[int], start: date, end: date, field: str) -> Dict[Tuple[int, int], int]:
+    from .models import ListingOccupancyYear
+
+    years = list(years_spanned(start, end))
+    if not listing_ids or not years:
+        return {}
+    rows = ListingOccupancyYear.objects.filter(
+        listing_id__in=listing_ids, year__in=years
+    ).values_list("listing_id", "year", field)
+    return {(listing_id, year): from_bytes(raw) for listing_id, year, raw in rows}
+
+
+def is_range_free(listing_id: int, start: date, end: date) -> bool:
+    """True if no night in ``[start, end)`` is held by a pending/active tenancy."""
+    bitmaps = _load([listing_id], start, end, "held")
+    return not any(
+        bitmaps.get((listing_id, year), 0) & night_mask(start, end, year)
+        for year in years_spanned(start, end)
+    )
+
+
+def occupied_nights(listing_ids: Sequence[int], start: date, end: date) -> int:
+    """Total occupied nights in ``[start, end)`` across ``listing_ids``."""
+    bitmaps = _load(list(listing_ids), start, end, "occupied")
+    masks = {year: night_mask(start, end, year) for year in years_spanned(start, end)}
+    return sum((bits & masks[year]).bit_count() for (_, year), bits in bitmaps.items())
+
+
+def daily_occupied_counts(listing_ids: Sequence[int], start: date, end: date) -> List[int]:
+    """Number of occupied listings for each night in ``[start, end)``."""
+    days = (end - start).days
+    counts = [0] * max(days, 0)
+    bitmaps = _load(list(listing_ids), start, end, "occupied")
+    for year in years_spanned(start, end):
+        # Offset of this year's first night within the requested window
+        offset = (max(start, date(year, 1, 1)) - start).days
+        lo = _night_index(max(start, date(year, 1, 1)))
+        mask = night_mask(start, end, year)
+        for (_, bitmap_year), bits in bitmaps.items():
+            if bitmap_year != year:
+                continue
+            window = (bits & mask) >> lo
+            while window:
+                low = window & -window
+                counts[offset + low.bit_length() - 1] += 1
+                window ^= low
+    return counts
+
+
+def occupancy_rate(listing_ids: Sequence[int], start: date, end: date) -> float:
+    """Occupied share of the listing-nights in ``[start, end)``."""
+    listing_ids = list(listing_ids)
+    capacity = len(listing_ids) * (end - start).days
+    if capacity <= 0:
+        return 0.0
+    return occupied_nights(listing_ids, start, end) / capacity
+
+
+def vacant_listing_ids(listing_ids: Sequence[int], start: date, end: date) -> List[int]:
+    """Listings with no held night in ``[start, end)``."""
+    listing_ids = list(listing_ids)
+    bitmaps = _load(listing_ids, start, end, "held")
+    masks = {year: night_mask(start, end, year) for year in years_spanned(start, end)}
+    busy = {listing_id for (listing_id, year), bits in bitmaps.items() if bits & masks[year]}
+    return [listing_id for listing_id in listing_ids if listing_id not in busy]
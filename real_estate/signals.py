@@ -0,0 +1,54 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Location, Tenancy
+from .locations import sync_location_aliases
+from .occupancy import rebuild_listing_years, years_spanned
+
+
+@receiver(post_save, sender=Location)
+def sync_aliases_on_location_save(sender, instance, **kwargs):
+    """Keep LocationAlias rows in step with a Location's city/area."""
+    if kwargs.get("raw"):
+        return
+    sync_location_aliases(instance)
+
+
+@receiver(pre_save, sender=Tenancy)
+def remember_tenancy_span(sender, instance, **kwargs):
+    """Stash the stored listing/dates so a move also clears the old nights."""
+    instance._previous_span = None
+    if instance.pk:
+        instance._previous_span = (
+            Tenancy.objects.filter(pk=instance.pk)
+            .values_list("listing_id", "start_date", "end_date")
+            .first()
+        )
+
+
+def _refresh_occupancy(spans):
+    to_date = Tenancy._meta.get_field("start_date").to_python  # instances may hold ISO strings
+    by_listing = {}
+    for listing_id, start, end in spans:
+        if listing_id is not None:
+            years = years_spanned(to_date(start), to_date(end))
+            by_listing.setdefault(listing_id, set()).update(years)
+    for listing_id, years in by_listing.items():
+        rebuild_listing_years(listing_id, years)
+
+
+@receiver(post_save, sender=Tenancy)
+def update_occupancy_on_tenancy_save(sender, instance, **kwargs):
+    """Rebuild the occupancy bitmaps of the listing-years this tenancy touches."""
+    if kwargs.get("raw"):
+        return
+    spans = [(instance.listing_id, instance.start_date, instance.end_date)]
+    previous = getattr(instance, "_previous_span", None)
+    if previous:
+        spans.append(previous)
+    _refresh_occupancy(spans)
+
+
+@receiver(post_delete, sender=Tenancy)
+def update_occupancy_on_tenancy_delete(sender, instance, **kwargs):
+    _refresh_occupancy([(instance.listing_id, instance.start_date, instance.end_date)])
@@ -0,0 +1,76 @@
+"""
+Tests for the location canonicalization service (real_estate.locations).
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+
+from real_estate.api.search_views import _location_clause
+from real_estate.locations import resolve_location_ids, sync_all_location_aliases
+from real_estate.models import Location, LocationAlias
+
+
+class LocationAliasResolutionTest(TestCase):
+    """Aliases resolve to Location ids, with regional expansion."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kyrenia = Location.objects.create(region="North Cyprus", city="Kyrenia", area="Kyrenia Centre")
+        cls.catalkoy = Location.objects.create(region="North Cyprus", city="Kyrenia", area="Çatalköy")
+        cls.nicosia = Location.objects.create(region="North Cyprus", city="Lefkoşa", area="Dereboyu")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_signal_creates_folded_aliases(self):
+        aliases = set(LocationAlias.objects.filter(location=self.catalkoy).values_list("alias", "canonical"))
+        self.assertEqual(aliases, {("kyrenia", "kyrenia"), ("catalkoy", "catalkoy")})
+
+    def test_turkish_alias_resolves_to_city(self):
+        self.assertEqual(resolve_location_ids("girne"), sorted([self.kyrenia.id, self.catalkoy.id]))
+        self.assertEqual(resolve_location_ids("Nicosia"), [self.nicosia.id])
+
+    def test_area_alias_without_region_expansion(self):
+        self.assertEqual(resolve_location_ids("catalkoy", expand_region=False), [self.catalkoy.id])
+
+    def test_unknown_alias_resolves_to_nothing(self):
+        self.assertEqual(resolve_location_ids("Atlantis"), [])
+
+    def test_resync_invalidates_cached_resolution(self):
+        self.assertEqual(resolve_location_ids("dereboyu"), [self.nicosia.id])
+        LocationAlias.objects.all().delete()
+        sync_all_location_aliases()
+        self.nicosia.area = "Ortaköy"
+        self.nicosia.save()
+        self.assertEqual(resolve_location_ids("dereboyu"), [])
+        self.assertEqual(resolve_location_ids("ortakoy"), [self.nicosia.id])
+
+
+class UnresolvedLocationClauseTest(TestCase):
+    """Input no alias resolves falls back to a prefix match on the raw column."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kyrenia = Location.objects.create(region="North Cyprus", city="Kyrenia", area="Kyrenia Centre")
+        cls.bellapais = Location.objects.create(region="North Cyprus", city="Kyrenia", area="Bellapais_Old")
+        cls.bellapais_new = Location.objects.create(region="North Cyprus", city="Kyrenia", area="BellapaisXNew")
+
+    def setUp(self):
+        cache.clear()
+
+    def _matching(self, field, raw):
+        sql_params = {}
+        sql = f"SELECT id FROM real_estate_location WHERE 1 = 1{_location_clause(field, raw, sql_params)}"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, sql_params)
+            return sorted(row[0] for row in cursor.fetchall())
+
+    def test_partial_name_matches_by_prefix(self):
+        self.assertEqual(resolve_location_ids("kyrenia cent"), [])
+        self.assertEqual(self._matching("area", "kyrenia cent"), [self.kyrenia.id])
+        self.assertEqual(self._matching("area", "BELLA"), sorted([self.bellapais.id, self.bellapais_new.id]))
+
+    def test_prefix_match_escapes_wildcards_and_never_matches_infix(self):
+        self.assertEqual(self._matching("area", "Bellapais_"), [self.bellapais.id])
+        self.assertEqual(self._matching("area", "Bellapais%"), [])
+        self.assertEqual(self._matching("area", "Centre"), [])
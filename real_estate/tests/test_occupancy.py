@@ -0,0 +1,160 @@
+"""
+Tests for the per-listing occupancy calendar (real_estate.occupancy).
+"""
+
+import pytest
+from datetime import date
+
+from real_estate.models import (
+    Contact,
+    Listing,
+    ListingOccupancyYear,
+    ListingType,
+    Location,
+    Property,
+    PropertyType,
+    Tenancy,
+)
+from real_estate.occupancy import (
+    build_year_bitmaps,
+    daily_occupied_counts,
+    is_range_free,
+    night_mask,
+    occupancy_rate,
+    occupied_nights,
+    rebuild_all,
+    vacant_listing_ids,
+    years_spanned,
+)
+
+
+def test_night_mask_covers_half_open_range():
+    mask = night_mask(date(2025, 1, 2), date(2025, 1, 5), 2025)
+    assert mask == 0b1110  # nights of Jan 2, 3 and 4
+    assert night_mask(date(2025, 1, 2), date(2025, 1, 2), 2025) == 0
+
+
+def test_night_mask_clips_to_year():
+    start, end = date(2024, 12, 30), date(2025, 1, 2)
+    assert list(years_spanned(start, end)) == [2024, 2025]
+    # 2024 is a leap year: Dec 30 is night 364, Dec 31 night 365
+    assert night_mask(start, end, 2024) == (1 << 364) | (1 << 365)
+    assert night_mask(start, end, 2025) == 0b1  # night of Jan 1
+
+
+def test_build_year_bitmaps_splits_held_and_occupied():
+    bitmaps = build_year_bitmaps([
+        (date(2025, 1, 1), date(2025, 1, 3), "PENDING"),
+        (date(2025, 1, 5), date(2025, 1, 6), "ENDED"),
+        (date(2025, 1, 10), date(2025, 1, 11), "ACTIVE"),
+        (date(2025, 1, 20), date(2025, 1, 25), "CANCELLED"),
+    ])
+    held, occupied = bitmaps[2025]
+    assert held == 0b11 | (1 << 9)
+    assert occupied == (1 << 4) | (1 << 9)
+
+
+@pytest.fixture
+def tenant():
+    return Contact.objects.create(first_name="Test", last_name="Tenant")
+
+
+@pytest.fixture
+def make_listing():
+    listing_type, _ = ListingType.objects.get_or_create(
+        code="DAILY_RENTAL", defaults={"label": "Daily Rental"}
+    )
+    property_type, _ = PropertyType.objects.get_or_create(
+        code="APARTMENT", defaults={"label": "Apartment", "category": "RESIDENTIAL"}
+    )
+    location, _ = Location.objects.get_or_create(
+        city="Kyrenia", area="Catalkoy", defaults={"region": "North Cyprus", "country": "Cyprus"}
+    )
+
+    def _make(ref):
+        property_obj = Property.objects.create(
+            reference_code=f"OCC-PROP-{ref}",
+            property_type=property_type,
+            location=location,
+            bedrooms=1,
+            bathrooms=1,
+        )
+        return Listing.objects.create(
+            reference_code=f"OCC-LISTING-{ref}",
+            listing_type=listing_type,
+            property=property_obj,
+            title=f"Occupancy {ref}",
+            base_price=100,
+            price_period="PER_DAY",
+            status="ACTIVE",
+        )
+
+    return _make
+
+
+def _tenancy(listing, tenant, start, end, status="ACTIVE"):
+    return Tenancy.objects.create(
+        property=listing.property,
+        listing=listing,
+        tenant=tenant,
+        tenancy_kind="DAILY",
+        start_date=start,
+        end_date=end,
+        rent_amount=100,
+        status=status,
+    )
+
+
+@pytest.mark.django_db
+class TestOccupancyCalendar:
+
+    def test_tenancy_save_updates_calendar(self, make_listing, tenant):
+        listing = make_listing("001")
+        _tenancy(listing, tenant, date(2025, 3, 10), date(2025, 3, 15), status="PENDING")
+
+        assert not is_range_free(listing.id, date(2025, 3, 14), date(2025, 3, 16))
+        assert is_range_free(listing.id, date(2025, 3, 15), date(2025, 3, 20))
+        # Pending tenancies hold nights but are not occupancy yet
+        assert occupied_nights([listing.id], date(2025, 3, 1), date(2025, 4, 1)) == 0
+
+    def test_status_change_and_date_move_are_reflected(self, make_listing, tenant):
+        listing = make_listing("002")
+        tenancy = _tenancy(listing, tenant, date(2025, 3, 10), date(2025, 3, 15))
+
+        tenancy.start_date, tenancy.end_date = date(2025, 4, 1), date(2025, 4, 3)
+        tenancy.save()
+        assert is_range_free(listing.id, date(2025, 3, 10), date(2025, 3, 15))
+        assert occupied_nights([listing.id], date(2025, 4, 1), date(2025, 5, 1)) == 2
+
+        tenancy.status = "CANCELLED"
+        tenancy.save()
+        assert is_range_free(listing.id, date(2025, 4, 1), date(2025, 4, 3))
+        assert not ListingOccupancyYear.objects.filter(listing=listing).exists()
+
+    def test_delete_clears_nights(self, make_listing, tenant):
+        listing = make_listing("003")
+        tenancy = _tenancy(listing, tenant, date(2025, 12, 30), date(2026, 1, 2))
+        assert ListingOccupancyYear.objects.filter(listing=listing).count() == 2
+
+        tenancy.delete()
+        assert is_range_free(listing.id, date(2025, 12, 30), date(2026, 1, 2))
+
+    def test_dashboard_queries(self, make_listing, tenant):
+        first, second = make_listing("004"), make_listing("005")
+        _tenancy(first, tenant, date(2025, 6, 1), date(2025, 6, 3))
+        _tenancy(second, tenant, date(2025, 6, 2), date(2025, 6, 4), status="ENDED")
+
+        ids = [first.id, second.id]
+        assert daily_occupied_counts(ids, date(2025, 6, 1), date(2025, 6, 5)) == [1, 2, 1, 0]
+        assert occupied_nights(ids, date(2025, 6, 1), date(2025, 6, 5)) == 4
+        assert occupancy_rate(ids, date(2025, 6, 1), date(2025, 6, 5)) == 0.5
+        # Ended tenancies no longer hold nights
+        assert vacant_listing_ids(ids, date(2025, 6, 1), date(2025, 6, 5)) == [second.id]
+
+    def test_rebuild_all_restores_calendar(self, make_listing, tenant):
+        listing = make_listing("006")
+        _tenancy(listing, tenant, date(2025, 7, 1), date(2025, 7, 8))
+        ListingOccupancyYear.objects.all().delete()
+
+        assert rebuild_all() == 1
+        assert occupied_nights([listing.id], date(2025, 7, 1), date(2025, 8, 1)) == 7
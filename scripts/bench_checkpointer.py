@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Checkpointer Memory Footprint Benchmark
+
+Replays a small multi-turn graph over many threads and compares:
+- InMemorySaver: Python heap held by the process (tracemalloc)
+- BoundedCacheSaver: bytes held by the cache (what Redis would store),
+  with retention of the last N checkpoints per thread
+
+Usage:
+    python3 scripts/bench_checkpointer.py --threads 100000 --turns 3
+    python3 scripts/bench_checkpointer.py --threads 10000 --max-checkpoints 4
+"""
+
+import argparse
+import operator
+import os
+import sys
+import time
+import tracemalloc
+from typing import Annotated, List, TypedDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langgraph.checkpoint.memory import InMemorySaver  # noqa: E402
+from langgraph.graph import END, StateGraph  # noqa: E402
+
+from assistant.brain.checkpointing import BoundedCacheSaver  # noqa: E402
+
+REPLY = "Here are a few two-bedroom apartments in Kyrenia within your budget. " * 4
+
+
+class _State(TypedDict):
+    messages: Annotated[List[str], operator.add]
+    agent_contexts: dict
+
+
+class _DictCache:
+    """Stand-in for the Redis cache: keeps encoded values and counts their bytes."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+
+    def delete_many(self, keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def nbytes(self):
+        return sum(len(k) + (len(v) if isinstance(v, bytes) else 64) for k, v in self.data.items())
+
+
+def _graph(saver):
+    def agent(state):
+        return {
+            "messages": [REPLY],
+            "agent_contexts": {"real_estate_agent": {"filled_slots": {"location": "Kyrenia", "bedrooms": 2}}},
+        }
+
+    graph = StateGraph(_State)
+    graph.add_node("agent", agent)
+    graph.set_entry_point("agent")
+    graph.add_edge("agent", END)
+    return graph.compile(checkpointer=saver)
+
+
+def _run(app, threads, turns):
+    started = time.perf_counter()
+    for t in range(threads):
+        config = {"configurable": {"thread_id": f"thread-{t}"}}
+        for turn in range(turns):
+            app.invoke({"messages": [f"show me 2 bedroom flats, turn {turn}"], "agent_contexts": {}}, config)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=100_000)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--max-checkpoints", type=int, default=4)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    in_memory = InMemorySaver()
+    elapsed = _run(_graph(in_memory), args.threads, args.turns)
+    heap = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del in_memory
+    print(f"InMemorySaver      : {heap / 1e6:9.1f} MB in-process heap  ({elapsed:.1f}s)")
+
+    store = _DictCache()
+    bounded = BoundedCacheSaver(cache_backend=store, max_checkpoints=args.max_checkpoints)
+    elapsed = _run(_graph(bounded), args.threads, args.turns)
+    print(
+        f"BoundedCacheSaver  : {store.nbytes() / 1e6:9.1f} MB in shared cache "
+        f"({elapsed:.1f}s, last {args.max_checkpoints} checkpoints/thread, TTL-evicted)"
+    )
+    print(f"threads={args.threads} turns={args.turns}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Guardrail Scan Microbenchmark
+
+Per-turn scan cost against message length and pattern count for:
+- legacy: one uncompiled ``re.search`` per pattern, category by category
+- compiled: GuardrailScanner single pass, verdict cache disabled
+- cached: GuardrailScanner with the verdict cache warm (repeat turns)
+
+Pattern count is scaled by adding synthetic word-list patterns to every
+category, so the base set (~25 patterns) grows by ``--pattern-scale``.
+
+Usage:
+    python3 scripts/bench_guardrails.py
+    python3 scripts/bench_guardrails.py --lengths 64 512 4096 --pattern-scale 1 8 32
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assistant.brain.guardrails import (  # noqa: E402
+    EnterpriseGuardrailSystem,
+    GuardrailScanner,
+)
+
+SENTENCE = "I need a 2 bedroom apartment in Kyrenia close to the sea with parking. "
+
+
+def _patterns(scale):
+    system = EnterpriseGuardrailSystem()
+    base = {
+        "toxicity": system.toxicity_patterns,
+        "injection": system.injection_patterns,
+        "pii": system.pii_patterns,
+        "out_of_scope": system.out_of_scope_patterns,
+    }
+    extra = scale - 1
+    return {
+        category: patterns + [
+            r"\b(zz{0}{1}a|zz{0}{1}b|zz{0}{1}c)\b".format(category[:3], i) for i in range(extra * len(patterns))
+        ]
+        for category, patterns in base.items()
+    }
+
+
+def _legacy_scan(patterns, text):
+    found = set()
+    lowered = text.lower()
+    for category, compiled_list in patterns.items():
+        for pattern in compiled_list:
+            if re.search(pattern, lowered, re.IGNORECASE):
+                found.add(category)
+                break
+    return found
+
+
+def _per_turn_us(fn, text, repeat):
+    fn(text)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[64, 512, 4096])
+    parser.add_argument("--pattern-scale", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'chars':>6} {'patterns':>9} {'legacy us':>10} {'compiled us':>12} {'cached us':>10} {'speedup':>8}")
+    for scale in args.pattern_scale:
+        patterns = _patterns(scale)
+        count = sum(len(p) for p in patterns.values())
+        uncached = GuardrailScanner(patterns, cache_size=0)
+        cached = GuardrailScanner(patterns)
+        for length in args.lengths:
+            text = (SENTENCE * (length // len(SENTENCE) + 1))[:length]
+            legacy = _per_turn_us(lambda t: _legacy_scan(patterns, t), text, args.repeat)
+            compiled = _per_turn_us(uncached.scan, text, args.repeat)
+            warm = _per_turn_us(cached.scan, text, args.repeat)
+            print(f"{length:>6} {count:>9} {legacy:>10.1f} {compiled:>12.1f} {warm:>10.1f} {legacy / compiled:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
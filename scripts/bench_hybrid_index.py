@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Hybrid Index Rebuild vs. Incremental Update Benchmark
+
+Sparse (BM25) side of HybridIndex at corpus sizes N:
+- cold rebuild: ``SparseRetriever.index`` over all N documents, i.e. what
+  every listing change cost when the corpus was re-tokenized from scratch
+- incremental: one ``upsert`` of a changed listing plus one ``delete``
+- query: top-10 BM25 search against the live index
+
+The dense side is a Chroma ``upsert``/``delete`` of one id in both designs
+and is not measured here.
+
+Usage:
+    python3 scripts/bench_hybrid_index.py
+    python3 scripts/bench_hybrid_index.py --sizes 10000 100000 --updates 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assistant.brain.hybrid_search import SparseRetriever  # noqa: E402
+
+VOCAB = [f"term{i}" for i in range(20000)] + [
+    "flat", "villa", "kyrenia", "famagusta", "nicosia", "pool", "sea", "view", "garden", "parking",
+]
+LOCATIONS = ["kyrenia", "famagusta", "nicosia", "iskele", "lefke"]
+
+
+def _document(rng, i):
+    return {
+        "id": f"listing-{i}",
+        "title": " ".join(rng.choices(VOCAB, k=6)),
+        "content": " ".join(rng.choices(VOCAB, k=rng.randint(40, 120))),
+        "metadata": {"location": rng.choice(LOCATIONS), "price": rng.randint(300, 3000)},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'docs':>8} {'rebuild ms':>11} {'update us':>10} {'query us':>9} {'speedup':>10}")
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        documents = [_document(rng, i) for i in range(size)]
+        sparse = SparseRetriever()
+
+        started = time.perf_counter()
+        sparse.index(documents)
+        rebuild = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(args.updates):
+            i = rng.randrange(size)
+            sparse.upsert(_document(rng, i))
+            sparse.remove(f"listing-{rng.randrange(size)}")
+        update = (time.perf_counter() - started) / args.updates
+
+        queries = [" ".join(rng.choices(VOCAB, k=4)) + " villa kyrenia" for _ in range(args.queries)]
+        started = time.perf_counter()
+        for query in queries:
+            sparse.search(query, top_k=10, metadata_filter={"budget_max": 2000})
+        query_cost = (time.perf_counter() - started) / args.queries
+
+        print(
+            f"{size:>8} {rebuild * 1e3:>11.1f} {update * 1e6:>10.1f} {query_cost * 1e6:>9.1f} "
+            f"{rebuild / update:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
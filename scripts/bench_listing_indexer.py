@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Listing Indexer Throughput Benchmark (CPU)
+
+Listings indexed per second into a throwaway Chroma directory for:
+- per-task: a fresh HuggingFaceEmbeddings + Chroma per listing (the old
+  ``index_listing_task`` path, so every listing pays a model load)
+- cached: the worker singletons, one ``add_documents`` call per listing
+- batched: the worker singletons, chunks coalesced into ``add_documents``
+  calls of ``--batch-chunks`` (the ``flush_listing_index`` path)
+
+Requires langchain-community, langchain-text-splitters, chromadb and
+sentence-transformers.
+
+Usage:
+    python3 scripts/bench_listing_indexer.py
+    python3 scripts/bench_listing_indexer.py --listings 500 --per-task 10 --batch-chunks 64 256
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assistant.brain import listing_index  # noqa: E402
+
+WORDS = "sea view flat villa kyrenia famagusta pool garden parking balcony quiet modern furnished".split()
+
+
+def _listing(rng):
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        owner_id=1,
+        title=" ".join(rng.choices(WORDS, k=5)),
+        description=" ".join(rng.choices(WORDS, k=rng.randint(40, 400))),
+        dynamic_fields={"bedrooms": rng.randint(1, 5), "furnished": rng.random() > 0.5},
+        category=None,
+        location=rng.choice(["Kyrenia", "Famagusta", "Nicosia"]),
+        price=rng.randint(300, 3000),
+        currency="EUR",
+        status="active",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _chunked(listings):
+    chunks, ids = [], []
+    for listing in listings:
+        parts = listing_index.listing_chunks(listing)
+        chunks.extend(parts)
+        ids.extend(f"listing_{listing.id}_chunk_{i}" for i in range(len(parts)))
+    return chunks, ids
+
+
+def _store(directory, collection):
+    from langchain_community.vectorstores import Chroma
+
+    return Chroma(
+        collection_name=collection,
+        embedding_function=listing_index.get_embeddings(),
+        persist_directory=directory,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--listings", type=int, default=200)
+    parser.add_argument("--per-task", type=int, default=5, help="listings to run through the per-task path")
+    parser.add_argument("--batch-chunks", type=int, nargs="+", default=[32, 256])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    from langchain_community.vectorstores import Chroma
+
+    rng = random.Random(args.seed)
+    listings = [_listing(rng) for _ in range(args.listings)]
+    directory = tempfile.mkdtemp(prefix="bench_listing_indexer_")
+    try:
+        started = time.perf_counter()
+        for listing in listings[:args.per_task]:
+            chunks, ids = _chunked([listing])
+            embeddings = HuggingFaceEmbeddings(model_name=listing_index.EMBEDDING_MODEL_NAME)
+            Chroma(
+                collection_name="per_task", embedding_function=embeddings, persist_directory=directory,
+            ).add_documents(chunks, ids=ids)
+        per_task = args.per_task / (time.perf_counter() - started)
+
+        listing_index.get_embeddings()  # worker_process_init warm-up, not counted
+        store = _store(directory, "cached")
+        started = time.perf_counter()
+        for listing in listings:
+            chunks, ids = _chunked([listing])
+            store.add_documents(chunks, ids=ids)
+        cached = args.listings / (time.perf_counter() - started)
+
+        print(f"{'path':<18} {'listings/s':>11}")
+        print(f"{'per-task':<18} {per_task:>11.1f}")
+        print(f"{'cached':<18} {cached:>11.1f}")
+        for batch_chunks in args.batch_chunks:
+            store = _store(directory, f"batched_{batch_chunks}")
+            started = time.perf_counter()
+            chunks, ids = _chunked(listings)
+            listing_index.write_chunks(chunks, ids, store=store, batch_size=batch_chunks)
+            batched = args.listings / (time.perf_counter() - started)
+            print(f"{'batched/' + str(batch_chunks):<18} {batched:>11.1f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
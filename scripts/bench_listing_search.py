@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Listing Full-Text Search Benchmark (PostgreSQL, EXPLAIN-verified)
+
+Builds a synthetic TEMP copy of the listing text columns (title,
+description, dynamic_fields) with ``--rows`` rows, fills ``search_vector``
+with the same expression the migration 0010 trigger uses, adds the GIN
+index, and compares per query:
+- icontains: the legacy ``ILIKE '%kw%'`` OR-chain across the text columns
+- fts: ``search_vector @@ tsquery`` ordered by ``ts_rank_cd``
+
+Each plan is read from ``EXPLAIN (ANALYZE, FORMAT JSON)``; the script exits
+non-zero if a full-text plan does not use the GIN index.
+
+Requires DATABASE_URL pointing at PostgreSQL with migrations applied (for
+the ``listing_search`` text search configuration).
+
+Usage:
+    DATABASE_URL=postgres://... python3 scripts/bench_listing_search.py
+    DATABASE_URL=postgres://... python3 scripts/bench_listing_search.py --rows 100000 --queries "sea view" "kiralik villa"
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "easy_islanders.settings.development")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from listings.search import SEARCH_CONFIG, SEARCH_VECTOR_SQL  # noqa: E402
+
+WORDS = [
+    "sea", "view", "villa", "flat", "penthouse", "garden", "pool", "parking", "furnished", "modern",
+    "kyrenia", "girne", "famagusta", "lefkoşa", "kiralık", "satılık", "deniz", "manzaralı", "havuz", "bahçe",
+] + [f"w{i}" for i in range(5000)]
+
+
+def _words_sql(count):
+    return (
+        "array_to_string(ARRAY(SELECT words[1 + floor(random() * array_length(words, 1))::int] "
+        f"FROM generate_series(1, {count}) WHERE g > 0), ' ')"
+    )
+
+
+def _build(cursor, rows):
+    cursor.execute("DROP TABLE IF EXISTS bench_listing")
+    cursor.execute(
+        "CREATE TEMP TABLE bench_listing (id serial PRIMARY KEY, title text, description text, "
+        "location text, dynamic_fields jsonb, search_vector tsvector)"
+    )
+    cursor.execute(
+        f"""
+        WITH vocab AS (SELECT %s::text[] AS words)
+        INSERT INTO bench_listing (title, description, location, dynamic_fields)
+        SELECT {_words_sql(6)}, {_words_sql(80)}, words[11 + g %% 4],
+               jsonb_build_object('bedrooms', 1 + g %% 5, 'pool', g %% 3 = 0, 'view', words[1 + g %% 20])
+        FROM vocab, generate_series(1, %s) AS g
+        """,
+        [WORDS, rows],
+    )
+    cursor.execute(f"UPDATE bench_listing b SET search_vector = {SEARCH_VECTOR_SQL.format(row='b')}")
+    cursor.execute("CREATE INDEX bench_listing_search_vector_gin ON bench_listing USING gin (search_vector)")
+    cursor.execute("ANALYZE bench_listing")
+
+
+def _explain(cursor, sql, params):
+    cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}", params)
+    plan = cursor.fetchone()[0]
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    nodes, stack = [], [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get("Plans", []))
+    return plan[0]["Execution Time"], nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", nargs="+", default=["sea view", "kiralik villa", "havuz", "penthouse girne"])
+    args = parser.parse_args()
+
+    if connection.vendor != "postgresql":
+        sys.exit("bench_listing_search needs DATABASE_URL pointing at PostgreSQL")
+
+    failed = False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_ts_config WHERE cfgname = %s", [SEARCH_CONFIG])
+        if cursor.fetchone() is None:
+            sys.exit(f"text search configuration {SEARCH_CONFIG!r} missing; run migrations first")
+        _build(cursor, args.rows)
+
+        print(f"{'query':<18} {'icontains ms':>13} {'fts ms':>8} {'speedup':>8}  fts plan")
+        for query in args.queries:
+            keywords = query.split()
+            ilike = " OR ".join(
+                "title ILIKE %s OR description ILIKE %s OR location ILIKE %s OR dynamic_fields::text ILIKE %s"
+                for _ in keywords
+            )
+            ilike_params = [f"%{k}%" for k in keywords for _ in range(4)]
+            legacy_ms, _ = _explain(
+                cursor, f"SELECT id FROM bench_listing WHERE {ilike} ORDER BY id DESC LIMIT 25", ilike_params
+            )
+
+            tsquery = " || ".join("plainto_tsquery(%s::regconfig, %s)" for _ in keywords)
+            ts_params = [p for k in keywords for p in (SEARCH_CONFIG, k)]
+            # Same shape as the SQL Django emits for listings.search.rank_by_text
+            fts_ms, nodes = _explain(
+                cursor,
+                f"SELECT id, ts_rank_cd(search_vector, {tsquery}) AS rank FROM bench_listing "
+                f"WHERE search_vector @@ ({tsquery}) ORDER BY rank DESC LIMIT 25",
+                ts_params * 2,
+            )
+            uses_gin = any(n.get("Index Name") == "bench_listing_search_vector_gin" for n in nodes)
+            failed |= not uses_gin
+            plan = "Bitmap Index Scan (GIN)" if uses_gin else "NO GIN INDEX USED"
+            print(f"{query:<18} {legacy_ms:>13.1f} {fts_ms:>8.1f} {legacy_ms / max(fts_ms, 1e-3):>7.1f}x  {plan}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Preference Extraction Debounce Benchmark
+
+Replays a burst of ``--messages`` user messages spread over ``--span``
+seconds on one thread (a simulated clock; nothing sleeps), ``--bursts``
+times, through:
+- per-message: one extraction and one ``upsert_preference`` transaction per
+  extracted preference for every message (the previous
+  ``extract_preferences_async`` behaviour)
+- debounced: ``preference_debounce.enqueue_message`` as the chat task uses it
+  now; flushes run when their countdown falls due on the simulated clock
+
+The LLM is a keyword stub, so the numbers count calls, not model latency.
+Reports extraction (LLM) calls, calls saved and DB writes (INSERT/UPDATE
+statements, audit rows included) per message. A repeated burst shows
+unchanged preferences being skipped.
+
+Everything runs in one transaction that is rolled back.
+
+Usage:
+    python3 scripts/bench_preference_debounce.py
+    PREFS_EXTRACT_DEBOUNCE_MS=1000 python3 scripts/bench_preference_debounce.py --messages 10 --span 5 --bursts 3
+"""
+
+import argparse
+import heapq
+import os
+import re
+import sys
+import uuid
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "easy_islanders.settings.development")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from assistant.models import PreferenceExtractionEvent  # noqa: E402
+from assistant.services import preference_debounce  # noqa: E402
+from assistant.services.preferences import PreferenceService  # noqa: E402
+from assistant.tasks import flush_preference_extraction  # noqa: E402
+
+BURST = [
+    "Hi, I'm looking for a flat to rent",
+    "in Kyrenia ideally",
+    "2 bedrooms",
+    "budget around €1200",
+    "with a pool if possible",
+    "sea view would be nice",
+    "actually Kyrenia or Esentepe",
+    "3 bedrooms is better",
+    "the pool is a must",
+    "thanks!",
+]
+
+
+class StubLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        prefs = []
+        places = [p for p in ("Kyrenia", "Esentepe") if p in text]
+        if places:
+            prefs.append({"category": "real_estate", "preference_type": "location",
+                          "value": {"type": "list", "values": places}, "confidence": 0.9, "source": "explicit"})
+        bedrooms = re.findall(r"(\d+) bedrooms", text)
+        if bedrooms:
+            prefs.append({"category": "real_estate", "preference_type": "bedrooms",
+                          "value": {"type": "single", "value": int(bedrooms[-1])}, "confidence": 0.9,
+                          "source": "explicit"})
+        features = [f for f in ("pool", "sea view") if f in text]
+        if features:
+            prefs.append({"category": "real_estate", "preference_type": "features",
+                          "value": {"type": "list", "values": features}, "confidence": 0.8, "source": "explicit"})
+        return {"preferences": prefs, "overall_reasoning": ""}
+
+
+def _writes(ctx):
+    return sum(1 for q in ctx.captured_queries if q["sql"].lstrip().split()[0].upper() in {"INSERT", "UPDATE"})
+
+
+def _per_message(user, thread_id, utterance, llm):
+    """The previous extract_preferences_async: one upsert transaction per preference."""
+    extracted = list(llm(utterance)["preferences"])
+    budget = preference_debounce._rule_budget(utterance)
+    if budget:
+        extracted.append(budget)
+    for pref in extracted:
+        PreferenceService.upsert_preference(
+            user_id=user.id,
+            category=pref["category"],
+            preference_type=pref["preference_type"],
+            value=pref["value"],
+            confidence=pref["confidence"],
+            source=pref["source"],
+        )
+    PreferenceExtractionEvent.objects.create(
+        user_id=user.id, thread_id=thread_id, message_id=uuid.uuid4(), utterance=utterance,
+        extracted_preferences=extracted, extraction_method="llm",
+    )
+
+
+def _debounced(user, thread_id, schedule, llm):
+    clock = {"t": 0.0}
+    due = []
+
+    def apply_async(args, countdown):
+        heapq.heappush(due, (clock["t"] + countdown, args[0]))
+
+    def run_due(until):
+        while due and due[0][0] <= until:
+            at, tid = heapq.heappop(due)
+            clock["t"] = at
+            preference_debounce.flush_thread(tid)
+
+    with mock.patch.object(preference_debounce, "_now", lambda: clock["t"]), \
+            mock.patch.object(preference_debounce, "extract_preferences_from_message", llm), \
+            mock.patch.object(flush_preference_extraction, "apply_async", apply_async):
+        for at, utterance in schedule:
+            run_due(at)
+            clock["t"] = at
+            preference_debounce.enqueue_message(thread_id, user_id=user.id, message_id=str(uuid.uuid4()),
+                                                utterance=utterance)
+        run_due(float("inf"))
+
+
+def _run(path, messages, span, bursts):
+    user = get_user_model().objects.create_user(username=f"bench-{uuid.uuid4().hex[:8]}", password="x")
+    thread_id = f"bench-{path}-{uuid.uuid4()}"
+    llm = StubLLM()
+    rows = []
+    for burst in range(bursts):
+        start = burst * (span + 60.0)
+        schedule = [(start + i * span / messages, BURST[i % len(BURST)]) for i in range(messages)]
+        calls_before = llm.calls
+        with CaptureQueriesContext(connection) as ctx:
+            if path == "per-message":
+                for _, utterance in schedule:
+                    _per_message(user, thread_id, utterance, llm)
+            else:
+                _debounced(user, thread_id, schedule, llm)
+        rows.append((burst + 1, llm.calls - calls_before, _writes(ctx)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10)
+    parser.add_argument("--span", type=float, default=5.0, help="seconds the burst is spread over")
+    parser.add_argument("--bursts", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"debounce={preference_debounce.DEBOUNCE_S:.1f}s max_wait={preference_debounce.MAX_WAIT_S:.1f}s "
+          f"messages={args.messages} span={args.span:.1f}s")
+    print(f"{'path':<12} {'burst':>5} {'llm calls':>10} {'saved':>6} {'db writes':>10} {'writes/msg':>11}")
+    with transaction.atomic():
+        for path in ("per-message", "debounced"):
+            for burst, calls, writes in _run(path, args.messages, args.span, args.bursts):
+                print(f"{path:<12} {burst:>5} {calls:>10} {args.messages - calls:>6} {writes:>10} "
+                      f"{writes / args.messages:>11.2f}")
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+WebSocket Frame Emission Benchmark (channels_redis)
+
+Replays the frames one ``process_chat_message`` turn emits (typing on,
+``--deltas`` streamed deltas, the assistant message, typing off) against a
+real Redis channel layer, per turn:
+- per-frame: every frame is its own ``async_to_sync(group_send)`` (the
+  previous task behaviour)
+- batched: ``FrameBatcher`` as the task uses it now; the assistant message
+  and typing-off go out as one ``chat.batch`` group_send
+
+Reports wall time, Redis commands and new Redis connections per turn, read
+from ``INFO stats`` deltas on the server.
+
+Requires channels-redis and a Redis server (REDIS_URL).
+
+Usage:
+    REDIS_URL=redis://localhost:6379/0 python3 scripts/bench_ws_frames.py
+    REDIS_URL=redis://localhost:6379/0 python3 scripts/bench_ws_frames.py --turns 500 --deltas 0 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "easy_islanders.settings.development")
+
+import django  # noqa: E402
+
+django.setup()
+
+import redis  # noqa: E402
+from asgiref.sync import async_to_sync  # noqa: E402
+from channels_redis.core import RedisChannelLayer  # noqa: E402
+
+from assistant.tasks import FrameBatcher  # noqa: E402
+
+GROUP = "thread-bench"
+
+
+def _turn(frames, deltas):
+    frames.send({"type": "chat_status", "event": "typing", "value": True})
+    for _ in range(deltas):
+        frames.send({"type": "chat.delta", "data": {"event": "assistant_delta", "payload": {"delta": "x" * 40}}})
+    frames.add({"type": "chat.message", "data": {"event": "assistant_message", "payload": {"text": "y" * 400}}})
+    frames.send({"type": "chat_status", "event": "typing", "value": False})
+
+
+def _stats(client):
+    info = client.info("stats")
+    return info["total_commands_processed"], info["total_connections_received"]
+
+
+def _run(layer, client, turns, deltas, batch):
+    commands0, connections0 = _stats(client)
+    started = time.perf_counter()
+    group_sends = 0
+    for _ in range(turns):
+        frames = FrameBatcher(layer, GROUP, batch=batch)
+        _turn(frames, deltas)
+        group_sends += frames.group_sends
+    elapsed = time.perf_counter() - started
+    commands1, connections1 = _stats(client)
+    return {
+        "ms_per_turn": elapsed * 1000 / turns,
+        "group_sends": group_sends / turns,
+        "commands": (commands1 - commands0 - 1) / turns,  # minus the INFO call itself
+        "connections": (connections1 - connections0) / turns,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--deltas", type=int, nargs="+", default=[0, 5])
+    args = parser.parse_args()
+
+    url = os.getenv("REDIS_URL")
+    if not url:
+        sys.exit("bench_ws_frames needs REDIS_URL")
+    client = redis.Redis.from_url(url)
+    layer = RedisChannelLayer(hosts=[url], capacity=1_000_000, expiry=30)
+    listener = async_to_sync(layer.new_channel)()
+    async_to_sync(layer.group_add)(GROUP, listener)
+
+    try:
+        print(f"{'deltas':>6} {'path':<10} {'ms/turn':>8} {'group_send':>11} {'redis cmds':>11} {'new conns':>10}")
+        for deltas in args.deltas:
+            for name, batch in (("per-frame", False), ("batched", True)):
+                row = _run(layer, client, args.turns, deltas, batch)
+                print(
+                    f"{deltas:>6} {name:<10} {row['ms_per_turn']:>8.2f} {row['group_sends']:>11.1f} "
+                    f"{row['commands']:>11.1f} {row['connections']:>10.1f}"
+                )
+    finally:
+        async_to_sync(layer.group_discard)(GROUP, listener)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Replay the router eval corpus through the routing cascade's local stage.
+
+Reports how many turns the local router answers (skipping the LLM intent
+parser) and how accurate those answers are.
+
+Usage:
+    python3 scripts/eval_router_cascade.py [-c scripts/router_eval_corpus.json]
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "easy_islanders.settings.development")
+try:
+    import django  # type: ignore
+    django.setup()
+except Exception:
+    pass
+
+from assistant.brain.router_cascade import CORPUS_PATH, evaluate_corpus  # noqa: E402
+
+
+def main(argv: list[str]) -> int:
+    corpus_path = CORPUS_PATH
+    if len(argv) >= 3 and argv[1] in ("-c", "--corpus"):
+        corpus_path = Path(argv[2])
+    rows = json.loads(corpus_path.read_text(encoding="utf-8"))
+
+    logging.getLogger("assistant.brain.intent_router").setLevel(logging.WARNING)
+    report = evaluate_corpus(rows)
+
+    print(
+        f"router-cascade: turns={report['total']} local_hit_rate={report['local_hit_rate']:.3f} "
+        f"local_accuracy={report['local_accuracy']:.3f} llm_calls={report['llm_calls']}"
+    )
+    for domain, stats in sorted(report["per_domain"].items()):
+        print(f"  {domain}: hits={stats['hits']} correct={stats['correct']}")
+
+    # The local stage must not answer wrongly more than 2% of the time
+    return 0 if report["local_accuracy"] >= 0.98 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -165,11 +165,11 @@ print("\n=== [6] LANGGRAPH MEMORY & CHECKPOINT ===")
 try:
     from assistant.brain.supervisor_graph import _SUPERVISOR_MEMORY
     if _SUPERVISOR_MEMORY:
-        print(f"  ✅ MemorySaver active: {type(_SUPERVISOR_MEMORY).__name__}")
+        print(f"  ✅ Checkpointer active: {type(_SUPERVISOR_MEMORY).__name__}")
     else:
-        print(f"  ⚠️  MemorySaver not initialized")
+        print(f"  ⚠️  Checkpointer not initialized")
 except Exception as e:
-    print(f"  ❌ MemorySaver check failed: {e}")
+    print(f"  ❌ Checkpointer check failed: {e}")
 
 # ---------------------------------------------
 # 7️⃣  RAG RETRIEVAL TEST
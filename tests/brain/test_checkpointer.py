@@ -0,0 +1,166 @@
+import operator
+import threading
+import time
+from typing import Annotated, List, TypedDict
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.graph import END, StateGraph
+
+from assistant.brain.checkpointing import BoundedCacheSaver, CheckpointError
+
+
+class _State(TypedDict):
+    messages: Annotated[List[str], operator.add]
+
+
+def _graph(saver):
+    graph = StateGraph(_State)
+    graph.add_node("echo", lambda state: {"messages": [f"echo:{state['messages'][-1]}"]})
+    graph.set_entry_point("echo")
+    graph.add_edge("echo", END)
+    return graph.compile(checkpointer=saver)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_history_survives_across_saver_instances():
+    """A second worker (new saver over the same cache) continues the thread."""
+    config = {"configurable": {"thread_id": "t-shared"}}
+    _graph(BoundedCacheSaver(key_prefix="test")).invoke({"messages": ["hi"]}, config)
+
+    result = _graph(BoundedCacheSaver(key_prefix="test")).invoke({"messages": ["again"]}, config)
+
+    assert result["messages"] == ["hi", "echo:hi", "again", "echo:again"]
+
+
+def test_keeps_only_last_checkpoints_per_thread():
+    saver = BoundedCacheSaver(key_prefix="test", max_checkpoints=3)
+    config = {"configurable": {"thread_id": "t-bounded"}}
+    app = _graph(saver)
+    for i in range(5):
+        app.invoke({"messages": [str(i)]}, config)
+
+    history = list(saver.list(config))
+    assert len(history) == 3
+    assert saver.get(config)["channel_values"]["messages"][-1] == "echo:4"
+    assert list(saver.list(config, limit=1))[0].config == saver.get_tuple(config).config
+
+
+def test_large_entries_are_compressed():
+    saver = BoundedCacheSaver(key_prefix="test", compress_min_bytes=256)
+    config = {"configurable": {"thread_id": "t-big"}}
+    _graph(saver).invoke({"messages": ["x" * 4000]}, config)
+
+    raw = cache.get(saver._key("t-big", ""))
+    assert raw[:1] == b"z"
+    assert len(raw) < 4000
+    assert saver.get(config)["channel_values"]["messages"][0] == "x" * 4000
+
+
+def test_delete_thread_and_ttl():
+    backend = Mock(wraps=cache)
+    saver = BoundedCacheSaver(cache_backend=backend, key_prefix="test", ttl=120)
+    config = {"configurable": {"thread_id": "t-gone"}}
+    _graph(saver).invoke({"messages": ["bye"]}, config)
+    assert {c.kwargs["timeout"] for c in backend.set.call_args_list} == {120}
+
+    saver.delete_thread("t-gone")
+    assert saver.get_tuple(config) is None
+
+
+class _SlowCache:
+    """Widens the load -> modify -> store window so racing writers overlap."""
+
+    def __init__(self, backend):
+        self._backend = backend
+
+    def get(self, key, *args, **kwargs):
+        value = self._backend.get(key, *args, **kwargs)
+        if not key.endswith("__lock__"):
+            time.sleep(0.005)
+        return value
+
+    def __getattr__(self, name):
+        return getattr(self._backend, name)
+
+
+def test_concurrent_writers_do_not_lose_checkpoints_or_writes():
+    backend = _SlowCache(cache)
+    config = {"configurable": {"thread_id": "t-race", "checkpoint_ns": ""}}
+    base = BoundedCacheSaver(cache_backend=backend, key_prefix="test", max_checkpoints=32)
+    parent = base.put(config, empty_checkpoint(), {}, {})
+
+    def worker(i):
+        saver = BoundedCacheSaver(cache_backend=backend, key_prefix="test", max_checkpoints=32)
+        checkpoint = empty_checkpoint()
+        saver.put(config, checkpoint, {"step": i}, {})
+        saver.put_writes(parent, [("messages", f"w{i}")], task_id=f"task-{i}")
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(list(base.list(config))) == 9
+    writes = base.get_tuple(parent).pending_writes
+    assert sorted(value for _, _, value in writes) == [f"w{i}" for i in range(8)]
+
+
+def test_latest_checkpoint_is_the_last_put_not_the_largest_id():
+    saver = BoundedCacheSaver(key_prefix="test", max_checkpoints=2)
+    config = {"configurable": {"thread_id": "t-order", "checkpoint_ns": ""}}
+    for checkpoint_id in ("z-first", "m-second", "a-third"):
+        checkpoint = empty_checkpoint()
+        checkpoint["id"] = checkpoint_id
+        saver.put(config, checkpoint, {}, {})
+
+    assert saver.get_tuple(config).config["configurable"]["checkpoint_id"] == "a-third"
+    assert [t.config["configurable"]["checkpoint_id"] for t in saver.list(config)] == ["a-third", "m-second"]
+    before = {"configurable": {"checkpoint_id": "a-third"}}
+    assert [t.config["configurable"]["checkpoint_id"] for t in saver.list(config, before=before)] == ["m-second"]
+
+
+class _DownCache:
+    """A cache that swallows backend errors: every add fails, nothing is stored."""
+
+    def add(self, *args, **kwargs):
+        return False
+
+    def get(self, key, default=None):
+        return default
+
+    def set(self, *args, **kwargs):
+        return None
+
+    def delete(self, *args, **kwargs):
+        return None
+
+
+def test_turn_completes_when_the_cache_backend_is_down():
+    saver = BoundedCacheSaver(cache_backend=_DownCache(), key_prefix="test")
+    config = {"configurable": {"thread_id": "t-outage"}}
+
+    started = time.monotonic()
+    result = _graph(saver).invoke({"messages": ["hi"]}, config)
+
+    assert result["messages"] == ["hi", "echo:hi"]
+    assert time.monotonic() - started < 1
+
+
+def test_held_lock_still_waits_for_its_holder(monkeypatch):
+    monkeypatch.setattr("assistant.brain.checkpointing.CHECKPOINT_LOCK_WAIT_SECONDS", 0.05)
+    saver = BoundedCacheSaver(key_prefix="test")
+    config = {"configurable": {"thread_id": "t-held", "checkpoint_ns": ""}}
+    cache.set(saver._lock_key("t-held"), "other-worker", timeout=10)
+
+    with pytest.raises(CheckpointError):
+        saver.put(config, empty_checkpoint(), {}, {})
@@ -0,0 +1,42 @@
+"""
+Tests for the shared location alias table in assistant.brain.geo.
+Ensures diacritic folding and that derived alias tables stay in sync.
+"""
+
+
+def test_fold_location_text_strips_turkish_diacritics():
+    from assistant.brain.geo import fold_location_text
+
+    assert fold_location_text("Çatalköy") == "catalkoy"
+    assert fold_location_text("  KARŞIYAKA ") == "karsiyaka"
+    assert fold_location_text("Lefkoşa") == "lefkosa"
+    assert fold_location_text("GİRNE") == "girne"
+    assert fold_location_text(None) == ""
+
+
+def test_canonical_location_resolves_aliases():
+    from assistant.brain.geo import canonical_location
+
+    assert canonical_location("Girne") == "kyrenia"
+    assert canonical_location("gazimağusa") == "famagusta"
+    assert canonical_location("LEFKOSA") == "nicosia"
+    assert canonical_location("Atlantis") is None
+
+
+def test_region_members_expands_regional_map():
+    from assistant.brain.geo import region_members
+
+    members = region_members("kyrenia")
+    assert {"kyrenia", "catalkoy", "esentepe", "lapta"} <= members
+    assert region_members("catalkoy") == {"catalkoy"}
+    assert region_members(None) == set()
+
+
+def test_derived_alias_tables_agree():
+    from assistant.agents.real_estate.tools import normalize_location
+    from assistant.tools import _normalize_location
+
+    assert "girne" in normalize_location("Kyrenia")
+    assert normalize_location("lefkoşa") == normalize_location("Nicosia")
+    assert _normalize_location("Girne") == "kyrenia"
+    assert _normalize_location("karşıyaka") == "karsiyaka"
@@ -0,0 +1,95 @@
+import random
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from assistant.brain.hybrid_search import HybridIndex, IncrementalBM25, tokenize
+
+WORDS = "flat villa kyrenia famagusta pool sea view garden parking studio penthouse quiet".split()
+
+
+class _NoDense:
+    collection = None
+
+    def upsert(self, *args):
+        pass
+
+    def delete(self, *args):
+        pass
+
+
+def _listing(pk, title, description, location="Kyrenia", price=600, **fields):
+    return SimpleNamespace(
+        id=pk, title=title, description=description, location=location,
+        price=Decimal(price), currency="EUR", status="active",
+        category=SimpleNamespace(slug="real-estate"), dynamic_fields=fields,
+    )
+
+
+def test_incremental_deltas_match_a_cold_rebuild():
+    rng = random.Random(7)
+    docs = {f"d{i}": [rng.choice(WORDS) for _ in range(rng.randint(3, 12))] for i in range(200)}
+    live = IncrementalBM25()
+    for doc_id, tokens in docs.items():
+        live.add(doc_id, tokens)
+    for i in range(0, 200, 3):
+        docs[f"d{i}"] = [rng.choice(WORDS) for _ in range(5)]
+        live.add(f"d{i}", docs[f"d{i}"])
+    for i in range(1, 200, 7):
+        del docs[f"d{i}"]
+        live.remove(f"d{i}")
+
+    cold = IncrementalBM25()
+    for doc_id, tokens in docs.items():
+        cold.add(doc_id, tokens)
+
+    query = tokenize("Sea view villa with a pool")
+    assert live.total_length == cold.total_length
+    assert live.scores(query) == pytest.approx(cold.scores(query))
+
+
+def test_upsert_and_delete_are_visible_to_search():
+    index = HybridIndex(dense=_NoDense())
+    index.upsert(_listing("a", "Sea view flat", "Two bedrooms", bedrooms=2))
+    index.upsert(_listing("b", "Garden villa", "Private pool", location="Famagusta", price=1500))
+
+    hits = index.search("villa pool")
+    assert [r.id for r in hits] == ["b"]
+    assert hits[0].metadata["location"] == "famagusta"
+
+    index.upsert(_listing("a", "Sea view villa", "Two bedrooms, shared pool"))
+    assert [r.id for r in index.search("villa", metadata_filter={"budget_max": 1000})] == ["a"]
+
+    assert index.delete("b") is True
+    assert [r.id for r in index.search("villa pool")] == ["a"]
+    assert len(index) == 1
+
+
+class _PagedCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.limits = []
+
+    def get(self, where=None, include=None, limit=None, offset=0):
+        self.limits.append(limit)
+        ids = sorted(self.docs)[offset:offset + limit]
+        return {"ids": ids, "documents": [self.docs[i] for i in ids], "metadatas": [{} for _ in ids]}
+
+    def count(self):
+        return len(self.docs)
+
+
+def test_first_sync_reads_the_collection_in_pages(monkeypatch):
+    from assistant.brain import hybrid_search
+
+    monkeypatch.setattr(hybrid_search, "HYBRID_INDEX_SYNC_PAGE", 2)
+    collection = _PagedCollection({f"d{i}": f"Villa {i}\n\npool" for i in range(5)})
+    dense = _NoDense()
+    dense.collection = collection
+    index = HybridIndex(dense=dense)
+
+    index.sync()
+
+    assert len(index) == 5
+    assert collection.limits == [2, 2, 2]
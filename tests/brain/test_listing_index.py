@@ -0,0 +1,138 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from assistant.brain import listing_index
+from listings.models import Listing
+
+
+class _CountingEmbeddings:
+    def __init__(self):
+        self.texts = 0
+
+    def embed_documents(self, texts):
+        self.texts += len(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class _RecordingStore:
+    def __init__(self):
+        self.deleted = []
+        self.batches = []
+        self.embeddings = _CountingEmbeddings()
+        self._collection = self
+
+    def delete(self, ids=None, **kwargs):
+        self.deleted.append(kwargs.get("where"))
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        assert len(ids) == len(embeddings) == len(documents) == len(metadatas)
+        self.batches.append(list(ids))
+
+
+class _FlakyHybrid:
+    def __init__(self, fail_on):
+        self.fail_on = fail_on
+        self.upserts = []
+
+    def upsert(self, listing, embedding=None):
+        if str(listing.id) == self.fail_on:
+            raise RuntimeError("chroma unavailable")
+        self.upserts.append((str(listing.id), embedding))
+
+    def delete(self, listing_id):
+        pass
+
+
+@pytest.fixture
+def buffered(monkeypatch):
+    cache.clear()
+    scheduled = []
+    monkeypatch.setattr(listing_index, "BATCHING_ENABLED", True)
+    monkeypatch.setattr(listing_index, "_schedule_flush", lambda countdown=None: scheduled.append(countdown))
+    yield scheduled
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_saves_are_coalesced_into_batched_writes(buffered, monkeypatch):
+    owner = get_user_model().objects.create_user(username="owner", password="x")
+    first = Listing.objects.create(owner=owner, title="Sea view flat", description="word " * 300)
+    second = Listing.objects.create(owner=owner, title="Garden villa", description="Private pool")
+    first.title = "Sea view flat, renovated"
+    first.save()
+    assert listing_index.pending_count() == 3 and buffered
+
+    monkeypatch.setattr(listing_index, "BATCH_CHUNKS", 2)
+    store = _RecordingStore()
+    assert listing_index.flush_pending(store=store) == 2
+
+    assert store.deleted == [{"listing_pk": {"$in": [str(first.id), str(second.id)]}}]
+    assert all(len(batch) <= 2 for batch in store.batches)
+    written = [chunk_id for batch in store.batches for chunk_id in batch]
+    assert len(written) == len(set(written)) > 2
+    assert listing_index.pending_count() == 0
+
+
+@pytest.mark.django_db
+def test_deleted_listings_only_drop_their_chunks(buffered):
+    store = _RecordingStore()
+    result = listing_index.index_listings(["00000000-0000-0000-0000-000000000001"], store=store)
+
+    assert result["missing"] == ["00000000-0000-0000-0000-000000000001"]
+    assert store.deleted == [{"listing_pk": {"$in": ["00000000-0000-0000-0000-000000000001"]}}]
+    assert store.batches == []
+
+
+@pytest.mark.django_db
+def test_hybrid_reuses_chunk_vectors_and_its_failures_do_not_fail_the_batch(buffered, monkeypatch):
+    from assistant.brain import hybrid_search
+
+    owner = get_user_model().objects.create_user(username="owner", password="x")
+    broken = Listing.objects.create(owner=owner, title="Sea view flat", description="Two bedrooms")
+    fine = Listing.objects.create(owner=owner, title="Garden villa", description="Private pool")
+    hybrid = _FlakyHybrid(fail_on=str(broken.id))
+    monkeypatch.setattr(hybrid_search, "get_hybrid_index", lambda: hybrid)
+    store = _RecordingStore()
+
+    result = listing_index.index_listings([str(broken.id), str(fine.id)], store=store)
+
+    assert result["hybrid_failed"] == [str(broken.id)]
+    assert store.embeddings.texts == result["chunks"]  # embedded once, for the chunks only
+    assert [(pk, vector is not None) for pk, vector in hybrid.upserts] == [(str(fine.id), True)]
+
+
+@pytest.mark.django_db
+def test_a_failing_listing_is_skipped_and_the_buffer_advances(buffered, monkeypatch):
+    owner = get_user_model().objects.create_user(username="owner", password="x")
+    broken = Listing.objects.create(owner=owner, title="Sea view flat", description="Two bedrooms")
+    fine = Listing.objects.create(owner=owner, title="Garden villa", description="Private pool")
+    real_index = listing_index.index_listings
+
+    def index_listings(listing_ids, store=None):
+        if str(broken.id) in listing_ids:
+            raise ValueError("bad dynamic_fields")
+        return real_index(listing_ids, store=store)
+
+    monkeypatch.setattr(listing_index, "index_listings", index_listings)
+    store = _RecordingStore()
+
+    assert listing_index.flush_pending(store=store) == 1
+
+    assert listing_index.pending_count() == 0
+    assert [batch[0].startswith(f"listing_{fine.id}_") for batch in store.batches] == [True]
+
+
+def test_worker_ready_warms_non_prefork_pools_only(monkeypatch):
+    from types import SimpleNamespace
+
+    from celery.concurrency.prefork import TaskPool as PreforkPool
+    from celery.concurrency.thread import TaskPool as ThreadPool
+
+    warmed = []
+    monkeypatch.setattr(listing_index, "warm_up", lambda **kwargs: warmed.append(True))
+
+    listing_index._warm_up_ready(sender=SimpleNamespace(pool=PreforkPool.__new__(PreforkPool)))
+    listing_index._warm_up_ready(sender=SimpleNamespace(pool=ThreadPool.__new__(ThreadPool)))
+
+    assert warmed == [True]
@@ -0,0 +1,64 @@
+import time
+
+from prometheus_client import REGISTRY
+
+from assistant.brain import node_timing
+from assistant.brain.node_timing import timed_node
+
+
+def _sample(name, node):
+    return REGISTRY.get_sample_value(name, {"node": node}) or 0.0
+
+
+def test_turn_breakdown_accumulates_across_nodes_and_resets_per_turn():
+    @timed_node("t_inner")
+    def inner(state):
+        return {**state, "inner": True}
+
+    @timed_node("t_entry", turn_start=True)
+    def entry(state):
+        return inner(state)
+
+    @timed_node("t_worker")
+    def worker(state):
+        return {**state, "done": True}
+
+    before = _sample("supervisor_node_latency_seconds_count", "t_entry")
+    state = worker(entry({"thread_id": "t1", "node_timings": {"stale": 1.0}}))
+
+    assert set(state["node_timings"]) == {"t_inner", "t_entry", "t_worker"}
+    assert state["node_timings"]["t_entry"] >= state["node_timings"]["t_inner"]
+    assert state["turn_started_at"] and state["budget_skipped"] == []
+    assert _sample("supervisor_node_latency_seconds_count", "t_entry") == before + 1
+
+
+def test_optional_node_is_skipped_when_turn_budget_is_spent(monkeypatch):
+    monkeypatch.setattr(node_timing, "TURN_BUDGET_MS", 100.0)
+    monkeypatch.setitem(node_timing.DEADLINES_MS, "t_fuse", 50.0)
+    calls = []
+
+    @timed_node("t_fuse", optional=True)
+    def fuse(state):
+        calls.append(state)
+        return {**state, "fused_context": "fresh"}
+
+    fresh = fuse({"turn_started_at": time.time(), "fused_context": "previous"})
+    spent = fuse({"turn_started_at": time.time() - 0.06, "fused_context": "previous"})
+
+    assert fresh["fused_context"] == "fresh"
+    assert spent["fused_context"] == "previous" and spent["budget_skipped"] == ["t_fuse"]
+    assert len(calls) == 1
+    assert _sample("supervisor_node_skipped_total", "t_fuse") >= 1
+
+
+def test_soft_deadline_overrun_is_counted_but_not_interrupted(monkeypatch):
+    monkeypatch.setitem(node_timing.DEADLINES_MS, "t_slow", 1.0)
+
+    @timed_node("t_slow")
+    def slow(state):
+        time.sleep(0.01)
+        return {**state, "ok": True}
+
+    before = _sample("supervisor_node_deadline_exceeded_total", "t_slow")
+    assert slow({"thread_id": "t1"})["ok"] is True
+    assert _sample("supervisor_node_deadline_exceeded_total", "t_slow") == before + 1
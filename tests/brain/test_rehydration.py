@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from assistant.brain import rehydration
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _fake_state(calls, delay=0.0):
+    def rehydrate_state(thread_id):
+        calls.append(thread_id)
+        time.sleep(delay)
+        return {"rehydrated": True, "active_domain": "real_estate_agent", "turn_count": 2}
+
+    return rehydrate_state
+
+
+def _checkpoint(thread_id):
+    return {
+        "agent_contexts": {"real_estate_agent": {"filled_slots": {"location": "Kyrenia"}, "stage": "search"}},
+        "messages": [{"role": "user", "content": "hi"}],
+    }
+
+
+def test_concurrent_connects_share_one_cached_build():
+    calls = []
+    with patch("assistant.brain.supervisor_graph.rehydrate_state", _fake_state(calls, delay=0.05)), \
+            patch("assistant.brain.supervisor_graph._get_checkpoint_state", _checkpoint):
+
+        async def storm():
+            return await asyncio.gather(*(rehydration.get_rehydration_snapshot("t-1") for _ in range(10)))
+
+        payloads = asyncio.run(storm())
+        again = asyncio.run(rehydration.get_rehydration_snapshot("t-1"))
+
+    assert calls == ["t-1"]
+    assert again == payloads[0]
+    assert payloads[0]["rehydrated"] is True
+    assert payloads[0]["shared_context"] == {"user_location": "Kyrenia"}
+    assert payloads[0]["recent_turns"] == [{"role": "user", "content": "hi"}]
+
+
+def test_slow_zep_times_out_without_blocking_the_loop():
+    calls = []
+    release = threading.Event()
+
+    def slow(thread_id):
+        calls.append(thread_id)
+        release.wait(2)
+        return {"rehydrated": False}
+
+    async def connect():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await rehydration.get_rehydration_snapshot("t-slow", budget=0.1)
+        finally:
+            task.cancel()
+        return ticks
+
+    with patch("assistant.brain.supervisor_graph.rehydrate_state", slow), \
+            patch("assistant.brain.supervisor_graph._get_checkpoint_state", lambda _t: None):
+        ticks = asyncio.run(connect())
+        release.set()
+
+    assert ticks >= 3
+
+
+def test_invalidate_drops_cached_snapshot():
+    calls = []
+    with patch("assistant.brain.supervisor_graph.rehydrate_state", _fake_state(calls)), \
+            patch("assistant.brain.supervisor_graph._get_checkpoint_state", lambda _t: None):
+        asyncio.run(rehydration.get_rehydration_snapshot("t-2"))
+        rehydration.invalidate_rehydration("t-2")
+        asyncio.run(rehydration.get_rehydration_snapshot("t-2"))
+
+    assert calls == ["t-2", "t-2"]
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from assistant.brain import router_cascade
+from assistant.brain.schemas import EnterpriseIntentResult
+
+
+def test_confident_local_turns_skip_the_llm():
+    with patch("assistant.brain.intent_parser.parse_intent_robust") as parse:
+        result = router_cascade.route_intent(
+            "pharmacy in nicosia", {"language": "en"}, "t-1", {}, fused_context=""
+        )
+
+    parse.assert_not_called()
+    assert (result.intent_type, result.category) == ("local_lookup", "KNOWLEDGE_QUERY")
+    assert result.attributes == {"city": "nicosia"}
+    assert result.reasoning.startswith("local_router:")
+
+
+def test_local_search_hits_carry_slots_and_detected_language():
+    with patch("assistant.brain.intent_parser.parse_intent_robust") as parse:
+        home = router_cascade.route_intent(
+            "2 bedroom apartment to rent in Kyrenia for 800 euros", {"language": "en"}, "t-4", {}
+        )
+        car = router_cascade.route_intent("used car in Kyrenia under 15000", {}, "t-5", {})
+        lookup = router_cascade.route_intent("merhaba, pharmacy in nicosia", {"language": "en"}, "t-6", {})
+
+    parse.assert_not_called()
+    assert home.intent_type == "property_search"
+    assert (home.attributes["bedrooms"], home.attributes["budget"], home.attributes["location"]) == (2, 800, "Kyrenia")
+    assert car.intent_type == "vehicle_search"
+    assert (car.attributes["budget"], car.attributes["location"]) == (15000, "Kyrenia")
+    assert lookup.user_language == "tr"
+
+
+def test_ambiguous_turns_fall_through_to_the_llm():
+    llm_result = EnterpriseIntentResult(
+        intent_type="greeting", category="CONVERSATION", confidence=0.9, reasoning="llm"
+    )
+    with patch("assistant.brain.intent_parser.parse_intent_robust", return_value=llm_result) as parse:
+        mixed = router_cascade.route_intent("I need a car for my new apartment", {}, "t-2", {})
+        hello = router_cascade.route_intent("hello", {}, "t-3", {})
+
+    assert parse.call_count == 2
+    assert mixed is llm_result and hello is llm_result
+
+
+def test_corpus_local_answers_are_accurate():
+    report = router_cascade.evaluate_corpus()
+
+    assert report["local_hit_rate"] >= 0.5
+    assert report["local_accuracy"] == 1.0
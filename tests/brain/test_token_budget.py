@@ -0,0 +1,98 @@
+import pytest
+
+from assistant.brain import token_budget
+from assistant.brain.supervisor_graph import _enforce_token_budget, _fuse_context
+from assistant.brain.token_budget import ContextSegment, count_tokens, select_segments, total_tokens
+
+
+@pytest.fixture(autouse=True)
+def encodes(monkeypatch):
+    """Deterministic 1 token per word tokenizer that records every encode."""
+    calls = []
+
+    def fake_encode_len(text, model):
+        calls.append(text)
+        return len(text.split())
+
+    token_budget.clear_token_cache()
+    monkeypatch.setattr(token_budget, "_encode_len", fake_encode_len)
+    yield calls
+    token_budget.clear_token_cache()
+
+
+def _state(**overrides):
+    state = {
+        "thread_id": "t-1",
+        "active_domain": "real_estate_agent",
+        "conversation_summary": "User wants a villa in Kyrenia.",
+        "retrieved_context": "\n".join(f"memory {i} " + "word " * 40 for i in range(10)),
+        "history": [
+            {"role": "user", "content": f"turn {i} " + "word " * 20} for i in range(8)
+        ],
+        "memory_context_facts": [{"fact": "Budget is 300k"}],
+    }
+    state.update(overrides)
+    return state
+
+
+def test_counts_are_memoized_by_content(encodes):
+    assert count_tokens("two words") == 2
+    assert count_tokens("two words") == 2
+    assert encodes == ["two words"]
+
+
+def test_knapsack_keeps_required_and_most_valuable_segments():
+    segments = [
+        ContextSegment("", "[Active Domain: x]", required=True),
+        ContextSegment("[A]:", "low " * 30, value=1.0),
+        ContextSegment("[A]:", "high " * 30, value=5.0),
+        ContextSegment("[B]:", "newest turn", value=10.0, required=True),
+    ]
+
+    kept = select_segments(segments, max_tokens=45)
+
+    assert [s.value for s in kept] == [1.0, 5.0, 10.0]
+    assert "low " * 30 not in [s.text for s in kept]
+    assert total_tokens(kept) <= 45
+
+
+def test_fused_context_layout_is_unchanged():
+    state = _fuse_context(_state(retrieved_context="one\ntwo", history=[{"role": "user", "content": "hi"}]))
+
+    assert state["fused_context"] == (
+        "[Active Domain: real_estate_agent]\n\n"
+        "[Conversation Summary]:\nUser wants a villa in Kyrenia.\n\n"
+        "[Relevant Past Context]:\none\ntwo\n\n"
+        "[Recent Conversation]:\nUser: hi\n\n"
+        "[Known Facts]:\n- Budget is 300k"
+    )
+
+
+def test_budget_drops_oldest_memories_without_reencoding(encodes):
+    state = _fuse_context(_state())
+    encoded_by_fusion = len(encodes)
+    state = _enforce_token_budget(state, max_tokens=300)
+
+    assert state["current_token_estimate"] <= 300
+    assert "turn 7" in state["fused_context"]
+    assert "[Active Domain: real_estate_agent]" in state["fused_context"]
+    assert "memory 0" in state["retrieved_context"]
+    assert "memory 9" not in state["fused_context"]
+    # Every segment was encoded exactly once; nothing was re-tokenized after trimming
+    assert len(encodes) == len(set(encodes))
+    assert encoded_by_fusion == 0
+
+    _enforce_token_budget(_fuse_context(_state()), max_tokens=300)
+    assert len(encodes) == len(set(encodes))
+
+
+def test_summarized_history_reaches_fused_context():
+    state = _enforce_token_budget(_fuse_context(_state()), max_tokens=300)
+
+    summary = state["history"][0]["content"]
+    assert state["history"][0]["role"] == "system" and "turn 0" in summary
+    fused = state["fused_context"]
+    assert fused.startswith("[Active Domain: real_estate_agent]\n\n[Conversation Summary]:\nUser wants a villa")
+    assert "user: turn 0" in fused and "user: turn 1" in fused
+    assert fused.index("user: turn 0") < fused.index("[Recent Conversation]:")
+    assert "turn 7" in fused
@@ -45,3 +45,8 @@ def _dj_autoclear_mailbox() -> None:
             mail.outbox = []
     except (ImportError, AttributeError):
         pass
+
+@pytest.fixture(autouse=True)
+def _llm_result_cache_off(monkeypatch):
+    """Keep mocked LLM responses from leaking between tests through the result cache."""
+    monkeypatch.setenv("LLM_RESULT_CACHE_ENABLED", "false")
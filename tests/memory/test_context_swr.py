@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+
+from assistant.memory import service as memory_service
+
+
+class SlowContextClient:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+        self.release = threading.Event()
+
+    def get_user_context(self, thread_id, mode="summary"):
+        self.calls += 1
+        if self.delay:
+            self.release.wait(self.delay)
+        return {"facts": [f"fact {self.calls}"], "recent": [], "summary": f"v{self.calls}"}
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    cache.clear()
+    monkeypatch.setattr(memory_service, "get_forced_mode", lambda: None)
+    yield
+    cache.clear()
+
+
+def _use(monkeypatch, client):
+    monkeypatch.setattr(memory_service, "get_client", lambda **_: client)
+
+
+def test_slow_read_is_cut_at_the_budget_and_fills_cache_in_background(monkeypatch):
+    client = SlowContextClient(delay=2)
+    _use(monkeypatch, client)
+
+    start = time.perf_counter()
+    context, meta = memory_service.fetch_thread_context("t-1", timeout_ms=50)
+    elapsed = time.perf_counter() - start
+
+    assert context is None
+    assert meta["reason"] == "timeout"
+    assert elapsed < 0.5
+    client.release.set()
+    for _ in range(50):
+        if cache.get("zep:ctx:v1:t-1:summary"):
+            break
+        time.sleep(0.01)
+    context, meta = memory_service.fetch_thread_context("t-1")
+    assert context["summary"] == "v1"
+    assert meta["cached"] is True
+    assert client.calls == 1
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(monkeypatch):
+    client = SlowContextClient()
+    _use(monkeypatch, client)
+    memory_service.fetch_thread_context("t-2")
+    memory_service.invalidate_context("t-2")
+
+    client.delay = 2
+    results = []
+    workers = [
+        threading.Thread(target=lambda: results.append(memory_service.fetch_thread_context("t-2", timeout_ms=50)))
+        for _ in range(5)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    client.release.set()
+
+    assert client.calls == 2  # one initial read + one shared refresh
+    assert all(ctx["summary"] == "v1" and meta["stale"] for ctx, meta in results)
+
+
+def test_prefetch_warms_the_cache_for_the_next_read(monkeypatch):
+    client = SlowContextClient()
+    _use(monkeypatch, client)
+
+    memory_service.prefetch_thread_context("t-3")
+    context, meta = memory_service.fetch_thread_context("t-3")
+
+    assert context["summary"] == "v1"
+    assert client.calls == 1
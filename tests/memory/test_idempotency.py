@@ -5,6 +5,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError
 
+from assistant.memory import service as memory_service
 import assistant.tasks as tasks
 from assistant.models import ConversationThread, Message
 
@@ -24,7 +25,7 @@ class StubZepClient:
         self.calls.append(("ensure_thread", thread_id, user_id))
         return {}
 
-    def add_messages(self, thread_id: str, messages):
+    def add_messages(self, thread_id: str, messages, user_id=None):
         self.calls.append(("add_messages", thread_id, messages))
         return {}
 
@@ -37,7 +38,9 @@ def test_assistant_idempotency_skips_duplicate_mirror(monkeypatch):
     monkeypatch.setattr(tasks, "write_enabled", lambda: True)
     monkeypatch.setattr(tasks, "read_enabled", lambda: False)
     monkeypatch.setattr(tasks, "get_client", lambda require_write=False, **__: stub)
-    monkeypatch.setattr(tasks, "call_zep", lambda op, func, observe_retry=False: (True, func()))
+    # Write-behind flushes (eager in tests) resolve the client via memory.service
+    monkeypatch.setattr(memory_service, "get_client", lambda require_write=False, **__: stub)
+    monkeypatch.setattr(memory_service, "call_zep", lambda op, func, observe_retry=False: (True, func()))
     # Supervisor returns a simple reply
     monkeypatch.setattr(tasks, "run_supervisor_agent", lambda text, tid, **_: {"message": "ok"})
 
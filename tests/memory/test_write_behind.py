@@ -0,0 +1,102 @@
+import pytest
+from django.core.cache import cache
+
+from assistant.memory import write_behind
+from assistant.memory.write_behind import WriteBehindFlushError, enqueue_messages, flush_thread, pending_count, redacted
+from assistant.memory.zep_sdk_client import ZepRequestError
+
+
+class StubZepClient:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def add_messages(self, thread_id, messages, user_id=None):
+        if self.fail:
+            raise ZepRequestError("unavailable", status_code=503)
+        self.calls.append((thread_id, [m["content"] for m in messages], user_id))
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    cache.clear()
+    scheduled = []
+    monkeypatch.setattr(write_behind, "_schedule_flush", lambda *args, **kwargs: scheduled.append(args))
+    yield scheduled
+    cache.clear()
+
+
+def _mirrored(role, content, pk):
+    return redacted(role, content, {"message_pk": pk})
+
+
+def test_enqueue_never_calls_zep_and_schedules_a_flush(_isolated):
+    stub = StubZepClient()
+    assert enqueue_messages("t-1", [_mirrored("user", "hello there", "1")], user_id="u-1")
+
+    assert stub.calls == []
+    assert pending_count("t-1") == 1
+    assert _isolated == [("t-1",)]
+
+
+def test_turn_is_flushed_as_one_ordered_batch_without_echoes():
+    enqueue_messages("t-2", [_mirrored("user", "call me on +90 533 123 4567", "1")])
+    # The supervisor graph echoes the same turn without a Message row behind it
+    enqueue_messages("t-2", [redacted("user", "call me on +90 533 123 4567")])
+    enqueue_messages("t-2", [redacted("assistant", "Sure, noted.")])
+    enqueue_messages("t-2", [_mirrored("assistant", "Sure, noted.", "2")])
+    stub = StubZepClient()
+
+    assert flush_thread("t-2", user_id="u-2", client=stub) == 2
+
+    assert stub.calls == [("t-2", ["call me on [PHONE]", "Sure, noted."], "u-2")]
+    assert pending_count("t-2") == 0
+
+
+def test_flush_uses_the_buffered_user_for_writes_without_one():
+    enqueue_messages("t-5", [_mirrored("user", "hello there", "1")], user_id="u-5")
+    # The supervisor graph may not know the user; the buffer does
+    enqueue_messages("t-5", [redacted("system", "[CONVERSATION SUMMARY] greeting")])
+    stub = StubZepClient()
+
+    flush_thread("t-5", client=stub)
+
+    assert stub.calls == [("t-5", ["hello there", "[CONVERSATION SUMMARY] greeting"], "u-5")]
+
+
+def test_echo_after_a_flush_and_re_enqueues_are_dropped():
+    enqueue_messages("t-6", [redacted("assistant", "Sure, noted.")])
+    stub = StubZepClient()
+    flush_thread("t-6", client=stub)
+
+    enqueue_messages("t-6", [_mirrored("assistant", "Sure, noted.", "7")])
+    enqueue_messages("t-6", [_mirrored("user", "thanks", "8")])
+    enqueue_messages("t-6", [_mirrored("user", "thanks", "8")])  # task retry
+    flush_thread("t-6", client=stub)
+
+    assert [contents for _, contents, _ in stub.calls] == [["Sure, noted."], ["thanks"]]
+
+
+def test_repeated_user_messages_are_kept():
+    enqueue_messages("t-3", [_mirrored("user", "yes please", "1"), _mirrored("user", "yes please", "2")])
+    stub = StubZepClient()
+
+    flush_thread("t-3", client=stub)
+
+    assert stub.calls[0][1] == ["yes please", "yes please"]
+
+
+def test_failed_batch_stays_buffered_and_invalidates_on_landing():
+    enqueue_messages("t-4", [_mirrored("user", "first message", "1")])
+    with pytest.raises(WriteBehindFlushError):
+        flush_thread("t-4", client=StubZepClient(fail=True))
+    assert pending_count("t-4") == 1
+
+    enqueue_messages("t-4", [_mirrored("user", "second message", "2")])
+    cache.set("zep:ctx:v1:t-4:summary", {"context": "stale"})
+    stub = StubZepClient()
+    flush_thread("t-4", client=stub)
+
+    assert stub.calls == [("t-4", ["first message", "second message"], None)]
+    assert cache.get("zep:ctx:v1:t-4:summary") is None
@@ -0,0 +1,107 @@
+"""
+Round-trip accounting for the pooled Zep transport against a local stub server.
+
+Before pooling, every chat turn opened fresh connections and re-ran
+ensure_user/ensure_thread (GET user, GET thread + POST messages = 3 requests
+per write). With the known-entity cache and keep-alive session, only the
+first write pays for the existence checks and all calls share one connection.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from django.core.cache import cache
+
+from assistant.memory.zep_sdk_client import ZepCloudClient
+from assistant.memory.zep_transport import KNOWN_THREADS, KNOWN_USERS
+
+
+class _StubZep(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    users: set = set()
+    threads: set = set()
+    requests: list = []
+    connections: list = []
+
+    def setup(self):
+        super().setup()
+        type(self).connections.append(self.client_address)
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=None):
+        data = json.dumps(body or {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        type(self).requests.append(("GET", path))
+        parts = path.strip("/").split("/")
+        if parts[2] == "users":
+            return self._reply(200 if parts[3] in self.users else 404)
+        return self._reply(200 if parts[3] in self.threads else 404, {"messages": []})
+
+    def do_POST(self):
+        path = self.path.split("?")[0]
+        type(self).requests.append(("POST", path))
+        body = self._body()
+        if path == "/api/v2/users":
+            self.users.add(body["user_id"])
+            return self._reply(201)
+        if path == "/api/v2/threads":
+            self.threads.add(body["thread_id"])
+            return self._reply(201)
+        return self._reply(201, {"messages": []})
+
+
+@pytest.fixture
+def stub_zep():
+    _StubZep.users, _StubZep.threads = set(), set()
+    _StubZep.requests, _StubZep.connections = [], []
+    cache.clear()
+    KNOWN_USERS.clear_local()
+    KNOWN_THREADS.clear_local()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubZep)
+    worker = threading.Thread(target=server.serve_forever, daemon=True)
+    worker.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    cache.clear()
+
+
+def _turn(i):
+    return [{"role": "user", "content": f"turn {i} question"}, {"role": "assistant", "content": f"turn {i} answer"}]
+
+
+def test_ensure_runs_once_per_thread_and_connections_are_reused(stub_zep):
+    client = ZepCloudClient(stub_zep, api_key="k")
+    for i in range(5):
+        client.add_messages("t-1", _turn(i), user_id="u-1")
+
+    # First turn: GET/POST user, GET/POST thread, POST messages; then one request per turn
+    assert len(_StubZep.requests) == 5 + 4
+    assert _StubZep.requests[5:] == [("POST", "/api/v2/threads/t-1/messages")] * 4
+    assert len(_StubZep.connections) == 1
+
+
+def test_known_threads_are_shared_across_clients_via_cache(stub_zep):
+    ZepCloudClient(stub_zep, api_key="k").add_messages("t-2", _turn(0), user_id="u-2")
+    KNOWN_THREADS.clear_local()
+    KNOWN_USERS.clear_local()
+    _StubZep.requests.clear()
+
+    ZepCloudClient(stub_zep, api_key="k").add_messages("t-2", _turn(1), user_id="u-2")
+
+    assert _StubZep.requests == [("POST", "/api/v2/threads/t-2/messages")]
+
@@ -26,7 +26,7 @@ class StubZepClient:
         self.calls.append(("ensure_thread", thread_id, user_id))
         return {}
 
-    def add_messages(self, thread_id: str, messages):
+    def add_messages(self, thread_id: str, messages, user_id=None):
         self.calls.append(("add_messages", thread_id, messages))
         return {}
 
@@ -40,7 +40,9 @@ def test_process_chat_message_mirrors_turn_to_zep(monkeypatch):
     monkeypatch.setattr(tasks, "read_enabled", lambda: False)
     monkeypatch.setattr(tasks, "current_mode", lambda: MemoryMode.WRITE_ONLY)
     monkeypatch.setattr(tasks, "get_client", lambda require_write=False, **__: stub)
-    monkeypatch.setattr(tasks, "call_zep", lambda op, func, observe_retry=False: (True, func()))
+    # Write-behind flushes (eager in tests) resolve the client via memory.service
+    monkeypatch.setattr(memory_service, "get_client", lambda require_write=False, **__: stub)
+    monkeypatch.setattr(memory_service, "call_zep", lambda op, func, observe_retry=False: (True, func()))
     monkeypatch.setattr(tasks, "run_supervisor_agent", lambda text, tid, **_: {"message": "hi there"})
 
     captured_calls = []
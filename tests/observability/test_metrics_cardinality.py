@@ -0,0 +1,74 @@
+import pytest
+from django.contrib.auth import get_user_model
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge
+from rest_framework.test import APIClient
+
+from assistant.monitoring import metrics
+from assistant.monitoring.cardinality import (
+    CardinalityError,
+    THREAD_BUCKETS,
+    TopKSketch,
+    check_label_names,
+    guarded,
+)
+
+
+def _series(registry, name):
+    return sum(len(family.samples) for family in registry.collect() if family.name == name)
+
+
+def test_series_count_stays_constant_as_threads_grow_to_100k():
+    registry = CollectorRegistry()
+    connections = guarded(
+        Gauge("t_ws_connections", "ws", ["thread_bucket"], registry=registry), thread_id="thread_bucket"
+    )
+    counts = []
+    for thread_count in (1_000, 10_000, 100_000):
+        for i in range(thread_count):
+            connections.labels(thread_id=f"thread-{i}").inc()
+        counts.append(_series(registry, "t_ws_connections"))
+
+    assert counts == [THREAD_BUCKETS] * 3
+
+
+def test_top_k_sketch_keeps_exact_counts_for_heavy_threads():
+    sketch = TopKSketch(capacity=10)
+    for i in range(5_000):
+        sketch.add(f"cold-{i}")
+        if i % 10 == 0:
+            sketch.add("hot")
+
+    top = sketch.top(1)[0]
+    assert top["key"] == "hot"
+    assert top["count"] - top["error"] <= 500 <= top["count"]
+    assert len(sketch) == 10
+
+
+def test_identifier_labels_are_rejected_and_free_text_values_collapse():
+    with pytest.raises(CardinalityError):
+        check_label_names("m", ["thread_id"])
+
+    registry = CollectorRegistry()
+    errors = guarded(Counter("t_errors", "e", ["reason"], registry=registry))
+    for i in range(1_000):
+        errors.labels(reason=f"free text {i}").inc()
+    assert _series(registry, "t_errors_total") <= 101
+
+
+def test_registered_metrics_only_use_allowlisted_labels():
+    for collector in list(REGISTRY._collector_to_names):
+        check_label_names(getattr(collector, "_name", ""), getattr(collector, "_labelnames", ()))
+
+
+@pytest.mark.django_db
+def test_top_threads_debug_endpoint_is_staff_only():
+    metrics.increment_ws_invalid_envelope("thread-debug")
+    client = APIClient()
+    user = get_user_model().objects.create_user(username="ops", password="pw12345")
+    client.force_authenticate(user)
+    assert client.get("/api/metrics/top-threads/").status_code == 403
+
+    user.is_staff = True
+    user.save()
+    body = client.get("/api/metrics/top-threads/?n=5").json()
+    assert any(row["key"] == "thread-debug" for row in body["top"]["ws_out_invalid_envelope"])
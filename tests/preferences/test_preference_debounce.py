@@ -0,0 +1,188 @@
+"""
+Tests for debounced per-thread preference extraction
+(assistant.services.preference_debounce) and PreferenceService.bulk_upsert.
+"""
+import uuid
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from assistant.services import preference_debounce
+from assistant.services.preference_debounce import enqueue_message, flush_thread, pending_count
+from assistant.services.preferences import PreferenceService
+from users.models import UserPreference
+
+User = get_user_model()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"t": 1000.0}
+    monkeypatch.setattr(preference_debounce, "_now", lambda: now["t"])
+    return now
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    cache.clear()
+    calls = []
+    monkeypatch.setattr(preference_debounce, "_schedule_flush", lambda *args, **kwargs: calls.append((args, kwargs)))
+    yield calls
+    cache.clear()
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    calls = []
+
+    def fake_extract(text):
+        calls.append(text)
+        prefs = []
+        if "Kyrenia" in text:
+            prefs.append({"category": "real_estate", "preference_type": "location",
+                          "value": {"type": "single", "value": "kyrenia"}, "confidence": 0.9, "source": "explicit"})
+        if "pool" in text:
+            prefs.append({"category": "real_estate", "preference_type": "features",
+                          "value": {"type": "list", "values": ["pool"]}, "confidence": 0.8, "source": "explicit"})
+        return {"preferences": prefs, "overall_reasoning": ""}
+
+    monkeypatch.setattr(preference_debounce, "extract_preferences_from_message", fake_extract)
+    return calls
+
+
+@pytest.mark.django_db
+def test_burst_of_messages_shares_one_extraction(clock, scheduled, llm):
+    user = User.objects.create_user(username="burst", password="pw")
+    for offset, text in enumerate(["flat in Kyrenia", "with a pool", "budget €1200"]):
+        clock["t"] = 1000.0 + offset
+        assert enqueue_message("t-1", user_id=user.id, message_id=str(uuid.uuid4()), utterance=text)
+    assert pending_count("t-1") == 3
+
+    # Still inside the debounce window of the last message: reschedule, no LLM call
+    clock["t"] = 1002.5
+    assert flush_thread("t-1")["extractions"] == 0
+    assert llm == []
+    assert scheduled[-1][1]["countdown"] == pytest.approx(preference_debounce.DEBOUNCE_S - 0.5)
+
+    clock["t"] = 1002.0 + preference_debounce.DEBOUNCE_S
+    assert flush_thread("t-1") == {"extractions": 1, "messages": 3, "saved": 3}
+
+    assert llm == ["flat in Kyrenia\nwith a pool\nbudget €1200"]
+    assert pending_count("t-1") == 0
+    stored = {p.preference_type: p.value for p in UserPreference.objects.filter(user=user)}
+    assert stored["location"] == {"type": "single", "value": "Kyrenia"}
+    assert stored["budget"]["min"] == 1200.0
+
+
+@pytest.mark.django_db
+def test_max_wait_bounds_a_continuous_stream(clock, scheduled, llm):
+    user = User.objects.create_user(username="stream", password="pw")
+    enqueue_message("t-2", user_id=user.id, message_id=str(uuid.uuid4()), utterance="Kyrenia")
+    clock["t"] = 1000.0 + preference_debounce.MAX_WAIT_S
+    enqueue_message("t-2", user_id=user.id, message_id=str(uuid.uuid4()), utterance="still typing")
+
+    assert flush_thread("t-2")["messages"] == 2
+
+
+@pytest.mark.django_db
+def test_failed_extraction_is_retried_and_does_not_block_the_thread(clock, scheduled, llm, monkeypatch):
+    user = User.objects.create_user(username="flaky", password="pw")
+    real = preference_debounce.extract_and_persist
+    failures = {"left": 1}
+
+    def flaky(*args, **kwargs):
+        if failures["left"]:
+            failures["left"] -= 1
+            raise RuntimeError("llm down")
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(preference_debounce, "extract_and_persist", flaky)
+    enqueue_message("t-3", user_id=user.id, message_id=str(uuid.uuid4()), utterance="flat in Kyrenia")
+    clock["t"] += preference_debounce.DEBOUNCE_S
+
+    assert flush_thread("t-3")["extractions"] == 0
+    assert pending_count("t-3") == 1
+    assert flush_thread("t-3") == {"extractions": 1, "messages": 1, "saved": 1}
+
+    enqueue_message("t-3", user_id=user.id, message_id=str(uuid.uuid4()), utterance="with a pool")
+    clock["t"] += preference_debounce.DEBOUNCE_S
+    assert flush_thread("t-3")["messages"] == 1
+    assert llm == ["flat in Kyrenia", "with a pool"]
+
+
+@pytest.mark.django_db
+def test_poison_batch_is_dropped_after_bounded_attempts(clock, scheduled, llm, monkeypatch):
+    user = User.objects.create_user(username="poison", password="pw")
+    real = preference_debounce.extract_and_persist
+
+    def poison(user_id, thread_id, message_ids, utterances):
+        if "poison" in utterances:
+            raise ValueError("bad payload")
+        return real(user_id, thread_id, message_ids, utterances)
+
+    monkeypatch.setattr(preference_debounce, "extract_and_persist", poison)
+    enqueue_message("t-4", user_id=user.id, message_id=str(uuid.uuid4()), utterance="poison")
+    clock["t"] += preference_debounce.DEBOUNCE_S
+    for _ in range(preference_debounce.EXTRACT_ATTEMPTS):
+        flush_thread("t-4")
+    assert pending_count("t-4") == 0
+
+    enqueue_message("t-4", user_id=user.id, message_id=str(uuid.uuid4()), utterance="Kyrenia")
+    clock["t"] += preference_debounce.DEBOUNCE_S
+    assert flush_thread("t-4")["extractions"] == 1
+    assert llm == ["Kyrenia"]
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_writes_once_and_skips_unchanged_rows():
+    user = User.objects.create_user(username="bulk", password="pw")
+    PreferenceService.upsert_preference(
+        user_id=user.id, category="real_estate", preference_type="location",
+        value={"type": "single", "value": "Kyrenia"}, confidence=0.9, source="explicit",
+    )
+    prefs = [
+        {"category": "real_estate", "preference_type": "location",
+         "value": {"type": "single", "value": "kyrenia"}, "confidence": 0.7, "source": "explicit"},
+        {"category": "real_estate", "preference_type": "bedrooms",
+         "value": {"type": "single", "value": 2}, "confidence": 0.6, "source": "inferred"},
+        {"category": "real_estate", "preference_type": "bedrooms",
+         "value": {"type": "single", "value": 3}, "confidence": 0.8, "source": "explicit"},
+    ]
+
+    with CaptureQueriesContext(connection) as ctx:
+        written, unchanged = PreferenceService.bulk_upsert(user_id=user.id, preferences=prefs)
+
+    assert [row.preference_type for row in written] == ["bedrooms"]
+    assert unchanged == 1
+    assert [q["sql"].split()[0] for q in ctx.captured_queries] == ["SELECT", "INSERT"]
+    bedrooms = UserPreference.objects.get(user=user, preference_type="bedrooms")
+    assert (bedrooms.value["value"], bedrooms.confidence) == (3, 0.8)
+
+    # Changed value on an existing row: updated in place, higher confidence kept
+    prefs[0]["value"] = {"type": "single", "value": "famagusta"}
+    written, unchanged = PreferenceService.bulk_upsert(user_id=user.id, preferences=prefs[:1])
+    location = UserPreference.objects.get(user=user, preference_type="location")
+    assert (location.value["value"], location.confidence) == ("Famagusta", 0.9)
+    assert UserPreference.objects.filter(user=user).count() == 2
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_keeps_the_stored_source_when_none_is_given():
+    user = User.objects.create_user(username="source", password="pw")
+    PreferenceService.upsert_preference(
+        user_id=user.id, category="real_estate", preference_type="bedrooms",
+        value={"type": "single", "value": 2}, confidence=0.6, source="inferred",
+    )
+
+    PreferenceService.bulk_upsert(user_id=user.id, preferences=[
+        {"category": "real_estate", "preference_type": "bedrooms", "value": {"type": "single", "value": 3},
+         "confidence": 0.7},
+        {"category": "real_estate", "preference_type": "location", "value": {"type": "single", "value": "kyrenia"},
+         "confidence": 0.7},
+    ])
+
+    sources = dict(UserPreference.objects.filter(user=user).values_list("preference_type", "source"))
+    assert sources == {"bedrooms": "inferred", "location": "explicit"}
@@ -0,0 +1,59 @@
+"""
+Tests for the seller dashboard metrics helpers (listings.dashboard_metrics).
+"""
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from listings.dashboard_metrics import (
+    _month_buckets,
+    cached_for_owner,
+    invalidate_owner_dashboard,
+)
+
+
+class MonthBucketsTest(SimpleTestCase):
+    def test_buckets_cover_last_months_oldest_first(self):
+        now = datetime(2025, 2, 14, 15, 30, tzinfo=timezone.utc)
+        buckets = _month_buckets(now, 3)
+
+        starts = [start.date().isoformat() for start, _ in buckets]
+        self.assertEqual(starts, ["2024-12-01", "2025-01-01", "2025-02-01"])
+        self.assertEqual(buckets[-1][1], datetime(2025, 3, 1, tzinfo=timezone.utc))
+        # Buckets are contiguous
+        for (_, end), (next_start, _) in zip(buckets, buckets[1:]):
+            self.assertEqual(end, next_start)
+
+    def test_bucket_lengths_are_days_in_month(self):
+        now = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        days = [(end - start).days for start, end in _month_buckets(now, 2)]
+        self.assertEqual(days, [29, 31])  # leap-year February, March
+
+
+class OwnerDashboardCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_compute_runs_once_until_invalidated(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        self.assertEqual(cached_for_owner(7, "occupancy", compute), {"n": 1})
+        self.assertEqual(cached_for_owner(7, "occupancy", compute), {"n": 1})
+        self.assertEqual(len(calls), 1)
+
+        invalidate_owner_dashboard(7)
+        self.assertEqual(cached_for_owner(7, "occupancy", compute), {"n": 2})
+
+    def test_invalidation_is_scoped_to_owner(self):
+        cached_for_owner(1, "earnings", lambda: "owner-1")
+        cached_for_owner(2, "earnings", lambda: "owner-2")
+
+        invalidate_owner_dashboard(1)
+
+        self.assertEqual(cached_for_owner(1, "earnings", lambda: "fresh"), "fresh")
+        self.assertEqual(cached_for_owner(2, "earnings", lambda: "fresh"), "owner-2")
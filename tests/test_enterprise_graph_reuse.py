@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from assistant.brain import enterprise_graph
+from assistant.brain.enterprise_graph import EnterpriseNodeDeps
+
+
+class _RefusingGuardrails:
+    def check_guardrails(self, user_input):
+        return SimpleNamespace(passed=False, reason="Request out of scope", risk_level="low")
+
+
+@pytest.fixture
+def fresh_graph(monkeypatch):
+    monkeypatch.setattr(enterprise_graph, "_COMPILED_ENTERPRISE_GRAPH", None)
+    builds = []
+    real_build = enterprise_graph.build_enterprise_graph
+
+    def counting_build():
+        builds.append(1)
+        return real_build()
+
+    monkeypatch.setattr(enterprise_graph, "build_enterprise_graph", counting_build)
+    monkeypatch.setattr(enterprise_graph, "save_assistant_turn", lambda *args, **kwargs: None)
+    return builds
+
+
+def test_graph_compiles_once_across_concurrent_requests(fresh_graph):
+    deps = EnterpriseNodeDeps(
+        chat_model=FakeListChatModel(responses=["stub"]),
+        guardrail_system=_RefusingGuardrails(),
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(
+            lambda i: enterprise_graph.run_enterprise_agent("a 2 bedroom flat in Kyrenia", f"conv-{i}", deps=deps),
+            range(16),
+        ))
+
+    assert len(fresh_graph) == 1
+    assert all(r["message"] for r in results)
+
+
+def test_synthesis_uses_the_injected_chat_model():
+    deps = EnterpriseNodeDeps(chat_model=FakeListChatModel(responses=["Two flats match in Kyrenia."]))
+    state = {
+        "conversation_id": "conv-1",
+        "user_input": "any flats?",
+        "output_language": "en",
+        "intent_result": {"intent_type": "knowledge_query", "category": "KNOWLEDGE_QUERY"},
+        "internal_search_results": [{"title": "Flat", "description": "2 bed"}],
+        "external_search_results": [],
+    }
+
+    with patch.object(enterprise_graph, "load_recent_messages", return_value=[]), \
+            patch.object(enterprise_graph, "record_turn_summary"):
+        result = enterprise_graph.synthesis_node(state, {"configurable": {"deps": deps}})
+
+    assert result["final_response"] == "Two flats match in Kyrenia."
@@ -0,0 +1,64 @@
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+
+from listings.models import Listing
+from listings.search import SEARCH_CONFIG, full_text_enabled, rank_by_text
+
+
+def _postgres_sql(qs):
+    pg = DatabaseWrapper({**settings.DATABASES["default"], "ENGINE": "django.db.backends.postgresql"}, "pg")
+    return qs.query.get_compiler(connection=pg).as_sql()
+
+
+def test_full_text_query_uses_the_vector_and_cover_density_rank():
+    sql, params = _postgres_sql(rank_by_text(Listing.objects.all(), "sea view").order_by("-rank"))
+
+    assert '"search_vector" @@ (plainto_tsquery(' in sql
+    assert "ts_rank_cd(" in sql
+    assert params.count(SEARCH_CONFIG) == 4  # two keywords, in WHERE and in the rank
+
+
+def test_sqlite_keeps_the_icontains_path():
+    assert connection.vendor != "postgresql"
+    assert full_text_enabled() is False
+
+
+def test_keyword_filter_uses_the_vector_on_postgres(monkeypatch):
+    from listings import search
+
+    assert "search_vector" not in str(search.keyword_filter(["pool"]))  # icontains on SQLite
+
+    monkeypatch.setattr(search, "full_text_enabled", lambda using=None: True)
+    sql, _ = _postgres_sql(Listing.objects.filter(search.keyword_filter(["private pool"])))
+    assert '"search_vector" @@ (plainto_tsquery(' in sql
+
+
+@pytest.mark.django_db
+def test_search_internal_listings_queries_the_listing_schema():
+    from django.contrib.auth import get_user_model
+
+    from assistant.tools import search_internal_listings
+
+    owner = get_user_model().objects.create_user(username="owner", password="x", phone="+905331234567")
+    match = Listing.objects.create(
+        owner=owner, title="Sea view flat", description="Walk to the harbour, shared pool",
+        location="Kyrenia", price=900, transaction_type="rent_long", dynamic_fields={"bedrooms": 2},
+    )
+    Listing.objects.create(
+        owner=owner, title="Sea view villa", description="Private pool", location="Kyrenia",
+        price=900, transaction_type="sale", dynamic_fields={"bedrooms": 2},
+    )
+    Listing.objects.create(
+        owner=owner, title="Town flat", description="No pool", location="Kyrenia",
+        price=2500, transaction_type="rent_long", dynamic_fields={"bedrooms": 2},
+    )
+
+    result = search_internal_listings(
+        "property_rent", location="Girne", attributes={"max_price": 1000, "query": "2+1 pool"},
+    )
+
+    assert result["success"], result
+    assert [card["id"] for card in result["data"]] == [str(match.id)]
+    assert result["data"][0]["features"] == ["2 bedrooms", "Long-Term Rent"]
@@ -0,0 +1,69 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.cache import cache
+
+from assistant.caching.llm_cache import LLMResultCache
+from assistant.brain import intent_parser
+from assistant.brain.schemas import EnterpriseIntentResult
+
+
+@pytest.fixture(autouse=True)
+def _cache_on(monkeypatch):
+    monkeypatch.setenv("LLM_RESULT_CACHE_ENABLED", "true")
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_key_normalizes_inputs_and_separates_versions():
+    v1 = LLMResultCache("t", version="v1")
+    v2 = LLMResultCache("t", version="v2")
+    key = v1.key(model="m", inputs={"message": "2 Bedroom  in Kyrenia "}, temperature=0.12)
+
+    assert key == v1.key(model="m", inputs={"message": "2 bedroom in kyrenia"}, temperature=0.1)
+    assert key != v2.key(model="m", inputs={"message": "2 bedroom in kyrenia"}, temperature=0.1)
+    assert key != v1.key(model="m", inputs={"message": "2 bedroom in kyrenia"}, temperature=0.7)
+
+
+def test_get_or_compute_uses_shared_tier_and_local_lru():
+    calls = []
+    first = LLMResultCache("t", version="v1", local_max=1)
+
+    def compute():
+        calls.append(1)
+        return {"answer": 42}
+
+    assert first.get_or_compute(compute, model="m", inputs={"q": "hi"}) == {"answer": 42}
+    # A second process (fresh local tier) is served from the shared cache
+    second = LLMResultCache("t", version="v1", local_max=1)
+    assert second.get_or_compute(compute, model="m", inputs={"q": "HI"}) == {"answer": 42}
+    assert calls == [1]
+
+    first.get_or_compute(lambda: "other", model="m", inputs={"q": "bye"})
+    assert list(first._local) == [first.key(model="m", inputs={"q": "bye"})]
+
+
+def test_uncacheable_results_are_not_stored():
+    c = LLMResultCache("t", version="v1")
+    c.get_or_compute(lambda: "fallback", model="m", inputs={"q": "x"}, cacheable=lambda v: v != "fallback")
+
+    assert c.get(c.key(model="m", inputs={"q": "x"})) is None
+
+
+def test_repeated_intents_skip_the_llm():
+    parser = intent_parser.StructuredIntentParser.__new__(intent_parser.StructuredIntentParser)
+    parser.model, parser.temperature = "gpt-4o-mini", 0.1
+    parser.llm = Mock()
+    structured = parser.llm.with_structured_output.return_value
+    structured.invoke.return_value = EnterpriseIntentResult(
+        intent_type="greeting", category="CONVERSATION", confidence=0.95, reasoning="greeting"
+    )
+    intent_parser._INTENT_CACHE.clear_local()
+
+    with patch("assistant.monitoring.metrics.LLMMetrics.track_request"):
+        first = parser.parse_intent("Hi", thread_id="t-1")
+        second = parser.parse_intent("hi ", thread_id="t-2")
+
+    assert structured.invoke.call_count == 1
+    assert second.intent_type == first.intent_type == "greeting"
@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+import pytest
+
+from assistant import llm_gateway
+from assistant.monitoring.metrics import LLMMetrics
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients(settings):
+    settings.OPENAI_API_KEY = "sk-test"
+    llm_gateway.reset_clients()
+    yield
+    llm_gateway.reset_clients()
+
+
+def test_openai_clients_are_reused_and_share_one_pool():
+    first = llm_gateway.get_openai_client(timeout=30.0)
+    again = llm_gateway.get_openai_client(timeout=30.0)
+    other = llm_gateway.get_openai_client(timeout=8.0)
+
+    assert first is again
+    assert other is not first
+    assert first._client is other._client is llm_gateway.shared_http_client()
+
+
+def test_chat_models_are_cached_per_configuration():
+    llm = llm_gateway.get_chat_openai("gpt-4o-mini", temperature=0.1, timeout=10)
+
+    assert llm is llm_gateway.get_chat_openai("gpt-4o-mini", temperature=0.1, timeout=10)
+    assert llm is not llm_gateway.get_chat_openai("gpt-4o-mini", temperature=0.1, timeout=10, json_mode=True)
+    assert llm.http_client is llm_gateway.shared_http_client()
+
+
+def test_chat_completion_records_tokens(monkeypatch):
+    usage = SimpleNamespace(prompt_tokens=12, completion_tokens=3, total_tokens=15)
+    response = SimpleNamespace(usage=usage, choices=[])
+    stub = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **_: response)))
+    monkeypatch.setattr(llm_gateway, "get_openai_client", lambda **_: stub)
+    tracked = []
+    monkeypatch.setattr(LLMMetrics, "track_request", lambda self, metrics: tracked.append(metrics))
+
+    assert llm_gateway.chat_completion(model="gpt-4o-mini", messages=[], agent="test") is response
+
+    assert [(m.prompt_tokens, m.completion_tokens, m.agent_name, m.success) for m in tracked] == [
+        (12, 3, "test", True)
+    ]
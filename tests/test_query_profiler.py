@@ -0,0 +1,122 @@
+"""
+Tests for the request-scoped query profiler (assistant.monitoring.query_profiler)
+and the query budgets it pins on the heaviest dashboard views.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from assistant.monitoring.query_profiler import (
+    QueryBudgetMixin,
+    QueryProfilerMiddleware,
+    fingerprint,
+)
+from listings.models import Category, Listing as MarketListing, SellerProfile
+from real_estate.models import (
+    Feature,
+    FeatureCategory,
+    Listing,
+    ListingEvent,
+    ListingType,
+    Location,
+    Property,
+    PropertyFeature,
+    PropertyType,
+)
+
+User = get_user_model()
+
+
+class FingerprintTest(SimpleTestCase):
+    def test_parameters_and_in_lists_collapse(self):
+        a = fingerprint('SELECT "t"."id" FROM "t" WHERE "t"."id" IN (%s, %s, %s) AND name = \'x\' LIMIT 21')
+        b = fingerprint('SELECT  "t"."id" FROM "t"\nWHERE "t"."id" IN (%s) AND name = \'it\'\'s\' LIMIT 5')
+        self.assertEqual(a, b)
+        self.assertEqual(a, 'SELECT "t"."id" FROM "t" WHERE "t"."id" IN (...) AND name = ? LIMIT ?')
+
+
+class QueryProfilerMiddlewareTest(TestCase):
+    def _n_plus_one_view(self, request):
+        for user in User.objects.all():
+            User.objects.filter(pk=user.pk).exists()
+        return HttpResponse("ok")
+
+    @override_settings(QUERY_PROFILER_ENABLED=True, QUERY_PROFILER_REPEAT_THRESHOLD=5, DEBUG=True)
+    def test_repeated_fingerprint_is_flagged_and_counts_exposed(self):
+        for i in range(6):
+            User.objects.create_user(username=f"u{i}", password="pw")
+        middleware = QueryProfilerMiddleware(self._n_plus_one_view)
+
+        with self.assertLogs("assistant.monitoring.query_profiler", "WARNING") as logs:
+            response = middleware(RequestFactory().get("/api/things/"))
+
+        self.assertEqual(response["X-DB-Query-Count"], "7")
+        self.assertEqual(response["X-DB-Max-Repeat"], "6")
+        self.assertIn("Likely N+1 on GET /api/things/", logs.output[0])
+
+    @override_settings(QUERY_PROFILER_ENABLED=False, DEBUG=True)
+    def test_disabled_profiler_adds_no_headers(self):
+        response = QueryProfilerMiddleware(self._n_plus_one_view)(RequestFactory().get("/"))
+        self.assertFalse(response.has_header("X-DB-Query-Count"))
+
+
+class DashboardQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """Query counts for the dashboard views must not grow with the seller's row count."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="seller", password="pw")
+        cls.seller = SellerProfile.objects.create(user=cls.user, business_name="Seaside", slug="seaside")
+        cls.category = Category.objects.create(name="Real Estate", slug="real-estate")
+        cls.listing_type = ListingType.objects.create(code="DAILY_RENTAL", label="Daily Rental")
+        cls.location = Location.objects.create(region="North Cyprus", city="Kyrenia", area="Esentepe")
+        cls.property_type = PropertyType.objects.create(code="APARTMENT", label="Apartment")
+        feature_category = FeatureCategory.objects.create(code="INTERNAL", label="Internal")
+        cls.features = [
+            Feature.objects.create(code=code, label=code, category=feature_category)
+            for code in ("WIFI", "PRIVATE_POOL", "SEA_VIEW")
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _add_portfolio_listings(self, count):
+        start = Listing.objects.count()
+        for i in range(start, start + count):
+            prop = Property.objects.create(
+                reference_code=f"EI-RE-{i:03d}", title=f"Flat {i}",
+                location=self.location, property_type=self.property_type,
+            )
+            for feature in self.features[: 1 + i % 3]:
+                PropertyFeature.objects.create(property=prop, feature=feature)
+            listing = Listing.objects.create(
+                reference_code=f"EI-L-{i:03d}", listing_type=self.listing_type, property=prop,
+                title=f"Flat {i}", base_price=100 + i, status="ACTIVE",
+            )
+            ListingEvent.objects.create(listing=listing, event_type="VIEW")
+            ListingEvent.objects.create(listing=listing, event_type="ENQUIRY")
+
+    def test_portfolio_listings_budget(self):
+        # page (with 30-day event counts), property features prefetch, total count
+        self._add_portfolio_listings(2)
+        self.assertMaxQueries("/api/v1/real_estate/portfolio/listings/", 3)
+
+        self._add_portfolio_listings(15)
+        cache.clear()
+        response = self.assertMaxQueries("/api/v1/real_estate/portfolio/listings/", 3)
+
+        first = response.json()["results"][0]
+        self.assertEqual((first["views_30d"], first["enquiries_30d"], first["bookings_30d"]), (1, 1, 0))
+        self.assertTrue(first["has_wifi"])
+
+    def test_seller_analytics_budget(self):
+        # seller profile, listings aggregate, two broadcast aggregates, category breakdown
+        for count in (2, 20):
+            for _ in range(count):
+                MarketListing.objects.create(owner=self.user, category=self.category, title="Flat")
+            cache.clear()
+            self.assertMaxQueries("/api/sellers/analytics/", 5)
@@ -0,0 +1,79 @@
+"""
+Tests for the aggregate-based seller analytics (listings.analytics).
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from assistant.models import AgentBroadcastV2, Request
+from listings.analytics import compute_dashboard_summary, compute_seller_stats
+from listings.models import Category, Listing, SellerProfile
+
+User = get_user_model()
+
+
+class SellerAnalyticsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="seller", password="pw")
+        self.seller = SellerProfile.objects.create(
+            user=self.user, business_name="Seaside", slug="seaside", rating=4.5
+        )
+        self.category = Category.objects.create(name="Real Estate", slug="real-estate")
+
+    def _listing(self, **kwargs):
+        defaults = {
+            "owner": self.user,
+            "category": self.category,
+            "title": "Flat",
+            "description": "",
+        }
+        defaults.update(kwargs)
+        return Listing.objects.create(**defaults)
+
+    def test_stats_are_aggregated_in_the_database(self):
+        self._listing(views=10)
+        self._listing(views=5, status="paused")
+        self._listing(views=1, category=None)
+        request = Request.objects.create(created_by=self.user, category="PROPERTY")
+        AgentBroadcastV2.objects.create(
+            request=request, seller_id=str(self.user.id), medium="email", status="responded"
+        )
+
+        stats = compute_seller_stats(self.seller)
+
+        self.assertEqual(stats["total_listings"], 3)
+        self.assertEqual(stats["active_listings"], 2)
+        self.assertEqual(stats["total_views"], 16)
+        self.assertEqual(stats["recent_listings_30d"], 3)
+        self.assertEqual(stats["total_broadcasts"], 1)
+        self.assertEqual(stats["broadcast_responses"], 1)
+        self.assertEqual(stats["active_broadcasts"], 0)
+
+    def test_summary_query_count_does_not_grow_with_listings(self):
+        for _ in range(2):
+            self._listing()
+        cache.clear()
+        # listings aggregate, two broadcast aggregates, category breakdown
+        with self.assertNumQueries(4):
+            compute_dashboard_summary(self.seller)
+
+        for _ in range(20):
+            self._listing()
+        cache.clear()
+        with self.assertNumQueries(4):
+            summary = compute_dashboard_summary(self.seller)
+
+        self.assertEqual(summary["stats"]["total_listings"], 22)
+        self.assertEqual(summary["category_breakdown"], {"Real Estate": 22})
+
+    def test_summary_is_cached_until_a_listing_changes(self):
+        self._listing()
+        first = compute_dashboard_summary(self.seller)
+        with self.assertNumQueries(0):
+            self.assertEqual(compute_dashboard_summary(self.seller), first)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._listing()
+
+        self.assertEqual(compute_dashboard_summary(self.seller)["stats"]["total_listings"], 2)
@@ -0,0 +1,88 @@
+"""
+Tests for assistant reply streaming helpers (assistant.utils.streaming).
+"""
+import json
+import threading
+
+from assistant.utils.streaming import (
+    DeltaCoalescer,
+    SpeakFieldExtractor,
+    delta_sink,
+    emit_delta,
+    streaming_active,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_coalescer_batches_within_interval_and_flushes_on_close():
+    clock = _Clock()
+    frames = []
+    coalescer = DeltaCoalescer(lambda text, seq: frames.append((seq, text)), interval=0.05, clock=clock)
+
+    coalescer("Hel")
+    coalescer("lo")
+    assert frames == []
+
+    clock.now = 0.06
+    coalescer(", wor")
+    coalescer("ld")
+    coalescer.close()
+
+    assert frames == [(0, "Hello, wor"), (1, "ld")]
+    assert coalescer.first_sent_at == 0.06
+
+
+def test_emit_delta_is_noop_outside_a_sink():
+    assert not streaming_active()
+    emit_delta("ignored")
+
+    received = []
+    with delta_sink(received.append):
+        assert streaming_active()
+        emit_delta("a")
+        emit_delta("")
+    assert received == ["a"]
+    assert not streaming_active()
+
+
+def test_emit_delta_swallows_sink_errors():
+    def broken(_text):
+        raise RuntimeError("channel layer down")
+
+    with delta_sink(broken):
+        emit_delta("still fine")
+
+
+def test_speak_extractor_decodes_only_the_speak_string():
+    reply = json.dumps({"act": "SEARCH", "speak": 'Found "3" flats\nété', "slots_delta": {"a": 1}})
+    extractor = SpeakFieldExtractor()
+
+    streamed = "".join(extractor.feed(reply[i:i + 3]) for i in range(0, len(reply), 3))
+
+    assert streamed == 'Found "3" flats\nété'
+
+
+def test_coalescer_flushes_buffered_text_once_it_reaches_max_age():
+    sent = threading.Event()
+    frames = []
+
+    def send(text, seq):
+        frames.append((seq, text))
+        sent.set()
+
+    coalescer = DeltaCoalescer(send, interval=60.0, max_age=0.01)
+    coalescer("Hello")
+
+    assert sent.wait(2)
+    assert frames == [(0, "Hello")]
+    coalescer.close()
+    coalescer("late")
+    coalescer.close()
+    assert frames == [(0, "Hello")]
@@ -63,7 +63,13 @@ def test_group_name_and_type_are_correct(monkeypatch):
 
     process_chat_message.run(message_id=str(msg.id), thread_id=str(thread.thread_id), client_msg_id=str(client_uuid))
 
-    assistant_events = [call for call in captured_calls if call[1].get('type') == 'chat.message']
+    # The final message and typing-off frame arrive together as one chat.batch
+    unpacked = [
+        (group, frame)
+        for group, event in captured_calls
+        for frame in (event["frames"] if event.get('type') == 'chat.batch' else [event])
+    ]
+    assistant_events = [call for call in unpacked if call[1].get('type') == 'chat.message']
     assert assistant_events, "Expected assistant frame to be emitted"
 
     group_name, payload = assistant_events[0]
@@ -0,0 +1,71 @@
+"""
+Tests for coalesced WebSocket frame emission (assistant.tasks.FrameBatcher
+and ChatConsumer.chat_batch).
+"""
+import asyncio
+
+from assistant.consumers import ChatConsumer
+from assistant.tasks import FrameBatcher
+
+
+class _Layer:
+    def __init__(self):
+        self.sent = []
+
+    async def group_send(self, group, message):
+        self.sent.append((group, message))
+
+
+def _typing(value):
+    return {"type": "chat_status", "event": "typing", "value": value}
+
+
+def test_frames_added_together_share_one_group_send():
+    layer = _Layer()
+    frames = FrameBatcher(layer, "thread-1", batch=True)
+
+    frames.send(_typing(True))
+    frames.add({"type": "chat.message", "data": {"event": "assistant_message"}})
+    frames.add(_typing(False))
+    assert len(layer.sent) == 1
+    frames.flush()
+    frames.flush()  # nothing pending
+
+    assert frames.group_sends == 2
+    assert layer.sent[0] == ("thread-1", _typing(True))
+    group, batch = layer.sent[1]
+    assert group == "thread-1" and batch["type"] == "chat.batch"
+    assert [f["type"] for f in batch["frames"]] == ["chat.message", "chat_status"]
+
+
+def test_batching_disabled_sends_each_frame():
+    layer = _Layer()
+    frames = FrameBatcher(layer, "thread-1", batch=False)
+    frames.add(_typing(True))
+    frames.add(_typing(False))
+    frames.flush()
+
+    assert [message for _, message in layer.sent] == [_typing(True), _typing(False)]
+
+
+def test_consumer_unpacks_batch_in_order_and_skips_unknown_frames():
+    consumer = ChatConsumer()
+    consumer.scope = {}
+    delivered = []
+
+    async def capture(payload):
+        delivered.append(payload)
+
+    consumer.safe_send_json = capture
+    asyncio.run(consumer.chat_batch({
+        "type": "chat.batch",
+        "frames": [
+            {"type": "chat.message", "data": {"event": "assistant_message", "meta": {}}},
+            {"type": "chat.unknown"},
+            {"type": "chat.batch", "frames": [_typing(True)]},
+            _typing(False),
+        ],
+    }))
+
+    assert [frame["event"] for frame in delivered] == ["assistant_message", "typing"]
+    assert delivered[1]["value"] is False